@@ -0,0 +1,424 @@
+"""
+bench.py — JobLess AI Pipeline Benchmarks
+=========================================
+Times every stage of the AIHandler → parse → render pipeline headless,
+against the offline fake provider, so a change that slows the app down
+shows up as a number instead of a hunch.
+
+Stages (all in milliseconds per call):
+
+  - pipeline/<method>/prompt  → method entry until the provider is called
+                                (prompt build, routing, cache / rate-limit checks)
+  - pipeline/<method>/llm     → provider round-trip (synthesis only, unless
+                                --realtime replays the fake latency model)
+  - pipeline/<method>/parse   → AIHandler._safe_parse_json
+  - pipeline/<method>/total   → the whole public method
+  - parse/<feature>/<variant>/<items> → _safe_parse_json over the corpus
+                                in corpus.py (realistic + malformed outputs)
+  - render/<function>         → HTML building in the result renderers,
+                                run inside streamlit's AppTest harness
+  - pdf/<exam>                → build_pyq_pdf
+  - import/<module>           → ``python -X importtime -c "import jobless_ai_public"``
+                                in a fresh interpreter (cumulative, per module)
+
+The import group is also checked against an absolute budget
+(--import-budget) and fails if any of the lazily loaded libraries
+(DEFERRED_IMPORTS) is imported while the app module loads.
+
+Usage (from the repo root):
+
+    python benchmarks/bench.py                    # run + compare to baseline.json
+    python benchmarks/bench.py --save-baseline    # overwrite baseline.json
+    python benchmarks/bench.py --only parse,pdf --iterations 50
+    python benchmarks/bench.py --only import       # cold-start budget only
+
+Exits 1 when any stage's p50 regresses past --threshold against the baseline.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# The app registers the "local" provider at import time
+os.environ.setdefault("JOBLESS_FAKE_PROVIDER", "1")
+os.environ["JOBLESS_BENCH_ROOT"] = ROOT
+for _p in (ROOT, os.path.dirname(os.path.abspath(__file__))):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+# Must not be imported by `import jobless_ai_public` (see lazy_imports)
+DEFERRED_IMPORTS = ("google.generativeai", "groq", "cohere", "altair", "streamlit_lottie",
+                    "reportlab", "pyq_pdf")
+# Reported alongside the app module itself
+IMPORT_MODULES = ("jobless_ai_public", "streamlit", "fitz")
+
+LOCAL_PROVIDER = "Local (offline)  🧪"
+MODEL = "fake-large"
+
+PROFILE_TEXT = (
+    "Software engineer, 3 years. Python, SQL, AWS, Docker, React. Built a payments "
+    "reconciliation service handling 2M events/day, cut batch runtime by 60%. "
+    "B.Tech CSE 2021. Led a team of 3 interns; mentors juniors on code review. " * 4)
+PROFILE_DATA = {
+    "name": "Test Candidate", "target_role": "Backend Engineer",
+    "job_description": "Build scalable APIs in Python and Go on AWS.",
+    "experience_years": "3", "work_experience": "Software Engineer at Acme (2021–now)",
+    "skills": "Python, SQL, AWS, Docker", "education": "B.Tech CSE, 2021",
+    "certifications": "AWS CCP", "projects": "Payments reconciler", "achievements": "60% faster batch",
+}
+FEEDBACK = {
+    "score": 72, "verdict": "Good", "one_line_reaction": "Solid structure, thin on numbers.",
+    "what_you_did_well": ["Clear STAR framing", "Owned the outcome"],
+    "what_went_wrong": ["No metrics", "Skipped trade-offs"],
+    "how_to_improve": ["Quantify impact", "Name the alternative you rejected"],
+    "sample_better_answer": "When our nightly batch started missing its SLA I profiled it... " * 3,
+    "keywords_used": ["ownership", "profiling"], "keywords_missed": ["SLA", "rollback"],
+    "crack_this_question": "Likely", "crack_message": "Add one number and you're there.",
+}
+
+
+# ==================== STATS ====================
+def summarize(samples_ms: List[float], nbytes: int = 0) -> Dict[str, float]:
+    values = sorted(samples_ms)
+    n = len(values)
+    total = sum(values)
+
+    def q(p):
+        return round(values[min(n - 1, int(p * n))], 4)
+    row = {"n": n, "mean": round(total / n, 4), "p50": q(0.50), "p95": q(0.95),
+           "p99": q(0.99), "ops_per_sec": round(n / (total / 1000.0), 1) if total else None}
+    if nbytes:
+        row["mb_per_sec"] = round(nbytes * n / (total / 1000.0) / 1e6, 2) if total else None
+    return row
+
+
+def _time(fn: Callable, iterations: int) -> List[float]:
+    out = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        out.append((time.perf_counter() - start) * 1000.0)
+    return out
+
+
+# ==================== PARSE / PDF (no streamlit runtime needed) ====================
+def bench_parse(iterations: int) -> Dict[str, Dict]:
+    from corpus import build_corpus
+    import jobless_ai_public as jp
+
+    results = {}
+    for row in build_corpus():
+        ok = True
+
+        def parse(text=row["text"]):
+            nonlocal ok
+            try:
+                jp.AIHandler._safe_parse_json(text)
+            except ValueError:
+                ok = False
+        stats = summarize(_time(parse, iterations), nbytes=len(row["text"].encode("utf-8")))
+        stats["ok"] = ok
+        results[f"parse/{row['feature']}/{row['variant']}/{row['items']}"] = stats
+    return results
+
+
+def bench_pdf(iterations: int) -> Dict[str, Dict]:
+    import jobless_ai_public as jp
+    import pyq_store
+    return {f"pdf/{exam}": summarize(_time(lambda e=exam: jp.build_pyq_pdf(e), iterations))
+            for exam in pyq_store.list_exams()}
+
+
+# ==================== IMPORT (fresh interpreter per sample) ====================
+def _importtime() -> Dict[str, int]:
+    """Cumulative import time (µs) per module of one cold ``import jobless_ai_public``."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", "import jobless_ai_public"],
+        cwd=ROOT, env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"),
+        capture_output=True, text=True, check=True)
+    out = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        out.setdefault(name.strip(), int(cumulative))
+    return out
+
+
+def bench_import(iterations: int) -> Dict[str, Dict]:
+    samples: Dict[str, List[float]] = {}
+    deferred_loaded = set()
+    for _ in range(iterations):
+        times = _importtime()
+        for name in IMPORT_MODULES:
+            if name in times:
+                samples.setdefault(f"import/{name}", []).append(times[name] / 1000.0)
+        deferred_loaded.update(n for n in DEFERRED_IMPORTS if n in times)
+    results = {name: summarize(values) for name, values in samples.items()}
+    app = results.get("import/jobless_ai_public")
+    if app is not None:
+        app["eager"] = sorted(deferred_loaded)
+        app["ok"] = not deferred_loaded
+    return results
+
+
+def check_import_budget(results: Dict[str, Dict], budget_ms: float) -> List[str]:
+    failures = []
+    app = results.get("import/jobless_ai_public")
+    if app and app["p50"] > budget_ms:
+        failures.append(f"import/jobless_ai_public: p50 {app['p50']:.1f} ms over the "
+                        f"{budget_ms:.0f} ms budget")
+    for name in (app or {}).get("eager", []):
+        failures.append(f"{name} is imported eagerly (expected on first use)")
+    return failures
+
+
+# ==================== PIPELINE / RENDER (inside AppTest) ====================
+def _app_script():
+    # Runs as a streamlit script (source is extracted by AppTest)
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.environ["JOBLESS_BENCH_ROOT"], "benchmarks"))
+    sys.path.insert(0, os.environ["JOBLESS_BENCH_ROOT"])
+    import bench
+    bench.app_main()
+
+
+def app_main():
+    import streamlit as st
+    mode = st.session_state.get("bench_mode")
+    if mode == "pipeline":
+        st.session_state["bench_result"] = _pipeline_run(st.session_state["bench_iterations"],
+                                                         st.session_state["bench_realtime"])
+    elif mode == "render":
+        st.session_state["bench_result"] = _render_run()
+
+
+def _pipeline_run(iterations: int, realtime: bool) -> Dict[str, List[float]]:
+    import streamlit as st
+    import jobless_ai_public as jp
+
+    st.session_state["ai_provider"] = LOCAL_PROVIDER
+    st.session_state["model_routing"] = False
+    fake = jp._FAKE_PROVIDER
+    fake.realtime = realtime
+    fake.error_rate = fake.server_error_rate = 0.0
+    fake.truncate_rate = fake.fence_rate = 0.0
+
+    marks: Dict[str, float] = {}
+    complete, parse = fake.complete, jp.AIHandler._safe_parse_json
+
+    def timed_complete(*args, **kwargs):
+        marks.setdefault("llm_start", time.perf_counter())
+        try:
+            return complete(*args, **kwargs)
+        finally:
+            marks["llm_end"] = time.perf_counter()
+
+    def timed_parse(txt):
+        marks["parse_start"] = time.perf_counter()
+        try:
+            return parse(txt)
+        finally:
+            marks["parse_end"] = time.perf_counter()
+
+    handler = jp.AIHandler(jp.Config())
+    feedback = [FEEDBACK] * 8
+    cases = {
+        "get_career_advice": lambda: handler.get_career_advice(
+            PROFILE_TEXT, MODEL, {"location": "India - Metro", "industries": ["Tech"],
+                                  "career_stage": "Early Career"}),
+        "build_ats_resume": lambda: handler.build_ats_resume(PROFILE_DATA, MODEL),
+        "generate_interview_questions": lambda: handler.generate_interview_questions(
+            "Backend Engineer", "Mid-Level", MODEL),
+        "evaluate_interview_answer": lambda: handler.evaluate_interview_answer(
+            "Tell me about a time you fixed a slow system.", FEEDBACK["sample_better_answer"],
+            ["Metrics", "Trade-offs"], "Backend Engineer", ["Flipkart"], MODEL),
+        "generate_final_verdict": lambda: handler.generate_final_verdict(
+            "Backend Engineer", "Mid-Level", ["Flipkart"], feedback, MODEL),
+        "find_pyq_resources": lambda: handler.find_pyq_resources("TCS", "Developer", MODEL),
+        "generate_pyq_questions": lambda: handler.generate_pyq_questions(
+            "TCS", "Developer", 15, MODEL),
+        "chat_interview_turn": lambda: handler.chat_interview_turn(
+            [{"role": "assistant", "content": "Tell me about yourself."},
+             {"role": "user", "content": PROFILE_TEXT}], "Backend Engineer", "Mid-Level", MODEL),
+    }
+
+    samples: Dict[str, List[float]] = {}
+    fake.complete = timed_complete
+    jp.AIHandler._safe_parse_json = staticmethod(timed_parse)
+    try:
+        for method, call in cases.items():
+            for _ in range(iterations):
+                jp._RESPONSE_CACHE.clear()
+                marks.clear()
+                start = time.perf_counter()
+                call()
+                end = time.perf_counter()
+                stages = {"total": end - start}
+                if "llm_start" in marks:
+                    stages["prompt"] = marks["llm_start"] - start
+                    stages["llm"] = marks["llm_end"] - marks["llm_start"]
+                if "parse_start" in marks:
+                    stages["parse"] = marks["parse_end"] - marks["parse_start"]
+                for stage, secs in stages.items():
+                    samples.setdefault(f"pipeline/{method}/{stage}", []).append(secs * 1000.0)
+    finally:
+        fake.complete = complete
+        jp.AIHandler._safe_parse_json = staticmethod(parse)
+    return samples
+
+
+def _render_run() -> Dict[str, float]:
+    # One call per script run: the renderers create keyed widgets
+    import random
+    import streamlit as st
+    import jobless_ai_public as jp
+    from fake_provider import _synth_career, _synth_resume
+
+    st.session_state.setdefault("history", [])
+    rng = random.Random(7)
+    career, resume = _synth_career("", rng), _synth_resume("", rng)
+    cases = {
+        "_render_career_results": lambda: jp._render_career_results(career),
+        "_render_resume_output": lambda: jp._render_resume_output(resume),
+        "_render_question_feedback": lambda: jp._render_question_feedback(FEEDBACK),
+    }
+    out = {}
+    for name, call in cases.items():
+        start = time.perf_counter()
+        call()
+        out[f"render/{name}"] = (time.perf_counter() - start) * 1000.0
+    return out
+
+
+def _app_test():
+    from streamlit.testing.v1 import AppTest
+    return AppTest.from_function(_app_script, default_timeout=600)
+
+
+def bench_pipeline(iterations: int, realtime: bool) -> Dict[str, Dict]:
+    at = _app_test()
+    at.session_state["bench_mode"] = "pipeline"
+    at.session_state["bench_iterations"] = iterations
+    at.session_state["bench_realtime"] = realtime
+    at.run()
+    _raise_script_errors(at)
+    return {name: summarize(values) for name, values in at.session_state["bench_result"].items()}
+
+
+def bench_render(iterations: int) -> Dict[str, Dict]:
+    at = _app_test()
+    at.session_state["bench_mode"] = "render"
+    samples: Dict[str, List[float]] = {}
+    for _ in range(iterations):
+        at.run()
+        _raise_script_errors(at)
+        for name, ms in at.session_state["bench_result"].items():
+            samples.setdefault(name, []).append(ms)
+    return {name: summarize(values) for name, values in samples.items()}
+
+
+def _raise_script_errors(at):
+    if at.exception:
+        raise RuntimeError(f"Benchmark script failed: {at.exception[0].value}")
+
+
+# ==================== REPORT ====================
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    regressions = []
+    for name, row in sorted(results.items()):
+        base = baseline.get(name)
+        if not base or not base.get("p50"):
+            continue
+        ratio = row["p50"] / base["p50"]
+        # Sub-10µs stages are timer noise
+        if ratio > threshold and row["p50"] - base["p50"] > 0.01:
+            regressions.append(f"{name}: p50 {base['p50']:.3f} → {row['p50']:.3f} ms "
+                               f"({ratio:.2f}x)")
+    return regressions
+
+
+def print_table(results: Dict[str, Dict], baseline: Dict[str, Dict]):
+    print(f"{'stage':<58} {'n':>5} {'p50':>9} {'p95':>9} {'p99':>9} {'ops/s':>10} {'Δp50':>7}")
+    for name, row in sorted(results.items()):
+        base = baseline.get(name, {}).get("p50")
+        delta = f"{row['p50'] / base:.2f}x" if base else "—"
+        ops = row.get("ops_per_sec")
+        flag = "" if row.get("ok", True) else (
+            "  (eager: " + ", ".join(row["eager"]) + ")" if "eager" in row else "  (parse failed)")
+        print(f"{name:<58} {row['n']:>5} {row['p50']:>9.3f} {row['p95']:>9.3f} "
+              f"{row['p99']:>9.3f} {ops if ops is not None else '—':>10} {delta:>7}{flag}")
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="JobLess AI pipeline benchmarks")
+    ap.add_argument("--iterations", type=int, default=20)
+    ap.add_argument("--only", default="pipeline,parse,render,pdf,import",
+                    help="comma-separated stage groups")
+    ap.add_argument("--realtime", action="store_true",
+                    help="replay the fake provider's latency model instead of returning instantly")
+    ap.add_argument("--baseline", default=BASELINE)
+    ap.add_argument("--save-baseline", action="store_true")
+    ap.add_argument("--threshold", type=float, default=1.25,
+                    help="p50 ratio vs baseline that counts as a regression")
+    ap.add_argument("--import-budget", type=float, default=1500.0,
+                    help="max p50 ms for a cold `import jobless_ai_public`")
+    ap.add_argument("--json", dest="json_out", help="also write results to this file")
+    args = ap.parse_args(argv)
+
+    groups = {g.strip() for g in args.only.split(",") if g.strip()}
+    results: Dict[str, Dict] = {}
+    if "pipeline" in groups:
+        results.update(bench_pipeline(args.iterations, args.realtime))
+    if "parse" in groups:
+        results.update(bench_parse(args.iterations))
+    if "render" in groups:
+        results.update(bench_render(args.iterations))
+    if "pdf" in groups:
+        results.update(bench_pdf(max(1, args.iterations // 4)))
+    if "import" in groups:
+        results.update(bench_import(max(3, args.iterations // 4)))
+
+    baseline: Dict[str, Dict] = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            baseline = json.load(fh).get("results", {})
+
+    print_table(results, baseline)
+    import streamlit
+    doc = {"meta": {"python": platform.python_version(), "platform": platform.platform(),
+                    "streamlit": streamlit.__version__,
+                    "iterations": args.iterations, "realtime": args.realtime,
+                    "created": time.strftime("%Y-%m-%dT%H:%M:%S")},
+           "results": results}
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as fh:
+            json.dump(doc, fh, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as fh:
+            json.dump(doc, fh, indent=2, sort_keys=True)
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if "import" in groups:
+        regressions += check_import_budget(results, args.import_budget)
+    if regressions:
+        print("\nRegressions:")
+        for line in regressions:
+            print("  " + line)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
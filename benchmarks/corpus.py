@@ -0,0 +1,72 @@
+"""
+corpus.py — JobLess AI Benchmark Corpora
+========================================
+LLM outputs of increasing size for the parse benchmark, in the shapes the
+real providers return them:
+
+  - clean      → bare JSON, what json_mode asks for
+  - fenced     → wrapped in ```json fences
+  - prose      → a sentence of chatter before and after the document
+  - commas     → trailing commas before every } / ]
+  - truncated  → cut off at 85% (max_tokens hit mid-array)
+
+Payloads come from fake_provider's synthesizers, seeded, so every run
+parses byte-identical input.
+"""
+
+import json
+import random
+import re
+from typing import Dict, List, Tuple
+
+from fake_provider import _synth_career, _synth_pyq, _synth_questions
+
+VARIANTS = ("clean", "fenced", "prose", "commas", "truncated")
+
+# feature → item counts; each step is ~4x the previous payload
+SIZES: Dict[str, Tuple[int, ...]] = {
+    "career":    (2, 8, 32, 128),
+    "questions": (8, 32, 128),
+    "pyq":       (15, 60, 240),
+}
+
+
+def _payload(feature: str, n: int, rng: random.Random):
+    if feature == "career":
+        data = _synth_career("", rng)
+        extra = _synth_career("", rng)["careers"]
+        while len(data["careers"]) < n:
+            data["careers"].extend(extra)
+        data["careers"] = data["careers"][:n]
+        return data
+    if feature == "questions":
+        items: List = []
+        while len(items) < n:
+            items.extend(_synth_questions("", rng))
+        return items[:n]
+    return _synth_pyq(f"Total Questions: {n}", rng)
+
+
+def variant(text: str, kind: str) -> str:
+    if kind == "fenced":
+        return f"```json\n{text}\n```"
+    if kind == "prose":
+        return f"Sure! Here is the JSON you asked for:\n{text}\nLet me know if you need changes."
+    if kind == "commas":
+        return re.sub(r"([}\]])", r",\1", text)
+    if kind == "truncated":
+        return text[:int(len(text) * 0.85)]
+    return text
+
+
+def build_corpus(seed: int = 7) -> List[Dict]:
+    """Rows of {feature, items, variant, text}."""
+    rng = random.Random(seed)
+    rows = []
+    for feature, sizes in SIZES.items():
+        for n in sizes:
+            base = json.dumps(_payload(feature, n, rng), ensure_ascii=False, indent=2)
+            for kind in VARIANTS:
+                rows.append({"feature": feature, "items": n, "variant": kind,
+                             "text": variant(base, kind)})
+    return rows
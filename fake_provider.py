@@ -0,0 +1,346 @@
+"""
+fake_provider.py — JobLess AI Offline Provider
+==============================================
+A "local" LLM backend for CI, benchmarks and air-gapped boxes. It needs no
+key and no network.
+
+For every AIHandler task it either replays a recorded fixture or
+synthesises a schema-valid payload, shaped like the real prompt asks for.
+Timing and failure behaviour are configurable:
+
+  - latency     → log-normal time-to-first-token, then a fixed token rate
+  - errors      → injected 429s (with Retry-After) and 503s
+  - malformed   → ```json fences and truncated JSON, to exercise the
+                  repair / salvage paths
+
+Outputs are deterministic per prompt (seeded from its hash plus ``seed``),
+so two benchmark runs see the same payloads.
+
+Enabled in the app by setting JOBLESS_FAKE_PROVIDER=1; see ``from_env`` for
+the tuning variables. Nothing in this module imports streamlit.
+"""
+
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from telemetry import current_method
+
+# Prompt fragments that identify each AIHandler task (checked in order)
+_TASK_MARKERS = [
+    ("build_ats_resume",             '"ats_score"'),
+    ("get_career_advice",            '"careers"'),
+    ("generate_interview_questions", '"ideal_answer_points"'),
+    ("evaluate_interview_answer",    '"crack_this_question"'),
+    ("generate_final_verdict",       '"overall_score"'),
+    ("find_pyq_resources",           '"overall_confidence"'),
+    ("generate_pyq_questions",       '"section"'),
+    ("summarize_interview_context",  "running notes on a mock interview"),
+    ("chat_interview_turn",          "live mock job interview"),
+]
+
+_WORDS = ("scalable systems data pipeline stakeholder ownership latency python sql cloud "
+          "design tradeoff testing metrics customer impact debugging mentoring api cache "
+          "queue ranking experiment dashboard reliability security review roadmap").split()
+
+
+class FakeProviderError(Exception):
+    """Shaped like the SDK errors llm_runtime.error_status / retry_after_seconds read."""
+
+    def __init__(self, status_code: int, message: str, retry_after: Optional[float] = None):
+        super().__init__(f"[fake {status_code}] {message}")
+        self.status_code = status_code
+        self.headers = {"retry-after": str(retry_after)} if retry_after is not None else {}
+
+
+class FakeProvider:
+    def __init__(self, *, ttft_ms: float = 400.0, ttft_sigma: float = 0.5,
+                 tokens_per_sec: float = 250.0, error_rate: float = 0.0,
+                 server_error_rate: float = 0.0, truncate_rate: float = 0.0,
+                 fence_rate: float = 0.0, fixtures_dir: Optional[str] = None,
+                 seed: int = 0, realtime: bool = True):
+        self.ttft_ms = ttft_ms
+        self.ttft_sigma = ttft_sigma
+        self.tokens_per_sec = tokens_per_sec
+        self.error_rate = error_rate
+        self.server_error_rate = server_error_rate
+        self.truncate_rate = truncate_rate
+        self.fence_rate = fence_rate
+        self.fixtures_dir = fixtures_dir
+        self.seed = seed
+        self.realtime = realtime
+        self._fixtures: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+        self._calls = 0
+
+    @classmethod
+    def from_env(cls) -> "FakeProvider":
+        env = os.getenv
+        return cls(
+            ttft_ms=float(env("JOBLESS_FAKE_TTFT_MS", "400")),
+            ttft_sigma=float(env("JOBLESS_FAKE_TTFT_SIGMA", "0.5")),
+            tokens_per_sec=float(env("JOBLESS_FAKE_TOKENS_PER_SEC", "250")),
+            error_rate=float(env("JOBLESS_FAKE_429_RATE", "0")),
+            server_error_rate=float(env("JOBLESS_FAKE_5XX_RATE", "0")),
+            truncate_rate=float(env("JOBLESS_FAKE_TRUNCATE_RATE", "0")),
+            fence_rate=float(env("JOBLESS_FAKE_FENCE_RATE", "0")),
+            fixtures_dir=env("JOBLESS_FAKE_FIXTURES") or None,
+            seed=int(env("JOBLESS_FAKE_SEED", "0")),
+        )
+
+    # ── Public API (mirrors what _provider_call / _provider_stream need) ───
+    def complete(self, prompt: str, model: str, max_tokens: int = 8192,
+                 json_mode: bool = False) -> str:
+        text, rng = self._respond(prompt, model, max_tokens)
+        self._sleep(self._ttft(rng) + self._gen_time(text))
+        return text
+
+    def stream(self, prompt: str, model: str, max_tokens: int = 8192,
+               json_mode: bool = False, chunk_chars: int = 16) -> Iterator[str]:
+        text, rng = self._respond(prompt, model, max_tokens)
+        self._sleep(self._ttft(rng))
+        per_chunk = self._gen_time(text[:chunk_chars])
+        for i in range(0, len(text), chunk_chars):
+            if i:
+                self._sleep(per_chunk)
+            yield text[i:i + chunk_chars]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"calls": self._calls}
+
+    # ── Internals ─────────────────────────────────────────────────────────
+    def _respond(self, prompt: str, model: str, max_tokens: int):
+        digest = hashlib.sha256(f"{self.seed}:{model}:{prompt}".encode("utf-8")).digest()
+        rng = random.Random(int.from_bytes(digest[:8], "big"))
+        with self._lock:
+            self._calls += 1
+        # Errors are drawn from an unseeded stream so retries can succeed
+        roll = random.random()
+        if roll < self.error_rate:
+            raise FakeProviderError(429, "rate limit exceeded", retry_after=1)
+        if roll < self.error_rate + self.server_error_rate:
+            raise FakeProviderError(503, "upstream overloaded")
+
+        task = detect_task(prompt)
+        text = self._fixture(task, rng)
+        if text is None:
+            text = synthesize(task, prompt, rng)
+        text = text[:max_tokens * 4]
+        if task not in ("chat_interview_turn", "summarize_interview_context", "text"):
+            if rng.random() < self.fence_rate:
+                text = f"```json\n{text}\n```"
+            if rng.random() < self.truncate_rate:
+                text = text[:int(len(text) * rng.uniform(0.4, 0.9))]
+        return text, rng
+
+    def _fixture(self, task: str, rng: random.Random) -> Optional[str]:
+        if not self.fixtures_dir:
+            return None
+        with self._lock:
+            if task not in self._fixtures:
+                path = os.path.join(self.fixtures_dir, f"{task}.jsonl")
+                texts = []
+                if os.path.exists(path):
+                    with open(path, encoding="utf-8") as fh:
+                        texts = [json.loads(line)["text"] for line in fh if line.strip()]
+                self._fixtures[task] = texts
+            texts = self._fixtures[task]
+        return rng.choice(texts) if texts else None
+
+    def _ttft(self, rng: random.Random) -> float:
+        return self.ttft_ms / 1000.0 * math.exp(rng.gauss(0, self.ttft_sigma))
+
+    def _gen_time(self, text: str) -> float:
+        return (len(text) / 4) / self.tokens_per_sec if self.tokens_per_sec > 0 else 0.0
+
+    def _sleep(self, seconds: float):
+        if self.realtime and seconds > 0:
+            time.sleep(seconds)
+
+
+def record_fixture(fixtures_dir: str, task: str, text: str):
+    """Append one real completion to <fixtures_dir>/<task>.jsonl for later replay."""
+    os.makedirs(fixtures_dir, exist_ok=True)
+    with open(os.path.join(fixtures_dir, f"{task}.jsonl"), "a", encoding="utf-8") as fh:
+        fh.write(json.dumps({"text": text}, ensure_ascii=False) + "\n")
+
+
+def detect_task(prompt: str) -> str:
+    for task, marker in _TASK_MARKERS:
+        if marker in prompt:
+            return task
+    method = current_method.get()
+    return method if method in _SYNTHESIZERS else "text"
+
+
+# ==================== SYNTHESIS ====================
+def _sentence(rng: random.Random, n: int = 12) -> str:
+    words = [rng.choice(_WORDS) for _ in range(n)]
+    return (" ".join(words)).capitalize() + "."
+
+
+def _list(rng: random.Random, k: int, n: int = 6) -> List[str]:
+    return [_sentence(rng, n).rstrip(".") for _ in range(k)]
+
+
+def _career(rng: random.Random, i: int) -> Dict[str, Any]:
+    return {
+        "title": f"{rng.choice(['Data', 'Platform', 'Product', 'ML', 'Backend'])} "
+                 f"{rng.choice(['Engineer', 'Analyst', 'Specialist', 'Lead'])} {i}",
+        "match_score": rng.randint(55, 96),
+        "salary_range": f"₹{rng.randint(6, 18)}L - ₹{rng.randint(19, 40)}L per annum",
+        "reason": _sentence(rng, 20),
+        "skill_gap_analysis": {w.title(): rng.randint(20, 95) for w in rng.sample(_WORDS, 5)},
+        "next_steps": _list(rng, 3),
+        "learning_path": _list(rng, 3, 4),
+        "interview_tips": _list(rng, 3),
+        "job_search_keywords": " ".join(rng.sample(_WORDS, 4)),
+        "top_companies": rng.sample(["Google", "Microsoft", "Amazon", "Flipkart", "Zoho",
+                                     "Infosys", "TCS", "Razorpay", "Swiggy"], 3),
+        "certifications": _list(rng, 2, 3),
+    }
+
+
+def _synth_career(prompt: str, rng: random.Random) -> Any:
+    return {
+        "profile_summary": _sentence(rng, 24),
+        "current_skills": [w.title() for w in rng.sample(_WORDS, 8)],
+        "careers": [_career(rng, i) for i in range(1, rng.randint(6, 8) + 1)],
+    }
+
+
+def _synth_resume(prompt: str, rng: random.Random) -> Any:
+    return {
+        "ats_score": rng.randint(70, 96),
+        "ats_tips": _list(rng, 3),
+        "keywords_found": rng.sample(_WORDS, 5),
+        "keywords_missing": rng.sample(_WORDS, 3),
+        "resume": {
+            "contact": {"name": "Test Candidate", "email": "test@example.com",
+                        "phone": "+91-9000000000", "linkedin": "linkedin.com/in/test",
+                        "location": "Bengaluru, KA"},
+            "summary": _sentence(rng, 30),
+            "experience": [{"title": "Software Engineer", "company": f"Company {i}",
+                            "duration": f"Jan 20{18 + i} – Present", "bullets": _list(rng, 3, 14)}
+                           for i in range(rng.randint(1, 3))],
+            "skills": {"technical": rng.sample(_WORDS, 6), "soft": ["Leadership", "Communication"],
+                       "tools": rng.sample(_WORDS, 3)},
+            "education": [{"degree": "B.Tech Computer Science", "institution": "Test University",
+                           "year": "2020", "gpa": "8.5/10"}],
+            "certifications": _list(rng, 2, 3),
+            "projects": [{"name": f"Project {i}", "description": _sentence(rng, 16), "link": ""}
+                         for i in range(2)],
+        },
+    }
+
+
+def _synth_questions(prompt: str, rng: random.Random) -> Any:
+    cats = ["Behavioral", "Behavioral", "Technical", "Technical", "Problem Solving",
+            "Situational", "Culture Fit", "Role-specific Scenario"]
+    return [{
+        "id": i + 1, "category": cat, "question": _sentence(rng, 18).rstrip(".") + "?",
+        "difficulty": rng.choice(["Easy", "Medium", "Hard"]),
+        "companies": rng.sample(["Flipkart", "Zoho", "TCS", "Infosys", "Razorpay"], 2),
+        "hint": _sentence(rng, 8), "ideal_answer_points": _list(rng, 3, 5),
+        "follow_ups": [_sentence(rng, 10).rstrip(".") + "?"],
+    } for i, cat in enumerate(cats)]
+
+
+def _synth_evaluation(prompt: str, rng: random.Random) -> Any:
+    score = rng.randint(40, 95)
+    verdict = ("Excellent" if score >= 90 else "Good" if score >= 75
+               else "Average" if score >= 60 else "Needs Work")
+    return {
+        "score": score, "verdict": verdict, "one_line_reaction": _sentence(rng, 10),
+        "what_you_did_well": _list(rng, 2), "what_went_wrong": _list(rng, 2),
+        "how_to_improve": _list(rng, 2), "sample_better_answer": _sentence(rng, 40),
+        "keywords_used": rng.sample(_WORDS, 2), "keywords_missed": rng.sample(_WORDS, 2),
+        "crack_this_question": rng.choice(["Very Likely", "Likely", "Borderline", "Unlikely"]),
+        "crack_message": _sentence(rng, 14),
+    }
+
+
+def _synth_verdict(prompt: str, rng: random.Random) -> Any:
+    return {
+        "overall_score": rng.randint(45, 92), "grade": rng.choice(["A", "B+", "B", "C+"]),
+        "headline": _sentence(rng, 10),
+        "can_crack_company": rng.choice(["Yes, apply now!", "Almost there", "Borderline",
+                                         "Not yet — keep practising"]),
+        "crack_verdict_message": _sentence(rng, 30), "top_strengths": _list(rng, 3),
+        "top_weaknesses": _list(rng, 3), "priority_action_plan": _list(rng, 3),
+        "ready_to_apply": rng.random() < 0.5, "estimated_weeks_to_ready": rng.randint(1, 12),
+        "motivational_close": _sentence(rng, 16),
+    }
+
+
+def _synth_resources(prompt: str, rng: random.Random) -> Any:
+    return {
+        "company": "Company", "role": "Role", "overall_confidence": rng.choice(["High", "Medium"]),
+        "summary": _sentence(rng, 24), "exam_pattern": _sentence(rng, 20),
+        "resources": [{"name": f"Resource {i}", "url": f"https://example.com/pyq/{i}",
+                       "description": _sentence(rng, 14), "content_type": "PYQs",
+                       "authenticity": "Verify Before Use"} for i in range(rng.randint(3, 6))],
+        "preparation_tips": _list(rng, 3),
+    }
+
+
+def _synth_pyq(prompt: str, rng: random.Random) -> Any:
+    m = re.search(r"Total Questions:\s*(\d+)", prompt)
+    count = int(m.group(1)) if m else 15
+    sections, per = [], max(1, count // 3)
+    for s in range(3):
+        qs = []
+        for _ in range(per):
+            options = [f"{letter}) {_sentence(rng, 3).rstrip('.')}" for letter in "ABCD"]
+            qs.append({"question": _sentence(rng, 20).rstrip(".") + "?", "code": "",
+                       "options": options, "answer": rng.choice(options),
+                       "explanation": _sentence(rng, 30)})
+        sections.append({"section": f"Section {s + 1}", "questions": qs})
+    return sections
+
+
+def _synth_chat(prompt: str, rng: random.Random) -> str:
+    tail = prompt.rsplit("=== YOUR NEXT RESPONSE ===", 1)[0][-400:].lower()
+    if any(t in tail for t in ("wrap up", "that's all", "no more questions")):
+        return ("Alright — interview over. Let me take off the interviewer hat. 🎓\n\n"
+                f"📋 **OVERALL IMPRESSION**\n{_sentence(rng, 24)}\n\n"
+                f"⭐ **SCORE: {rng.randint(4, 9)}/10**\n\n"
+                "✅ **STRENGTHS**\n" + "\n".join(f"• {x}" for x in _list(rng, 3)) + "\n\n"
+                "⚠️ **AREAS TO IMPROVE**\n" + "\n".join(f"• {x}" for x in _list(rng, 3)) + "\n\n"
+                f"🎯 **VERDICT**\nWould advance to next round? **Maybe**\n{_sentence(rng, 18)}")
+    if "[CANDIDATE]" not in prompt:
+        return ("Hi, I'm Alex Morgan from TechRecruit AI, a Series B startup. "
+                "Thanks for joining today. Tell me about yourself.")
+    return f"{_sentence(rng, 8)} {_sentence(rng, 14).rstrip('.')}?"
+
+
+def _synth_summary(prompt: str, rng: random.Random) -> str:
+    return "\n".join(f"- {x}" for x in _list(rng, 5, 10))
+
+
+_SYNTHESIZERS = {
+    "get_career_advice":            _synth_career,
+    "build_ats_resume":             _synth_resume,
+    "generate_interview_questions": _synth_questions,
+    "evaluate_interview_answer":    _synth_evaluation,
+    "generate_final_verdict":       _synth_verdict,
+    "find_pyq_resources":           _synth_resources,
+    "generate_pyq_questions":       _synth_pyq,
+    "chat_interview_turn":          _synth_chat,
+    "summarize_interview_context":  _synth_summary,
+}
+
+
+def synthesize(task: str, prompt: str, rng: random.Random) -> str:
+    fn = _SYNTHESIZERS.get(task)
+    if fn is None:
+        return _sentence(rng, 40)
+    out = fn(prompt, rng)
+    return out if isinstance(out, str) else json.dumps(out, ensure_ascii=False)
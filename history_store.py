@@ -0,0 +1,208 @@
+"""
+history_store.py — JobLess AI History Store
+===========================================
+Career-analysis history on SQLite, shared by every session on the node.
+
+Records are keyed by an anonymous user id (the app keeps it in the page
+URL, so a bookmarked link brings the history back). Each row keeps the
+analysis JSON plus indexed columns for listing without decoding it:
+
+  - created / top_score            → (uid, created) and (uid, top_score) indexes
+  - titles / skills / summary      → FTS5 (porter) for search, or LIKE
+                                     matching where SQLite lacks FTS5
+  - retention                      → rows older than ``retention_days`` and
+                                     anything past ``max_per_user`` per id are
+                                     pruned on write
+
+The résumé text itself is never written — only the analysis derived from
+it. The database is opened on first use and runs in WAL mode; if the file
+can't be opened (read-only host, …) the store falls back to an in-memory
+database for this process. Nothing in this module imports streamlit.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from pyq_store import fts_query
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS history ("
+    " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+    " uid TEXT NOT NULL, created REAL NOT NULL, top_score INTEGER NOT NULL,"
+    " titles TEXT NOT NULL, skills TEXT NOT NULL, stage TEXT NOT NULL,"
+    " summary TEXT NOT NULL, analysis TEXT NOT NULL, context TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS history_uid_created ON history (uid, created DESC)",
+    "CREATE INDEX IF NOT EXISTS history_uid_score ON history (uid, top_score DESC)",
+)
+_FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5("
+    " summary, titles, skills, content='history', content_rowid='id',"
+    " tokenize='porter unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS history_ai AFTER INSERT ON history BEGIN"
+    " INSERT INTO history_fts (rowid, summary, titles, skills)"
+    " VALUES (new.id, new.summary, new.titles, new.skills); END",
+    "CREATE TRIGGER IF NOT EXISTS history_ad AFTER DELETE ON history BEGIN"
+    " INSERT INTO history_fts (history_fts, rowid, summary, titles, skills)"
+    " VALUES ('delete', old.id, old.summary, old.titles, old.skills); END",
+)
+
+# Listing columns — everything but the analysis / context JSON
+_ROW_COLUMNS = "id, created, top_score, titles, skills, stage, summary"
+SORTS = {"newest": "created DESC", "oldest": "created ASC", "top_match": "top_score DESC, created DESC"}
+
+
+def _score(value: Any) -> int:
+    # LLM output: 85, "85", "85%", "~85 / 100", None, …
+    m = re.search(r"\d+(?:\.\d+)?", str(value if value is not None else ""))
+    return max(0, min(100, int(float(m.group())))) if m else 0
+
+
+def _texts(values: Any) -> List[str]:
+    if isinstance(values, str):
+        values = [values]
+    if not isinstance(values, (list, tuple)):
+        return []
+    return [str(v) for v in values if v is not None and str(v).strip()]
+
+
+def _like_terms(text: str) -> List[str]:
+    return ["%" + re.sub(r"([\\%_])", r"\\\1", w) + "%" for w in re.findall(r"\w+", text)]
+
+
+class HistoryStore:
+    def __init__(self, db_path: str = ":memory:", retention_days: float = 30.0,
+                 max_per_user: int = 200):
+        self.retention_days = retention_days
+        self.max_per_user = max_per_user
+        self._lock = threading.Lock()
+        self.db_path = db_path
+        self.fts = False
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        # Caller holds self._lock. Opening also decides self.fts.
+        if self._conn is None:
+            try:
+                self._conn = self._open(self.db_path)
+            except sqlite3.Error:
+                self.db_path = ":memory:"
+                self._conn = self._open(":memory:")
+        return self._conn
+
+    def _open(self, path: str) -> sqlite3.Connection:
+        db = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            for stmt in _SCHEMA:
+                db.execute(stmt)
+            try:
+                for stmt in _FTS_SCHEMA:
+                    db.execute(stmt)
+                self.fts = True
+            except sqlite3.OperationalError:
+                # SQLite built without FTS5: search falls back to LIKE
+                db.rollback()
+                self.fts = False
+            db.commit()
+        except sqlite3.Error:
+            db.close()
+            raise
+        return db
+
+    # ── Writes ────────────────────────────────────────────────────────────
+    def add(self, uid: str, analysis: Dict, context: Dict) -> int:
+        """Store one analysis. Loosely shaped model output is coerced, not rejected."""
+        careers = [c for c in analysis.get("careers") or [] if isinstance(c, dict)]
+        row = (
+            uid, time.time(),
+            max((_score(c.get("match_score")) for c in careers), default=0),
+            " · ".join(_texts([c.get("title") for c in careers])),
+            ", ".join(_texts(analysis.get("current_skills"))),
+            str(context.get("career_stage") or ""),
+            str(analysis.get("profile_summary") or "Analysis"),
+            json.dumps(analysis, ensure_ascii=False, default=str),
+            json.dumps(context, ensure_ascii=False, default=str),
+        )
+        with self._lock:
+            cur = self._db.execute(
+                "INSERT INTO history (uid, created, top_score, titles, skills, stage,"
+                " summary, analysis, context) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+            self._prune(uid)
+            self._db.commit()
+            return cur.lastrowid
+
+    def _prune(self, uid: str):
+        # Caller holds self._lock
+        self._db.execute("DELETE FROM history WHERE created < ?",
+                         (time.time() - self.retention_days * 86400,))
+        self._db.execute(
+            "DELETE FROM history WHERE uid = ? AND id NOT IN ("
+            " SELECT id FROM history WHERE uid = ? ORDER BY created DESC LIMIT ?)",
+            (uid, uid, self.max_per_user))
+
+    def delete(self, uid: str, record_id: Optional[int] = None) -> int:
+        """Delete one record, or every record of `uid` when no id is given."""
+        sql, args = "DELETE FROM history WHERE uid = ?", [uid]
+        if record_id is not None:
+            sql += " AND id = ?"
+            args.append(record_id)
+        with self._lock:
+            n = self._db.execute(sql, args).rowcount
+            self._db.commit()
+        return n
+
+    # ── Reads ─────────────────────────────────────────────────────────────
+    def _where(self, uid: str, query: str) -> Tuple[str, List[Any]]:
+        # Caller holds self._lock
+        if self._db is not None and self.fts:
+            match = fts_query(query or "")
+            if not match:
+                return "uid = ?", [uid]
+            return ("uid = ? AND id IN (SELECT rowid FROM history_fts WHERE history_fts MATCH ?)",
+                    [uid, match])
+        terms = _like_terms(query or "")
+        clause = " AND (summary || ' ' || titles || ' ' || skills) LIKE ? ESCAPE '\\'"
+        return "uid = ?" + clause * len(terms), [uid] + terms
+
+    def count(self, uid: str, query: str = "") -> int:
+        with self._lock:
+            where, args = self._where(uid, query)
+            return self._db.execute(f"SELECT COUNT(*) FROM history WHERE {where}", args).fetchone()[0]
+
+    def page(self, uid: str, offset: int = 0, limit: int = 10, query: str = "",
+             sort: str = "newest") -> List[Dict]:
+        """One page of listing rows (no analysis JSON) for `uid`, optionally searched."""
+        with self._lock:
+            where, args = self._where(uid, query)
+            sql = (f"SELECT {_ROW_COLUMNS} FROM history WHERE {where}"
+                   f" ORDER BY {SORTS.get(sort, SORTS['newest'])} LIMIT ? OFFSET ?")
+            rows = self._db.execute(sql, args + [limit, offset]).fetchall()
+        keys = [c.strip() for c in _ROW_COLUMNS.split(",")]
+        return [dict(zip(keys, r)) for r in rows]
+
+    def get(self, uid: str, record_id: int) -> Optional[Dict]:
+        """Full record with its decoded analysis and context."""
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {_ROW_COLUMNS}, analysis, context FROM history"
+                " WHERE uid = ? AND id = ?", (uid, record_id)).fetchone()
+        if row is None:
+            return None
+        keys = [c.strip() for c in _ROW_COLUMNS.split(",")]
+        record = dict(zip(keys, row[:-2]))
+        record["analysis"] = json.loads(row[-2])
+        record["context"] = json.loads(row[-1])
+        return record
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows, users = self._db.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT uid) FROM history").fetchone()
+        return {"path": self.db_path, "fts": self.fts, "records": rows, "users": users,
+                "retention_days": self.retention_days, "max_per_user": self.max_per_user}
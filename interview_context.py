@@ -0,0 +1,146 @@
+"""
+interview_context.py — JobLess AI Interview Context Layer
+=========================================================
+Keeps the conversational-interview prompt a flat size however long the
+interview runs.
+
+  - The last RECENT_TURNS messages are sent verbatim.
+  - Older messages are folded, FOLD_BATCH at a time, into a running summary
+    that lives in the caller's state dict (st.session_state in the app), so
+    each message is summarised once rather than re-sent every turn.
+  - Anything older than the recent window that has not been folded yet is
+    sent as a clipped extract, and the whole history is held to a per-model
+    token budget.
+
+Nothing in this module imports streamlit; the LLM call that produces the
+summary is made by the caller (AIHandler).
+"""
+
+import threading
+from typing import Dict, List, Tuple
+
+RECENT_TURNS = 6
+FOLD_BATCH = 4
+EXTRACT_CHARS = 220
+
+# History budget (tokens) when the model's window is not the constraint.
+# Latency tracks prompt size, so this — not the context window — is what
+# keeps turn 15 as fast as turn 2.
+DEFAULT_HISTORY_BUDGET = 1800
+
+# Context windows (tokens) of the models offered in PROVIDER_MODELS
+MODEL_CONTEXT_TOKENS: Dict[str, int] = {
+    "llama3-8b-8192":          8192,
+    "llama3-70b-8192":         8192,
+    "gemma-7b-it":             8192,
+    "gemma2-9b-it":            8192,
+    "mixtral-8x7b-32768":      32768,
+    "llama-3.1-8b-instant":    131072,
+    "llama-3.3-70b-versatile": 131072,
+    "command":                 4096,
+    "command-light":           4096,
+    "command-r":               128000,
+    "command-r-plus":          128000,
+}
+_DEFAULT_CONTEXT = 32768
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (≈4 chars / token for English prose)."""
+    return len(text) // 4 + 1
+
+
+def history_budget(model_name: str, system_prompt: str, reply_tokens: int) -> int:
+    """Tokens left for history once the system prompt and the reply are reserved."""
+    window = MODEL_CONTEXT_TOKENS.get(model_name, _DEFAULT_CONTEXT)
+    room = window - estimate_tokens(system_prompt) - reply_tokens - 256
+    return max(300, min(DEFAULT_HISTORY_BUDGET, room))
+
+
+def new_state() -> Dict:
+    return {"summary": "", "upto": 0, "lock": threading.Lock(), "folding": False}
+
+
+def _speaker(msg: Dict) -> str:
+    return "INTERVIEWER" if msg["role"] == "assistant" else "CANDIDATE"
+
+
+def format_turns(messages: List[Dict], clip: int = 0) -> str:
+    parts = []
+    for msg in messages:
+        content = msg["content"]
+        if clip and len(content) > clip:
+            content = content[:clip].rstrip() + " …"
+        parts.append(f"[{_speaker(msg)}]: {content}")
+    return "\n\n".join(parts)
+
+
+def split_history(messages: List[Dict], state: Dict) -> Tuple[List[Dict], List[Dict]]:
+    """(older messages not yet in the summary, recent verbatim window)."""
+    cut = max(0, len(messages) - RECENT_TURNS)
+    upto = min(state.get("upto", 0), cut)
+    return messages[upto:cut], messages[cut:]
+
+
+def fold_due(messages: List[Dict], state: Dict) -> List[Dict]:
+    """Messages to fold into the summary now, or [] if the batch isn't full yet."""
+    pending, _ = split_history(messages, state)
+    if state.get("folding") or len(pending) < FOLD_BATCH:
+        return []
+    return pending
+
+
+def summary_prompt(summary: str, turns: List[Dict], role: str, level: str) -> str:
+    return f"""You keep running notes on a mock interview for a {level} {role} candidate.
+
+Existing notes:
+{summary or "(none yet)"}
+
+New exchanges to fold in:
+{format_turns(turns)}
+
+Rewrite the notes to include the new exchanges. Keep: every question asked, the gist of each answer with any concrete details (numbers, tools, examples), and strengths / weak spots you noticed. Max 180 words, plain bullet points, no preamble."""
+
+
+def apply_fold(state: Dict, summary: str, upto: int):
+    with state["lock"]:
+        if upto > state.get("upto", 0) and summary.strip():
+            state["summary"] = summary.strip()
+            state["upto"] = upto
+        state["folding"] = False
+
+
+def build_history(messages: List[Dict], state: Dict, budget_tokens: int) -> str:
+    """
+    History block for the next turn: summary + clipped unfolded turns +
+    recent verbatim turns, shrunk until it fits `budget_tokens`.
+    """
+    with state["lock"]:
+        summary = state.get("summary", "")
+        pending, recent = split_history(messages, state)
+
+    def render(summary_text, pending_clip, recent_msgs):
+        blocks = []
+        if summary_text:
+            blocks.append(f"[EARLIER IN THIS INTERVIEW — NOTES]\n{summary_text}")
+        if pending:
+            blocks.append(format_turns(pending, clip=pending_clip))
+        if recent_msgs:
+            blocks.append(format_turns(recent_msgs))
+        return "\n\n".join(blocks)
+
+    text = render(summary, EXTRACT_CHARS, recent)
+    # Shrink in order of least value: older extracts, then the oldest recent
+    # turns (never below the last exchange), then the notes themselves.
+    clip = EXTRACT_CHARS
+    while estimate_tokens(text) > budget_tokens and pending and clip > 60:
+        clip //= 2
+        text = render(summary, clip, recent)
+    while estimate_tokens(text) > budget_tokens and len(recent) > 2:
+        recent = recent[1:]
+        text = render(summary, clip, recent)
+    if estimate_tokens(text) > budget_tokens and summary:
+        over = (estimate_tokens(text) - budget_tokens) * 4
+        summary = summary[:max(0, len(summary) - over)].rstrip() + " …"
+        text = render(summary, clip, recent)
+    return text
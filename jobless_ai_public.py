@@ -5,32 +5,47 @@ Refactored: each tab is its own render_tab_*() function.
 """
 
 import time
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 import io
-from reportlab.lib.enums import TA_CENTER as _TAC, TA_LEFT as _TAL
-from reportlab.platypus import (
-    SimpleDocTemplate as _SDT, Paragraph as _Para, Spacer as _Spacer,
-    Table as _Table, TableStyle as _TStyle, PageBreak as _PB,
-    HRFlowable as _HR, KeepTogether as _KT
-)
-from reportlab.lib.units import cm as _cm, mm as _mm
-from reportlab.lib.styles import getSampleStyleSheet as _getSS, ParagraphStyle as _PS
-from reportlab.lib import colors as _rl_colors
-from reportlab.lib.pagesizes import A4 as _A4
-import io as _io
 import datetime
 import streamlit as st
 import streamlit.components.v1 as components
+from streamlit.errors import StreamlitAPIException
 import fitz  # PyMuPDF
 import json
-import pandas as pd
-import altair as alt
-import requests
-from streamlit_lottie import st_lottie
+import functools
+import hashlib
+import re
+import secrets
+import threading
+import contextvars
+import hmac
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 import os
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+
+from lazy_imports import LazyModule, available, stats as lazy_imports_stats
+from llm_runtime import (ClientPool, RateLimiter, ResponseCache, SingleFlight, StreamRace,
+                         call_with_retry, key_fingerprint, process_shared,
+                         response_cache_key)
+from json_stream import IncrementalJSONParser, fenced_body
+from telemetry import SIZE_BUCKETS, TELEMETRY, current_method, instrumented
+from model_router import TASK_TIERS, choose_model, model_health
+import interview_context
+import pyq_store
+import resume_segmenter
+import static_assets
+from pdf_service import PDFQueueFull, PDFRenderService
+from history_store import HistoryStore
+from fake_provider import FakeProvider, detect_task, record_fixture
+
+# Charts, the sidebar animation and PDF export load their libraries on first
+# use (see lazy_imports); ReportLab is imported inside the PDF builders.
+pd = LazyModule("pandas")
+alt = LazyModule("altair")
+st_lottie = LazyModule("streamlit_lottie", "st_lottie")
+pyq_pdf = LazyModule("pyq_pdf")  # ReportLab layout; only needed to build PYQ PDFs
 
 # ── Lucide Icon SVG Helper ─────────────────────────────────────────────────
 # Self-contained SVG strings for every icon used in the UI.
@@ -53,15 +68,17 @@ _L = {
     "waveform":    '<path d="M2 13a2 2 0 0 0 2-2V7a2 2 0 0 1 4 0v13a2 2 0 0 0 4 0V4a2 2 0 0 1 4 0v13a2 2 0 0 0 4 0v-4a2 2 0 0 0-2-2"/>',
 }
 
-# Lucide path data as a JS object literal (single quotes in values, safe inside HTML script tags)
-_LUCIDE_JS = (
-    "{" +
-    ",".join(
-        '"' + k + '":"' + v.replace('"', "'") + '"'
-        for k, v in _L.items()
-    ) +
-    "}"
-)
+@functools.lru_cache(maxsize=None)
+def _lucide_js() -> str:
+    """Lucide path data as a JS object literal (single quotes in values, safe inside HTML script tags)."""
+    return (
+        "{" +
+        ",".join(
+            '"' + k + '":"' + v.replace('"', "'") + '"'
+            for k, v in _L.items()
+        ) +
+        "}"
+    )
 
 
 def _svg(key, size=20, color="currentColor"):
@@ -98,635 +115,58 @@ def render_spline_scene(scene_url: str, title: str = "Interactive 3D", descripti
         Height of the component in pixels
     """
 
-    html_template = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-      <meta charset="UTF-8">
-      <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0">
-      <link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;600;700&family=Inter:wght@400;500&display=swap" rel="stylesheet">
-      <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        html, body {{ background: #0A0A0A !important; overflow: hidden; cursor: none !important; }}
-        canvas {{ cursor: none !important; }}
-
-        .wrapper {{
-          width: 100%;
-          height: {height}px;
-          background: #0A0A0A;
-          position: relative;
-          overflow: hidden;
-          border-radius: 0;
-          display: flex;
-          border: none;
-          box-shadow: none;
-        }}
-
-        /* Ambient glow */
-        .glow-left {{
-          position: absolute;
-          width: 450px; height: 450px;
-          border-radius: 50%;
-          background: radial-gradient(circle, rgba(255,255,255,0.04) 0%, rgba(255,255,255,0.01) 40%, transparent 70%);
-          top: 50%; left: 20%;
-          transform: translate(-50%, -50%);
-          pointer-events: none;
-          z-index: 1;
-          animation: glowBreathe 5s ease-in-out infinite;
-        }}
-        .glow-right {{
-          position: absolute;
-          width: 550px; height: 550px;
-          border-radius: 50%;
-          background: radial-gradient(circle, rgba(255,255,255,0.03) 0%, rgba(255,255,255,0.01) 40%, transparent 70%);
-          top: 50%; right: -10%;
-          transform: translateY(-50%);
-          pointer-events: none;
-          z-index: 1;
-          animation: glowBreathe 7s ease-in-out infinite reverse;
-        }}
-        @keyframes glowBreathe {{
-          0%,100% {{ opacity: 0.7; transform: translate(-50%, -50%) scale(1); }}
-          50% {{ opacity: 1; transform: translate(-50%, -50%) scale(1.05); }}
-        }}
-
-        /* Left text panel */
-        .left-panel {{
-          flex: 0 0 48%;
-          padding: 20px 36px;
-          position: relative;
-          z-index: 10;
-          display: flex;
-          flex-direction: column;
-          justify-content: center;
-        }}
-        .label {{
-          font-family: 'Inter', sans-serif;
-          font-size: 0.7rem;
-          letter-spacing: 0.18em;
-          text-transform: uppercase;
-          color: rgba(255,255,255,0.4);
-          margin-bottom: 18px;
-          display: flex;
-          align-items: center;
-          gap: 8px;
-        }}
-        .label::before {{
-          content: '';
-          display: inline-block;
-          width: 6px; height: 6px;
-          border-radius: 50%;
-          background: #FFFFFF;
-          box-shadow: 0 0 8px rgba(255,255,255,0.6), 0 0 20px rgba(255,255,255,0.2);
-          animation: pulse 2s ease-in-out infinite;
-        }}
-        @keyframes pulse {{ 0%,100%{{opacity:1}} 50%{{opacity:0.4}} }}
-
-        .left-panel h1 {{
-          font-family: 'Space Grotesk', sans-serif;
-          font-size: 2.6rem;
-          font-weight: 700;
-          color: #ffffff;
-          line-height: 1.1;
-          letter-spacing: -0.02em;
-          margin-bottom: 16px;
-        }}
-
-        /* Gooey text morphing */
-        .gooey-container {{
-          position: relative;
-          height: 3.6rem;
-          margin-bottom: 44px;
-          filter: url(#gooey-threshold);
-        }}
-        .gooey-text {{
-          position: absolute;
-          left: 0;
-          top: 0;
-          display: inline-block;
-          font-family: 'Space Grotesk', sans-serif;
-          font-size: 2.6rem;
-          font-weight: 700;
-          color: #ffffff;
-          line-height: 1.1;
-          letter-spacing: -0.02em;
-          white-space: nowrap;
-          user-select: none;
-        }}
-        .left-panel p {{
-          color: #999999;
-          font-family: 'Inter', sans-serif;
-          font-size: 0.95rem;
-          line-height: 1.7;
-          max-width: 340px;
-          margin-bottom: 32px;
-        }}
-        .btn {{
-          display: {'inline-flex' if show_get_started else 'none'};
-          align-items: center;
-          gap: 8px;
-          padding: 13px 28px;
-          background: #FFFFFF;
-          color: #0A0A0A;
-          font-family: 'Inter', sans-serif;
-          font-size: 0.82rem;
-          font-weight: 700;
-          letter-spacing: 0.1em;
-          text-transform: uppercase;
-          border-radius: 50px;
-          border: none;
-          cursor: none;
-          box-shadow: 0 0 24px rgba(255,255,255,0.15), 0 4px 16px rgba(0,0,0,0.5);
-          transition: all 0.25s cubic-bezier(0.16,1,0.3,1);
-          width: fit-content;
-          position: relative;
-          overflow: hidden;
-        }}
-        .btn::before {{
-          content: '';
-          position: absolute;
-          inset: 0;
-          background: linear-gradient(135deg, rgba(255,255,255,0.2), transparent);
-          opacity: 0;
-          transition: opacity 0.2s;
-        }}
-        .btn:hover {{
-          box-shadow: 0 0 40px rgba(255,255,255,0.2), 0 4px 20px rgba(0,0,0,0.5);
-          transform: translateY(-2px);
-        }}
-        .btn:hover::before {{ opacity: 1; }}
-
-        /* Globe canvas panel */
-        .right-panel {{
-          flex: 1;
-          position: relative;
-          z-index: 5;
-          overflow: hidden;
-          background: transparent;
-        }}
-        #globe-canvas {{
-          width: 100%;
-          height: 100%;
-          display: block;
-        }}
-
-        /* Globe glow behind canvas */
-        .globe-glow {{
-          position: absolute;
-          top: 50%; left: 50%;
-          transform: translate(-50%, -50%);
-          width: 300px; height: 300px;
-          border-radius: 50%;
-          background: radial-gradient(circle, rgba(255,255,255,0.05) 0%, rgba(255,255,255,0.02) 40%, transparent 70%);
-          pointer-events: none;
-          z-index: 1;
-          animation: globeGlow 4s ease-in-out infinite;
-        }}
-        @keyframes globeGlow {{
-          0%,100% {{ opacity: 0.6; transform: translate(-50%, -50%) scale(1); }}
-          50% {{ opacity: 1; transform: translate(-50%, -50%) scale(1.1); }}
-        }}
-
-        /* ── MOBILE ── */
-        @media (max-width: 600px) {{
-          .wrapper {{ flex-direction: column !important; height: auto !important; }}
-          .left-panel {{ flex: 0 0 auto !important; width: 100% !important; padding: 16px 20px !important; order: 2 !important; }}
-          .left-panel h1 {{ font-size: 1.6rem !important; }}
-          .gooey-container {{ height: 2.4rem !important; margin-bottom: 12px !important; }}
-          .gooey-text {{ font-size: 1.6rem !important; }}
-          .left-panel p {{ font-size: 0.82rem !important; margin-bottom: 14px !important; }}
-          /* Globe on top, text below */
-          .right-panel {{ order: 1 !important; flex: 0 0 {'220px' if show_get_started else '160px'} !important; width: 100% !important; }}
-        }}
-        @media (min-width: 601px) and (max-width: 900px) {{
-          .left-panel {{ flex: 0 0 38%; padding: 16px 20px; }}
-          .left-panel h1 {{ font-size: 1.6rem; }}
-          .gooey-container {{ height: 2.6rem; margin-bottom: 30px; }}
-          .gooey-text {{ font-size: 1.6rem; }}
-        }}
-      </style>
-    </head>
-    <body>
-      <div class="wrapper">
-        <canvas id="shader-bg" style="position: absolute; inset: 0; width: 100%; height: 100%; z-index: -1;"></canvas>
-
-        <!-- Left content -->
-        <div class="left-panel">
-          <div class="label">AI-Powered Career Intelligence</div>
-          <svg style="position:absolute;width:0;height:0" aria-hidden="true">
-            <defs>
-              <filter id="gooey-threshold">
-                <feColorMatrix in="SourceGraphic" type="matrix" values="1 0 0 0 0  0 1 0 0 0  0 0 1 0 0  0 0 0 255 -140" />
-              </filter>
-            </defs>
-          </svg>
-          <div class="gooey-container">
-            <span class="gooey-text" id="gText1"></span>
-            <span class="gooey-text" id="gText2"></span>
-          </div>
-          <p>{description}</p>
-          <div class="btn" id="getStartedBtn">Get Started →</div>
-        </div>
-
-        <!-- Three.js Globe -->
-        <div class="right-panel">
-          <div class="globe-glow"></div>
-          <canvas id="globe-canvas"></canvas>
-        </div>
-      </div>
-
-      <!-- Three.js Globe -->
-      <script src="https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js"></script>
-      <script>
-      (function() {{
-        var canvas = document.getElementById('globe-canvas');
-        var scene = new THREE.Scene();
-        var camera = new THREE.PerspectiveCamera(45, canvas.clientWidth / canvas.clientHeight, 0.1, 1000);
-        camera.position.z = 4.5;
-
-        var renderer = new THREE.WebGLRenderer({{ canvas: canvas, alpha: true, antialias: true }});
-        renderer.setPixelRatio(Math.min(window.devicePixelRatio, 2));
-        renderer.setSize(canvas.clientWidth, canvas.clientHeight);
-        renderer.setClearColor(0x000000, 0);
-
-        // Globe group
-        var globeGroup = new THREE.Group();
-        scene.add(globeGroup);
-
-        // Wireframe sphere
-        var sphereGeo = new THREE.IcosahedronGeometry(1.5, 3);
-        var wireframe = new THREE.WireframeGeometry(sphereGeo);
-        var wireMat = new THREE.LineBasicMaterial({{ color: 0xFFFFFF, transparent: true, opacity: 0.15 }});
-        var wireLines = new THREE.LineSegments(wireframe, wireMat);
-        globeGroup.add(wireLines);
-
-        // Outer glow ring
-        var ringGeo = new THREE.RingGeometry(1.65, 1.68, 64);
-        var ringMat = new THREE.MeshBasicMaterial({{ color: 0xFFFFFF, transparent: true, opacity: 0.1, side: THREE.DoubleSide }});
-        var ring = new THREE.Mesh(ringGeo, ringMat);
-        ring.rotation.x = Math.PI * 0.5;
-        globeGroup.add(ring);
-
-        // Second ring tilted
-        var ring2 = ring.clone();
-        ring2.rotation.x = Math.PI * 0.3;
-        ring2.rotation.z = Math.PI * 0.25;
-        ring2.material = ringMat.clone();
-        ring2.material.opacity = 0.08;
-        globeGroup.add(ring2);
-
-        // Dot particles on globe surface
-        var dotCount = 120;
-        var dotGeo = new THREE.BufferGeometry();
-        var dotPositions = [];
-        for (var i = 0; i < dotCount; i++) {{
-          var phi = Math.acos(2 * Math.random() - 1);
-          var theta = 2 * Math.PI * Math.random();
-          var r = 1.52;
-          dotPositions.push(
-            r * Math.sin(phi) * Math.cos(theta),
-            r * Math.sin(phi) * Math.sin(theta),
-            r * Math.cos(phi)
-          );
-        }}
-        dotGeo.setAttribute('position', new THREE.Float32BufferAttribute(dotPositions, 3));
-        var dotMat = new THREE.PointsMaterial({{ color: 0xFFFFFF, size: 0.03, transparent: true, opacity: 0.4, sizeAttenuation: true }});
-        var dots = new THREE.Points(dotGeo, dotMat);
-        globeGroup.add(dots);
-
-        // Inner glow sphere
-        var innerGeo = new THREE.SphereGeometry(1.48, 32, 32);
-        var innerMat = new THREE.MeshBasicMaterial({{ color: 0xFFFFFF, transparent: true, opacity: 0.02, side: THREE.BackSide }});
-        var innerGlow = new THREE.Mesh(innerGeo, innerMat);
-        globeGroup.add(innerGlow);
-
-        // Tilt globe slightly
-        globeGroup.rotation.x = 0.3;
-        globeGroup.rotation.z = -0.1;
-
-        // Animation
-        function animate() {{
-          requestAnimationFrame(animate);
-          globeGroup.rotation.y += 0.002;
-          dots.rotation.y += 0.001;
-          ring.rotation.z += 0.0005;
-          ring2.rotation.z -= 0.0003;
-          renderer.render(scene, camera);
-        }}
-        animate();
-
-        // Resize
-        function onResize() {{
-          var w = canvas.parentElement.clientWidth;
-          var h = canvas.parentElement.clientHeight;
-          camera.aspect = w / h;
-          camera.updateProjectionMatrix();
-          renderer.setSize(w, h);
-        }}
-        window.addEventListener('resize', onResize);
-        setTimeout(onResize, 100);
-
-        // Get Started → navigate
-        var gsBtn = document.getElementById('getStartedBtn');
-        if (gsBtn) {{
-          gsBtn.addEventListener('click', function() {{
-            window.parent.postMessage({{ type: 'jl-nav', page: 'career' }}, '*');
-          }});
-        }}
-
-        // Relay mouse position to parent
-        document.addEventListener('mousemove', function(e) {{
-          var rect = window.frameElement ? window.frameElement.getBoundingClientRect() : {{left:0, top:0}};
-          window.parent.postMessage({{ type: 'ns-move', x: e.clientX + rect.left, y: e.clientY + rect.top }}, '*');
-        }}, {{passive: true}});
-      }})();
-      </script>
-
-      <!-- Gooey Text Morphing Animation -->
-      <script>
-      (function() {{
-        var texts = ["{title}", "Career Intel", "Your Future", "AI Powered"];
-        var morphTime = 1;
-        var cooldownTime = 0.25;
-        var textIndex = texts.length - 1;
-        var time = new Date();
-        var morph = 0;
-        var cooldown = cooldownTime;
-        var text1 = document.getElementById('gText1');
-        var text2 = document.getElementById('gText2');
-        if (!text1 || !text2) return;
-
-        text1.textContent = texts[textIndex % texts.length];
-        text2.textContent = texts[(textIndex + 1) % texts.length];
-
-        function setMorph(fraction) {{
-          text2.style.filter = 'blur(' + Math.min(8 / fraction - 8, 100) + 'px)';
-          text2.style.opacity = (Math.pow(fraction, 0.4) * 100) + '%';
-          var f2 = 1 - fraction;
-          text1.style.filter = 'blur(' + Math.min(8 / f2 - 8, 100) + 'px)';
-          text1.style.opacity = (Math.pow(f2, 0.4) * 100) + '%';
-        }}
-
-        function doCooldown() {{
-          morph = 0;
-          text2.style.filter = '';
-          text2.style.opacity = '100%';
-          text1.style.filter = '';
-          text1.style.opacity = '0%';
-        }}
-
-        function doMorph() {{
-          morph -= cooldown;
-          cooldown = 0;
-          var fraction = morph / morphTime;
-          if (fraction > 1) {{
-            cooldown = cooldownTime;
-            fraction = 1;
-          }}
-          setMorph(fraction);
-        }}
-
-        function animate() {{
-          requestAnimationFrame(animate);
-          var newTime = new Date();
-          var shouldIncrementIndex = cooldown > 0;
-          var dt = (newTime.getTime() - time.getTime()) / 1000;
-          time = newTime;
-          cooldown -= dt;
-          if (cooldown <= 0) {{
-            if (shouldIncrementIndex) {{
-              textIndex = (textIndex + 1) % texts.length;
-              text1.textContent = texts[textIndex % texts.length];
-              text2.textContent = texts[(textIndex + 1) % texts.length];
-            }}
-            doMorph();
-          }} else {{
-            doCooldown();
-          }}
-        }}
-        animate();
-      }})();
-      </script>
-
-      <!-- WebGL Shader Background Logic -->
-      <script>
-      (function() {{
-        const defaultShaderSource = `#version 300 es
-        precision highp float;
-        out vec4 O;
-        uniform vec2 resolution;
-        uniform float time;
-        #define FC gl_FragCoord.xy
-        #define T time
-        #define R resolution
-        #define MN min(R.x,R.y)
-        float rnd(vec2 p) {{ p=fract(p*vec2(12.9898,78.233)); p+=dot(p,p+34.56); return fract(p.x*p.y); }}
-        float noise(in vec2 p) {{ vec2 i=floor(p), f=fract(p), u=f*f*(3.-2.*f); float a=rnd(i), b=rnd(i+vec2(1,0)), c=rnd(i+vec2(0,1)), d=rnd(i+1.); return mix(mix(a,b,u.x),mix(c,d,u.x),u.y); }}
-        float fbm(vec2 p) {{ float t=.0, a=1.; mat2 m=mat2(1.,-.5,.2,1.2); for (int i=0; i<5; i++) {{ t+=a*noise(p); p*=2.*m; a*=.5; }} return t; }}
-        float clouds(vec2 p) {{ float d=1., t=.0; for (float i=.0; i<3.; i++) {{ float a=d*fbm(i*10.+p.x*.2+.2*(1.+i)*p.y+d+i*i+p); t=mix(t,d,a); d=a; p*=2./(i+1.); }} return t; }}
-        void main(void) {{
-            vec2 uv=(FC-.5*R)/MN,st=uv*vec2(2,1);
-            vec3 col=vec3(0);
-            float bg=clouds(vec2(st.x+T*.5,-st.y));
-            uv*=1.-.3*(sin(T*.2)*.5+.5);
-            for (float i=1.; i<12.; i++) {{
-                uv+=.1*cos(i*vec2(.1+.01*i, .8)+i*i+T*.5+.1*uv.x);
-                vec2 p=uv;
-                float d=length(p);
-                col+=.00125/d*(cos(sin(i)*vec3(0.5,0.5,0.5))+1.);
-                float b=noise(i+p+bg*1.731);
-                col+=.002*b/length(max(p,vec2(b*p.x*.02,p.y)));
-                col=mix(col,vec3(bg*.08,bg*.08,bg*.08),d);
-            }}
-            O=vec4(col,1);
-        }}`; 
-
-        class WebGLRenderer {{
-            constructor(canvas, scale) {{
-                this.canvas = canvas;
-                this.scale = scale;
-                this.gl = canvas.getContext('webgl2');
-                this.gl.viewport(0, 0, canvas.width * scale, canvas.height * scale);
-                this.shaderSource = defaultShaderSource;
-                this.vertexSrc = `#version 300 es\\nprecision highp float;\\nin vec4 position;\\nvoid main(){{gl_Position=position;}}`;
-                this.vertices = [-1, 1, -1, -1, 1, 1, 1, -1];
-                this.mouseMove = [0, 0];
-                this.mouseCoords = [0, 0];
-                this.pointerCoords = [0, 0];
-                this.nbrOfPointers = 0;
-            }}
-            updateShader(source) {{ this.reset(); this.shaderSource = source; this.setup(); this.init(); }}
-            updateMove(deltas) {{ this.mouseMove = deltas; }}
-            updateMouse(coords) {{ this.mouseCoords = coords; }}
-            updatePointerCoords(coords) {{ this.pointerCoords = coords; }}
-            updatePointerCount(nbr) {{ this.nbrOfPointers = nbr; }}
-            updateScale(scale) {{ this.scale = scale; this.gl.viewport(0, 0, this.canvas.width * scale, this.canvas.height * scale); }}
-            compile(shader, source) {{
-                const gl = this.gl;
-                gl.shaderSource(shader, source);
-                gl.compileShader(shader);
-                if (!gl.getShaderParameter(shader, gl.COMPILE_STATUS)) console.error('Shader error:', gl.getShaderInfoLog(shader));
-            }}
-            test(source) {{
-                const gl = this.gl;
-                const shader = gl.createShader(gl.FRAGMENT_SHADER);
-                gl.shaderSource(shader, source);
-                gl.compileShader(shader);
-                let result = gl.getShaderParameter(shader, gl.COMPILE_STATUS) ? null : gl.getShaderInfoLog(shader);
-                gl.deleteShader(shader);
-                return result;
-            }}
-            reset() {{
-                const gl = this.gl;
-                if (this.program && !gl.getProgramParameter(this.program, gl.DELETE_STATUS)) {{
-                    if (this.vs) {{ gl.detachShader(this.program, this.vs); gl.deleteShader(this.vs); }}
-                    if (this.fs) {{ gl.detachShader(this.program, this.fs); gl.deleteShader(this.fs); }}
-                    gl.deleteProgram(this.program);
-                }}
-            }}
-            setup() {{
-                const gl = this.gl;
-                this.vs = gl.createShader(gl.VERTEX_SHADER);
-                this.fs = gl.createShader(gl.FRAGMENT_SHADER);
-                this.compile(this.vs, this.vertexSrc);
-                this.compile(this.fs, this.shaderSource);
-                this.program = gl.createProgram();
-                gl.attachShader(this.program, this.vs);
-                gl.attachShader(this.program, this.fs);
-                gl.linkProgram(this.program);
-            }}
-            init() {{
-                const gl = this.gl;
-                const program = this.program;
-                this.buffer = gl.createBuffer();
-                gl.bindBuffer(gl.ARRAY_BUFFER, this.buffer);
-                gl.bufferData(gl.ARRAY_BUFFER, new Float32Array(this.vertices), gl.STATIC_DRAW);
-                const position = gl.getAttribLocation(program, 'position');
-                gl.enableVertexAttribArray(position);
-                gl.vertexAttribPointer(position, 2, gl.FLOAT, false, 0, 0);
-                program.resolution = gl.getUniformLocation(program, 'resolution');
-                program.time = gl.getUniformLocation(program, 'time');
-                program.move = gl.getUniformLocation(program, 'move');
-                program.touch = gl.getUniformLocation(program, 'touch');
-                program.pointerCount = gl.getUniformLocation(program, 'pointerCount');
-                program.pointers = gl.getUniformLocation(program, 'pointers');
-            }}
-            render(now = 0) {{
-                const gl = this.gl;
-                const program = this.program;
-                if (!program) return;
-                gl.clearColor(0, 0, 0, 1);
-                gl.clear(gl.COLOR_BUFFER_BIT);
-                gl.useProgram(program);
-                gl.bindBuffer(gl.ARRAY_BUFFER, this.buffer);
-                gl.uniform2f(program.resolution, this.canvas.width, this.canvas.height);
-                gl.uniform1f(program.time, now * 1e-3);
-                gl.uniform2f(program.move, ...this.mouseMove);
-                gl.uniform2f(program.touch, ...this.mouseCoords);
-                gl.uniform1i(program.pointerCount, this.nbrOfPointers);
-                gl.uniform2fv(program.pointers, this.pointerCoords);
-                gl.drawArrays(gl.TRIANGLE_STRIP, 0, 4);
-            }}
-        }}
-
-        class PointerHandler {{
-            constructor(element, scale) {{
-                this.scale = scale;
-                this.active = false;
-                this.pointers = new Map();
-                this.lastCoords = [0, 0];
-                this.moves = [0, 0];
-                const map = (x, y) => [x * this.scale, element.height - y * this.scale];
-                element.addEventListener('pointerdown', e => {{ this.active = true; this.pointers.set(e.pointerId, map(e.clientX, e.clientY)); }});
-                element.addEventListener('pointerup', e => {{ if (this.count === 1) this.lastCoords = this.first; this.pointers.delete(e.pointerId); this.active = this.pointers.size > 0; }});
-                element.addEventListener('pointerleave', e => {{ if (this.count === 1) this.lastCoords = this.first; this.pointers.delete(e.pointerId); this.active = this.pointers.size > 0; }});
-                element.addEventListener('pointermove', e => {{ if (!this.active) return; this.lastCoords = [e.clientX, e.clientY]; this.pointers.set(e.pointerId, map(e.clientX, e.clientY)); this.moves = [this.moves[0] + e.movementX, this.moves[1] + e.movementY]; }});
-            }}
-            get count() {{ return this.pointers.size; }}
-            get move() {{ return this.moves; }}
-            get coords() {{ return this.pointers.size > 0 ? Array.from(this.pointers.values()).flat() : [0, 0]; }}
-            get first() {{ return this.pointers.values().next().value || this.lastCoords; }}
-        }}
-
-        const shaderCanvas = document.getElementById('shader-bg');
-        let animationFrameRef;
-        let shaderRenderer, pointers;
-
-        function resize() {{
-            const wrapper = document.querySelector('.wrapper');
-            const dpr = Math.max(1, 0.5 * window.devicePixelRatio);
-            shaderCanvas.width = wrapper.clientWidth * dpr;
-            shaderCanvas.height = wrapper.clientHeight * dpr;
-            if (shaderRenderer) shaderRenderer.updateScale(dpr);
-        }}
-
-        function loop(now) {{
-            shaderRenderer.updateMouse(pointers.first);
-            shaderRenderer.updatePointerCount(pointers.count);
-            shaderRenderer.updatePointerCoords(pointers.coords);
-            shaderRenderer.updateMove(pointers.move);
-            shaderRenderer.render(now);
-            animationFrameRef = requestAnimationFrame(loop);
-        }}
-
-        function init() {{
-            const dpr = Math.max(1, 0.5 * window.devicePixelRatio);
-            shaderRenderer = new WebGLRenderer(shaderCanvas, dpr);
-            pointers = new PointerHandler(shaderCanvas, dpr);
-            shaderRenderer.setup();
-            shaderRenderer.init();
-            resize();
-            if (shaderRenderer.test(defaultShaderSource) === null) {{
-                shaderRenderer.updateShader(defaultShaderSource);
-            }}
-            loop(0);
-            window.addEventListener('resize', resize);
-        }}
-
-        init();
-      }})();
-      </script>
-
-      <!-- Auto-resize iframe on mobile to fit stacked content -->
-      <script>
-      (function() {{
-        function fitIframe() {{
-          try {{
-            if (window.innerWidth <= 600 && window.frameElement) {{
-              var h = document.querySelector('.wrapper').scrollHeight;
-              if (h > 0) window.frameElement.style.height = (h + 8) + 'px';
-            }}
-          }} catch(e) {{}}
-        }}
-        setTimeout(fitIframe, 200);
-        window.addEventListener('resize', fitIframe);
-      }})();
-      </script>
-    </body>
-    </html>
-    """
+    html_template = (static_assets.read("spline_scene.html")
+                     .replace("__HEIGHT__", str(height))
+                     .replace("__CTA_DISPLAY__", "inline-flex" if show_get_started else "none")
+                     .replace("__SCENE_MOBILE_BASIS__", "220px" if show_get_started else "160px")
+                     .replace("__DESCRIPTION__", description)
+                     .replace("__TITLE__", title))
 
     components.html(html_template, height=height, scrolling=False)
 
 
-# ── Provider SDK imports (graceful fallback if not installed) ──────────────
-try:
-    import google.generativeai as genai
-    _GEMINI_OK = True
-except ImportError:
-    _GEMINI_OK = False
-
-try:
-    from groq import Groq as _GroqClient
-    _GROQ_OK = True
-except ImportError:
-    _GROQ_OK = False
-
-try:
-    import cohere as _cohere_sdk
-    _COHERE_OK = True
-except ImportError:
-    _COHERE_OK = False
+# ── Provider SDKs (graceful fallback if not installed) ─────────────────────
+# Only checked for here; each SDK is imported the first time a call needs it.
+_GEMINI_OK = available("google.generativeai")
+_GROQ_OK = available("groq")
+_COHERE_OK = available("cohere")
+genai = LazyModule("google.generativeai")
+_genai_client = LazyModule("google.generativeai.client")  # not re-exported by genai (0.3.x)
+_GroqClient = LazyModule("groq", "Groq")
+_cohere_sdk = LazyModule("cohere")
+_httpx = LazyModule("httpx") if available("httpx") else None  # shipped with groq / cohere
+
+# Offline "local" provider (JOBLESS_FAKE_PROVIDER=1) for CI / benchmarks; set
+# JOBLESS_RECORD_FIXTURES to a directory to capture real completions it can replay.
+_FAKE_PROVIDER = (process_shared("fake_provider", FakeProvider.from_env)
+                  if os.getenv("JOBLESS_FAKE_PROVIDER") else None)
+_FIXTURE_RECORD_DIR = os.getenv("JOBLESS_RECORD_FIXTURES") or None
+
+# ── Pooled provider clients (shared by every session in this process) ─────
+# Everything built via process_shared() survives script reruns (see llm_runtime).
+_CLIENT_POOL = process_shared("client_pool", lambda: ClientPool(max_size=64, idle_ttl=600.0))
+_HTTP_LIMITS = dict(max_connections=20, max_keepalive_connections=10,
+                    keepalive_expiry=60.0)
+# genai.configure() mutates module-global state; serialise it so two sessions
+# with different keys can't swap each other's default client mid-build.
+_GENAI_CONFIGURE_LOCK = process_shared("genai_configure_lock", threading.Lock)
+
+# ── Completion cache (set JOBLESS_LLM_CACHE_DB to add the SQLite tier) ────
+_RESPONSE_CACHE = process_shared("response_cache", lambda: ResponseCache(
+    max_entries=512, db_path=os.getenv("JOBLESS_LLM_CACHE_DB") or None))
+
+# Identical calls already in flight (same prompt key + same API key) wait on
+# the first one instead of each spending quota on the shared secrets keys.
+_SINGLE_FLIGHT = process_shared("single_flight", SingleFlight)
+
+# Per-method cache TTLs in seconds. Methods not listed here are never cached —
+# chat_interview_turn is conversational, and resume / career / evaluation
+# prompts carry personal data that is effectively unique per user anyway.
+_CACHE_TTLS: Dict[str, float] = {
+    "generate_interview_questions": 6 * 3600,
+    "find_pyq_resources":           24 * 3600,
+    "generate_pyq_questions":       6 * 3600,
+}
 
 # ── Static model catalogue ─────────────────────────────────────────────────
 PROVIDER_MODELS: Dict[str, List[str]] = {
@@ -766,504 +206,51 @@ PROVIDER_FREE_TIER: Dict[str, str] = {
     "Cohere  🆓":         "✅ Free trial key · No card needed · Generous limits",
 }
 
+# Client-side quotas per API key (internal provider names). Every session
+# using the same key — including the shared app key — draws from one bucket,
+# so bursts queue up to the quota instead of coming back as 429s.
+PROVIDER_RATE_LIMITS: Dict[str, Dict[str, Optional[int]]] = {
+    "gemini": {"per_minute": 15, "per_day": 1500},
+    "groq":   {"per_minute": 30, "per_day": 14400},
+    "cohere": {"per_minute": 20, "per_day": None},
+}
+
 PROVIDER_INTERNAL = {
     "Google Gemini  🆓":  "gemini",
     "Groq  🆓⚡":         "groq",
     "Cohere  🆓":         "cohere",
 }
 
-# ==================== ANIMATED HEADER ====================
-_HEADER_HTML = """<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>JobLess AI</title>
-<link href="https://fonts.googleapis.com/css2?family=Bebas+Neue&family=Inter:wght@300;400&display=swap" rel="stylesheet">
-<style>
-* { margin:0; padding:0; box-sizing:border-box; cursor: none !important; }
-
-/* FIX 1: overflow:hidden on body kills 3D transforms on iOS Safari.
-   Use overflow:clip instead — it clips visually without creating a
-   stacking context that flattens preserve-3d children.
-   Fallback: auto (allows scroll in very old browsers, not ideal but safe). */
-body {
-  background: #0A0A0A!important;
-  overflow: clip; /* modern browsers */
-  overflow: hidden; /* legacy fallback — overridden above in supporting browsers */
-  font-family: 'Inter', sans-serif;
-  padding: 0; margin: 0;
-}
-
-.stage {
-  position: relative; z-index: 1;
-  padding: 4px 0 6px 0;
-  display: flex; flex-direction: column; align-items: flex-start;
-}
-
-/* ── badge ── */
-.badge { display:flex; align-items:center; gap:9px; margin-bottom:16px; }
-.badge-pip {
-  width:6px; height:6px; border-radius:50%;
-  background:#FFFFFF;
-  box-shadow:0 0 0 0 rgba(255,255,255,0.4);
-  animation: pip 2.2s ease-out infinite;
-}
-@keyframes pip{0%{box-shadow:0 0 0 0 rgba(255,255,255,.4)}70%{box-shadow:0 0 0 9px rgba(255,255,255,0)}100%{box-shadow:0 0 0 0 rgba(255,255,255,0)}}
-.badge span { font-size:10px; letter-spacing:5px; text-transform:uppercase; color:rgba(255,255,255,0.3); font-weight:300; }
-.badge-div { width:1px; height:11px; background:rgba(255,255,255,0.12); }
-.badge-v { font-size:10px; letter-spacing:2px; color:rgba(255,255,255,0.18); font-weight:300; }
-
-/* ── title row ── */
-.title-row { display:flex; align-items:center; gap:24px; position:relative; }
-
-/* ══════════════════════════════════════════
-   GYROSCOPE
-   FIX 2: add -webkit-transform-style so iOS Safari
-   respects preserve-3d inside the clipped container.
-   FIX 3: isolate gyro in its own stacking context with
-   will-change:transform so iOS doesn't flatten rings.
-══════════════════════════════════════════ */
-.gyro-wrap {
-  width:90px; height:90px;
-  position:relative;
-  perspective:380px;
-  flex-shrink:0;
-  animation: bob 5s ease-in-out infinite;
-  will-change: transform;        /* GPU layer — prevents iOS flatten bug */
-  -webkit-perspective: 380px;
+# Max in-flight requests per provider across the whole process (every
+# session shares these slots), used by fan-out paths such as batch evaluation.
+PROVIDER_MAX_CONCURRENCY: Dict[str, int] = {
+    "gemini": 4,
+    "groq":   6,
+    "cohere": 4,
 }
-@keyframes bob{0%,100%{transform:translateY(0)}50%{transform:translateY(-9px)}}
+_PROVIDER_SLOTS = process_shared("provider_slots", lambda: {
+    p: threading.BoundedSemaphore(n) for p, n in PROVIDER_MAX_CONCURRENCY.items()})
+_RATE_LIMITER = process_shared("rate_limiter", lambda: RateLimiter(PROVIDER_RATE_LIMITS))
+
+# ── Multi-provider routing (opt-in: sidebar → Advanced Options) ─────────────
+# Failover moves on to the next configured provider / model when the current
+# one errors or shows no first token within the budget. Hedged calls (live
+# interview turns) use a much shorter budget, so a duplicate request is in
+# flight well before the primary would hit its tail latency.
+ROUTING_FIRST_TOKEN_BUDGET = 10.0
+ROUTING_HEDGE_DELAY = 1.5
+_ROUTER_POOL = process_shared("router_pool", lambda: ThreadPoolExecutor(
+    max_workers=32, thread_name_prefix="jl-route"))
+_PROVIDER_SDK_OK = {"gemini": _GEMINI_OK, "groq": _GROQ_OK, "cohere": _COHERE_OK}
+
+if _FAKE_PROVIDER is not None:
+    PROVIDER_MODELS["Local (offline)  🧪"] = ["fake-large", "fake-fast"]
+    PROVIDER_FREE_TIER["Local (offline)  🧪"] = "🧪 Synthetic responses · No key · No network"
+    PROVIDER_INTERNAL["Local (offline)  🧪"] = "local"
+    _PROVIDER_SDK_OK["local"] = True
 
-.gyro-body {
-  width:100%; height:100%;
-  transform-style: preserve-3d;
-  -webkit-transform-style: preserve-3d; /* FIX: iOS Safari */
-  position:relative;
-}
-.gr {
-  position:absolute; top:50%; left:50%;
-  border-radius:50%;
-  transform-style: preserve-3d;
-  -webkit-transform-style: preserve-3d;
-}
-.gr-a{ width:82px; height:82px; margin:-41px 0 0 -41px; }
-.gr-b{ width:82px; height:82px; margin:-41px 0 0 -41px; }
-.gr-c{ width:62px; height:62px; margin:-31px 0 0 -31px; }
-.gr-a { box-shadow:0 0 0 2px rgba(255,255,255,0.3),0 0 16px rgba(255,255,255,0.08),inset 0 0 16px rgba(255,255,255,0.02); animation:spinA 5.5s linear infinite; }
-.gr-b { box-shadow:0 0 0 1.5px rgba(255,255,255,0.15),0 0 10px rgba(255,255,255,0.05); transform:rotateX(90deg); -webkit-transform:rotateX(90deg); animation:spinB 7s linear infinite reverse; }
-.gr-c { box-shadow:0 0 0 1.5px rgba(255,255,255,0.1),0 0 8px rgba(255,255,255,0.03); transform:rotateX(55deg) rotateY(30deg); -webkit-transform:rotateX(55deg) rotateY(30deg); animation:spinC 9s linear infinite; }
-.gr-a::before { content:''; position:absolute; width:8px; height:8px; border-radius:50%; background:#fff; top:-4px; left:calc(50% - 4px); box-shadow:0 0 10px rgba(255,255,255,0.8),0 0 22px rgba(255,255,255,.5),0 0 40px rgba(255,255,255,.2); }
-.gr-b::before { content:''; position:absolute; width:5px; height:5px; border-radius:50%; background:rgba(255,255,255,0.6); bottom:-3px; left:calc(50% - 2.5px); box-shadow:0 0 8px rgba(255,255,255,0.5); }
-@keyframes spinA{to{transform:rotateY(360deg)}}
-@keyframes spinB{to{transform:rotateX(90deg) rotateZ(360deg)}}
-@keyframes spinC{to{transform:rotateX(55deg) rotateY(30deg) rotateZ(360deg)}}
-.g-sphere {
-  position:absolute; top:50%; left:50%;
-  transform:translate(-50%,-50%);
-  width:26px; height:26px; border-radius:50%;
-  background:radial-gradient(circle at 35% 28%,#ffffff 0%,#cccccc 15%,#999999 35%,#666666 65%,#333333 100%);
-  box-shadow:0 0 18px rgba(255,255,255,.4),0 0 40px rgba(255,255,255,.15),0 0 80px rgba(255,255,255,.06);
-  z-index:10;
-  animation:sbreathe 3s ease-in-out infinite;
-}
-.g-sphere::after { content:''; position:absolute; top:16%; left:20%; width:32%; height:16%; background:rgba(255,255,255,0.6); border-radius:50%; filter:blur(1px); transform:rotate(-28deg); }
-@keyframes sbreathe{
-  0%,100%{box-shadow:0 0 18px rgba(255,255,255,.4),0 0 40px rgba(255,255,255,.15),0 0 80px rgba(255,255,255,.06)}
-  50%{box-shadow:0 0 24px rgba(255,255,255,.6),0 0 60px rgba(255,255,255,.25),0 0 110px rgba(255,255,255,.1)}
-}
-.g-halo {
-  position:absolute; top:50%; left:50%;
-  transform:translate(-50%,-50%);
-  width:100px; height:100px; border-radius:50%;
-  border:1px solid rgba(255,255,255,0.06);
-  z-index:0;
-  animation:halospin 14s linear infinite reverse;
-}
-.g-halo::before { content:''; position:absolute; top:-2px; left:calc(50% - 2px); width:4px; height:4px; border-radius:50%; background:rgba(255,255,255,.4); box-shadow:0 0 6px rgba(255,255,255,.6); }
-@keyframes halospin{to{transform:translate(-50%,-50%) rotate(360deg)}}
-
-/* ── SVG title ── */
-.svg-title-wrap { position:relative; line-height:1; }
-#titleSvg { overflow:visible; display:block; max-width:100%; }
-#glitchCanvas { position:absolute; top:0; left:0; pointer-events:none; z-index:11; }
-
-/* ── subtitle ── */
-.sub {
-  margin-top:10px;
-  font-size:12px;
-  font-weight:300;
-  letter-spacing:1.3px;
-  color:rgba(255,255,255,0.28);
-  padding-left:2px;
-  opacity:0;
-  animation: fadeUp 0.7s ease forwards 1.4s;
-  /* Prevent text from forcing the iframe wider on small screens */
-  white-space: nowrap;
-  overflow: hidden;
-  text-overflow: ellipsis;
-  max-width: 100%;
-}
-
-/* ── entrance animations ── */
-.badge { opacity:0; animation: fadeUp 0.6s ease forwards 0.2s; }
-.title-row { opacity:0; animation: revealRow 1s cubic-bezier(0.16,1,0.3,1) forwards 0.55s; }
-@keyframes fadeUp { from{opacity:0;transform:translateY(14px)} to{opacity:1;transform:translateY(0)} }
-@keyframes revealRow { from{opacity:0;transform:translateY(24px) scale(0.96);filter:blur(8px)} to{opacity:1;transform:translateY(0) scale(1);filter:blur(0)} }
-.svg-title-wrap { animation: depthBreathe 5s ease-in-out infinite 2.2s; }
-@keyframes depthBreathe {
-  0%,100%{filter:drop-shadow(0 5px 22px rgba(255,255,255,0.08)) drop-shadow(0 2px 6px rgba(255,255,255,0.04))}
-  50%    {filter:drop-shadow(0 8px 42px rgba(255,255,255,0.18)) drop-shadow(0 3px 16px rgba(255,255,255,0.08))}
-}
-
-/* ══════════════════════════════════════════
-   FIX 7: RESPONSIVE — tablet (600-900px)
-══════════════════════════════════════════ */
-@media (max-width: 900px) {
-  .gyro-wrap { width:72px; height:72px; }
-  .gr-a { width:66px; height:66px; margin:-33px 0 0 -33px; }
-  .gr-b { width:66px; height:66px; margin:-33px 0 0 -33px; }
-  .gr-c { width:50px; height:50px; margin:-25px 0 0 -25px; }
-  .g-halo { width:82px; height:82px; }
-  .g-sphere { width:22px; height:22px; }
-  .title-row { gap:16px; }
-}
-
-/* ══════════════════════════════════════════
-   FIX 7 + 9: RESPONSIVE — mobile (<600px)
-   Shrink gyro, reduce gaps, tighten badge
-══════════════════════════════════════════ */
-@media (max-width: 600px) {
-  .gyro-wrap { width:56px; height:56px; -webkit-perspective:240px; perspective:240px; }
-  .gr-a { width:50px; height:50px; margin:-25px 0 0 -25px; }
-  .gr-b { width:50px; height:50px; margin:-25px 0 0 -25px; }
-  .gr-c { width:38px; height:38px; margin:-19px 0 0 -19px; }
-  .g-halo { width:64px; height:64px; }
-  .g-sphere { width:16px; height:16px; }
-  .title-row { gap:12px; }
-  .badge { margin-bottom:10px; }
-  .badge span { letter-spacing:3px; font-size:9px; }
-  .sub { font-size:10px; letter-spacing:0.7px; margin-top:7px; }
-}
-
-/* FIX 9: very small screens — hide gyro, let title breathe */
-@media (max-width: 360px) {
-  .gyro-wrap { display:none; }
-  .title-row { gap:0; }
-}
-
-/* ══════════════════════════════════════════
-   FIX 8: ACCESSIBILITY — prefers-reduced-motion
-   Disable all animations for users who request it.
-══════════════════════════════════════════ */
-@media (prefers-reduced-motion: reduce) {
-  *, *::before, *::after {
-    animation-duration: 0.01ms !important;
-    animation-iteration-count: 1 !important;
-    transition-duration: 0.01ms !important;
-  }
-  .badge, .title-row, .sub { opacity: 1 !important; transform: none !important; filter: none !important; }
-}
-</style>
-</head>
-<body>
-<script>
-(function(){
-  var fe = window.frameElement;
-  if(fe){ fe.style.cssText += 'border:none!important;outline:none!important;box-shadow:none!important;background:#0A0A0A!important;'; }
-})();
-</script>
-
-<script>
-(function() {
-  var s = document.createElement('style');
-  s.textContent = '* { cursor: none !important; }';
-  document.head.appendChild(s);
-  function fwd(e) {
-    try {
-      var fe = window.frameElement;
-      if (!fe) return;
-      var r = fe.getBoundingClientRect();
-      window.parent.document.dispatchEvent(new window.parent.MouseEvent(e.type, {
-        clientX: e.clientX + r.left, clientY: e.clientY + r.top,
-        bubbles: true, cancelable: false
-      }));
-    } catch(err) {}
-  }
-  ['mousemove','mouseover','mouseout','mousedown','mouseup'].forEach(function(ev) {
-    document.addEventListener(ev, fwd, { passive: true });
-  });
-})();
-</script>
-
-<div class="stage" id="stage">
-  <div class="badge">
-    <div class="badge-pip"></div>
-    <span>AI Career Intelligence</span>
-    <div class="badge-div"></div>
-    <span class="badge-v">v2.0 Pro</span>
-  </div>
-  <div class="title-row">
-    <div class="gyro-wrap">
-      <div class="g-halo"></div>
-      <div class="gyro-body">
-        <div class="gr gr-a"></div>
-        <div class="gr gr-b"></div>
-        <div class="gr gr-c"></div>
-      </div>
-      <div class="g-sphere"></div>
-    </div>
-    <div class="svg-title-wrap" id="titleWrap">
-      <canvas id="glitchCanvas"></canvas>
-      <svg id="titleSvg" xmlns="http://www.w3.org/2000/svg">
-        <defs>
-          <linearGradient id="faceGrad" x1="0" y1="0" x2="0" y2="1">
-            <stop offset="0%"   stop-color="#ffffff"/>
-            <stop offset="25%"  stop-color="#e0e0e0"/>
-            <stop offset="55%"  stop-color="#b0b0b0"/>
-            <stop offset="80%"  stop-color="#808080"/>
-            <stop offset="100%" stop-color="#505050"/>
-          </linearGradient>
-
-          <!--
-            FIX 4: fePointLight is expensive on mobile GPUs.
-            We define TWO filters:
-            - #lighting      → full animated fePointLight (desktop)
-            - #lightingSimple → static drop-shadow fallback (mobile)
-            JS selects which to apply based on device.
-          -->
-          <filter id="lighting" x="-5%" y="-5%" width="110%" height="120%" color-interpolation-filters="sRGB">
-            <feGaussianBlur in="SourceAlpha" stdDeviation="2" result="blur"/>
-            <feDiffuseLighting in="blur" result="diffuse" lighting-color="#ffffff" diffuseConstant="0.8" surfaceScale="4">
-              <fePointLight x="150" y="-60" z="180">
-                <animate attributeName="x" values="80;320;80" dur="8s" repeatCount="indefinite"/>
-                <animate attributeName="y" values="-60;-20;-60" dur="8s" repeatCount="indefinite"/>
-              </fePointLight>
-            </feDiffuseLighting>
-            <feSpecularLighting in="blur" result="specular" lighting-color="#ffffff" specularConstant="1.8" specularExponent="55" surfaceScale="4">
-              <fePointLight x="150" y="-60" z="180">
-                <animate attributeName="x" values="80;320;80" dur="8s" repeatCount="indefinite"/>
-                <animate attributeName="y" values="-60;-20;-60" dur="8s" repeatCount="indefinite"/>
-              </fePointLight>
-            </feSpecularLighting>
-            <feComposite in="diffuse"  in2="SourceAlpha" operator="in" result="diffOut"/>
-            <feComposite in="specular" in2="SourceAlpha" operator="in" result="specOut"/>
-            <feBlend in="SourceGraphic" in2="diffOut"  mode="multiply" result="step1"/>
-            <feBlend in="step1"         in2="specOut"  mode="screen"   result="step2"/>
-          </filter>
-
-          <!-- Mobile fallback: simple static directional lighting, no point light -->
-          <filter id="lightingSimple" x="-5%" y="-5%" width="110%" height="120%" color-interpolation-filters="sRGB">
-            <feGaussianBlur in="SourceAlpha" stdDeviation="1.5" result="blur"/>
-            <feDiffuseLighting in="blur" result="diffuse" lighting-color="#ffffff" diffuseConstant="0.7" surfaceScale="3">
-              <feDistantLight azimuth="225" elevation="60"/>
-            </feDiffuseLighting>
-            <feComposite in="diffuse" in2="SourceAlpha" operator="in" result="diffOut"/>
-            <feBlend in="SourceGraphic" in2="diffOut" mode="multiply"/>
-          </filter>
-
-          <linearGradient id="shimmerGrad" x1="0" y1="0" x2="1" y2="0" gradientUnits="objectBoundingBox">
-            <stop offset="0%"   stop-color="rgba(255,255,255,0)"/>
-            <stop offset="42%"  stop-color="rgba(255,255,255,0)"/>
-            <stop offset="50%"  stop-color="rgba(255,255,255,0.45)"/>
-            <stop offset="58%"  stop-color="rgba(255,255,255,0.25)"/>
-            <stop offset="70%"  stop-color="rgba(255,255,255,0)"/>
-            <stop offset="100%" stop-color="rgba(255,255,255,0)"/>
-            <animateTransform attributeName="gradientTransform" type="translate"
-              values="-1.6 0;0.6 0;0.6 0" keyTimes="0;0.5;1" dur="5s" repeatCount="indefinite"/>
-          </linearGradient>
-        </defs>
-        <g id="extrudeGroup"></g>
-        <text id="mainText"
-          font-family="'Space Grotesk', 'Inter', sans-serif"
-          font-weight="700"
-          fill="url(#faceGrad)"
-          filter="url(#lighting)"
-          dominant-baseline="auto">JobLess AI</text>
-        <text id="shimmerText"
-          font-family="'Space Grotesk', 'Inter', sans-serif"
-          font-weight="700"
-          fill="url(#shimmerGrad)"
-          opacity="0.9"
-          dominant-baseline="auto">JobLess AI</text>
-      </svg>
-    </div>
-  </div>
-  <p class="sub">Transform your potential into a concrete career roadmap — powered by AI.</p>
-</div>
-
-<script>
-document.fonts.ready.then(function() {
-  var svg     = document.getElementById('titleSvg');
-  var mainTxt = document.getElementById('mainText');
-  var shimTxt = document.getElementById('shimmerText');
-  var extGrp  = document.getElementById('extrudeGroup');
-
-  /* ── FIX 6 + 9: use parent window width for breakpoints,
-     not the iframe's own innerWidth (which equals the iframe container width,
-     so this is actually fine — but we also cap the font size to prevent
-     overflow on narrow screens with a tighter minimum). ── */
-  var vw = Math.min(innerWidth, window.parent ? window.parent.innerWidth : innerWidth);
-  var isMobile = vw < 600;
-  var isTablet = vw < 900 && !isMobile;
-  var isSmall  = vw < 360;
-
-  /* FIX 9: tighter font size floor on small screens */
-  var FS;
-  if (isSmall)        { FS = 38; }
-  else if (isMobile)  { FS = 48; }
-  else if (isTablet)  { FS = Math.min(72, Math.max(48, vw * 0.065)); }
-  else                { FS = Math.min(96, Math.max(56, vw * 0.072)); }
-
-  var BL = FS, LAYERS = isMobile ? 4 : 6;
-
-  [mainTxt, shimTxt].forEach(function(t) {
-    t.setAttribute('font-size', FS);
-    t.setAttribute('y', BL);
-    t.setAttribute('x', 0);
-  });
-
-  /* FIX 4: use lightweight filter on mobile/tablet */
-  if (isMobile || isTablet) {
-    mainTxt.setAttribute('filter', 'url(#lightingSimple)');
-  }
-
-  var bb = mainTxt.getBBox();
-  var W = bb.width + 8, H = BL + 10;
-  svg.setAttribute('width',  W);
-  svg.setAttribute('height', H);
-  svg.setAttribute('viewBox', '0 0 ' + W + ' ' + H);
-
-  /* Build extrusion layers */
-  for (var i = LAYERS; i >= 1; i--) {
-    var t  = document.createElementNS('http://www.w3.org/2000/svg', 'text');
-    var p  = i / LAYERS;
-    var ox = i * 0.45, oy = i * 0.45;
-    var r  = Math.round(20  + (1-p)*30);
-    var g  = Math.round(20  + (1-p)*30);
-    var b2 = Math.round(20  + (1-p)*30);
-    var a  = 0.3 + (1-p)*0.3;
-    t.setAttribute('font-family', "'Space Grotesk', 'Inter', sans-serif");
-    t.setAttribute('font-weight', '700');
-    t.setAttribute('font-size', FS);
-    t.setAttribute('x', ox);
-    t.setAttribute('y', BL + oy);
-    t.setAttribute('fill', 'rgba('+r+','+g+','+b2+','+a+')');
-    t.textContent = 'JobLess AI';
-    extGrp.appendChild(t);
-  }
-
-  /* ── FIX 1 (dynamic iframe height): auto-fit the iframe to its content ── */
-  function fitIframe() {
-    try {
-      var fe = window.frameElement;
-      if (fe) {
-        var h = document.getElementById('stage').scrollHeight + 16;
-        fe.style.height = h + 'px';
-      }
-    } catch(e) {}
-  }
-  setTimeout(fitIframe, 120); /* after fonts + paint */
-
-  /* ── Glitch canvas ── */
-  var glitchC = document.getElementById('glitchCanvas');
-  glitchC.width  = W; glitchC.height = H;
-  glitchC.style.width  = W + 'px';
-  glitchC.style.height = H + 'px';
-  var glitchX = glitchC.getContext('2d');
-
-  /* FIX 5: check if canvas 2D filter is supported before using it.
-     Safari < 15 and older Android Chrome don't support ctx.filter. */
-  var canvasFilterSupported = (function() {
-    try {
-      var c = document.createElement('canvas').getContext('2d');
-      c.filter = 'blur(0px)';
-      return c.filter !== undefined && c.filter !== '';
-    } catch(e) { return false; }
-  })();
-
-  /* Skip glitch entirely on mobile — saves battery & CPU */
-  if (!isMobile) {
-    function getSvgImage(cb) {
-      var xml  = new XMLSerializer().serializeToString(svg);
-      var blob = new Blob([xml], {type:'image/svg+xml'});
-      var url  = URL.createObjectURL(blob);
-      var img  = new Image();
-      img.onload = function() { cb(img); URL.revokeObjectURL(url); };
-      img.src = url;
-    }
-
-    function scheduleGlitch() {
-      var delay = 12000 + Math.random() * 8000;
-      setTimeout(function() { getSvgImage(function(img) { runGlitch(img); }); }, delay);
-    }
-
-    function runGlitch(img) {
-      var frames = 5, f = 0;
-      var slices = Array.from({length:3}, function() {
-        return { y: Math.random()*(H*0.75), h: 3+Math.random()*10, dx: (Math.random()-.5)*10 };
-      });
-      function glitchFrame() {
-        glitchX.clearRect(0,0,W,H);
-        if (f < frames) {
-          var intensity = f < 2 ? 1 : (frames-f)/frames;
-          glitchX.save();
-          glitchX.globalAlpha = 0.28 * intensity;
-          glitchX.globalCompositeOperation = 'screen';
-          /* FIX 5: only apply canvas filter if browser supports it */
-          if (canvasFilterSupported) glitchX.filter = 'hue-rotate(-20deg) saturate(2.5)';
-          glitchX.drawImage(img, -2, 1);
-          glitchX.restore();
-
-          glitchX.save();
-          glitchX.globalAlpha = 0.28 * intensity;
-          glitchX.globalCompositeOperation = 'screen';
-          if (canvasFilterSupported) glitchX.filter = 'hue-rotate(160deg) saturate(2.5)';
-          glitchX.drawImage(img, 2, -1);
-          glitchX.restore();
-
-          slices.forEach(function(sl) {
-            glitchX.save();
-            glitchX.globalAlpha = 0.5 * intensity;
-            glitchX.drawImage(img, 0, sl.y, W, sl.h, sl.dx, sl.y, W, sl.h);
-            glitchX.restore();
-          });
-
-          if (f % 2 === 0) {
-            glitchX.fillStyle = 'rgba(0,208,255,' + (0.10*intensity) + ')';
-            glitchX.fillRect(0, Math.random()*H, W, 1+Math.random()*1.5);
-          }
-          f++;
-          requestAnimationFrame(glitchFrame);
-        } else {
-          glitchX.clearRect(0,0,W,H);
-          scheduleGlitch();
-        }
-      }
-      requestAnimationFrame(glitchFrame);
-    }
-    setTimeout(scheduleGlitch, 12000);
-  }
-
-  /* ── Extrusion depth pulse ── */
-  var extLayers = extGrp.querySelectorAll('text');
-  var pulseT = 0;
-  function pulseLayers() {
-    pulseT += 0.018;
-    var breathe = Math.sin(pulseT) * 0.18;
-    extLayers.forEach(function(el, i) {
-      var base   = (extLayers.length - i) * 0.45;
-      var offset = base + breathe * (i / extLayers.length);
-      el.setAttribute('x', offset);
-      el.setAttribute('y', BL + offset);
-    });
-    requestAnimationFrame(pulseLayers);
-  }
-  requestAnimationFrame(pulseLayers);
-});
-</script>
-</body>
-</html>"""
+# ==================== ANIMATED HEADER ====================
+# The header page lives in static/header.html (see static_assets).
 
 
 # ==================== CONFIGURATION ====================
@@ -1286,8 +273,14 @@ class Config:
         "Cohere  🆓": "COHERE_API_KEY",
     }
 
+    def is_keyless(self, provider=None) -> bool:
+        """The offline provider needs no key; JOBLESS_FAKE_PROVIDER only switches it on."""
+        return PROVIDER_INTERNAL.get(provider or self.get_provider()) == "local"
+
     def get_api_key(self, provider=None) -> str:
         p = provider or self.get_provider()
+        if self.is_keyless(p):
+            return ""
         val = st.session_state.get(f"api_key_{p}", "")
         if val:
             return val
@@ -1301,6 +294,8 @@ class Config:
 
     def using_own_key(self, provider=None) -> bool:
         p = provider or self.get_provider()
+        if self.is_keyless(p):
+            return True  # nothing leaves the machine, so no free-tier quota
         return bool(st.session_state.get(f"api_key_{p}", ""))
 
     def set_api_key(self, key: str, provider=None) -> bool:
@@ -1309,7 +304,7 @@ class Config:
         return bool(key)
 
     def is_ready(self) -> bool:
-        return bool(self.get_api_key())
+        return self.is_keyless() or bool(self.get_api_key())
 
     def get_selected_model(self):
         return st.session_state.get("selected_model")
@@ -1322,35 +317,142 @@ class AIHandler:
 
     def _call_llm(self, prompt: str, model_name: str,
                   max_tokens: int = 8192, temperature: float = 0.7,
-                  json_mode: bool = False) -> str:
-        provider_display = self.config.get_provider()
-        provider = PROVIDER_INTERNAL.get(provider_display, "gemini")
-        api_key = self.config.get_api_key()
-
+                  json_mode: bool = False, cache_ttl: Optional[float] = None,
+                  provider: Optional[str] = None, api_key: Optional[str] = None,
+                  hedge: bool = False) -> str:
+        """
+        Run one completion against the sidebar-selected provider.
+        Pass `cache_ttl` (seconds) to serve / store the result via
+        _RESPONSE_CACHE; leave it None for calls that must always be fresh.
+        Worker threads can't read st.session_state, so fan-out callers resolve
+        `provider` / `api_key` up front (see _resolve_provider) and pass them in.
+        With routing enabled, failover applies; `hedge=True` marks the call
+        as latency-critical.
+        """
+        routes = None
+        if provider is None or api_key is None:
+            provider, api_key = self._resolve_provider()
+            model_name = self._task_model(model_name)
+            routes = self._resolve_routes(model_name, hedge)
+
+        prompt_key = response_cache_key(provider, model_name, prompt,
+                                        temperature, max_tokens, json_mode)
+        cache_key = prompt_key if cache_ttl else None
+        if cache_key:
+            cached = _RESPONSE_CACHE.get(cache_key)
+            if cached is not None:
+                TELEMETRY.record_llm_call(provider=provider, model=model_name, wall=0.0,
+                                          prompt_chars=len(prompt),
+                                          completion_chars=len(cached), cached=True)
+                return cached
+
+        def fetch() -> str:
+            if routes:
+                return "".join(self._timed_stream(
+                    self._race(routes, prompt, max_tokens, temperature, json_mode, hedge),
+                    provider, model_name, prompt)).strip()
+            start = time.perf_counter()
+            try:
+                result = call_with_retry(
+                    lambda: self._provider_call(provider, api_key, prompt, model_name,
+                                                max_tokens, temperature, json_mode),
+                    before_attempt=lambda: _RATE_LIMITER.acquire(provider, api_key))
+            except Exception as e:
+                TELEMETRY.record_llm_call(provider=provider, model=model_name,
+                                          wall=time.perf_counter() - start,
+                                          prompt_chars=len(prompt), error=type(e).__name__)
+                raise
+            TELEMETRY.record_llm_call(provider=provider, model=model_name,
+                                      wall=time.perf_counter() - start,
+                                      prompt_chars=len(prompt), completion_chars=len(result))
+            return result
+
+        text, shared = _SINGLE_FLIGHT.do(f"{prompt_key}:{key_fingerprint(api_key)}", fetch)
+        if shared:
+            # The leader already recorded telemetry and filled the cache
+            TELEMETRY.inc("llm_coalesced_total", method=current_method.get())
+            return text
+        if _FIXTURE_RECORD_DIR and provider != "local":
+            record_fixture(_FIXTURE_RECORD_DIR, detect_task(prompt), text)
+
+        cacheable = True
+        if json_mode:
+            # Parse outcome feeds the model router; and never pin a malformed
+            # payload in the cache for hours
+            cacheable = self._parses(text)
+            TELEMETRY.record_parse(model=model_name, ok=cacheable)
+        if cache_key and cacheable:
+            _RESPONSE_CACHE.set(cache_key, text, cache_ttl)
+        return text
+
+    def _task_model(self, model_name: str, method: Optional[str] = None) -> str:
+        """
+        Model for `method` — by default the AIHandler method currently running
+        (see model_router). Returns `model_name` unchanged unless the user has
+        switched routing on. Main thread only.
+        """
+        if not st.session_state.get("model_routing", False):
+            return model_name
+        display = self.config.get_provider()
+        return choose_model(PROVIDER_INTERNAL.get(display, "gemini"),
+                            method or current_method.get(),
+                            model_name, PROVIDER_MODELS.get(display, []))
+
+    def _resolve_provider(self):
+        """(internal provider key, api key) for the current session — main thread only."""
+        provider = PROVIDER_INTERNAL.get(self.config.get_provider(), "gemini")
+        return provider, self.config.get_api_key()
+
+    def _resolve_routes(self, model_name: str, hedge: bool = False) -> Optional[List]:
+        """
+        Ordered (provider, api_key, model) routes for failover / hedging, or
+        None when routing is off or nothing but the primary is usable.
+        Main thread only — reads session state and secrets.
+        """
+        if not st.session_state.get("llm_routing"):
+            return None
+        primary_display = self.config.get_provider()
+        primary = PROVIDER_INTERNAL.get(primary_display, "gemini")
+        routes = [(primary, self.config.get_api_key(), model_name)]
+        for display, internal in PROVIDER_INTERNAL.items():
+            if display == primary_display or not _PROVIDER_SDK_OK.get(internal):
+                continue
+            key = self.config.get_api_key(display)
+            if key and PROVIDER_MODELS.get(display):
+                routes.append((internal, key, PROVIDER_MODELS[display][0]))
+        # Last resort: a sibling model on the primary provider
+        sibling = next((m for m in PROVIDER_MODELS.get(primary_display, [])
+                        if m != model_name), None)
+        if sibling:
+            routes.append((primary, routes[0][1], sibling))
+        if hedge and len(routes) == 1:
+            routes.append(routes[0])
+        return routes if len(routes) > 1 else None
+
+    def _race(self, routes: List, prompt: str, max_tokens: int, temperature: float,
+              json_mode: bool, hedge: bool) -> StreamRace:
+        def open_route(route):
+            provider, api_key, model = route
+            _RATE_LIMITER.acquire(provider, api_key)
+            return self._provider_stream(provider, api_key, prompt, model,
+                                         max_tokens, temperature, json_mode)
+        budget = ROUTING_HEDGE_DELAY if hedge else ROUTING_FIRST_TOKEN_BUDGET
+        return StreamRace(routes, open_route, _ROUTER_POOL, first_token_budget=budget)
+
+    def _provider_call(self, provider: str, api_key: str, prompt: str, model_name: str,
+                       max_tokens: int, temperature: float, json_mode: bool) -> str:
         if provider == "gemini":
             if not _GEMINI_OK:
                 raise RuntimeError("Run: pip install google-generativeai")
-            genai.configure(api_key=api_key)
-            try:
-                gen_config = genai.GenerationConfig(
-                    max_output_tokens=max_tokens,
-                    temperature=temperature,
-                    **({"response_mime_type": "application/json"} if json_mode else {})
-                )
-            except TypeError:
-                gen_config = genai.GenerationConfig(
-                    max_output_tokens=max_tokens,
-                    temperature=temperature,
-                )
-            model = genai.GenerativeModel(
-                model_name, generation_config=gen_config)
-            response = model.generate_content(prompt)
+            model = self._gemini_model(api_key, model_name)
+            response = model.generate_content(
+                prompt, generation_config=self._gemini_config(max_tokens, temperature, json_mode))
             return response.text.strip()
 
         elif provider == "groq":
             if not _GROQ_OK:
                 raise RuntimeError("Run: pip install groq")
-            client = _GroqClient(api_key=api_key)
+            client = self._groq_client(api_key)
             response = client.chat.completions.create(
                 model=model_name,
                 messages=[{"role": "user", "content": prompt}],
@@ -1362,7 +464,7 @@ class AIHandler:
         elif provider == "cohere":
             if not _COHERE_OK:
                 raise RuntimeError("Run: pip install cohere")
-            client = _cohere_sdk.ClientV2(api_key=api_key)
+            client = self._cohere_client(api_key)
             response = client.chat(
                 model=model_name,
                 messages=[{"role": "user", "content": prompt}],
@@ -1371,10 +473,259 @@ class AIHandler:
             )
             return response.message.content[0].text.strip()
 
+        elif provider == "local":
+            if _FAKE_PROVIDER is None:
+                raise RuntimeError("Set JOBLESS_FAKE_PROVIDER=1 to enable the offline provider")
+            return _FAKE_PROVIDER.complete(prompt, model_name, max_tokens, json_mode).strip()
+
         else:
             raise ValueError(f"Unknown provider internal key: {provider}")
 
-    def get_career_advice(self, input_text: str, model_name: str, context: Dict) -> Optional[Dict]:
+    # ── Streaming ─────────────────────────────────────────────────────────
+    def _stream_llm(self, prompt: str, model_name: str, max_tokens: int = 8192,
+                    temperature: float = 0.7, json_mode: bool = False,
+                    hedge: bool = False, task_routing: bool = True) -> Iterator[str]:
+        """
+        Streaming twin of _call_llm: yields text chunks as the provider emits
+        them, so the UI can render from the first token instead of the last.
+        Streams are never cached.
+        """
+        provider, api_key = self._resolve_provider()
+        if task_routing:
+            model_name = self._task_model(model_name)
+        routes = self._resolve_routes(model_name, hedge)
+        if routes:
+            chunks = self._race(routes, prompt, max_tokens, temperature, json_mode, hedge)
+        else:
+            chunks = self._retrying_stream(provider, api_key, prompt, model_name,
+                                           max_tokens, temperature, json_mode)
+        yield from self._timed_stream(chunks, provider, model_name, prompt)
+
+    def _retrying_stream(self, provider: str, api_key: str, prompt: str, model_name: str,
+                         max_tokens: int, temperature: float,
+                         json_mode: bool) -> Iterator[str]:
+        def open_stream():
+            # Pull the first chunk inside the retry so a 429 / 5xx on connect
+            # is retried; once text is flowing, errors propagate as-is.
+            chunks = self._provider_stream(provider, api_key, prompt, model_name,
+                                           max_tokens, temperature, json_mode)
+            return next(chunks, None), chunks
+
+        first, chunks = call_with_retry(
+            open_stream, before_attempt=lambda: _RATE_LIMITER.acquire(provider, api_key))
+        if first is None:
+            return
+        yield first
+        yield from chunks
+
+    @staticmethod
+    def _timed_stream(chunks, provider: str, model_name: str, prompt: str) -> Iterator[str]:
+        """Pass `chunks` through, recording wall time / TTFT / sizes to TELEMETRY."""
+        start = time.perf_counter()
+        ttft = None
+        size = 0
+        error = None
+        try:
+            for chunk in chunks:
+                if ttft is None:
+                    ttft = time.perf_counter() - start
+                size += len(chunk)
+                yield chunk
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            winner = getattr(chunks, "winner", None)
+            if winner:
+                provider, model_name = winner[0], winner[2]
+            TELEMETRY.record_llm_call(provider=provider, model=model_name,
+                                      wall=time.perf_counter() - start, ttft=ttft,
+                                      prompt_chars=len(prompt), completion_chars=size,
+                                      error=error)
+
+    def _stream_json(self, prompt: str, model_name: str, on_item, item_key: Optional[str] = None,
+                     max_tokens: int = 8192, temperature: float = 0.7,
+                     cache_ttl: Optional[float] = None):
+        """
+        Stream a JSON completion, calling `on_item(item)` for every element of
+        the top-level array (or of `item_key` inside the top-level object) as
+        soon as it closes. Returns the fully parsed document.
+
+        Shares _RESPONSE_CACHE entries with the equivalent json_mode _call_llm,
+        so a cached payload is replayed item by item without a provider call.
+        """
+        model_name = self._task_model(model_name)
+        provider, api_key = self._resolve_provider()
+        prompt_key = response_cache_key(provider, model_name, prompt,
+                                        temperature, max_tokens, True)
+        cache_key = prompt_key if cache_ttl else None
+        if cache_key:
+            cached = _RESPONSE_CACHE.get(cache_key)
+            if cached is not None:
+                TELEMETRY.record_llm_call(provider=provider, model=model_name, wall=0.0,
+                                          prompt_chars=len(prompt),
+                                          completion_chars=len(cached), cached=True)
+                return self._replay_json(cached, item_key, on_item)
+
+        # Same single-flight key as _call_llm, so a streamed and a plain call
+        # for the same prompt coalesce too
+        flight_key = f"{prompt_key}:{key_fingerprint(api_key)}"
+        future, leader = _SINGLE_FLIGHT.begin(flight_key)
+        if not leader:
+            TELEMETRY.inc("llm_coalesced_total", method=current_method.get())
+            return self._replay_json(future.result(), item_key, on_item)
+
+        parser = IncrementalJSONParser(item_key)
+        parts = []
+        try:
+            for chunk in self._stream_llm(prompt, model_name, max_tokens=max_tokens,
+                                          temperature=temperature, json_mode=True,
+                                          task_routing=False):
+                parts.append(chunk)
+                for item in parser.feed(chunk):
+                    on_item(item)
+            text = "".join(parts)
+            result = parser.result()
+        except BaseException as e:
+            _SINGLE_FLIGHT.fail(flight_key, e)
+            if isinstance(e, ValueError):
+                TELEMETRY.record_parse(model=model_name, ok=False)
+            raise
+        _SINGLE_FLIGHT.finish(flight_key, text)
+        TELEMETRY.record_parse(model=model_name, ok=True)
+        if cache_key:
+            _RESPONSE_CACHE.set(cache_key, text, cache_ttl)
+        return result
+
+    @staticmethod
+    def _replay_json(text: str, item_key: Optional[str], on_item):
+        parser = IncrementalJSONParser(item_key)
+        for item in parser.feed(fenced_body(text)):
+            on_item(item)
+        return parser.result()
+
+    def _provider_stream(self, provider: str, api_key: str, prompt: str, model_name: str,
+                         max_tokens: int, temperature: float,
+                         json_mode: bool = False) -> Iterator[str]:
+        """Provider-neutral chunk iterator over Gemini / Groq / Cohere streams."""
+        if provider == "gemini":
+            if not _GEMINI_OK:
+                raise RuntimeError("Run: pip install google-generativeai")
+            model = self._gemini_model(api_key, model_name)
+            response = model.generate_content(
+                prompt, generation_config=self._gemini_config(max_tokens, temperature, json_mode),
+                stream=True)
+            for chunk in response:
+                try:
+                    text = chunk.text
+                except ValueError:
+                    # Chunk carried no text part (e.g. safety / finish metadata)
+                    continue
+                if text:
+                    yield text
+
+        elif provider == "groq":
+            if not _GROQ_OK:
+                raise RuntimeError("Run: pip install groq")
+            client = self._groq_client(api_key)
+            stream = client.chat.completions.create(
+                model=model_name,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=min(max_tokens, 8192),
+                temperature=temperature,
+                stream=True,
+            )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        elif provider == "cohere":
+            if not _COHERE_OK:
+                raise RuntimeError("Run: pip install cohere")
+            client = self._cohere_client(api_key)
+            stream = client.chat_stream(
+                model=model_name,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+            for event in stream:
+                if getattr(event, "type", "") == "content-delta":
+                    text = event.delta.message.content.text
+                    if text:
+                        yield text
+
+        elif provider == "local":
+            if _FAKE_PROVIDER is None:
+                raise RuntimeError("Set JOBLESS_FAKE_PROVIDER=1 to enable the offline provider")
+            yield from _FAKE_PROVIDER.stream(prompt, model_name, max_tokens, json_mode)
+
+        else:
+            raise ValueError(f"Unknown provider internal key: {provider}")
+
+    @staticmethod
+    def _gemini_config(max_tokens: int, temperature: float, json_mode: bool):
+        try:
+            return genai.GenerationConfig(
+                max_output_tokens=max_tokens,
+                temperature=temperature,
+                **({"response_mime_type": "application/json"} if json_mode else {})
+            )
+        except TypeError:
+            return genai.GenerationConfig(
+                max_output_tokens=max_tokens,
+                temperature=temperature,
+            )
+
+    # ── Pooled SDK clients ────────────────────────────────────────────────
+    # Clients are shared across sessions via _CLIENT_POOL, so TLS handshakes
+    # and SDK construction are paid once per key instead of once per call.
+    # Groq / Cohere clients are model-agnostic, so one HTTP pool per key is
+    # shared by every model; Gemini binds the model into the object.
+
+    @staticmethod
+    def _gemini_model(api_key: str, model_name: str):
+        def build():
+            with _GENAI_CONFIGURE_LOCK:
+                genai.configure(api_key=api_key)
+                model = genai.GenerativeModel(model_name)
+                # Pin the transport client now so a later configure() from
+                # another session (different key) can't swap it underneath us.
+                model._client = _genai_client.get_default_generative_client()
+            return model, None
+        return _CLIENT_POOL.get("gemini", api_key, model_name, build)
+
+    @staticmethod
+    def _groq_client(api_key: str):
+        def build():
+            if _httpx is not None:
+                http_client = _httpx.Client(
+                    limits=_httpx.Limits(**_HTTP_LIMITS), timeout=60.0)
+                client = _GroqClient(api_key=api_key, http_client=http_client,
+                                     max_retries=0)
+            else:
+                client = _GroqClient(api_key=api_key, max_retries=0)
+            return client, getattr(client, "close", None)
+        return _CLIENT_POOL.get("groq", api_key, "", build)
+
+    @staticmethod
+    def _cohere_client(api_key: str):
+        def build():
+            if _httpx is not None:
+                http_client = _httpx.Client(
+                    limits=_httpx.Limits(**_HTTP_LIMITS), timeout=60.0)
+                return (_cohere_sdk.ClientV2(api_key=api_key, httpx_client=http_client),
+                        http_client.close)
+            return _cohere_sdk.ClientV2(api_key=api_key), None
+        return _CLIENT_POOL.get("cohere", api_key, "", build)
+
+    @instrumented
+    def get_career_advice(self, input_text: str, model_name: str, context: Dict,
+                          on_career=None) -> Optional[Dict]:
+        """
+        Career analysis for the résumé / profile text.
+        Pass `on_career` to receive each career dict as soon as it has streamed in.
+        """
         try:
             location = context.get('location', 'India - Metro')
             is_international = "international" in location.lower()
@@ -1421,6 +772,9 @@ class AIHandler:
 
             Suggest 6-8 distinct career paths. Return ONLY the JSON object.
             """
+            if on_career is not None:
+                return self._stream_json(prompt, model_name, on_career, item_key="careers",
+                                         max_tokens=8192, temperature=0.7)
             txt = self._call_llm(
                 prompt, model_name, max_tokens=8192, temperature=0.7, json_mode=True)
             return self._safe_parse_json(txt)
@@ -1428,6 +782,7 @@ class AIHandler:
             st.error(f"⚠️ AI Error: {str(e)}")
             return None
 
+    @instrumented
     def build_ats_resume(self, profile_data: Dict, model_name: str) -> Optional[Dict]:
         try:
             prompt = f"""
@@ -1471,7 +826,13 @@ class AIHandler:
             st.error(f"⚠️ Resume Builder Error: {str(e)}")
             return None
 
-    def generate_interview_questions(self, role: str, level: str, model_name: str) -> Optional[List]:
+    @instrumented
+    def generate_interview_questions(self, role: str, level: str, model_name: str,
+                                     on_question=None) -> Optional[List]:
+        """
+        Eight mock-interview questions for `role` at `level`.
+        Pass `on_question` to receive each question dict as soon as it has streamed in.
+        """
         try:
             prompt = f"""You are a world-class technical recruiter who has conducted 10,000+ interviews across a wide variety of industries and roles — tech, core engineering, finance, consulting, healthcare, and more.
 
@@ -1502,9 +863,15 @@ Format:
 Mix: id 1-2 Behavioral, id 3-4 Technical, id 5 Problem Solving, id 6 Situational, id 7 Culture Fit, id 8 Role-specific scenario.
 Rules: straight double quotes, no apostrophes, single-line strings, no trailing commas, max 3 ideal_answer_points, exactly 1 follow_up.
 Start with [ immediately."""
-            txt = self._call_llm(
-                prompt, model_name, max_tokens=6000, temperature=0.65, json_mode=True)
-            result = self._safe_parse_json(txt)
+            if on_question is not None:
+                result = self._stream_json(
+                    prompt, model_name, on_question, max_tokens=6000, temperature=0.65,
+                    cache_ttl=_CACHE_TTLS["generate_interview_questions"])
+            else:
+                txt = self._call_llm(
+                    prompt, model_name, max_tokens=6000, temperature=0.65, json_mode=True,
+                    cache_ttl=_CACHE_TTLS["generate_interview_questions"])
+                result = self._safe_parse_json(txt)
             if isinstance(result, list) and len(result) > 0:
                 return result
             raise ValueError("Empty or invalid question list returned")
@@ -1512,7 +879,9 @@ Start with [ immediately."""
             st.error(f"⚠️ Interview Generation Error: {str(e)}")
             return None
 
-    def chat_interview_turn(self, messages: list, role: str, level: str, model_name: str) -> str:
+    @instrumented
+    def chat_interview_turn(self, messages: list, role: str, level: str, model_name: str,
+                            context: Optional[Dict] = None) -> str:
         """
         Drives the live conversational interview.
         `messages` is the full conversation so far:
@@ -1520,7 +889,69 @@ Start with [ immediately."""
         Returns the AI's next reply — either an interviewer question/follow-up
         OR the full Head-of-Talent review when the interview ends.
         Works with Gemini, Groq, and Cohere via _call_llm.
+        `context` is the interview_context state for this conversation; with it,
+        older turns are folded into a running summary so the prompt stays flat.
+        """
+        full_prompt = self._interview_turn_prompt(
+            messages, role, level, self._task_model(model_name), context)
+        self._fold_interview_context(messages, role, level, model_name, context)
+        try:
+            return self._call_llm(full_prompt, model_name, max_tokens=2000, temperature=0.75,
+                                  hedge=True)
+        except Exception as e:
+            return f"⚠️ Interview AI error: {str(e)}"
+
+    @instrumented
+    def chat_interview_turn_stream(self, messages: list, role: str, level: str,
+                                   model_name: str, context: Optional[Dict] = None) -> Iterator[str]:
+        """
+        Streaming variant of chat_interview_turn — yields the reply chunk by
+        chunk so the interviewer (and the final review) render progressively.
+        """
+        full_prompt = self._interview_turn_prompt(
+            messages, role, level, self._task_model(model_name), context)
+        self._fold_interview_context(messages, role, level, model_name, context)
+        try:
+            yield from self._stream_llm(full_prompt, model_name, max_tokens=2000, temperature=0.75,
+                                        hedge=True)
+        except Exception as e:
+            yield f"⚠️ Interview AI error: {str(e)}"
+
+    def _fold_interview_context(self, messages: list, role: str, level: str,
+                                model_name: str, context: Optional[Dict]):
         """
+        Fold the next batch of older turns into the running summary, in the
+        background so it overlaps with this turn's own generation. If it fails
+        (or hasn't finished by the next turn) the prompt falls back to clipped
+        extracts, and the batch is retried on a later turn.
+        """
+        if context is None:
+            return
+        with context["lock"]:
+            turns = interview_context.fold_due(messages, context)
+            if not turns:
+                return
+            context["folding"] = True
+            prompt = interview_context.summary_prompt(
+                context["summary"], turns, role, level)
+        upto = len(messages) - interview_context.RECENT_TURNS
+        provider, api_key = self._resolve_provider()
+        summary_model = self._task_model(model_name, method="summarize_interview_context")
+
+        def run():
+            current_method.set("summarize_interview_context")
+            try:
+                summary = self._call_llm(prompt, summary_model, max_tokens=400, temperature=0.2,
+                                         provider=provider, api_key=api_key)
+            except Exception:
+                summary = ""
+            interview_context.apply_fold(context, summary, upto)
+
+        _ROUTER_POOL.submit(contextvars.copy_context().run, run)
+
+    @staticmethod
+    def _interview_turn_prompt(messages: list, role: str, level: str,
+                               model_name: str = "", context: Optional[Dict] = None) -> str:
         SYSTEM = f"""You are conducting a live mock job interview. You play TWO roles:
 
 ROLE 1 — Expert Technical Interviewer
@@ -1592,32 +1023,89 @@ Current interview context:
 - Role: {role}
 - Level: {level}
 """
-        history_text = ""
-        for msg in messages:
-            speaker = "INTERVIEWER" if msg["role"] == "assistant" else "CANDIDATE"
-            history_text += f"\n[{speaker}]: {msg['content']}\n"
+        if context is None:
+            context = interview_context.new_state()
+        budget = interview_context.history_budget(model_name, SYSTEM, reply_tokens=2000)
+        history_text = interview_context.build_history(messages, context, budget)
 
         full_prompt = f"""{SYSTEM}
 
 === CONVERSATION HISTORY SO FAR ===
-{history_text.strip()}
+{history_text}
 
 === YOUR NEXT RESPONSE ===
 (Continue naturally as the interviewer. If the interview is done, write the full Head of Talent Review.)
 """
-        try:
-            return self._call_llm(full_prompt, model_name, max_tokens=2000, temperature=0.75)
-        except Exception as e:
-            return f"⚠️ Interview AI error: {str(e)}"
+        return full_prompt
 
+    @instrumented
     def evaluate_interview_answer(self, question: str, answer: str, ideal_points: List,
                                   role: str, companies: List, model_name: str) -> Optional[Dict]:
         try:
-            safe_q = question.replace('"', "'")
-            safe_a = answer.replace('"', "'")[:1500]
-            companies_str = ", ".join(
-                companies) if companies else "top tech companies"
-            prompt = f"""You are a warm but brutally honest senior hiring manager at {companies_str} evaluating a {role} candidate.
+            return self._evaluate_answer(question, answer, ideal_points, role,
+                                         companies, model_name)
+        except Exception as e:
+            st.error(f"⚠️ Evaluation Error: {str(e)}")
+            return None
+
+    @instrumented
+    def evaluate_interview_answers_batch(self, items: List[Dict], role: str, model_name: str,
+                                         on_result=None) -> Dict[str, Dict]:
+        """
+        Evaluate several answers concurrently.
+
+        `items` are dicts with id / question / answer / ideal_points / companies.
+        Requests fan out on a thread pool, bounded per provider by
+        PROVIDER_MAX_CONCURRENCY, so a full report takes roughly as long as
+        the slowest single evaluation. `on_result(q_id, feedback, done, total)`
+        runs on the calling (script) thread in completion order, which makes
+        it safe to touch st.session_state / placeholders from it.
+        Returns {str(q_id): feedback} for the evaluations that succeeded.
+        """
+        if not items:
+            return {}
+        provider, api_key = self._resolve_provider()
+        model_name = self._task_model(model_name)
+        slots = _PROVIDER_SLOTS.get(provider, nullcontext())
+        workers = min(len(items), PROVIDER_MAX_CONCURRENCY.get(provider, 4))
+
+        def run(item):
+            with slots:
+                return self._evaluate_answer(
+                    item["question"], item["answer"], item.get("ideal_points", []), role,
+                    item.get("companies", []), model_name, provider, api_key)
+
+        results: Dict[str, Dict] = {}
+        errors: List[str] = []
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix="jl-eval") as pool:
+            # copy_context carries the telemetry method tag into the workers
+            futures = {pool.submit(contextvars.copy_context().run, run, item): str(item["id"])
+                       for item in items}
+            for done, future in enumerate(as_completed(futures), 1):
+                q_id = futures[future]
+                try:
+                    fb = future.result()
+                except Exception as e:
+                    fb = None
+                    errors.append(f"Q{q_id}: {str(e)}")
+                if fb:
+                    results[q_id] = fb
+                if on_result is not None:
+                    on_result(q_id, fb, done, len(items))
+        if errors:
+            st.error("⚠️ Evaluation Error: " + " · ".join(errors))
+        return results
+
+    def _evaluate_answer(self, question: str, answer: str, ideal_points: List, role: str,
+                         companies: List, model_name: str, provider: Optional[str] = None,
+                         api_key: Optional[str] = None) -> Dict:
+        """Raising core of evaluate_interview_answer (thread-safe given provider / api_key)."""
+        safe_q = question.replace('"', "'")
+        safe_a = answer.replace('"', "'")[:1500]
+        companies_str = ", ".join(
+            companies) if companies else "top tech companies"
+        prompt = f"""You are a warm but brutally honest senior hiring manager at {companies_str} evaluating a {role} candidate.
 
 Question asked: {safe_q}
 Candidate answered: {safe_a}
@@ -1632,13 +1120,12 @@ Scoring: 90-100=Excellent, 75-89=Good, 60-74=Average, below 60=Needs Work
 crack_this_question must be exactly: "Very Likely", "Likely", "Borderline", or "Unlikely"
 Rules: straight double quotes, no apostrophes, single-line strings, no trailing commas.
 Start with {{ immediately."""
-            txt = self._call_llm(
-                prompt, model_name, max_tokens=1800, temperature=0.4, json_mode=True)
-            return self._safe_parse_json(txt)
-        except Exception as e:
-            st.error(f"⚠️ Evaluation Error: {str(e)}")
-            return None
+        txt = self._call_llm(
+            prompt, model_name, max_tokens=1800, temperature=0.4, json_mode=True,
+            provider=provider, api_key=api_key)
+        return self._safe_parse_json(txt)
 
+    @instrumented
     def generate_final_verdict(self, role: str, level: str, companies: List,
                                all_feedback: List[Dict], model_name: str) -> Optional[Dict]:
         try:
@@ -1671,6 +1158,7 @@ Start with {{ immediately."""
             st.error(f"⚠️ Final Verdict Error: {str(e)}")
             return None
 
+    @instrumented
     def find_pyq_resources(self, company: str, role: str, model_name: str) -> Optional[Dict]:
         try:
             prompt = f"""You are an expert career resource curator with deep knowledge of Indian and global company hiring processes, exam portals, and open-source PYQ (Previous Year Question) databases.
@@ -1717,12 +1205,14 @@ Include 3-6 resources maximum. Quality over quantity.
 Rules: straight double quotes, no apostrophes, single-line strings, no trailing commas.
 Start with {{ immediately."""
             txt = self._call_llm(
-                prompt, model_name, max_tokens=3000, temperature=0.3, json_mode=True)
+                prompt, model_name, max_tokens=3000, temperature=0.3, json_mode=True,
+                cache_ttl=_CACHE_TTLS["find_pyq_resources"])
             return self._safe_parse_json(txt)
         except Exception as e:
             st.error(f"⚠️ PYQ Finder Error: {str(e)}")
             return None
 
+    @instrumented
     def generate_pyq_questions(self, company: str, role: str, count: int, model_name: str) -> Optional[List]:
         try:
             prompt = f"""You are a senior exam content creator specialising in recruitment tests.
@@ -1758,7 +1248,8 @@ Rules: each section ~{count // 3} questions. Straight double quotes only, no apo
 Explanations must be detailed and educational.
 Start with [ immediately."""
             txt = self._call_llm(
-                prompt, model_name, max_tokens=6000, temperature=0.6, json_mode=True)
+                prompt, model_name, max_tokens=6000, temperature=0.6, json_mode=True,
+                cache_ttl=_CACHE_TTLS["generate_pyq_questions"])
             result = self._safe_parse_json(txt)
             if isinstance(result, list) and len(result) > 0:
                 return result
@@ -1767,88 +1258,157 @@ Start with [ immediately."""
             st.error(f"⚠️ PYQ Generation Error: {str(e)}")
             return None
 
+    @staticmethod
+    def _parses(txt: str) -> bool:
+        """Whether `txt` is usable JSON (after repair), without touching telemetry."""
+        try:
+            json.loads(txt)
+            return True
+        except json.JSONDecodeError:
+            pass
+        parser = IncrementalJSONParser()
+        parser.feed(fenced_body(txt))
+        try:
+            parser.result()
+            return True
+        except ValueError:
+            return False
+
     @staticmethod
     def _safe_parse_json(txt: str):
-        import re
         txt = txt.strip()
-        for fence in ('```json', '```'):
-            if fence in txt:
-                parts = txt.split(fence)
-                if len(parts) >= 3:
-                    txt = parts[1].strip()
-                    break
-                elif len(parts) == 2:
-                    txt = parts[1].strip()
-                    break
-        txt = re.sub(r',\s*([\]}])', r'\1', txt)
         try:
             return json.loads(txt)
         except json.JSONDecodeError:
             pass
-        if txt.lstrip().startswith('['):
-            objects, depth, start = [], 0, None
-            for i, ch in enumerate(txt):
-                if ch == '{':
-                    if depth == 0:
-                        start = i
-                    depth += 1
-                elif ch == '}':
-                    depth -= 1
-                    if depth == 0 and start is not None:
-                        chunk = re.sub(r',\s*([\]}])', r'\1', txt[start:i+1])
-                        try:
-                            objects.append(json.loads(chunk))
-                        except Exception:
-                            pass
-                        start = None
-            if objects:
-                return objects
-        if txt.lstrip().startswith('{'):
-            brace_start = txt.find('{')
-            depth = 0
-            for i in range(brace_start, len(txt)):
-                if txt[i] == '{':
-                    depth += 1
-                elif txt[i] == '}':
-                    depth -= 1
-                    if depth == 0:
-                        chunk = re.sub(
-                            r',\s*([\]}])', r'\1', txt[brace_start:i+1])
-                        try:
-                            return json.loads(chunk)
-                        except Exception:
-                            break
-        raise ValueError(
-            f"Could not parse JSON. Raw (first 300 chars): {txt[:300]}")
+        # Fences, trailing commas, truncated arrays — one linear repair pass
+        TELEMETRY.inc("json_parse_repairs_total", method=current_method.get())
+        parser = IncrementalJSONParser()
+        parser.feed(fenced_body(txt))
+        try:
+            return parser.result()
+        except ValueError:
+            TELEMETRY.inc("json_parse_failures_total", method=current_method.get())
+            raise
 
 
 # ==================== SUPPORTING CLASSES ====================
+class PDFExtractCache:
+    """
+    Bounded LRU of extraction results keyed by SHA-256 of the PDF bytes.
+    Shared by every session; entries expire after `ttl` seconds so résumé
+    text isn't held in memory indefinitely.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl: float = 3600.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, digest: str) -> Optional[Dict]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at < now:
+                del self._entries[digest]
+                return None
+            self._entries.move_to_end(digest)
+            return result
+
+    def set(self, digest: str, result: Dict):
+        with self._lock:
+            self._entries[digest] = (time.monotonic() + self.ttl, result)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "max_entries": self.max_entries}
+
+
+_PDF_EXTRACT_CACHE = process_shared("pdf_extract_cache", PDFExtractCache)
+
+
 class PDFHandler:
+    MAX_BYTES = 5 * 1024 * 1024
+    MAX_PAGES = 15
+    # Résumé text the career / ATS prompts can actually use (~3k tokens).
+    # Past this it is boilerplate that only pushes 8k-context models over.
+    MAX_CHARS = 12000
+
+    @staticmethod
+    def extract_text(uploaded_file, max_chars: int = MAX_CHARS) -> str:
+        result = PDFHandler.extract(uploaded_file, max_chars)
+        return result["text"] if result else ""
+
     @staticmethod
-    def extract_text(uploaded_file) -> str:
+    def extract(uploaded_file, max_chars: int = MAX_CHARS) -> Optional[Dict]:
+        """
+        {text, sections, page_count, raw_chars, truncated, sha256} for an
+        uploaded PDF, or None (after st.error) if it is rejected. `text` is the
+        compact, sectioned form from resume_segmenter — what the prompts get.
+        Results are memoised by content hash, so reruns while the file sits in
+        the uploader skip PyMuPDF.
+        """
         try:
-            pdf_bytes = uploaded_file.read()
+            # 🛡️ Block oversized files before touching the bytes
+            size = getattr(uploaded_file, "size", None)
+            if size is not None and size > PDFHandler.MAX_BYTES:
+                st.error("⚠️ File too large. Please upload a resume under 5MB.")
+                return None
 
-            # 🛡️ Block oversized files
-            if len(pdf_bytes) > 5 * 1024 * 1024:  # 5 MB max
+            # UploadedFile is a BytesIO over the upload's bytes; getvalue()
+            # hands back that same object (copy-on-write), whereas read() on a
+            # moved cursor or getbuffer() would copy. PyMuPDF only takes bytes.
+            pdf_bytes = uploaded_file.getvalue()
+            if len(pdf_bytes) > PDFHandler.MAX_BYTES:
                 st.error("⚠️ File too large. Please upload a resume under 5MB.")
-                return ""
+                return None
 
-            text = ""
+            digest = hashlib.sha256(pdf_bytes).hexdigest()
+            cache_key = f"{digest}:{max_chars}"
+            cached = _PDF_EXTRACT_CACHE.get(cache_key)
+            if cached is not None:
+                TELEMETRY.inc("pdf_extract_total", outcome="cached")
+                return cached
+
+            start = time.perf_counter()
             with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
 
-                # 🛡️ Block suspiciously large PDFs
-                if len(doc) > 15:
+                # 🛡️ Block suspiciously large PDFs (page count comes from the
+                # page tree; no page is parsed yet)
+                page_count = len(doc)
+                if page_count > PDFHandler.MAX_PAGES:
                     st.error(
                         "⚠️ Too many pages. Resume should be under 15 pages.")
-                    return ""
-
-                for page in doc:
-                    text += page.get_text()
-            return text.strip()
+                    return None
+
+                segmented = resume_segmenter.segment_document(
+                    doc, PDFHandler.MAX_PAGES, max_chars)
+            full = resume_segmenter.to_prompt(segmented)
+            text = resume_segmenter.to_prompt(segmented, max_chars)
+            result = {
+                "text": text,
+                "sections": list(segmented["sections"]),
+                "page_count": page_count,
+                "raw_chars": segmented["raw_chars"],
+                "truncated": segmented["truncated"] or len(text) < len(full),
+                "sha256": digest,
+            }
+            _PDF_EXTRACT_CACHE.set(cache_key, result)
+            TELEMETRY.inc("pdf_extract_total", outcome="parsed")
+            TELEMETRY.observe("pdf_extract_seconds", time.perf_counter() - start)
+            TELEMETRY.observe("resume_raw_chars", segmented["raw_chars"], SIZE_BUCKETS)
+            TELEMETRY.observe("resume_prompt_chars", len(text), SIZE_BUCKETS)
+            return result
         except Exception as e:
             st.error(f"PDF extraction error: {e}")
-            return ""
+            return None
 
 
 class ExportHandler:
@@ -1856,6 +1416,8 @@ class ExportHandler:
     def generate_pdf_report(analysis_data: Dict) -> Optional[io.BytesIO]:
         try:
             from reportlab.lib.pagesizes import letter
+            from reportlab.lib.styles import getSampleStyleSheet
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
             buffer = io.BytesIO()
             doc = SimpleDocTemplate(buffer, pagesize=letter)
             styles = getSampleStyleSheet()
@@ -1882,21 +1444,61 @@ class ExportHandler:
             return None
 
 
+# ── Analysis history (JOBLESS_HISTORY_DB, default data/history.db) ─────────
+_HISTORY_STORE = process_shared("history_store", lambda: HistoryStore(
+    db_path=os.getenv("JOBLESS_HISTORY_DB") or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "data", "history.db"),
+    retention_days=float(os.getenv("JOBLESS_HISTORY_DAYS", "30")),
+    max_per_user=int(os.getenv("JOBLESS_HISTORY_MAX", "200"))))
+
+_UID_RE = re.compile(r"^[A-Za-z0-9_-]{16,64}$")
+
+
 class HistoryManager:
+    PAGE_SIZE = 10
+
+    @staticmethod
+    def user_id() -> str:
+        """
+        Anonymous id the history is filed under. It rides along in the page
+        URL (?uid=…), so reloading or bookmarking the link keeps the history.
+        """
+        uid = st.session_state.get('history_uid')
+        if not uid:
+            uid = st.query_params.get("uid", "")
+            if not _UID_RE.match(uid):
+                uid = secrets.token_urlsafe(16)
+            st.session_state.history_uid = uid
+        if st.query_params.get("uid") != uid:
+            st.query_params["uid"] = uid
+        return uid
+
     @staticmethod
     def add_to_history(input_text: str, analysis: Dict, context: Dict):
-        if 'history' not in st.session_state:
-            st.session_state.history = []
-        record = {
-            'timestamp': datetime.datetime.now().strftime('%Y-%m-%d %H:%M'),
-            'summary': analysis.get('profile_summary', 'Analysis')[:50] + '...',
-            'input_text': input_text[:500],
-            'analysis': analysis,
-            'context': context,
-        }
-        st.session_state.history.append(record)
-        if len(st.session_state.history) > 20:
-            st.session_state.history = st.session_state.history[-20:]
+        # input_text is deliberately not persisted — only the analysis is.
+        # Saving is best-effort: the analysis is already on screen either way.
+        try:
+            _HISTORY_STORE.add(HistoryManager.user_id(), analysis, context)
+        except Exception:
+            st.warning("⚠️ This analysis couldn't be saved to your history.")
+
+    @staticmethod
+    def count(query: str = "") -> int:
+        return _HISTORY_STORE.count(HistoryManager.user_id(), query)
+
+    @staticmethod
+    def page(page: int, query: str = "", sort: str = "newest") -> List[Dict]:
+        size = HistoryManager.PAGE_SIZE
+        return _HISTORY_STORE.page(HistoryManager.user_id(), offset=page * size,
+                                   limit=size, query=query, sort=sort)
+
+    @staticmethod
+    def get(record_id: int) -> Optional[Dict]:
+        return _HISTORY_STORE.get(HistoryManager.user_id(), record_id)
+
+    @staticmethod
+    def clear() -> int:
+        return _HISTORY_STORE.delete(HistoryManager.user_id())
 
 
 # ==================== HELPER FUNCTIONS ====================
@@ -1970,503 +1572,11 @@ def render_job_links(title: str, location: str, keywords: str = "") -> str:
 class UIComponents:
     @staticmethod
     def apply_custom_css():
-        css = """
-        <style>
-            @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=Space+Grotesk:wght@400;500;600;700&display=swap');
-        
-            /* Animations */
-            @keyframes fadeUp { from { opacity: 0; transform: translateY(20px); } to { opacity: 1; transform: translateY(0); } }
-            @keyframes scan { 0% { left: -100% } 100% { left: 200% } }
-            @keyframes glowPulse { 0%,100% { box-shadow: 0 0 20px rgba(255,255,255,0.04), 0 0 60px rgba(255,255,255,0.02); } 50% { box-shadow: 0 0 30px rgba(255,255,255,0.08), 0 0 80px rgba(255,255,255,0.03); } }
-            @keyframes shimmer { 0% { background-position: -200% 0; } 100% { background-position: 200% 0; } }
-        
-            /* Globals */
-            html, body {
-                background: #0A0A0A !important;
-                color: #E5E5E5 !important;
-                font-family: 'Inter', sans-serif !important;
-                cursor: none !important;
-            }
-            .stApp, .stApp > div, [data-testid="stAppViewContainer"], [data-testid="stAppViewBlockContainer"], .main, .block-container, section.main > div {
-                background: #0A0A0A !important;
-                font-family: 'Inter', sans-serif !important;
-                color: #E5E5E5 !important;
-            }
-        
-            /* Typography */
-            h1, h2, h3, h4, h5, h6 {
-                font-family: 'Space Grotesk', 'Inter', sans-serif !important;
-                font-weight: 700 !important;
-                letter-spacing: -0.03em !important;
-                color: #FFFFFF !important;
-            }
-            h2 { font-size: 1.8rem !important; }
-            h3 { font-size: 1.2rem !important; font-weight: 600 !important; color: #FFFFFF !important; }
-            p, li { font-weight: 300 !important; color: #999999 !important; line-height: 1.7 !important; }
-        
-            /* Streamlit padding resets */
-            .main .block-container { padding-top: 1rem !important; padding-left: 2rem !important; padding-right: 2rem !important; max-width: 100% !important; margin-top: -30px !important; }
-            header[data-testid="stHeader"] { background: #0A0A0A !important; }
-            div[data-testid="stToolbar"], div[data-testid="stDecoration"], div[data-testid="stStatusWidget"] { display: none !important; }
-
-            /* Make component iframes seamless — no visible border or boundary */
-            iframe,
-            iframe[title="streamlit_components.v1.components.html"],
-            .stComponentFrame,
-            [data-testid="stComponentFrame"],
-            [data-testid="stCustomComponentV1"],
-            .element-container iframe,
-            .stHtml iframe {
-                border: none !important;
-                outline: none !important;
-                box-shadow: none !important;
-                background: #0A0A0A !important;
-            }
-            .stComponentFrame > div,
-            [data-testid="stComponentFrame"] > div,
-            [data-testid="stCustomComponentV1"] > div,
-            .stHtml > div,
-            .stHtml {
-                border: none !important;
-                outline: none !important;
-                box-shadow: none !important;
-                background: #0A0A0A !important;
-            }
-            /* Remove any gap/margin between vertically stacked elements */
-            .stComponentFrame,
-            [data-testid="stComponentFrame"],
-            [data-testid="stCustomComponentV1"],
-            .stHtml {
-                margin-bottom: 0 !important;
-                padding: 0 !important;
-            }
-
-            /* Sidebar — dark glass */
-            [data-testid="stSidebar"] {
-                background: rgba(10,10,10,0.95) !important;
-                backdrop-filter: blur(24px) saturate(1.2) !important;
-                -webkit-backdrop-filter: blur(24px) saturate(1.2) !important;
-                border-right: 1px solid rgba(255,255,255,0.06) !important;
-                box-shadow: 4px 0 40px rgba(0,0,0,0.7) !important;
-            }
-            /* Keep main content full-width always */
-            [data-testid="stAppViewContainer"] { margin-left: 0 !important; width: 100% !important; }
-            [data-testid="stMain"] { margin-left: 0 !important; width: 100% !important; }
-            [data-testid="stSidebar"] > div:first-child { padding-top: 0 !important; }
-            [data-testid="stSidebar"] hr { border-color: rgba(255,255,255,0.06) !important; margin: 16px 0 !important; }
-            [data-testid="stSidebar"] h1, [data-testid="stSidebar"] h2, [data-testid="stSidebar"] h3 {
-                font-family: 'Space Grotesk', sans-serif !important; font-size: 0.75rem !important; color: #666666 !important; text-transform: uppercase !important; letter-spacing: 0.12em !important; margin: 16px 0 8px 0 !important;
-            }
-        
-            /* Tabs — minimal glass */
-            .stTabs [data-baseweb="tab-list"] {
-                background: rgba(255,255,255,0.03) !important;
-                border-radius: 12px !important;
-                padding: 6px !important;
-                border: 1px solid rgba(255,255,255,0.06) !important;
-                gap: 4px !important;
-                backdrop-filter: blur(8px) !important;
-            }
-            .stTabs [data-baseweb="tab"] {
-                font-family: 'Inter', sans-serif !important;
-                font-size: 0.85rem !important;
-                font-weight: 500 !important;
-                color: #666666 !important;
-                border-radius: 8px !important;
-                transition: all 0.25s cubic-bezier(0.16,1,0.3,1) !important;
-                padding: 10px 16px !important;
-            }
-            .stTabs [data-baseweb="tab"]:hover {
-                background: rgba(255,255,255,0.06) !important;
-                color: #E5E5E5 !important;
-            }
-            .stTabs [aria-selected="true"] {
-                background: rgba(255,255,255,0.1) !important;
-                color: #ffffff !important;
-                box-shadow: 0 4px 16px rgba(0,0,0,0.3), inset 0 1px 0 rgba(255,255,255,0.05) !important;
-                border: 1px solid rgba(255,255,255,0.12) !important;
-            }
-        
-            /* ═══════ REUSABLE UTILITY CLASSES ═══════ */
-
-            /* Glass Card */
-            .glass-card {
-                background: rgba(255,255,255,0.03) !important;
-                backdrop-filter: blur(16px) saturate(1.3) !important;
-                -webkit-backdrop-filter: blur(16px) saturate(1.3) !important;
-                border: 1px solid rgba(255,255,255,0.08) !important;
-                border-radius: 16px !important;
-                box-shadow: 0 8px 32px rgba(0,0,0,0.4) !important;
-                transition: all 0.3s cubic-bezier(0.16,1,0.3,1) !important;
-                position: relative; overflow: hidden;
-            }
-            .glass-card:hover {
-                border-color: rgba(255,255,255,0.2) !important;
-                box-shadow: 0 16px 48px rgba(0,0,0,0.5), 0 0 30px rgba(255,255,255,0.03) !important;
-                transform: translateY(-3px) !important;
-            }
-
-            /* Neon Button */
-            .neon-button {
-                background: #FFFFFF !important;
-                color: #0A0A0A !important;
-                font-weight: 700 !important;
-                border: none !important;
-                border-radius: 10px !important;
-                padding: 12px 28px !important;
-                box-shadow: 0 4px 20px rgba(255,255,255,0.1) !important;
-                transition: all 0.25s cubic-bezier(0.16,1,0.3,1) !important;
-                letter-spacing: 0.05em !important;
-            }
-            .neon-button:hover {
-                transform: translateY(-2px) !important;
-                box-shadow: 0 8px 30px rgba(255,255,255,0.2) !important;
-            }
-
-            /* Gradient Text */
-            .gradient-text {
-                background: linear-gradient(135deg, #FFFFFF 0%, #999999 100%) !important;
-                -webkit-background-clip: text !important;
-                -webkit-text-fill-color: transparent !important;
-                background-clip: text !important;
-            }
-
-            /* Soft Glow */
-            .soft-glow {
-                box-shadow: 0 0 20px rgba(255,255,255,0.05), 0 0 60px rgba(255,255,255,0.02) !important;
-                animation: glowPulse 4s ease-in-out infinite !important;
-            }
-
-            /* ═══════ CARD SYSTEM ═══════ */
-            .result-card, .stat-card, .hist-card, .resource-card, .stExpander {
-                background: rgba(255,255,255,0.03) !important;
-                backdrop-filter: blur(16px) saturate(1.2) !important;
-                -webkit-backdrop-filter: blur(16px) saturate(1.2) !important;
-                border: 1px solid rgba(255,255,255,0.07) !important;
-                border-radius: 14px !important;
-                box-shadow: 0 8px 32px rgba(0,0,0,0.3) !important;
-                transition: all 0.3s cubic-bezier(0.16,1,0.3,1) !important;
-                position: relative; overflow: hidden;
-            }
-            .result-card { padding: 24px !important; animation: fadeUp 0.6s cubic-bezier(0.16,1,0.3,1); margin-bottom: 20px; }
-            .result-card:hover, .stat-card:hover, .hist-card:hover, .resource-card:hover, .stExpander:hover {
-                border-color: rgba(255,255,255,0.18) !important;
-                transform: translateY(-4px) !important;
-                box-shadow: 0 16px 48px rgba(0,0,0,0.5) !important;
-                background: rgba(255,255,255,0.05) !important;
-            }
-            .result-card::after {
-                content: ''; position: absolute; top: 0; left: 0; width: 100%; height: 2px;
-                background: linear-gradient(90deg, rgba(255,255,255,0.6), rgba(255,255,255,0.1), transparent); opacity: 0; transition: opacity 0.3s ease;
-            }
-            .result-card:hover::after { opacity: 1; }
-        
-            /* ── Ghost nav buttons ── */
-            [data-testid="stBottomBlockContainer"] {
-                display: none !important;
-                visibility: hidden !important;
-                height: 0 !important;
-                overflow: hidden !important;
-            }
-
-            /* Buttons — white on black */
-            .stButton > button {
-                font-family: 'Inter', sans-serif !important;
-                font-weight: 600 !important;
-                letter-spacing: 0.05em !important;
-                background: #FFFFFF !important;
-                color: #0A0A0A !important;
-                border-radius: 10px !important;
-                border: none !important;
-                padding: 10px 24px !important;
-                transition: all 0.25s cubic-bezier(0.16,1,0.3,1) !important;
-                box-shadow: 0 4px 16px rgba(0,0,0,0.3) !important;
-                position: relative !important;
-                overflow: hidden !important;
-            }
-            .stButton > button::before {
-                content: '' !important; position: absolute !important; inset: 0 !important;
-                background: linear-gradient(135deg, rgba(255,255,255,0.15), transparent) !important;
-                opacity: 0 !important; transition: opacity 0.2s !important;
-            }
-            .stButton > button:hover {
-                transform: translateY(-2px) !important;
-                box-shadow: 0 8px 28px rgba(255,255,255,0.15) !important;
-                background: #F0F0F0 !important;
-            }
-            .stButton > button:hover::before { opacity: 1 !important; }
-        
-            /* Inputs — dark glass */
-            .stTextInput > div > div > input, .stTextArea > div > div > textarea, .stSelectbox > div > div, .stMultiSelect > div > div {
-                background: rgba(255,255,255,0.04) !important;
-                border: 1px solid rgba(255,255,255,0.1) !important;
-                border-radius: 10px !important;
-                color: #E5E5E5 !important;
-                font-family: 'Inter', sans-serif !important;
-                font-size: 0.95rem !important;
-                transition: all 0.25s cubic-bezier(0.16,1,0.3,1) !important;
-                backdrop-filter: blur(8px) !important;
-            }
-            .stTextInput > div > div > input:focus, .stTextArea > div > div > textarea:focus, .stSelectbox > div > div:focus-within {
-                border-color: rgba(255,255,255,0.3) !important;
-                background: rgba(255,255,255,0.06) !important;
-                box-shadow: 0 0 0 3px rgba(255,255,255,0.06) !important;
-            }
-            label, .stRadio label, .stCheckbox label, .stSelectbox label, .stTextInput label, .stTextArea label {
-                font-family: 'Space Grotesk', sans-serif !important;
-                font-size: 0.72rem !important;
-                letter-spacing: 0.1em !important;
-                color: #666666 !important;
-                text-transform: uppercase !important;
-            }
-            
-            /* Dividers */
-            hr { border: none !important; border-top: 1px solid rgba(255,255,255,0.07) !important; margin: 32px 0 !important; background: transparent !important; }
-        
-            /* Badge Pills */
-            .skill-badge {
-                display: inline-block; padding: 4px 12px; border-radius: 6px;
-                font-family: 'Space Grotesk', sans-serif; font-size: 0.7rem; font-weight: 500; letter-spacing: 0.04em;
-                margin: 4px; background: rgba(255,255,255,0.06); color: #CCCCCC;
-                border: 1px solid rgba(255,255,255,0.12); transition: all 0.25s cubic-bezier(0.16,1,0.3,1); cursor: default;
-            }
-            .skill-badge:hover { background: rgba(255,255,255,0.12); border-color: rgba(255,255,255,0.3); color: #fff; transform: translateY(-1px); box-shadow: 0 4px 12px rgba(0,0,0,0.3); }
-            .skill-badge.purple { background: rgba(255,255,255,0.05); border-color: rgba(255,255,255,0.12); color: #BBBBBB; }
-            .skill-badge.green { background: rgba(255,255,255,0.05); border-color: rgba(255,255,255,0.12); color: #BBBBBB; }
-        
-            /* Match Ring */
-            .match-ring-wrap { display:flex; flex-direction:column; align-items:center; justify-content:center; gap:8px; }
-            .match-ring { position:relative; width:80px; height:80px; }
-            .match-ring svg { transform:rotate(-90deg); }
-            .match-ring .ring-bg { fill:none; stroke:rgba(255,255,255,0.06); stroke-width:5; }
-            .match-ring .ring-fill { fill:none; stroke-width:5; stroke-linecap:round; transition:stroke-dashoffset 1.2s cubic-bezier(.16,1,.3,1); filter:drop-shadow(0 0 4px currentColor); }
-            .match-ring .ring-text { position:absolute; inset:0; display:flex; flex-direction:column; align-items:center; justify-content:center; }
-            .match-ring .ring-pct { font-size:1.4rem; font-weight:700; color:#fff; line-height:1; }
-            .match-ring .ring-label { font-size:0.55rem; color:rgba(255,255,255,0.35); letter-spacing:0.1em; text-transform:uppercase; font-family:'Space Grotesk', sans-serif; margin-top: 2px;}
-        
-            /* Components */
-            .stats-row { display:flex; gap:16px; margin:20px 0; flex-wrap:wrap; }
-            .stat-card { padding: 24px 20px; text-align: left; }
-            .stat-card .stat-num { font-size: 2.2rem; font-weight: 700; color: #FFFFFF; line-height: 1; margin-bottom: 8px; font-family: 'Space Grotesk', sans-serif; }
-            .stat-card .stat-lbl { font-family: 'Space Grotesk', sans-serif; font-size: 0.65rem; color: #666666; text-transform: uppercase; letter-spacing: 0.1em; }
-            .hist-card { padding: 20px; margin-bottom: 16px; border-radius: 12px; text-decoration: none; }
-            .resource-grid { display: grid; grid-template-columns: repeat(auto-fill, minmax(280px, 1fr)); gap: 16px; margin: 16px 0; }
-            .resource-card { padding: 24px; text-decoration: none; display: block; }
-            .resource-card .rc-icon { font-size: 1.8rem; margin-bottom: 12px; }
-            .resource-card .rc-name { font-size: 1.05rem; font-weight: 600; color: #E5E5E5; margin-bottom: 6px; }
-            .resource-card .rc-desc { font-size: 0.85rem; color: #666666; line-height: 1.6; }
-            .resource-card .rc-tag { display: inline-block; margin-top: 14px; font-family: 'Space Grotesk', sans-serif; font-size: 0.65rem; padding: 4px 10px; border-radius: 6px; background: rgba(255,255,255,0.04); color: #999999; border: 1px solid rgba(255,255,255,0.08); }
-            .tip-item  { display:flex; gap:10px; align-items:flex-start; padding:12px; border-radius:10px; background:rgba(255,255,255,0.03); border:1px solid rgba(255,255,255,0.08); margin-bottom:8px; font-size:0.88rem; color:#CCCCCC; backdrop-filter:blur(4px); }
-            .learn-item { display:flex; gap:10px; align-items:center; padding:12px; border-radius:10px; background:rgba(255,255,255,0.03); border:1px solid rgba(255,255,255,0.08); margin-bottom:8px; font-size:0.88rem; color:#CCCCCC; backdrop-filter:blur(4px); }
-            .compare-header { font-family:'Space Grotesk',sans-serif; font-size:1.4rem; letter-spacing:0; color:#E5E5E5; margin-bottom:12px; }
-            .compare-cell { background:rgba(255,255,255,0.03); border:1px solid rgba(255,255,255,0.07); border-radius:14px; padding:20px; height:100%; backdrop-filter:blur(8px); }
-        
-            /* Progress Bar */
-            .stProgress > div > div > div { background: #FFFFFF !important; border-radius: 6px !important; }
-        
-            /* Job Links */
-            .job-links-row { display:flex; flex-wrap:wrap; gap:10px; margin-top:16px; }
-            .job-link-btn { display:inline-flex; align-items:center; gap:8px; padding:8px 16px; border-radius:8px; font-size:0.8rem; font-weight:500; text-decoration:none!important; border:1px solid; transition:all 0.25s cubic-bezier(0.16,1,0.3,1); background:rgba(255,255,255,0.03); color:#E5E5E5; border-color:rgba(255,255,255,0.1); backdrop-filter:blur(4px); }
-            .job-link-btn:hover { background: rgba(255,255,255,0.08); border-color: rgba(255,255,255,0.25); transform: translateY(-2px); box-shadow: 0 4px 16px rgba(0,0,0,0.3); }
-        
-            /* Custom Hamburger Menu overrides */
-            #jl-hamburger {
-                background: rgba(10,10,10,0.7); border: 1px solid rgba(255,255,255,0.1); border-radius: 10px; box-shadow: 0 4px 16px rgba(0,0,0,0.5); backdrop-filter: blur(12px);
-            }
-            #jl-hamburger:hover { background: rgba(255,255,255,0.08); border-color: rgba(255,255,255,0.25); }
-            #jl-hamburger span { background: #FFFFFF; }
-            #jl-nav-panel {
-                background: rgba(10,10,10,0.97); border-left: 1px solid rgba(255,255,255,0.06); box-shadow: -8px 0 40px rgba(0,0,0,0.8); backdrop-filter: blur(20px);
-            }
-            #jl-nav-panel .nav-label { color: #666666; }
-            #jl-nav-panel .nav-item:hover { background: rgba(255,255,255,0.06); border-color: rgba(255,255,255,0.1); color: #fff; }
-            #jl-nav-panel .nav-item.active { background: rgba(255,255,255,0.1); border-color: rgba(255,255,255,0.2); color: #fff; }
-            #jl-nav-panel .settings-btn { border-color: rgba(255,255,255,0.1); color: #E5E5E5; background: rgba(255,255,255,0.04); }
-            #jl-nav-panel .settings-btn:hover { background: rgba(255,255,255,0.1); border-color: rgba(255,255,255,0.2); }
-        </style>
-        
-        """
-        st.markdown(css, unsafe_allow_html=True)
+        static_assets.stylesheet("jobless.css")
 
         # ── Custom cursor + hidden-nav wiring + hamburger ─────────────────
-        cursor_js = """
-        <script>
-        (function() {
-            var fe = window.frameElement;
-            if (fe) { fe.style.cssText += ';display:block!important;position:absolute!important;top:0!important;left:0!important;width:0!important;height:0!important;overflow:hidden!important;pointer-events:none!important;border:none!important;margin:0!important;padding:0!important;opacity:0!important;'; }
-        })();
-        (function cursorBoot() {
-            function init() {
-                try {
-                    var P = window.parent, pdoc = P.document;
-                    if (!pdoc || !pdoc.body) { setTimeout(init, 80); return; }
-
-                    // Force cleanup of old injected elements on Streamlit auto-reruns
-                    ['nexstep-injected-css', 'jl-sidebar-btn', 'jl-overlay', 'jl-panel', 'jl-hbg', 'jl-hamburger', 'ns-dot', 'ns-ring'].forEach(function(i){ pdoc.querySelectorAll('#' + i).forEach(function(e){ e.remove(); }); });
-                    if (P.__jlNavObserver) { P.__jlNavObserver.disconnect(); P.__jlNavObserver = null; }
-                    var oldStyles = pdoc.head.querySelectorAll('style');
-                    for(var i=0; i<oldStyles.length; i++) {
-                        if(oldStyles[i].textContent && oldStyles[i].textContent.indexOf('stSidebar')>-1 && !oldStyles[i].id) oldStyles[i].remove();
-                    }
-
-
-                    // ── CSS: cursor + ghost hide + hamburger ──────────────
-                    if (!pdoc.getElementById('nexstep-injected-css')) {
-                        var s = pdoc.createElement('style'); s.id = 'nexstep-injected-css';
-                        s.textContent = [
-                            '* { cursor: none !important; }',
-                            '#ns-dot { position:fixed!important; left:0!important; top:0!important; width:10px!important; height:10px!important; background:#FFFFFF!important; border-radius:50%!important; pointer-events:none!important; z-index:2147483647!important; will-change:transform!important; box-shadow:0 0 10px rgba(255,255,255,.5),0 0 24px rgba(255,255,255,.2)!important; transition:width .15s,height .15s,background .15s!important; mix-blend-mode:screen!important; }',
-                            '#ns-dot.ns-click { width:5px!important; height:5px!important; background:#FFFFFF!important; box-shadow:0 0 12px #FFFFFF!important; }',
-                            '#ns-ring { position:fixed!important; left:0!important; top:0!important; width:34px!important; height:34px!important; border:1.5px solid rgba(255,255,255,.3)!important; border-radius:50%!important; pointer-events:none!important; z-index:2147483646!important; will-change:transform!important; transition:width .2s ease,height .2s ease,border-color .2s ease,background .2s ease!important; }',
-                            '#ns-ring.ns-hover { width:56px!important; height:56px!important; border-color:#FFFFFF!important; background:rgba(255,255,255,.06)!important; }',
-                            '.jl-ghost-btn { position:fixed!important; top:-9999px!important; left:-9999px!important; width:1px!important; height:1px!important; overflow:hidden!important; opacity:0!important; pointer-events:none!important; }',
-                            /* hamburger button — top right */
-                            '#jl-hbg { position:fixed!important; top:14px!important; right:14px!important; z-index:2147483640!important; width:42px!important; height:42px!important; background:rgba(10,10,10,0.7)!important; backdrop-filter:blur(12px)!important; -webkit-backdrop-filter:blur(12px)!important; border:1px solid rgba(255,255,255,0.1)!important; border-radius:11px!important; display:flex!important; flex-direction:column!important; align-items:center!important; justify-content:center!important; gap:5px!important; cursor:pointer!important; transition:all 0.2s ease!important; box-shadow:0 4px 20px rgba(0,0,0,0.5)!important; }',
-                            '#jl-hbg:hover { background:rgba(255,255,255,0.08)!important; border-color:rgba(255,255,255,0.25)!important; }',
-                            '#jl-hbg span { display:block!important; width:17px!important; height:1.5px!important; background:#FFFFFF!important; border-radius:2px!important; transition:all 0.25s ease!important; pointer-events:none!important; }',
-                            '#jl-hbg.open span:nth-child(1) { transform:translateY(6.5px) rotate(45deg)!important; }',
-                            '#jl-hbg.open span:nth-child(2) { opacity:0!important; transform:scaleX(0)!important; }',
-                            '#jl-hbg.open span:nth-child(3) { transform:translateY(-6.5px) rotate(-45deg)!important; }',
-                            /* nav panel */
-                            '#jl-panel { position:fixed!important; top:0!important; right:0!important; width:230px!important; height:100vh!important; background:rgba(10,10,10,0.97)!important; backdrop-filter:blur(24px)!important; -webkit-backdrop-filter:blur(24px)!important; border-left:1px solid rgba(255,255,255,0.06)!important; z-index:2147483639!important; transform:translateX(100%)!important; transition:transform 0.3s cubic-bezier(0.16,1,0.3,1)!important; padding:68px 16px 24px!important; display:flex!important; flex-direction:column!important; gap:3px!important; box-shadow:-8px 0 40px rgba(0,0,0,0.6)!important; overflow-y:auto!important; }',
-                            '#jl-panel.open { transform:translateX(0)!important; }',
-                            '#jl-overlay { position:fixed!important; inset:0!important; z-index:2147483638!important; display:none!important; }',
-                            '#jl-overlay.open { display:block!important; }',
-                            '.jl-nlbl { font-family:monospace!important; font-size:0.58rem!important; letter-spacing:0.2em!important; text-transform:uppercase!important; color:rgba(255,255,255,0.25)!important; margin:0 0 10px 4px!important; }',
-                            '.jl-ni { display:flex!important; align-items:center!important; gap:10px!important; padding:10px 14px!important; border-radius:10px!important; border:1px solid transparent!important; cursor:pointer!important; font-family:sans-serif!important; font-size:0.88rem!important; font-weight:500!important; color:#666666!important; transition:all 0.18s ease!important; margin-bottom:2px!important; }',
-                            '.jl-ni:hover { background:rgba(255,255,255,0.06)!important; border-color:rgba(255,255,255,0.1)!important; color:#E5E5E5!important; }',
-                            '.jl-ni.active { background:rgba(255,255,255,0.1)!important; border-color:rgba(255,255,255,0.2)!important; color:#FFFFFF!important; font-weight:600!important; }'
-                        ].join('');
-                        pdoc.head.appendChild(s);
-                    }
-
-                    // ── Build hamburger in parent doc ─────────────────────
-                    if (!pdoc.getElementById('jl-hbg')) {
-                        var L=__LUCIDE_JS__;
-                        function _mkSvg(k,sz,col){
-                            var ns='http://www.w3.org/2000/svg';
-                            var s=document.createElementNS(ns,'svg');
-                            s.setAttribute('width',sz);s.setAttribute('height',sz);
-                            s.setAttribute('viewBox','0 0 24 24');s.setAttribute('fill','none');
-                            s.setAttribute('stroke',col||'currentColor');
-                            s.setAttribute('stroke-width','1.6');
-                            s.setAttribute('stroke-linecap','round');s.setAttribute('stroke-linejoin','round');
-                            s.style.cssText='display:inline-block;vertical-align:middle;flex-shrink:0;margin-right:2px;';
-                            s.innerHTML=L[k]||'';return s;
-                        }
-                        var NAV_DEFS = [
-                            ['home',     'dashboard',   'Home'],
-                            ['career',   'trending-up', 'Career Analysis'],
-                            ['resume',   'file-edit',   'Resume Builder'],
-                            ['interview','mic',         'Mock Interview'],
-                            ['pyq',      'archive',     'PYQ Hub'],
-                            ['resources','library',     'Resources'],
-                            ['compare',  'compare',     'Compare'],
-                            ['history',  'history',     'History']
-                        ];
-                        var curPage = (new URLSearchParams(P.location.search)).get('page') || 'home';
-
-                        // ── Right-Side Nav Hamburger & Panel ──
-                        var overlay = pdoc.createElement('div'); overlay.id = 'jl-overlay';
-                        var panel   = pdoc.createElement('div'); panel.id   = 'jl-panel';
-                        var lbl     = pdoc.createElement('div'); lbl.className = 'jl-nlbl'; lbl.textContent = 'Navigation';
-                        panel.appendChild(lbl);
-
-                        NAV_DEFS.forEach(function(nd) {
-                            var item = pdoc.createElement('div');
-                            item.className = 'jl-ni' + (nd[0] === curPage ? ' active' : '');
-                            item.setAttribute('data-page', nd[0]);
-                            var col = nd[0] === curPage ? '#0047FF' : 'currentColor';
-                            item.appendChild(_mkSvg(nd[1], 17, col));
-                            item.appendChild(pdoc.createTextNode('\u00a0' + nd[2]));
-                            item.addEventListener('click', function() {
-                                P.postMessage({type:'jl-nav', page:nd[0]}, '*');
-                                try { P.history.pushState({page:nd[0]},'','?page='+nd[0]); } catch(e){}
-                                closePanel();
-                            });
-                            panel.appendChild(item);
-                        });
-
-                        var hbg = pdoc.createElement('div'); hbg.id = 'jl-hbg';
-                        hbg.innerHTML = '<span></span><span></span><span></span>';
-
-                        function closePanel() {
-                            hbg.classList.remove('open');
-                            panel.classList.remove('open');
-                            overlay.classList.remove('open');
-                        }
-                        hbg.addEventListener('click', function(e) {
-                            e.stopPropagation();
-                            panel.classList.contains('open') ? closePanel() : (hbg.classList.add('open'), panel.classList.add('open'), overlay.classList.add('open'));
-                        });
-                        overlay.addEventListener('click', closePanel);
-
-                        // browser back/forward → update active item
-                        P.addEventListener('popstate', function(e) {
-                            var pg = (e.state && e.state.page) || (new URLSearchParams(P.location.search)).get('page') || 'home';
-                            P.postMessage({type:'jl-nav', page:pg}, '*');
-                            pdoc.querySelectorAll('.jl-ni').forEach(function(el) {
-                                el.classList.toggle('active', el.getAttribute('data-page') === pg);
-                            });
-                        });
-
-                        pdoc.body.appendChild(overlay);
-                        pdoc.body.appendChild(panel);
-                        pdoc.body.appendChild(hbg);
-                    }
-
-                    // ── Cursor elements ───────────────────────────────────
-                    if (pdoc.getElementById('ns-dot')) return;
-                    var dot = pdoc.createElement('div'); dot.id = 'ns-dot'; pdoc.body.appendChild(dot);
-                    var ring = pdoc.createElement('div'); ring.id = 'ns-ring'; pdoc.body.appendChild(ring);
-                    var mx = P.innerWidth/2, my = P.innerHeight/2, rx = mx, ry = my;
-                    pdoc.addEventListener('mousemove', function(e){ mx=e.clientX; my=e.clientY; dot.style.transform='translate3d('+(mx-5)+'px,'+(my-5)+'px,0)'; }, {passive:true});
-                    P.addEventListener('message', function(e){ if(e.data&&e.data.type==='ns-move'){ mx=e.data.x; my=e.data.y; dot.style.transform='translate3d('+(mx-5)+'px,'+(my-5)+'px,0)'; } });
-
-                    // ── Ghost nav buttons ─────────────────────────────────
-                    var NAV_PAGES = ['home','career','history','compare','resources','resume','interview','pyq'];
-                    function processNavBtns() {
-                        pdoc.querySelectorAll('button').forEach(function(btn) {
-                            var t = btn.textContent.replace(/\\s+/g,'').toLowerCase();
-                            NAV_PAGES.forEach(function(p) {
-                                if (t === 'jlnav' + p) {
-                                    btn.setAttribute('data-jl-nav', p);
-                                    var wrap = btn.closest('.stButton') || btn.parentElement;
-                                    if (wrap) wrap.classList.add('jl-ghost-btn');
-                                }
-                            });
-                        });
-                    }
-                    processNavBtns();
-                    if (!P.__jlNavObserver) {
-                        P.__jlNavObserver = new P.MutationObserver(processNavBtns);
-                        P.__jlNavObserver.observe(pdoc.body, {childList:true, subtree:true});
-                    }
-
-                    // Route postMessage → ghost button click + update hamburger active state
-                    P.addEventListener('message', function(e) {
-                        if (e.data && e.data.type === 'jl-nav') {
-                            var btn = pdoc.querySelector('[data-jl-nav="' + e.data.page + '"]');
-                            if (btn) btn.click();
-                            pdoc.querySelectorAll('.jl-ni').forEach(function(el) {
-                                el.classList.toggle('active', el.getAttribute('data-page') === e.data.page);
-                            });
-                        }
-                    });
-
-                    var HSel = 'button,a,input,textarea,select,label,summary';
-                    pdoc.addEventListener('mouseover', function(e){ if(e.target.closest&&e.target.closest(HSel)) ring.classList.add('ns-hover'); });
-                    pdoc.addEventListener('mouseout',  function(e){ if(e.target.closest&&e.target.closest(HSel)) ring.classList.remove('ns-hover'); });
-                    pdoc.addEventListener('mousedown', function(){ dot.classList.add('ns-click'); });
-                    pdoc.addEventListener('mouseup',   function(){ dot.classList.remove('ns-click'); });
-                    (function ringLoop(){ rx+=(mx-rx)*0.22; ry+=(my-ry)*0.22; ring.style.transform='translate3d('+(rx-17)+'px,'+(ry-17)+'px,0)'; P.requestAnimationFrame(ringLoop); })();
-                } catch(err){ setTimeout(init, 200); }
-            }
-            init();
-        })();
-        </script>
-        """
-        cursor_js = cursor_js.replace('__LUCIDE_JS__', _LUCIDE_JS)
+        cursor_js = static_assets.read("cursor.html")
+        cursor_js = cursor_js.replace('__LUCIDE_JS__', _lucide_js())
         components.html(cursor_js, height=1, scrolling=False)
 
     @staticmethod
@@ -2474,382 +1584,30 @@ class UIComponents:
     @staticmethod
     def show_api_setup_banner():
         import streamlit.components.v1 as _cmp
-        _cmp.html("""<!DOCTYPE html>
-<html>
-<head>
-<meta charset="UTF-8">
-<link href="https://fonts.googleapis.com/css2?family=Syne:wght@400;600;700;800&family=DM+Mono:wght@400;500&family=DM+Sans:wght@300;400;500&display=swap" rel="stylesheet">
-<style>
-*{margin:0;padding:0;box-sizing:border-box}
-html,body{background:#0A0A0A!important;font-family:'DM Sans',sans-serif}
-.wrap{display:flex;height:340px;gap:0;position:relative}
-.L{flex:0 0 44%;padding:22px 24px 18px 24px;display:flex;flex-direction:column;justify-content:space-between;position:relative;overflow:hidden;border-right:1px solid rgba(255,255,255,0.06)}
-.L::before{content:'';position:absolute;inset:0;background:radial-gradient(ellipse 80% 60% at 10% 0%,rgba(255,255,255,0.03) 0%,transparent 60%),radial-gradient(ellipse 60% 50% at 90% 100%,rgba(255,255,255,0.04) 0%,transparent 60%),linear-gradient(160deg,#0A0A0A 0%,#080808 100%);z-index:0}
-.L::after{content:'';position:absolute;inset:0;background-image:linear-gradient(rgba(255,255,255,0.02) 1px,transparent 1px),linear-gradient(90deg,rgba(255,255,255,0.02) 1px,transparent 1px);background-size:28px 28px;z-index:0;mask-image:radial-gradient(ellipse 100% 100% at 50% 50%,black 40%,transparent 100%)}
-.L>*{position:relative;z-index:2}
-.ltag{display:inline-flex;align-items:center;gap:6px;background:rgba(255,255,255,0.04);border:1px solid rgba(255,255,255,0.1);border-radius:20px;padding:3px 10px;margin-bottom:12px}
-.ltag-dot{width:5px;height:5px;border-radius:50%;background:#FFFFFF;box-shadow:0 0 8px rgba(255,255,255,0.5);animation:glow 2s ease-in-out infinite}
-@keyframes glow{0%,100%{opacity:1;box-shadow:0 0 8px rgba(255,255,255,0.5)}50%{opacity:.5;box-shadow:0 0 4px rgba(255,255,255,0.3)}}
-.ltag-txt{font-family:'DM Mono',monospace;font-size:.52rem;letter-spacing:.18em;text-transform:uppercase;color:rgba(255,255,255,0.4)}
-.ltitle{font-family:'Syne',sans-serif;font-size:1.05rem;font-weight:800;background:linear-gradient(125deg,#ffffff 0%,#cccccc 45%,#999999 100%);-webkit-background-clip:text;-webkit-text-fill-color:transparent;background-clip:text;line-height:1.25;margin-bottom:4px}
-.lsub{font-size:.62rem;color:rgba(255,255,255,0.28);letter-spacing:.04em;font-weight:300;margin-bottom:14px}
-.ldiv{height:1px;margin-bottom:14px;background:linear-gradient(90deg,transparent,rgba(255,255,255,.15),rgba(255,255,255,.1),transparent);position:relative}
-.ldiv::after{content:'';position:absolute;top:-1px;left:30%;width:20px;height:3px;background:#FFFFFF;border-radius:2px;filter:blur(3px);animation:divslide 3s ease-in-out infinite}
-@keyframes divslide{0%,100%{left:10%;opacity:.8}50%{left:70%;opacity:1}}
-.prow{display:flex;align-items:center;gap:8px;margin-bottom:8px;padding:7px 10px;border-radius:10px;border:1px solid rgba(255,255,255,0.05);background:rgba(255,255,255,0.03);transition:all .25s ease;cursor:default;animation:prowIn .5s ease both}
-.prow:nth-child(1){animation-delay:.1s}
-.prow:nth-child(2){animation-delay:.2s}
-.prow:nth-child(3){animation-delay:.3s}
-@keyframes prowIn{from{opacity:0;transform:translateX(-12px)}to{opacity:1;transform:translateX(0)}}
-.prow:hover{border-color:rgba(255,255,255,0.15);background:rgba(255,255,255,0.04);transform:translateX(3px)}
-.pbadge{border-radius:6px;padding:2px 8px;font-size:.6rem;font-weight:700;flex-shrink:0;font-family:'Syne',sans-serif}
-.pmeta{flex:1;overflow:hidden}
-.pname{font-size:.68rem;font-weight:600;color:rgba(255,255,255,.8);line-height:1;margin-bottom:1px}
-.pdesc{font-size:.57rem;color:rgba(255,255,255,.3);white-space:nowrap;overflow:hidden;text-overflow:ellipsis}
-.plink{font-size:.58rem;font-weight:600;text-decoration:none;flex-shrink:0;opacity:.65;font-family:'DM Mono',monospace;transition:opacity .2s}
-.plink:hover{opacity:1}
-.lpill{display:inline-flex;align-items:center;gap:8px;padding:7px 14px;border-radius:30px;background:rgba(255,255,255,.04);border:1px solid rgba(255,255,255,.1);animation:pillIn .6s ease .5s both}
-@keyframes pillIn{from{opacity:0;transform:translateY(8px)}to{opacity:1;transform:translateY(0)}}
-.lpill-txt{font-size:.65rem;color:rgba(255,255,255,.6);font-weight:500;letter-spacing:.03em}
-.lpill-accent{color:#FFFFFF;font-weight:700}
-.R{flex:1;position:relative;overflow:hidden;background:linear-gradient(155deg,#0A0A0A 0%,#080808 100%)}
-.R::after{content:'';position:absolute;inset:0;pointer-events:none;z-index:40;background:repeating-linear-gradient(0deg,transparent,transparent 3px,rgba(0,0,0,0.06) 3px,rgba(0,0,0,0.06) 4px)}
-.blob{position:absolute;border-radius:50%;pointer-events:none;filter:blur(40px);opacity:.3}
-.blob1{width:180px;height:180px;background:radial-gradient(#FFFFFF,transparent);top:-40px;right:-20px;animation:b1 8s ease-in-out infinite}
-.blob2{width:140px;height:140px;background:radial-gradient(#CCCCCC,transparent);bottom:-30px;left:10px;animation:b2 10s ease-in-out infinite}
-@keyframes b1{0%,100%{transform:translate(0,0) scale(1)}50%{transform:translate(-20px,15px) scale(1.1)}}
-@keyframes b2{0%,100%{transform:translate(0,0) scale(1)}50%{transform:translate(15px,-20px) scale(.9)}}
-.livebadge{position:absolute;top:12px;right:14px;z-index:50;display:flex;align-items:center;gap:5px;background:rgba(0,0,0,0.5);border:1px solid rgba(255,255,255,0.15);border-radius:20px;padding:3px 10px;backdrop-filter:blur(8px)}
-.livebadge-dot{width:5px;height:5px;border-radius:50%;background:#FFFFFF;box-shadow:0 0 8px rgba(255,255,255,0.5);animation:lp 1.4s ease-in-out infinite}
-@keyframes lp{0%,100%{transform:scale(1);opacity:1}50%{transform:scale(1.4);opacity:.6}}
-.livebadge-txt{font-family:'DM Mono',monospace;font-size:.48rem;letter-spacing:.18em;color:rgba(255,255,255,.5);text-transform:uppercase}
-.tabs{position:absolute;bottom:0;left:0;right:0;z-index:50;display:flex;align-items:center;justify-content:center;gap:4px;padding:8px 10px;background:linear-gradient(0deg,rgba(10,10,10,.95) 0%,transparent 100%)}
-.tab{display:flex;align-items:center;gap:5px;padding:4px 10px;border-radius:20px;border:1px solid rgba(255,255,255,.07);background:rgba(255,255,255,.04);font-size:.56rem;font-weight:600;color:rgba(255,255,255,.35);cursor:pointer;transition:all .25s ease;font-family:'DM Mono',monospace;letter-spacing:.05em;text-transform:uppercase;white-space:nowrap}
-.tab.active{background:rgba(255,255,255,.1);border-color:rgba(255,255,255,.25);color:#FFFFFF;box-shadow:0 0 14px rgba(255,255,255,.06)}
-.tab-icon{font-size:.65rem}
-.slides{position:absolute;inset:0;bottom:38px}
-.slide{position:absolute;inset:0;padding:18px 18px 10px 18px;display:flex;flex-direction:column;opacity:0;transform:translateY(14px) scale(.98);transition:opacity .5s cubic-bezier(.4,0,.2,1),transform .5s cubic-bezier(.4,0,.2,1);pointer-events:none;overflow:hidden}
-.slide.active{opacity:1;transform:translateY(0) scale(1);pointer-events:auto}
-.slide.exit{opacity:0;transform:translateY(-10px) scale(.98)}
-.slabel{display:flex;align-items:center;gap:6px;margin-bottom:10px}
-.slabel-dot{width:4px;height:4px;border-radius:50%;background:#FFFFFF;box-shadow:0 0 6px rgba(255,255,255,0.5);animation:glow 1.5s ease-in-out infinite}
-.slabel-txt{font-family:'DM Mono',monospace;font-size:.5rem;letter-spacing:.16em;text-transform:uppercase;color:rgba(255,255,255,.35)}
-.stitle{font-family:'Syne',sans-serif;font-size:.88rem;font-weight:700;color:#f1f5f9;margin-bottom:10px;line-height:1.2}
-.stitle span{background:linear-gradient(90deg,#FFFFFF,#999999);-webkit-background-clip:text;-webkit-text-fill-color:transparent;background-clip:text}
-.input-field{background:rgba(255,255,255,.04);border:1px solid rgba(255,255,255,.1);border-radius:8px;padding:7px 11px;font-size:.67rem;color:#b3b3b3;font-family:'DM Mono',monospace;margin-bottom:10px;display:flex;align-items:center;gap:6px}
-.input-field::before{content:'>';color:rgba(255,255,255,.3);font-size:.55rem}
-.cursor{display:inline-block;width:1.5px;height:10px;background:#FFFFFF;margin-left:2px;vertical-align:middle;animation:blink .9s step-end infinite}
-@keyframes blink{0%,100%{opacity:1}50%{opacity:0}}
-.career-cards{display:flex;flex-direction:column;gap:6px}
-.ccard{background:rgba(255,255,255,.03);border:1px solid rgba(255,255,255,.07);border-radius:10px;padding:8px 10px;display:flex;align-items:center;gap:10px;opacity:0;transform:translateX(-10px)}
-.ccard.show{animation:cardIn .4s ease forwards}
-@keyframes cardIn{to{opacity:1;transform:translateX(0)}}
-.ccard-role{flex:1}
-.ccard-name{font-size:.7rem;font-weight:600;color:#FAFAF7;font-family:'Syne',sans-serif;margin-bottom:3px}
-.ccard-sal{font-size:.58rem;color:rgba(255,255,255,.35);font-family:'DM Mono',monospace}
-.ccard-score{text-align:right;flex-shrink:0}
-.ccard-pct{font-family:'DM Mono',monospace;font-size:.75rem;font-weight:500}
-.ccard-bar{width:60px;height:3px;background:rgba(255,255,255,.08);border-radius:2px;overflow:hidden;margin-top:3px}
-.ccard-fill{height:100%;border-radius:2px;background:linear-gradient(90deg,#FFFFFF,#999999);width:0%;transition:width 1.2s cubic-bezier(.4,0,.2,1)}
-.resume-mock{background:rgba(255,255,255,.03);border:1px solid rgba(255,255,255,.08);border-radius:10px;padding:10px 12px;flex:1;display:flex;flex-direction:column;gap:5px;overflow:hidden}
-.rm-head{height:8px;width:55%;border-radius:4px;background:rgba(255,255,255,.2);transform:scaleX(0);transform-origin:left;margin-bottom:3px}
-.rm-line{height:4px;border-radius:2px;background:rgba(255,255,255,.1);transform:scaleX(0);transform-origin:left}
-.rm-line.go{animation:lineIn .4s ease forwards}
-.rm-head.go{animation:lineIn .4s ease forwards}
-@keyframes lineIn{to{transform:scaleX(1)}}
-.ats-badge{display:inline-flex;align-items:center;gap:6px;margin-top:8px;background:linear-gradient(135deg,rgba(255,255,255,.06),rgba(255,255,255,.03));border:1px solid rgba(255,255,255,.15);border-radius:8px;padding:5px 12px;opacity:0;transition:opacity .5s ease;align-self:flex-start}
-.ats-badge.show{opacity:1}
-.ats-check{color:#FFFFFF;font-size:.8rem}
-.ats-label{font-family:'DM Mono',monospace;font-size:.62rem;font-weight:500;color:#FFFFFF}
-.ats-score{font-family:'Syne',sans-serif;font-size:1.1rem;font-weight:800;color:#FFFFFF;line-height:1}
-.ats-max{font-size:.55rem;color:rgba(255,255,255,.35);font-family:'DM Mono',monospace}
-.chat{display:flex;flex-direction:column;gap:8px;flex:1}
-.bubble{max-width:90%;border-radius:12px;padding:8px 11px;font-size:.63rem;line-height:1.55;font-family:'DM Sans',sans-serif;opacity:0;transform:translateY(8px)}
-.bubble.show{animation:bubbleIn .4s ease forwards}
-@keyframes bubbleIn{to{opacity:1;transform:translateY(0)}}
-.bubble.ai{background:rgba(255,255,255,.1);border:1px solid rgba(255,255,255,.25);border-radius:12px 12px 12px 3px;color:#d8b4fe;align-self:flex-start}
-.bubble.user{background:rgba(255,255,255,.05);border:1px solid rgba(255,255,255,.12);border-radius:12px 12px 3px 12px;color:#CCCCCC;align-self:flex-end;margin-left:10%}
-.typing{display:flex;align-items:center;gap:3px;padding:8px 12px;background:rgba(255,255,255,.07);border:1px solid rgba(255,255,255,.15);border-radius:12px 12px 12px 3px;width:fit-content;opacity:0}
-.typing.show{animation:bubbleIn .3s ease forwards}
-.tdot{width:4px;height:4px;border-radius:50%;background:#FFFFFF;animation:td 1.2s ease-in-out infinite}
-.tdot:nth-child(2){animation-delay:.2s}
-.tdot:nth-child(3){animation-delay:.4s}
-@keyframes td{0%,80%,100%{transform:translateY(0);opacity:.4}40%{transform:translateY(-4px);opacity:1}}
-.score-row{display:flex;align-items:center;gap:8px;margin-top:4px;opacity:0}
-.score-row.show{animation:bubbleIn .4s ease .2s forwards}
-.score-chip{display:flex;align-items:center;gap:4px;background:rgba(255,255,255,.05);border:1px solid rgba(255,255,255,.12);border-radius:6px;padding:3px 8px;font-family:'DM Mono',monospace;font-size:.58rem;color:#FFFFFF;font-weight:500}
-.score-val{font-size:.8rem;font-weight:700;font-family:'Syne',sans-serif;color:#FFFFFF}
-.pyq-grid{display:flex;flex-direction:column;gap:6px;flex:1}
-.pyq-card{background:rgba(255,255,255,.03);border:1px solid rgba(255,255,255,.07);border-radius:10px;padding:8px 11px;display:flex;align-items:center;gap:10px;opacity:0;transform:translateY(8px)}
-.pyq-card.show{animation:cardIn .4s ease forwards}
-.pyq-co{width:28px;height:28px;border-radius:7px;display:flex;align-items:center;justify-content:center;font-size:.75rem;flex-shrink:0;font-family:'Syne',sans-serif;font-weight:700}
-.pyq-info{flex:1}
-.pyq-name{font-size:.7rem;font-weight:600;color:#FAFAF7;font-family:'Syne',sans-serif;margin-bottom:2px}
-.pyq-meta{font-size:.57rem;color:rgba(255,255,255,.3);font-family:'DM Mono',monospace}
-.pyq-count{background:rgba(255,255,255,.06);border:1px solid rgba(255,255,255,.12);border-radius:6px;padding:2px 7px;font-family:'DM Mono',monospace;font-size:.58rem;color:#FFFFFF;flex-shrink:0}
-
-/* ── Mobile: stack panels vertically so Live Preview stays visible ── */
-@media (max-width: 520px) {
-  .wrap {
-    flex-direction: column !important;
-    height: auto !important;
-  }
-  .L {
-    flex: 0 0 auto !important;
-    width: 100% !important;
-    border-right: none !important;
-    border-bottom: 1px solid rgba(255,255,255,0.06) !important;
-    padding: 18px 16px 16px 16px !important;
-  }
-  .R {
-    flex: 0 0 320px !important;
-    width: 100% !important;
-    height: 320px !important;
-    min-height: 320px !important;
-  }
-  /* tighter slide padding so content doesn't crowd the tab bar */
-  .slide { padding: 12px 12px 8px 12px !important; }
-  .slabel { margin-bottom: 6px !important; }
-  .stitle { font-size: .78rem !important; margin-bottom: 6px !important; }
-  .bubble { font-size: .6rem !important; padding: 6px 9px !important; }
-  .chat { gap: 6px !important; }
-  .ccard { padding: 6px 8px !important; }
-  .ltitle { font-size: 1.1rem !important; }
-  .prow { gap: 6px !important; padding: 7px 8px !important; }
-  .pbadge { font-size: .58rem !important; padding: 2px 6px !important; }
-  .pname { font-size: .66rem !important; }
-  .pdesc { font-size: .55rem !important; }
-  .plink { font-size: .6rem !important; white-space: nowrap; }
-  .lpill { padding: 6px 10px !important; }
-  .lpill-txt { font-size: .6rem !important; }
-}
-</style>
-</head>
-<body>
-<div class="wrap">
-<div class="L">
-  <div class="lhead">
-    <div class="ltag"><div class="ltag-dot"></div><span class="ltag-txt">Quick Setup</span></div>
-    <div class="ltitle">Choose Your Free<br>AI Provider</div>
-    <div class="lsub">100% free &middot; no credit card &middot; no billing &middot; ever</div>
-    <div class="ldiv"></div>
-    <div class="prow">
-      <span class="pbadge" style="background:rgba(66,133,244,.15);border:1px solid rgba(66,133,244,.4);color:#93c5fd">&#x25CF; Gemini</span>
-      <div class="pmeta"><div class="pname">Google Gemini</div><div class="pdesc">15 req/min &middot; 1500/day free</div></div>
-      <a href="https://aistudio.google.com/app/apikey" target="_blank" class="plink" style="color:#7dd3fc">Get key &rarr;</a>
-    </div>
-    <div class="prow">
-      <span class="pbadge" style="background:rgba(249,115,22,.12);border:1px solid rgba(249,115,22,.4);color:#fdba74">&#x26A1; Groq</span>
-      <div class="pmeta"><div class="pname">Groq &mdash; Llama 3.3</div><div class="pdesc">Ultra-fast &middot; unlimited free</div></div>
-      <a href="https://console.groq.com/keys" target="_blank" class="plink" style="color:#fdba74">Get key &rarr;</a>
-    </div>
-    <div class="prow">
-      <span class="pbadge" style="background:rgba(20,184,166,.12);border:1px solid rgba(20,184,166,.4);color:#5eead4">&#x25C6; Cohere</span>
-      <div class="pmeta"><div class="pname">Cohere Command-R+</div><div class="pdesc">Free trial &middot; no card needed</div></div>
-      <a href="https://dashboard.cohere.com/api-keys" target="_blank" class="plink" style="color:#5eead4">Get key &rarr;</a>
-    </div>
-  </div>
-  <div class="lpill">
-    <span style="font-size:.75rem">&#128072;</span>
-    <span class="lpill-txt">Sidebar &rarr; pick provider &rarr; paste key &rarr; <span class="lpill-accent">30 sec</span></span>
-  </div>
-</div>
-<div class="R">
-  <div class="blob blob1"></div>
-  <div class="blob blob2"></div>
-  <div class="livebadge"><div class="livebadge-dot"></div><span class="livebadge-txt">Live Preview</span></div>
-  <div class="slides">
-    <div class="slide active" id="sl0">
-      <div class="slabel"><div class="slabel-dot"></div><span class="slabel-txt">Career Analysis</span></div>
-      <div class="stitle">Your <span>AI Career</span> Roadmap</div>
-      <div class="input-field">Python &middot; ML &middot; 2 yrs @ TCS<span class="cursor"></span></div>
-      <div class="career-cards">
-        <div class="ccard" id="cc0"><div class="ccard-role"><div class="ccard-name">Data Scientist</div><div class="ccard-sal">&#8377;18L &ndash; &#8377;32L / yr</div></div><div class="ccard-score"><div class="ccard-pct" style="color:#0047FF" id="pct0">0%</div><div class="ccard-bar"><div class="ccard-fill" id="bf0"></div></div></div></div>
-        <div class="ccard" id="cc1"><div class="ccard-role"><div class="ccard-name">ML Engineer</div><div class="ccard-sal">&#8377;22L &ndash; &#8377;40L / yr</div></div><div class="ccard-score"><div class="ccard-pct" style="color:#FFFFFF" id="pct1">0%</div><div class="ccard-bar"><div class="ccard-fill" id="bf1" style="background:linear-gradient(90deg,#FFFFFF,#ec4899)"></div></div></div></div>
-        <div class="ccard" id="cc2"><div class="ccard-role"><div class="ccard-name">AI Researcher</div><div class="ccard-sal">&#8377;28L &ndash; &#8377;55L / yr</div></div><div class="ccard-score"><div class="ccard-pct" style="color:#34d399" id="pct2">0%</div><div class="ccard-bar"><div class="ccard-fill" id="bf2" style="background:linear-gradient(90deg,#34d399,#06b6d4)"></div></div></div></div>
-      </div>
-    </div>
-    <div class="slide" id="sl1">
-      <div class="slabel"><div class="slabel-dot"></div><span class="slabel-txt">Resume Builder</span></div>
-      <div class="stitle"><span>ATS-Optimized</span> Resume</div>
-      <div class="resume-mock">
-        <div class="rm-head" id="rmh"></div>
-        <div class="rm-line" id="rl0" style="width:100%"></div>
-        <div class="rm-line" id="rl1" style="width:72%"></div>
-        <div class="rm-line" id="rl2" style="width:88%"></div>
-        <div class="rm-line" id="rl3" style="width:55%"></div>
-        <div class="rm-line" id="rl4" style="width:91%"></div>
-        <div class="rm-line" id="rl5" style="width:66%"></div>
-        <div class="rm-line" id="rl6" style="width:80%"></div>
-        <div class="ats-badge" id="atsbadge"><span class="ats-check">&#10003;</span><div><div style="display:flex;align-items:baseline;gap:3px"><span class="ats-score" id="atsscore">0</span><span class="ats-max">/100</span></div><div class="ats-label">ATS Score</div></div></div>
-      </div>
-    </div>
-    <div class="slide" id="sl2">
-      <div class="slabel"><div class="slabel-dot"></div><span class="slabel-txt">Mock Interview</span></div>
-      <div class="stitle">Practice with <span>AI Coach</span></div>
-      <div class="chat">
-        <div class="typing" id="typ0"><div class="tdot"></div><div class="tdot"></div><div class="tdot"></div></div>
-        <div class="bubble ai" id="bub0">&#8220;Walk me through solving a complex ML problem under a tight deadline.&#8221;</div>
-        <div class="bubble user" id="bub1">Used STAR method: led churn-prediction model in 3 days, reduced churn 18%.</div>
-        <div class="typing" id="typ1"><div class="tdot"></div><div class="tdot"></div><div class="tdot"></div></div>
-        <div class="bubble ai" id="bub2">Strong STAR structure. Quantified impact. Clear ownership. Excellent.</div>
-        <div class="score-row" id="scorerow"><div class="score-chip"><span class="score-val">8.5</span>&nbsp;/ 10</div><div class="score-chip" style="border-color:rgba(52,211,153,.3);color:#34d399;background:rgba(52,211,153,.07)">&#10022; Excellent</div></div>
-      </div>
-    </div>
-    <div class="slide" id="sl3">
-      <div class="slabel"><div class="slabel-dot"></div><span class="slabel-txt">PYQ Hub</span></div>
-      <div class="stitle"><span>Past Questions</span> by Company</div>
-      <div class="pyq-grid">
-        <div class="pyq-card" id="pq0"><div class="pyq-co" style="background:rgba(66,133,244,.15);border:1px solid rgba(66,133,244,.3);color:#93c5fd">G</div><div class="pyq-info"><div class="pyq-name">Google &mdash; SWE L4</div><div class="pyq-meta">2024 &middot; System Design + DSA</div></div><div class="pyq-count">48 Qs</div></div>
-        <div class="pyq-card" id="pq1"><div class="pyq-co" style="background:rgba(20,184,166,.12);border:1px solid rgba(20,184,166,.3);color:#5eead4">M</div><div class="pyq-info"><div class="pyq-name">Microsoft &mdash; Data Scientist</div><div class="pyq-meta">2024 &middot; ML + Behavioural</div></div><div class="pyq-count">36 Qs</div></div>
-        <div class="pyq-card" id="pq2"><div class="pyq-co" style="background:rgba(249,115,22,.12);border:1px solid rgba(249,115,22,.3);color:#fdba74">A</div><div class="pyq-info"><div class="pyq-name">Amazon &mdash; ML Engineer</div><div class="pyq-meta">2023 &middot; Leadership + Coding</div></div><div class="pyq-count">52 Qs</div></div>
-      </div>
-    </div>
-  </div>
-  <div class="tabs">
-    <div class="tab active" id="tab0" onclick="goSlide(0)"><span class="tab-icon">&#128202;</span>Career</div>
-    <div class="tab" id="tab1" onclick="goSlide(1)"><span class="tab-icon">&#128196;</span>Resume</div>
-    <div class="tab" id="tab2" onclick="goSlide(2)"><span class="tab-icon">&#127908;</span>Interview</div>
-    <div class="tab" id="tab3" onclick="goSlide(3)"><span class="tab-icon">&#128194;</span>PYQ</div>
-  </div>
-</div>
-</div>
-<script>
-var cur=0,timer=null,VALS=[90,78,88];
-function animCount(el,t,d){var s=0,step=t/(d/16);var iv=setInterval(function(){s=Math.min(s+step,t);el.textContent=Math.round(s)+'%';if(s>=t)clearInterval(iv);},16);}
-function animAts(el,t,d){var s=0,step=t/(d/16);var iv=setInterval(function(){s=Math.min(s+step,t);el.textContent=Math.round(s);if(s>=t)clearInterval(iv);},16);}
-function anim(i){
-  if(i===0){
-    ['cc0','cc1','cc2'].forEach(function(id,j){setTimeout(function(){var e=document.getElementById(id);if(e)e.classList.add('show');},300+j*180);});
-    setTimeout(function(){VALS.forEach(function(v,j){var b=document.getElementById('bf'+j);var p=document.getElementById('pct'+j);if(b)b.style.width=v+'%';if(p)animCount(p,v,1200);});},700);
-  }
-  if(i===1){
-    ['rmh','rl0','rl1','rl2','rl3','rl4','rl5','rl6'].forEach(function(id,j){setTimeout(function(){var e=document.getElementById(id);if(e)e.classList.add('go');},200+j*90);});
-    setTimeout(function(){var b=document.getElementById('atsbadge');var s=document.getElementById('atsscore');if(b)b.classList.add('show');if(s)animAts(s,94,900);},200+8*90+200);
-  }
-  if(i===2){
-    var seq=[{id:'typ0',d:0},{id:'bub0',d:600,r:'typ0'},{id:'bub1',d:1300},{id:'typ1',d:1800},{id:'bub2',d:2500,r:'typ1'},{id:'scorerow',d:3000}];
-    seq.forEach(function(s){setTimeout(function(){var e=document.getElementById(s.id);if(e)e.classList.add('show');if(s.r){var rm=document.getElementById(s.r);if(rm){rm.classList.remove('show');rm.style.opacity='0';}}},s.d);});
-  }
-  if(i===3){
-    ['pq0','pq1','pq2'].forEach(function(id,j){setTimeout(function(){var e=document.getElementById(id);if(e)e.classList.add('show');},250+j*200);});
-  }
-}
-function reset(i){
-  if(i===0){['cc0','cc1','cc2'].forEach(function(id){var e=document.getElementById(id);if(e){e.classList.remove('show');e.style.opacity='0';e.style.transform='translateX(-10px)';}});[0,1,2].forEach(function(j){var b=document.getElementById('bf'+j);if(b)b.style.width='0%';var p=document.getElementById('pct'+j);if(p)p.textContent='0%';});}
-  if(i===1){['rmh','rl0','rl1','rl2','rl3','rl4','rl5','rl6'].forEach(function(id){var e=document.getElementById(id);if(e)e.classList.remove('go');});var b=document.getElementById('atsbadge');if(b)b.classList.remove('show');var s=document.getElementById('atsscore');if(s)s.textContent='0';}
-  if(i===2){['typ0','bub0','bub1','typ1','bub2','scorerow'].forEach(function(id){var e=document.getElementById(id);if(e){e.classList.remove('show');e.style.opacity='0';e.style.transform='translateY(8px)';}});}
-  if(i===3){['pq0','pq1','pq2'].forEach(function(id){var e=document.getElementById(id);if(e){e.classList.remove('show');e.style.opacity='0';e.style.transform='translateY(8px)';}});}
-}
-function goSlide(n){
-  if(n===cur)return;
-  clearTimeout(timer);
-  var pe=document.getElementById('sl'+cur),ne=document.getElementById('sl'+n);
-  var pt=document.getElementById('tab'+cur),nt=document.getElementById('tab'+n);
-  if(pe){pe.classList.remove('active');pe.classList.add('exit');}
-  if(pt)pt.classList.remove('active');
-  setTimeout(function(){if(pe)pe.classList.remove('exit');reset(cur);},550);
-  setTimeout(function(){if(ne)ne.classList.add('active');if(nt)nt.classList.add('active');cur=n;anim(n);schedNext();},280);
-}
-function schedNext(){clearTimeout(timer);timer=setTimeout(function(){goSlide((cur+1)%4);},5800);}
-anim(0);schedNext();
-document.addEventListener('mousemove',function(e){var rect=window.frameElement?window.frameElement.getBoundingClientRect():{left:0,top:0};window.parent.postMessage({type:'ns-move',x:e.clientX+rect.left,y:e.clientY+rect.top},'*');},{passive:true});
-
-// Auto-resize iframe to content height so desktop has no dead whitespace
-(function resizeParent(){
-  try{
-    var h = document.body.scrollHeight || document.documentElement.scrollHeight;
-    if(window.frameElement) window.frameElement.style.height = (h+4)+'px';
-  }catch(e){}
-})();
-window.addEventListener('resize', function(){
-  try{
-    var h = document.body.scrollHeight || document.documentElement.scrollHeight;
-    if(window.frameElement) window.frameElement.style.height = (h+4)+'px';
-  }catch(e){}
-});
-</script>
-</body>
-</html>""", height=700, scrolling=False)
+        _cmp.html(static_assets.read("api_setup_banner.html"), height=700, scrolling=False)
 
 
 # ==================== GLOBAL BACKGROUND ====================
 def render_global_background():
-    """Injects a global Three.js Dotted Surface background into the parent Streamlit page via components.html parent DOM injection."""
-    components.html("""<!DOCTYPE html>
-<html><body style="margin:0;padding:0;background:transparent;">
-<script src="https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js"></script>
-<script>
-(function() {
-  var p = window.parent;
-  if (!p || p._jlBgInit) return;
-  p._jlBgInit = true;
-
-  var doc = p.document;
-
-  // ── 1. Three.js dotted background ───────────────────────────────────────
-  var old = doc.getElementById('dotted-bg-canvas');
-  if (old) old.remove();
-
-  var SEPARATION = 150, AMOUNTX = 40, AMOUNTY = 60;
-  var scene = new THREE.Scene();
-  var camera = new THREE.PerspectiveCamera(60, p.innerWidth / p.innerHeight, 1, 10000);
-  camera.position.set(0, 355, 1220);
-
-  var renderer = new THREE.WebGLRenderer({ alpha: true, antialias: true });
-  renderer.setPixelRatio(p.devicePixelRatio);
-  renderer.setSize(p.innerWidth, p.innerHeight);
-  renderer.setClearColor(0x000000, 0);
-
-  var cv = renderer.domElement;
-  cv.id = 'dotted-bg-canvas';
-  cv.style.cssText = 'position:fixed;top:0;left:0;width:100vw;height:100vh;z-index:0;pointer-events:none;';
-  doc.body.appendChild(cv);
-
-  var positions = [], colors = [];
-  for (var ix = 0; ix < AMOUNTX; ix++) {
-    for (var iy = 0; iy < AMOUNTY; iy++) {
-      positions.push(
-        ix * SEPARATION - (AMOUNTX * SEPARATION) / 2, 0,
-        iy * SEPARATION - (AMOUNTY * SEPARATION) / 2
-      );
-      colors.push(1.0, 1.0, 1.0);
-    }
-  }
-  var geo = new THREE.BufferGeometry();
-  geo.setAttribute('position', new THREE.Float32BufferAttribute(positions, 3));
-  geo.setAttribute('color', new THREE.Float32BufferAttribute(colors, 3));
-  var mat = new THREE.PointsMaterial({ size: 6, vertexColors: true, transparent: true, opacity: 0.2, sizeAttenuation: true });
-  scene.add(new THREE.Points(geo, mat));
-
-  var count = 0;
-  function animate() {
-    requestAnimationFrame(animate);
-    var arr = geo.attributes.position.array;
-    var i = 0;
-    for (var ix = 0; ix < AMOUNTX; ix++) {
-      for (var iy = 0; iy < AMOUNTY; iy++) {
-        arr[i * 3 + 1] = Math.sin((ix + count) * 0.3) * 50 + Math.sin((iy + count) * 0.5) * 50;
-        i++;
-      }
-    }
-    geo.attributes.position.needsUpdate = true;
-    renderer.render(scene, camera);
-    count += 0.07;
-  }
-  p.addEventListener('resize', function() {
-    camera.aspect = p.innerWidth / p.innerHeight;
-    camera.updateProjectionMatrix();
-    renderer.setSize(p.innerWidth, p.innerHeight);
-  });
-  animate();
-
-})();
-</script>
-</body></html>""", height=0)
+    """Injects a global Three.js Dotted Surface background into the parent Streamlit page (static/background.html reaches up via window.parent)."""
+    static_assets.frame("background.html", height=0)
+
 
 # ==================== TAB RENDER FUNCTIONS ====================
 
+# Regions decorated with @st.fragment re-run on their own when a widget inside
+# them changes, instead of re-running all of main() (sidebar, chrome, nav
+# buttons, the active tab).
+
+
+def _rerun_fragment():
+    """Rerun just the enclosing fragment; from a full-app run, rerun the app."""
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        # scope="fragment" is only valid while a fragment rerun is in progress
+        st.rerun()
+
 
 def render_tab_career_analysis(ai_handler: AIHandler, pdf_handler: PDFHandler,
                                history_manager: HistoryManager, selected_model: str,
@@ -2873,7 +1631,12 @@ def render_tab_career_analysis(ai_handler: AIHandler, pdf_handler: PDFHandler,
                                          key="resume_upload", help="PDF only · Max 10 MB")
         if uploaded_file:
             st.success(f"✅ Loaded: **{uploaded_file.name}**")
-            raw_text = pdf_handler.extract_text(uploaded_file)
+            extracted = pdf_handler.extract(uploaded_file)
+            if extracted:
+                raw_text = extracted["text"]
+                if extracted["truncated"]:
+                    st.caption(f"ℹ️ Long resume — using the first {len(raw_text):,} "
+                               "characters for the analysis.")
     else:
         raw_text = st.text_area("Your skills, experience & education", height=180,
                                 placeholder="e.g.\n• Python, SQL, Machine Learning\n• 2 yrs data analyst @ TCS\n• B.Tech CS, NIT Durgapur, 2023")
@@ -2919,9 +1682,19 @@ def render_tab_career_analysis(ai_handler: AIHandler, pdf_handler: PDFHandler,
                 'include_learning_path': include_learning_path,
                 'include_interview_prep': include_interview_prep,
             }
+            preview_slot = st.empty()
+            preview = preview_slot.container()
+            streamed = []
+
+            def _show_career(job):
+                streamed.append(job)
+                with preview:
+                    _render_career_card(len(streamed), job, expanded=False)
+
             with st.spinner("🧠 AI is analyzing your profile… (30–60 seconds)"):
                 data = ai_handler.get_career_advice(
-                    raw_text, selected_model, context)
+                    raw_text, selected_model, context, on_career=_show_career)
+            preview_slot.empty()
 
             if data:
                 st.session_state.current_analysis = data
@@ -2950,7 +1723,7 @@ def _render_career_results(data: Dict):
       <div class="stat-card"><div class="stat-num">{len(careers)}</div><div class="stat-lbl">Career Paths</div></div>
       <div class="stat-card"><div class="stat-num">{top_match}%</div><div class="stat-lbl">Top Match</div></div>
       <div class="stat-card"><div class="stat-num">{skill_count}</div><div class="stat-lbl">Skills Found</div></div>
-      <div class="stat-card"><div class="stat-num">{len(st.session_state.history)}</div><div class="stat-lbl">Analyses Done</div></div>
+      <div class="stat-card"><div class="stat-num">{HistoryManager.count()}</div><div class="stat-lbl">Analyses Done</div></div>
     </div>
     """, unsafe_allow_html=True)
 
@@ -2979,93 +1752,150 @@ def _render_career_results(data: Dict):
             key="career_sort_order",
             label_visibility="collapsed",
         )
-    if sort_order.startswith("↓"):
-        careers = sorted(careers, key=lambda c: c.get('match_score', 0), reverse=True)
-    else:
-        careers = sorted(careers, key=lambda c: c.get('match_score', 0))
+    # Cards keep their position in the analysis as chart id, so re-sorting
+    # reuses the same frame and spec
+    gap_frame = _skill_gap_data(careers)
+    ranked = sorted(enumerate(careers), key=lambda ic: ic[1].get('match_score', 0),
+                    reverse=sort_order.startswith("↓"))
     # ────────────────────────────────────────────────────────────────────────
 
-    for idx, job in enumerate(careers, 1):
-        score = job.get('match_score', 0)
-        keywords = job.get('job_search_keywords', job['title'])
-        companies = job.get('top_companies', [])
-        certs = job.get('certifications', [])
-        ring_html = render_match_ring(score)
-        jlinks_html = render_job_links(job['title'],
-                                       st.session_state.get('location_pref', 'India'), keywords)
-        comp_badges = render_skill_badges(companies, "green")
-        cert_badges = render_skill_badges(certs, "purple")
-        tips_html = "".join(
-            f'<div class="tip-item">{t}</div>' for t in job.get('interview_tips', []))
-        learning_path = job.get('learning_path', [])
-        learn_html = "".join(
-            f'<div class="learn-item">{x}</div>' for x in learning_path)
-        yt_query = "+".join((job["title"] + " " +
-                            " ".join(learning_path[:2])).split())
-        yt_url = f"https://www.youtube.com/results?search_query={yt_query}+tutorial"
-        yt_course_url = f"https://www.youtube.com/results?search_query={yt_query}+full+course"
-        if learning_path:
-            learn_html += f'''
+    for idx, (career_id, job) in enumerate(ranked, 1):
+        _render_career_card(idx, job, expanded=(idx == 1), gap_chart=(gap_frame, career_id))
+
+
+# ── Skill-gap chart ─────────────────────────────────────────────────────────
+def _skill_gap_frame(careers: List[Dict]) -> "pd.DataFrame":
+    """Every career's skill_gap_analysis as one long frame: career (index), Skill, Proficiency."""
+    wide = pd.DataFrame.from_dict(
+        {i: c.get('skill_gap_analysis') for i, c in enumerate(careers)
+         if isinstance(c.get('skill_gap_analysis'), dict)},
+        orient='index')
+    if wide.empty:
+        return pd.DataFrame({'career': [], 'Skill': [], 'Proficiency': []})
+    long = (wide.rename_axis('career').reset_index()
+            .melt(id_vars='career', var_name='Skill', value_name='Proficiency'))
+    long['Proficiency'] = pd.to_numeric(long['Proficiency'], errors='coerce')
+    return long.dropna(subset=['Proficiency']).reset_index(drop=True)
+
+
+def _skill_gap_data(careers: List[Dict]) -> "pd.DataFrame":
+    """The long frame for this analysis, rebuilt only when the skill gaps change."""
+    analysis_id = hashlib.sha256(json.dumps(
+        [c.get('skill_gap_analysis') for c in careers], sort_keys=True, default=str
+    ).encode("utf-8")).hexdigest()[:16]
+    cached = st.session_state.get('skill_gap_chart')
+    if cached is None or cached[0] != analysis_id:
+        cached = (analysis_id, _skill_gap_frame(careers))
+        st.session_state['skill_gap_chart'] = cached
+    return cached[1]
+
+
+@functools.lru_cache(maxsize=None)
+def _skill_gap_spec() -> Dict:
+    """
+    Vega-Lite spec of the skill-gap bar chart, compiled from Altair once per
+    process. Rows are picked by the ``career`` param, so every card shares it.
+    """
+    career = alt.param(name="career", value=0)
+    spec = alt.Chart().mark_bar(cornerRadiusTopRight=4, cornerRadiusBottomRight=4).encode(
+        x=alt.X('Proficiency:Q', scale=alt.Scale(domain=[0, 100]),
+                axis=alt.Axis(labelColor='#7a7a7a', gridColor='rgba(255,255,255,0.05)')),
+        y=alt.Y('Skill:N', sort='-x',
+                axis=alt.Axis(labelColor='#b3b3b3')),
+        color=alt.Color('Proficiency:Q', scale=alt.Scale(
+            scheme='viridis'), legend=None)
+    ).add_params(career).transform_filter(alt.datum.career == career).properties(
+        height=180, background='transparent').configure_view(strokeWidth=0, fill='transparent').to_dict()
+    spec.pop('data', None)  # the frame is passed alongside
+    return spec
+
+
+def _render_skill_gap_chart(frame: "pd.DataFrame", career_id: int):
+    spec = _skill_gap_spec()
+    st.vega_lite_chart(frame, {**spec, 'params': [{**spec['params'][0], 'value': career_id}]},
+                       use_container_width=True)
+
+
+def _render_career_card(idx: int, job: Dict, expanded: bool = False, gap_chart=None):
+    """
+    One career-path expander (also used to preview careers while they stream in).
+    `gap_chart` is (long frame, career id) from _skill_gap_data; without it the
+    card charts its own skill gaps.
+    """
+    score = job.get('match_score', 0)
+    keywords = job.get('job_search_keywords', job['title'])
+    companies = job.get('top_companies', [])
+    certs = job.get('certifications', [])
+    ring_html = render_match_ring(score)
+    jlinks_html = render_job_links(job['title'],
+                                   st.session_state.get('location_pref', 'India'), keywords)
+    comp_badges = render_skill_badges(companies, "green")
+    cert_badges = render_skill_badges(certs, "purple")
+    tips_html = "".join(
+        f'<div class="tip-item">{t}</div>' for t in job.get('interview_tips', []))
+    learning_path = job.get('learning_path', [])
+    learn_html = "".join(
+        f'<div class="learn-item">{x}</div>' for x in learning_path)
+    yt_query = "+".join((job["title"] + " " +
+                        " ".join(learning_path[:2])).split())
+    yt_url = f"https://www.youtube.com/results?search_query={yt_query}+tutorial"
+    yt_course_url = f"https://www.youtube.com/results?search_query={yt_query}+full+course"
+    if learning_path:
+        learn_html += f'''
 <div style="margin-top:10px;padding:10px 14px;background:rgba(255,50,50,0.06);border:1px solid rgba(255,80,80,0.2);border-radius:10px;display:flex;align-items:center;gap:12px;">
   <span style="font-size:1.2rem">&#127910;</span>
   <div>
-    <div style="font-size:0.7rem;font-weight:700;color:#f87171;margin-bottom:6px;font-family:Space Mono,monospace;letter-spacing:.06em;text-transform:uppercase;">YouTube Resources</div>
-    <div style="display:flex;gap:8px;flex-wrap:wrap;">
-      <a href="{yt_url}" target="_blank" style="font-size:0.73rem;color:#fca5a5;text-decoration:none;background:rgba(255,80,80,0.1);border:1px solid rgba(255,80,80,0.25);border-radius:6px;padding:3px 10px;">&#128269; Search Tutorials</a>
-      <a href="{yt_course_url}" target="_blank" style="font-size:0.73rem;color:#fca5a5;text-decoration:none;background:rgba(255,80,80,0.1);border:1px solid rgba(255,80,80,0.25);border-radius:6px;padding:3px 10px;">&#127916; Full Courses</a>
-    </div>
+<div style="font-size:0.7rem;font-weight:700;color:#f87171;margin-bottom:6px;font-family:Space Mono,monospace;letter-spacing:.06em;text-transform:uppercase;">YouTube Resources</div>
+<div style="display:flex;gap:8px;flex-wrap:wrap;">
+  <a href="{yt_url}" target="_blank" style="font-size:0.73rem;color:#fca5a5;text-decoration:none;background:rgba(255,80,80,0.1);border:1px solid rgba(255,80,80,0.25);border-radius:6px;padding:3px 10px;">&#128269; Search Tutorials</a>
+  <a href="{yt_course_url}" target="_blank" style="font-size:0.73rem;color:#fca5a5;text-decoration:none;background:rgba(255,80,80,0.1);border:1px solid rgba(255,80,80,0.25);border-radius:6px;padding:3px 10px;">&#127916; Full Courses</a>
+</div>
   </div>
 </div>'''
-        steps_html = "".join(f'<li style="color:#b3b3b3;font-size:.88rem;margin-bottom:5px;">{s}</li>'
-                             for s in job.get('next_steps', []))
+    steps_html = "".join(f'<li style="color:#b3b3b3;font-size:.88rem;margin-bottom:5px;">{s}</li>'
+                         for s in job.get('next_steps', []))
 
-        with st.expander(f"**{idx}. {job['title']}** — {score}% Match", expanded=(idx == 1)):
-            col_left, col_mid, col_right = st.columns([3, 2, 1])
-            with col_left:
-                st.markdown(f"""
-                <div style="padding-right:16px;">
-                  <span style="font-family:'Space Mono',monospace;font-size:.85rem;color:#4ade80;background:rgba(74,222,128,.08);border:1px solid rgba(74,222,128,.2);border-radius:6px;padding:4px 12px;display:inline-block;margin-bottom:12px;">💰 {job['salary_range']}</span>
-                  <p style="color:#b3b3b3;font-size:.9rem;line-height:1.65;margin-bottom:14px;">{job.get('reason','')}</p>
-                  <div style="font-family:'Space Mono',monospace;font-size:.65rem;color:#0047FF;text-transform:uppercase;letter-spacing:.12em;margin-bottom:6px;">▸ NEXT STEPS</div>
-                  <ul style="margin:0;padding-left:18px;">{steps_html}</ul>
-                  {"<div style='font-family:Space Mono,monospace;font-size:.65rem;color:#0047FF;text-transform:uppercase;letter-spacing:.12em;margin:12px 0 6px;'>▸ TOP COMPANIES</div>" + comp_badges if companies else ""}
-                  {"<div style='font-family:Space Mono,monospace;font-size:.65rem;color:#FFFFFF;text-transform:uppercase;letter-spacing:.12em;margin:12px 0 6px;'>▸ CERTIFICATIONS</div>" + cert_badges if certs else ""}
-                  <div style="font-family:'Space Mono',monospace;font-size:.65rem;color:#0047FF;text-transform:uppercase;letter-spacing:.12em;margin:14px 0 4px;">▸ APPLY NOW</div>
-                  {jlinks_html}
-                </div>
-                """, unsafe_allow_html=True)
-            with col_mid:
-                gaps = job.get('skill_gap_analysis', {})
-                if gaps:
-                    chart_data = pd.DataFrame(
-                        {'Skill': list(gaps.keys()), 'Proficiency': list(gaps.values())})
-                    c = alt.Chart(chart_data).mark_bar(cornerRadiusTopRight=4, cornerRadiusBottomRight=4).encode(
-                        x=alt.X('Proficiency:Q', scale=alt.Scale(domain=[0, 100]),
-                                axis=alt.Axis(labelColor='#7a7a7a', gridColor='rgba(255,255,255,0.05)')),
-                        y=alt.Y('Skill:N', sort='-x',
-                                axis=alt.Axis(labelColor='#b3b3b3')),
-                        color=alt.Color('Proficiency:Q', scale=alt.Scale(
-                            scheme='viridis'), legend=None)
-                    ).properties(height=180, background='transparent').configure_view(strokeWidth=0, fill='transparent')
-                    st.altair_chart(c, use_container_width=True)
-                if learn_html:
-                    st.markdown(f"""
-                    <div style="font-family:'Space Mono',monospace;font-size:.65rem;color:#34d399;text-transform:uppercase;letter-spacing:.12em;margin:10px 0 6px;">▸ LEARNING PATH</div>
-                    {learn_html}""", unsafe_allow_html=True)
-            with col_right:
-                st.markdown(ring_html, unsafe_allow_html=True)
-            if tips_html:
+    with st.expander(f"**{idx}. {job['title']}** — {score}% Match", expanded=expanded):
+        col_left, col_mid, col_right = st.columns([3, 2, 1])
+        with col_left:
+            st.markdown(f"""
+            <div style="padding-right:16px;">
+              <span style="font-family:'Space Mono',monospace;font-size:.85rem;color:#4ade80;background:rgba(74,222,128,.08);border:1px solid rgba(74,222,128,.2);border-radius:6px;padding:4px 12px;display:inline-block;margin-bottom:12px;">💰 {job['salary_range']}</span>
+              <p style="color:#b3b3b3;font-size:.9rem;line-height:1.65;margin-bottom:14px;">{job.get('reason','')}</p>
+              <div style="font-family:'Space Mono',monospace;font-size:.65rem;color:#0047FF;text-transform:uppercase;letter-spacing:.12em;margin-bottom:6px;">▸ NEXT STEPS</div>
+              <ul style="margin:0;padding-left:18px;">{steps_html}</ul>
+              {"<div style='font-family:Space Mono,monospace;font-size:.65rem;color:#0047FF;text-transform:uppercase;letter-spacing:.12em;margin:12px 0 6px;'>▸ TOP COMPANIES</div>" + comp_badges if companies else ""}
+              {"<div style='font-family:Space Mono,monospace;font-size:.65rem;color:#FFFFFF;text-transform:uppercase;letter-spacing:.12em;margin:12px 0 6px;'>▸ CERTIFICATIONS</div>" + cert_badges if certs else ""}
+              <div style="font-family:'Space Mono',monospace;font-size:.65rem;color:#0047FF;text-transform:uppercase;letter-spacing:.12em;margin:14px 0 4px;">▸ APPLY NOW</div>
+              {jlinks_html}
+            </div>
+            """, unsafe_allow_html=True)
+        with col_mid:
+            gaps = job.get('skill_gap_analysis', {})
+            if gaps:
+                _render_skill_gap_chart(*(gap_chart or (_skill_gap_frame([job]), 0)))
+            if learn_html:
                 st.markdown(f"""
-                <div style="margin-top:14px;">
-                  <div style="font-family:'Space Mono',monospace;font-size:.65rem;color:#FFFFFF;text-transform:uppercase;letter-spacing:.12em;margin-bottom:8px;">▸ INTERVIEW TIPS</div>
-                  {tips_html}
-                </div>""", unsafe_allow_html=True)
+                <div style="font-family:'Space Mono',monospace;font-size:.65rem;color:#34d399;text-transform:uppercase;letter-spacing:.12em;margin:10px 0 6px;">▸ LEARNING PATH</div>
+                {learn_html}""", unsafe_allow_html=True)
+        with col_right:
+            st.markdown(ring_html, unsafe_allow_html=True)
+        if tips_html:
+            st.markdown(f"""
+            <div style="margin-top:14px;">
+              <div style="font-family:'Space Mono',monospace;font-size:.65rem;color:#FFFFFF;text-transform:uppercase;letter-spacing:.12em;margin-bottom:8px;">▸ INTERVIEW TIPS</div>
+              {tips_html}
+            </div>""", unsafe_allow_html=True)
+
+
+_HISTORY_SORTS = {"Newest first": "newest", "Top match": "top_match", "Oldest first": "oldest"}
 
 
 def render_tab_history():
     """Tab 2 — Analysis History."""
     st.markdown("### 📜 Analysis History")
-    if not st.session_state.history:
+    total = HistoryManager.count()
+    if not total:
         st.markdown("""
         <div style="text-align:center;padding:60px 20px;color:#475569;">
           <div style="font-size:3rem;margin-bottom:12px;">📭</div>
@@ -3074,27 +1904,65 @@ def render_tab_history():
         </div>""", unsafe_allow_html=True)
         return
 
-    st.markdown(f'<p style="color:#7a7a7a;font-size:.85rem;">{len(st.session_state.history)} analyses saved this session</p>',
-                unsafe_allow_html=True)
-    for idx, record in enumerate(reversed(st.session_state.history), 1):
-        careers_in_record = record['analysis'].get('careers', [])
-        top = max((c.get('match_score', 0)
-                  for c in careers_in_record), default=0)
-        titles = " · ".join(c.get('title', '') for c in careers_in_record)
-        stage = record.get('context', {}).get('career_stage', '')
-        badges = render_skill_badges(
-            record['analysis'].get('current_skills', [])[:5])
-        with st.expander(f"**#{idx}** {record['timestamp']}  —  Top match {top}%", expanded=False):
+    f1, f2 = st.columns([3, 1])
+    with f1:
+        query = st.text_input("Search history", key="history_query",
+                              placeholder="🔍 Search summaries, career paths, skills…",
+                              label_visibility="collapsed")
+    with f2:
+        sort_label = st.selectbox("Sort", list(_HISTORY_SORTS), key="history_sort",
+                                  label_visibility="collapsed")
+        sort = _HISTORY_SORTS[sort_label]
+    matches = HistoryManager.count(query) if query else total
+    pages = max(1, -(-matches // HistoryManager.PAGE_SIZE))
+    # A new search / sort starts again from the first page
+    if st.session_state.get('history_filter') != (query, sort):
+        st.session_state.history_filter = (query, sort)
+        st.session_state.history_page = 0
+    page = min(st.session_state.get('history_page', 0), pages - 1)
+
+    label = f"{matches} of {total} analyses match" if query else f"{total} analyses saved"
+    st.markdown(f'<p style="color:#7a7a7a;font-size:.85rem;">{label} · kept for '
+                f'{_HISTORY_STORE.retention_days:g} days</p>', unsafe_allow_html=True)
+
+    first = page * HistoryManager.PAGE_SIZE
+    for idx, record in enumerate(HistoryManager.page(page, query, sort), first + 1):
+        timestamp = datetime.datetime.fromtimestamp(record['created']).strftime('%Y-%m-%d %H:%M')
+        summary = record['summary'][:50] + '...'
+        skills = [s for s in record['skills'].split(", ") if s]
+        badges = render_skill_badges(skills[:5])
+        with st.expander(f"**#{idx}** {timestamp}  —  Top match {record['top_score']}%", expanded=False):
             st.markdown(f"""
             <div class="hist-card" style="margin:0;">
-              <div>📅 {record['timestamp']} · {stage}</div>
-              <p style="color:#FAFAF7;font-size:.95rem;font-weight:600;margin:8px 0 4px;">{record['summary']}</p>
-              <div style="color:#7a7a7a;font-size:.85rem;">Paths: {titles}</div>
+              <div>📅 {timestamp} · {record['stage']}</div>
+              <p style="color:#FAFAF7;font-size:.95rem;font-weight:600;margin:8px 0 4px;">{summary}</p>
+              <div style="color:#7a7a7a;font-size:.85rem;">Paths: {record['titles']}</div>
               <div style="margin-top:10px;">{badges}</div>
             </div>""", unsafe_allow_html=True)
-            if st.button("♻️ Restore This Analysis", key=f"restore_{idx}"):
-                st.session_state.current_analysis = record['analysis']
-                st.success("✅ Analysis restored! Go to Career Analysis tab.")
+            if st.button("♻️ Restore This Analysis", key=f"restore_{record['id']}"):
+                full = HistoryManager.get(record['id'])
+                if full:
+                    st.session_state.current_analysis = full['analysis']
+                    st.success("✅ Analysis restored! Go to Career Analysis tab.")
+
+    if pages > 1:
+        p1, p2, p3 = st.columns([1, 2, 1])
+        with p1:
+            if st.button("← Newer", key="history_prev", disabled=page == 0):
+                st.session_state.history_page = page - 1
+                st.rerun()
+        with p2:
+            st.markdown(f'<p style="text-align:center;color:#7a7a7a;font-size:.85rem;">'
+                        f'Page {page + 1} of {pages}</p>', unsafe_allow_html=True)
+        with p3:
+            if st.button("Older →", key="history_next", disabled=page >= pages - 1):
+                st.session_state.history_page = page + 1
+                st.rerun()
+
+    if st.button("🗑️ Clear my history", key="history_clear"):
+        HistoryManager.clear()
+        st.session_state.history_page = 0
+        st.rerun()
 
 
 def render_tab_compare():
@@ -3194,6 +2062,12 @@ def render_tab_resume_builder(ai_handler: AIHandler, selected_model: str):
     </div>
     """, unsafe_allow_html=True)
 
+    _render_resume_builder_form(ai_handler, selected_model)
+
+
+@st.fragment
+def _render_resume_builder_form(ai_handler: AIHandler, selected_model: str):
+    """Inputs, Build button and the result — editing a field reruns only this."""
     with st.expander("👤 Personal Info & Target Role", expanded=True):
         rb_c1, rb_c2, rb_c3 = st.columns(3)
         with rb_c1:
@@ -3398,483 +2272,7 @@ WORK EXPERIENCE
 # AI VOICE ASSISTANT INTERVIEW — Animated avatar, TTS speaks, STT listens
 # ──────────────────────────────────────────────────────────────────────────────
 
-_AI_AVATAR_VOICE_HTML = """<!DOCTYPE html>
-<html>
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<link href="https://fonts.googleapis.com/css2?family=Syne:wght@700;800&family=DM+Mono:wght@400;500&family=DM+Sans:wght@300;400;500&display=swap" rel="stylesheet">
-<style>
-*{margin:0;padding:0;box-sizing:border-box}
-html,body{background:#050a12;font-family:'DM Sans',sans-serif;overflow:hidden;height:100%;width:100%}
-
-/* ── MOBILE-FIRST: single column stack ── */
-#root{
-  display:flex;flex-direction:column;
-  height:__HEIGHT__px;width:100%;overflow:hidden;
-}
-
-/* TOP BAR: avatar + name + status inline */
-#topBar{
-  display:flex;align-items:center;gap:12px;
-  padding:10px 14px;flex-shrink:0;
-  background:linear-gradient(90deg,#060d1a,#0a0f1a);
-  border-bottom:1px solid rgba(0,71,255,.08);
-  position:relative;overflow:hidden;
-}
-#topBar::before{
-  content:'';position:absolute;inset:0;
-  background:radial-gradient(ellipse 120px 60px at 10% 50%,rgba(255,255,255,.10),transparent);
-  pointer-events:none;
-}
-canvas#face{border-radius:50%;flex-shrink:0;display:block;position:relative;z-index:2}
-#avatarInfo{flex:1;min-width:0;z-index:2}
-.ai-name{font-family:'Syne',sans-serif;font-size:.9rem;font-weight:800;color:#FAFAF7;letter-spacing:.03em;white-space:nowrap;overflow:hidden;text-overflow:ellipsis}
-.ai-title{font-family:'DM Mono',monospace;font-size:.48rem;letter-spacing:.14em;text-transform:uppercase;color:rgba(0,71,255,.5);margin-top:2px;white-space:nowrap;overflow:hidden;text-overflow:ellipsis}
-.ai-status{display:flex;align-items:center;gap:5px;margin-top:5px}
-.status-dot{width:6px;height:6px;border-radius:50%;background:#22c55e;box-shadow:0 0 7px #22c55e;flex-shrink:0}
-.status-dot.speaking{background:#FFFFFF;box-shadow:0 0 10px #FFFFFF;animation:sdot .6s ease-in-out infinite}
-.status-dot.listening{background:#0047FF;box-shadow:0 0 10px #0047FF;animation:sdot .8s ease-in-out infinite}
-@keyframes sdot{0%,100%{opacity:1;transform:scale(1)}50%{opacity:.4;transform:scale(1.4)}}
-.status-txt{font-family:'DM Mono',monospace;font-size:.52rem;color:#7a7a7a;letter-spacing:.07em;text-transform:uppercase}
-
-/* WAVE bars (right side of top bar) */
-.wv{display:inline-flex;align-items:center;gap:2px;height:16px;flex-shrink:0}
-.wv-b{width:3px;border-radius:2px;background:#FFFFFF;opacity:.25;height:4px}
-.wv-b.on{opacity:.9;animation:wvb .5s ease-in-out infinite}
-.wv-b:nth-child(1){animation-delay:0s}
-.wv-b:nth-child(2){animation-delay:.07s;height:10px}
-.wv-b:nth-child(3){animation-delay:.13s;height:16px}
-.wv-b:nth-child(4){animation-delay:.17s;height:10px}
-.wv-b:nth-child(5){animation-delay:.21s;height:6px}
-@keyframes wvb{0%,100%{transform:scaleY(1)}50%{transform:scaleY(1.6)}}
-
-/* AI SPEECH */
-#aiSpeech{
-  padding:12px 14px;border-bottom:1px solid rgba(255,255,255,.05);
-  background:rgba(255,255,255,.05);flex-shrink:0;
-  max-height:130px;overflow-y:auto;
-}
-#aiSpeech::-webkit-scrollbar{width:2px}
-#aiSpeech::-webkit-scrollbar-thumb{background:rgba(255,255,255,.3)}
-.ai-lbl{font-family:'DM Mono',monospace;font-size:.47rem;letter-spacing:.14em;text-transform:uppercase;color:rgba(255,255,255,.5);margin-bottom:6px}
-#aiTxt{color:#FAFAF7;font-size:.85rem;line-height:1.6;white-space:pre-wrap}
-
-/* USER TRANSCRIPT */
-#mainCol { flex:1; display:flex; flex-direction:column; overflow:hidden; min-height:0; }
-#userPanel{
-  flex:1;display:flex;flex-direction:column;
-  padding:10px 14px 8px;background:rgba(0,71,255,.025);
-  overflow:hidden;min-height:0;
-}
-.user-lbl{
-  font-family:'DM Mono',monospace;font-size:.47rem;letter-spacing:.14em;
-  text-transform:uppercase;color:rgba(0,71,255,.5);
-  margin-bottom:6px;display:flex;align-items:center;gap:7px;flex-shrink:0;
-}
-.live-dot{width:5px;height:5px;border-radius:50%;background:#ef4444;opacity:0;flex-shrink:0}
-.live-dot.on{opacity:1;animation:ldot 1s ease-in-out infinite}
-@keyframes ldot{0%,100%{opacity:1}50%{opacity:.2}}
-#transcript{
-  flex:1;font-size:.83rem;color:#7a7a7a;line-height:1.6;
-  font-style:italic;overflow-y:auto;cursor:text;
-  border:1px solid rgba(255,255,255,.07);border-radius:10px;
-  padding:9px 11px;background:rgba(255,255,255,.02);
-  min-height:44px;outline:none;
-  -webkit-user-select:text;user-select:text;
-  word-break: break-word; /* Prevent horizontal overflow */
-}
-#transcript.has{color:#FAFAF7;font-style:normal}
-#transcript::-webkit-scrollbar{width:2px}
-#transcript[contenteditable="true"]:focus{border-color:rgba(0,71,255,.3);box-shadow:0 0 0 2px rgba(0,71,255,.07)}
-.no-speech-warn{font-size:.72rem;color:#f59e0b;background:rgba(245,158,11,.08);border:1px solid rgba(245,158,11,.2);border-radius:8px;padding:7px 11px;text-align:center}
-
-/* BUTTONS — two rows on mobile */
-#btns{
-  display:grid;
-  grid-template-columns:52px 1fr 1fr;
-  gap:7px;
-  padding:8px 14px 10px;
-  border-top:1px solid rgba(255,255,255,.06);
-  flex-shrink:0;
-}
-.mic-btn{
-  width:52px;height:52px;border-radius:50%;
-  background:linear-gradient(135deg,#0047FF,#0ea8d8);
-  border:none;cursor:pointer;font-size:1.3rem;
-  display:flex;align-items:center;justify-content:center;
-  transition:all .2s;box-shadow:0 0 16px rgba(0,71,255,.35);
-  touch-action:manipulation;grid-row:1/3;align-self:center;
-}
-.mic-btn.listening{
-  background:linear-gradient(135deg,#ef4444,#dc2626);
-  box-shadow:0 0 18px rgba(239,68,68,.55);
-  animation:micpulse .8s ease-in-out infinite;
-}
-@keyframes micpulse{0%,100%{box-shadow:0 0 18px rgba(239,68,68,.5)}50%{box-shadow:0 0 32px rgba(239,68,68,.8)}}
-.action-btn{
-  height:44px;border-radius:11px;border:1.5px solid;
-  font-family:'Syne',sans-serif;font-size:.78rem;font-weight:700;
-  cursor:pointer;letter-spacing:.03em;transition:all .2s;
-  touch-action:manipulation;display:flex;align-items:center;
-  justify-content:center;gap:5px;padding:0 8px;
-}
-.action-btn:disabled{opacity:.35;cursor:not-allowed}
-#submitBtn{
-  background:linear-gradient(135deg,rgba(255,255,255,.22),rgba(0,71,255,.12));
-  border-color:rgba(255,255,255,.45);color:#FAFAF7;
-}
-#submitBtn:active{transform:scale(.97)}
-#clearBtn{
-  background:rgba(255,255,255,.04);
-  border-color:rgba(255,255,255,.12);color:#7a7a7a;
-  font-family:'DM Mono',monospace;font-size:.6rem;
-}
-#clearBtn:active{color:#FAFAF7}
-
-/* DESKTOP: side-by-side layout at ≥560px */
-@media(min-width:560px){
-  #root{flex-direction:row}
-  #topBar{
-    flex:0 0 220px;flex-direction:column;align-items:center;justify-content:center;
-    border-bottom:none;border-right:1px solid rgba(0,71,255,.08);
-    padding:20px 16px;
-  }
-  canvas#face{margin-bottom:10px}
-  .ai-name{text-align:center;font-size:.92rem}
-  .ai-title{text-align:center}
-  .ai-status{justify-content:center;margin-top:8px}
-  .wv{display:none}
-  #mainCol{flex:1;display:flex;flex-direction:column;overflow:hidden;min-width:0}
-  #btns{grid-template-columns:52px 1fr 1fr}
-}
-</style>
-</head>
-<body>
-<div id="root">
-
-  <!-- TOP BAR (mobile) / LEFT PANEL (desktop) -->
-  <div id="topBar">
-    <canvas id="face" width="64" height="64"></canvas>
-    <div id="avatarInfo">
-      <div class="ai-name">__INTERVIEWER_NAME__</div>
-      <div class="ai-title">Senior Interviewer · __COMPANY__</div>
-      <div class="ai-status">
-        <div class="status-dot" id="statusDot"></div>
-        <div class="status-txt" id="statusTxt">Ready</div>
-      </div>
-    </div>
-    <div class="wv" id="wv">
-      <div class="wv-b"></div><div class="wv-b"></div>
-      <div class="wv-b"></div><div class="wv-b"></div>
-      <div class="wv-b"></div>
-    </div>
-  </div>
-
-  <!-- MAIN COLUMN -->
-  <div id="mainCol">
-    <!-- AI speech -->
-    <div id="aiSpeech">
-      <div class="ai-lbl">AI Interviewer</div>
-      <div id="aiTxt">__AI_MESSAGE__</div>
-    </div>
-
-    <!-- User transcript -->
-    <div id="userPanel">
-      <div class="user-lbl">
-        <div class="live-dot" id="liveDot"></div>
-        Your Answer
-        <span style="margin-left:auto;font-size:.45rem;color:#334155">speak or type</span>
-      </div>
-      <div id="transcript" contenteditable="true">__PLACEHOLDER__</div>
-    </div>
-
-    <!-- Buttons -->
-    <div id="btns">
-      <button class="mic-btn" id="micBtn" onclick="toggleMic()" title="Tap to speak">🎤</button>
-      <button class="action-btn" id="submitBtn" onclick="submitAnswer('answer')">✅ Submit</button>
-      <button class="action-btn" id="clearBtn" onclick="clearTranscript()">✕ Clear</button>
-    </div>
-  </div>
-
-</div>
-
-<script>
-// ── CONFIG ──────────────────────────────────────────────────────────
-var AI_MSG   = __AI_MSG_JS__;
-var HIST     = __HISTORY_JS__;
-var isSpeaking = false, isListening = false;
-var recognition = null;
-var finalT = "", interimT = "";
-var synth = window.speechSynthesis;
-
-// ── CANVAS AVATAR ────────────────────────────────────────────────────
-var canvas = document.getElementById('face');
-var ctx    = canvas.getContext('2d');
-// Responsive canvas size
-var isMobile = window.innerWidth < 560;
-var CSIZE = isMobile ? 64 : 100;
-canvas.width = CSIZE; canvas.height = CSIZE;
-var W = CSIZE, H = CSIZE, CX = W/2, CY = H/2;
-var mouthAnim = 0, breathe = 0, glowR = 52;
-
-function drawAvatar(speaking) {
-  ctx.clearRect(0, 0, W, H);
-  breathe += 0.04;
-  if (speaking) mouthAnim = Math.sin(Date.now() * 0.012) * 0.5 + 0.5;
-  else mouthAnim *= 0.88;
-
-  var scale = W / 140;  // scale factor relative to original 140px design
-  var baseR = 52 * scale;
-
-  // Outer glow ring
-  var glow = baseR + Math.sin(breathe) * 4 * scale;
-  var grad = ctx.createRadialGradient(CX,CY,glow*0.4,CX,CY,glow*1.1);
-  grad.addColorStop(0, speaking ? 'rgba(255,255,255,0.0)' : 'rgba(0,71,255,0.0)');
-  grad.addColorStop(0.6, speaking ? 'rgba(255,255,255,0.10)' : 'rgba(0,71,255,0.06)');
-  grad.addColorStop(1, 'transparent');
-  ctx.beginPath(); ctx.arc(CX,CY,glow*1.15,0,Math.PI*2);
-  ctx.fillStyle=grad; ctx.fill();
-
-  // Face circle
-  var faceGrad = ctx.createRadialGradient(CX-12*scale,CY-14*scale,8*scale,CX,CY,glow);
-  faceGrad.addColorStop(0, speaking ? '#2d1a4a' : '#0d2035');
-  faceGrad.addColorStop(0.6, speaking ? '#1a0f2e' : '#071525');
-  faceGrad.addColorStop(1, '#050a12');
-  ctx.beginPath(); ctx.arc(CX,CY,glow,0,Math.PI*2);
-  ctx.fillStyle=faceGrad; ctx.fill();
-
-  // Border ring
-  var ringGrad = ctx.createLinearGradient(0,0,W,H);
-  ringGrad.addColorStop(0, speaking ? 'rgba(255,255,255,0.8)' : 'rgba(0,71,255,0.6)');
-  ringGrad.addColorStop(0.5, speaking ? 'rgba(0,71,255,0.4)' : 'rgba(255,255,255,0.3)');
-  ringGrad.addColorStop(1, speaking ? 'rgba(255,255,255,0.8)' : 'rgba(0,71,255,0.6)');
-  ctx.beginPath(); ctx.arc(CX,CY,glow,0,Math.PI*2);
-  ctx.strokeStyle=ringGrad; ctx.lineWidth = speaking ? 2.5*scale : 1.5*scale; ctx.stroke();
-
-  // Eyes
-  var eyeY = CY - 10*scale, eyeOffX = 14*scale, eyeR = 7*scale;
-  var eyeColor = speaking ? 'rgba(255,255,255,0.9)' : 'rgba(0,71,255,0.85)';
-  [CX-eyeOffX, CX+eyeOffX].forEach(function(ex){
-    var eyeGrad = ctx.createRadialGradient(ex,eyeY,0,ex,eyeY,eyeR);
-    eyeGrad.addColorStop(0,'rgba(255,255,255,0.9)');
-    eyeGrad.addColorStop(0.4, eyeColor);
-    eyeGrad.addColorStop(1,'transparent');
-    ctx.beginPath(); ctx.arc(ex,eyeY,eyeR,0,Math.PI*2);
-    ctx.fillStyle=eyeGrad; ctx.fill();
-    ctx.beginPath(); ctx.arc(ex,eyeY,2.5*scale,0,Math.PI*2);
-    ctx.fillStyle='rgba(255,255,255,0.95)'; ctx.fill();
-  });
-
-  // Blink
-  if(Math.sin(Date.now()*0.0008)*Math.sin(Date.now()*0.0003) > 0.99){
-    [CX-eyeOffX, CX+eyeOffX].forEach(function(ex){
-      ctx.beginPath(); ctx.arc(ex,eyeY,eyeR,0,Math.PI*2);
-      ctx.fillStyle='#050a12'; ctx.fill();
-    });
-  }
-
-  // Mouth
-  var mouthY = CY + 14*scale;
-  var openH  = mouthAnim * 10*scale;
-  ctx.save();
-  if (openH > 1) {
-    var mouthGrad = ctx.createLinearGradient(CX-12*scale,mouthY-openH/2,CX+12*scale,mouthY+openH/2);
-    mouthGrad.addColorStop(0,'rgba(255,255,255,0.8)');
-    mouthGrad.addColorStop(1,'rgba(0,71,255,0.6)');
-    ctx.beginPath();
-    ctx.ellipse(CX, mouthY, 12*scale, openH/2+1, 0, 0, Math.PI*2);
-    ctx.fillStyle = 'rgba(5,10,18,0.9)'; ctx.fill();
-    ctx.strokeStyle = mouthGrad; ctx.lineWidth=1.5*scale; ctx.stroke();
-    ctx.beginPath(); ctx.ellipse(CX,mouthY-openH/4,9*scale,openH/4,0,0,Math.PI);
-    ctx.fillStyle='rgba(255,255,255,0.15)'; ctx.fill();
-  } else {
-    ctx.beginPath();
-    ctx.moveTo(CX-10*scale, mouthY);
-    ctx.quadraticCurveTo(CX, mouthY+6*scale, CX+10*scale, mouthY);
-    ctx.strokeStyle = speaking ? 'rgba(255,255,255,0.7)' : 'rgba(0,71,255,0.6)';
-    ctx.lineWidth=2*scale; ctx.lineCap='round'; ctx.stroke();
-  }
-  ctx.restore();
-
-  // Subtle scan line
-  var scanY = (Date.now()*0.04) % H;
-  ctx.beginPath(); ctx.moveTo(CX-glow,scanY); ctx.lineTo(CX+glow,scanY);
-  ctx.strokeStyle='rgba(0,71,255,0.03)'; ctx.lineWidth=2*scale; ctx.stroke();
-}
-
-// Animation loop
-(function loop(){
-  requestAnimationFrame(loop);
-  drawAvatar(isSpeaking);
-})();
-
-// ── TTS ──────────────────────────────────────────────────────────────
-function setStatus(state) {
-  var dot = document.getElementById('statusDot');
-  var txt = document.getElementById('statusTxt');
-  dot.className = 'status-dot' + (state==='speaking'?' speaking':state==='listening'?' listening':'');
-  txt.textContent = state==='speaking'?'Speaking...':state==='listening'?'Listening...':'Ready';
-}
-
-function speakText(txt, onEnd) {
-  if (!txt || !synth) { if(onEnd) onEnd(); return; }
-  synth.cancel();
-  var u = new SpeechSynthesisUtterance(txt);
-  u.rate=0.91; u.pitch=1.05; u.volume=1.0;
-  function trySpeak(){
-    var voices = synth.getVoices();
-    var pref = voices.find(function(v){return v.name.includes('Google UK English Female');})
-            || voices.find(function(v){return v.name.includes('Samantha');})
-            || voices.find(function(v){return v.name.includes('Google') && v.lang.startsWith('en');})
-            || voices.find(function(v){return v.lang.startsWith('en-') && !v.localService;})
-            || voices.find(function(v){return v.lang.startsWith('en');});
-    if(pref) u.voice=pref;
-    var wvBars = document.querySelectorAll('.wv-b');
-    u.onstart=function(){
-      isSpeaking=true; setStatus('speaking');
-      wvBars.forEach(function(b){b.classList.add('on');});
-    };
-    u.onend=u.onerror=function(){
-      isSpeaking=false; setStatus('ready');
-      wvBars.forEach(function(b){b.classList.remove('on');});
-      if(onEnd) onEnd();
-    };
-    synth.speak(u);
-  }
-  if(synth.getVoices().length===0){
-    synth.onvoiceschanged=function(){trySpeak();synth.onvoiceschanged=null;};
-  } else { trySpeak(); }
-}
-
-// ── STT ──────────────────────────────────────────────────────────────
-function initSTT(){
-  var SR = window.SpeechRecognition||window.webkitSpeechRecognition;
-  if(!SR){
-    document.getElementById('transcript').innerHTML = '<div class="no-speech-warn">⚠️ Speech recognition needs Chrome or Edge.<br>You can still type your answer directly.</div>';
-    return;
-  }
-  recognition = new SR();
-  // FIX: continuous=false prevents Android Chrome from infinitely duplicating speech
-  // It stops after every utterance, and we manually restart it in onend.
-  recognition.continuous=false; 
-  recognition.interimResults=true; 
-  recognition.lang='en-US';
-  
-  recognition.onresult=function(e){
-    var interimText = '';
-    var finalChunk = ''; 
-    for(var i=0; i<e.results.length; i++){
-      if(e.results[i].isFinal) {
-        finalChunk += e.results[i][0].transcript;
-      } else {
-        interimText += e.results[i][0].transcript;
-      }
-    }
-    
-    if (finalChunk) {
-      finalT += finalChunk + ' ';
-    }
-    
-    var el=document.getElementById('transcript');
-    var full = (finalT + interimText).trim();
-    if (full) {
-      el.textContent = full;
-      el.classList.add('has');
-      el.scrollTop = el.scrollHeight;
-    }
-    
-    // Send live preview to parent
-    try{window.parent.postMessage({type:'jl-voice-transcript',text:finalT.trim()},'*');}catch(e){}
-  };
-  recognition.onerror=function(e){if(e.error!=='no-speech') console.log(e.error);};
-  recognition.onend=function(){if(isListening){try{recognition.start();}catch(e){}}};
-}
-
-function toggleMic(){
-  if(isListening) stopListening(); else startListening();
-}
-function startListening(){
-  if(!recognition){alert('Please use Chrome or Edge for voice input.');return;}
-  isListening=true;
-  try{recognition.start();}catch(e){}
-  document.getElementById('micBtn').className='mic-btn listening';
-  document.getElementById('micBtn').innerHTML='⏹';
-  document.getElementById('liveDot').className='live-dot on';
-  setStatus('listening');
-}
-function stopListening(){
-  isListening=false;
-  if(recognition) try{recognition.stop();}catch(e){}
-  document.getElementById('micBtn').className='mic-btn';
-  document.getElementById('micBtn').innerHTML='🎤';
-  document.getElementById('liveDot').className='live-dot';
-  setStatus('ready');
-}
-
-function showTranscript() {
-  // Handled inside onresult
-}
-
-function clearTranscript(){
-  finalT = '';
-  var el=document.getElementById('transcript');
-  el.textContent='Speak or type your answer...';
-  el.classList.remove('has');
-}
-
-function getTranscriptText(){
-  var el=document.getElementById('transcript');
-  var t=el.textContent.trim();
-  if(t==='Speak or type your answer...'||t==='') return '';
-  return t;
-}
-
-function submitAnswer(mode){
-  if(isListening) stopListening();
-  var t = mode==='wrapup'
-    ? 'WRAPUP_SIGNAL'
-    : getTranscriptText();
-  if(mode!=='wrapup' && !t){ alert('Please speak or type your answer first.'); return; }
-  // Disable both buttons
-  document.getElementById('submitBtn').disabled=true;
-  if(document.getElementById('wrapBtn')) document.getElementById('wrapBtn').disabled=true;
-  document.getElementById('submitBtn').textContent='Sending...';
-  // Fill hidden input in parent and trigger form submit
-  try{
-    var inp = window.parent.document.getElementById('jl_bridge_input');
-    if(inp){
-      var setter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype,'value').set;
-      setter.call(inp, t);
-      inp.dispatchEvent(new Event('input',{bubbles:true}));
-      // Small delay then click the hidden submit button
-      setTimeout(function(){
-        var btn = window.parent.document.getElementById('jl_bridge_btn');
-        if(btn) btn.click();
-      }, 120);
-    }
-    // Also postMessage as fallback
-    window.parent.postMessage({type:'jl-voice-submit', text:t, mode:mode},'*');
-  }catch(e){
-    window.parent.postMessage({type:'jl-voice-submit', text:t, mode:mode},'*');
-  }
-}
-
-// Allow editing transcript directly
-document.getElementById('transcript').addEventListener('input',function(){
-  var t = this.textContent.trim();
-  if(t&&t!=='Speak or type your answer...') this.classList.add('has');
-  finalT = t + ' ';
-});
-
-// ── INIT ──────────────────────────────────────────────────────────────
-initSTT();
-speakText(AI_MSG);
-// Scroll history to bottom
-(function(){var h=document.getElementById('histList');h.scrollTop=h.scrollHeight;})();
-</script>
-</body>
-</html>"""
+# The avatar page lives in static/voice_avatar.html (see static_assets).
 
 
 def _build_avatar_voice_html(ai_message: str, history: list, interviewer_name: str,
@@ -3888,7 +2286,7 @@ def _build_avatar_voice_html(ai_message: str, history: list, interviewer_name: s
     history_js = json.dumps(
         [{"role": m["role"], "content": m["content"]} for m in history])
 
-    out = _AI_AVATAR_VOICE_HTML
+    out = static_assets.read("voice_avatar.html")
     out = out.replace("__HEIGHT__", str(height))
     out = out.replace("__INTERVIEWER_NAME__", _html.escape(interviewer_name))
     out = out.replace("__COMPANY__", _html.escape(company))
@@ -4087,14 +2485,45 @@ def _render_message_bubble(role_: str, content: str, is_review: bool = False):
         """, unsafe_allow_html=True)
 
 
+def _stream_interviewer_reply(chunks, min_interval: float = 0.05) -> str:
+    """
+    Render a streamed interviewer reply progressively and return the full text.
+
+    Repaints one placeholder bubble at most every ``min_interval`` seconds so a
+    fast provider doesn't flood the websocket with a delta per token. Switches
+    to the review style as soon as the wrap-up phrase shows up.
+    """
+    placeholder = st.empty()
+    text = ""
+    last_paint = 0.0
+    for chunk in chunks:
+        text += chunk
+        now = time.monotonic()
+        if now - last_paint < min_interval:
+            continue
+        last_paint = now
+        lowered = text.lower()
+        with placeholder.container():
+            _render_message_bubble(
+                "assistant", text + " ▌",
+                is_review=("let me take off the interviewer hat" in lowered
+                           or "overall impression" in lowered))
+    placeholder.empty()
+    return text
+
+
+@st.fragment
 def _render_conversational_interview(ai_handler, selected_model: str):
     """
     Full AI Voice Assistant Interview.
     - Animated talking AI avatar (canvas-based, mouth moves when speaking)
     - TTS: AI speaks every message automatically
     - STT: User speaks via mic, sees live transcript
-    - Fully conversational via chat_interview_turn()
+    - Fully conversational via chat_interview_turn_stream()
     - Head of Talent review at end (also spoken aloud)
+
+    Runs as a fragment: a voice turn only re-renders this session, while
+    New (which leaves it) reruns the whole app.
     """
     import streamlit.components.v1 as _cmp
 
@@ -4126,14 +2555,15 @@ def _render_conversational_interview(ai_handler, selected_model: str):
                 st.session_state[k] = False if k == "conv_interview_active" else (
                     [] if k == "conv_interview_messages" else (
                         False if k == "conv_interview_done" else ""))
+            st.session_state.conv_interview_context = interview_context.new_state()
             st.rerun()
 
     # ── Auto-fire: generate first AI message ─────────────────────────────
     if not messages:
-        with st.spinner("🤖 Your AI interviewer is getting ready..."):
-            first_reply = ai_handler.chat_interview_turn(
-                messages=[], role=role, level=level, model_name=selected_model
-            )
+        first_reply = _stream_interviewer_reply(ai_handler.chat_interview_turn_stream(
+            messages=[], role=role, level=level, model_name=selected_model,
+            context=st.session_state.conv_interview_context,
+        ))
         st.session_state.conv_interview_messages.append(
             {"role": "assistant", "content": first_reply}
         )
@@ -4141,7 +2571,7 @@ def _render_conversational_interview(ai_handler, selected_model: str):
         name, company = _extract_interviewer_meta(first_reply)
         st.session_state.conv_interviewer_name = name
         st.session_state.conv_interviewer_company = company
-        st.rerun()
+        _rerun_fragment()
         return
 
     interviewer_name = st.session_state.get(
@@ -4211,16 +2641,16 @@ def _render_conversational_interview(ai_handler, selected_model: str):
                     "role": "user",
                     "content": "That's all from my side. I've answered all the questions. Please wrap up now and give me my full Head of Talent review."
                 })
-                with st.spinner("🤖 Generating your full review..."):
-                    ai_reply = ai_handler.chat_interview_turn(
-                        messages=st.session_state.conv_interview_messages,
-                        role=role, level=level, model_name=selected_model,
-                    )
+                ai_reply = _stream_interviewer_reply(ai_handler.chat_interview_turn_stream(
+                    messages=st.session_state.conv_interview_messages,
+                    role=role, level=level, model_name=selected_model,
+                    context=st.session_state.conv_interview_context,
+                ))
                 st.session_state.conv_interview_messages.append(
                     {"role": "assistant", "content": ai_reply}
                 )
                 st.session_state.conv_interview_done = True
-                st.rerun()
+                _rerun_fragment()
             st.markdown(
                 f'<div style="color:#334155;font-size:.78rem;padding:10px 0;">'
                 f'💬 {max(0, 3 - exchanges)} more exchange(s) before review becomes available</div>',
@@ -4232,15 +2662,15 @@ def _render_conversational_interview(ai_handler, selected_model: str):
             st.session_state.conv_interview_messages.append({
                 "role": "user", "content": "Let me skip this one and move on."
             })
-            with st.spinner("🤖 Moving to next question..."):
-                ai_reply = ai_handler.chat_interview_turn(
-                    messages=st.session_state.conv_interview_messages,
-                    role=role, level=level, model_name=selected_model,
-                )
+            ai_reply = _stream_interviewer_reply(ai_handler.chat_interview_turn_stream(
+                messages=st.session_state.conv_interview_messages,
+                role=role, level=level, model_name=selected_model,
+                context=st.session_state.conv_interview_context,
+            ))
             st.session_state.conv_interview_messages.append(
                 {"role": "assistant", "content": ai_reply}
             )
-            st.rerun()
+            _rerun_fragment()
 
     st.markdown("<hr style='border-color:rgba(255,255,255,.05);margin:8px 0 4px;'>",
                 unsafe_allow_html=True)
@@ -4304,11 +2734,11 @@ def _render_conversational_interview(ai_handler, selected_model: str):
         st.session_state.conv_interview_messages.append(
             {"role": "user", "content": final_input}
         )
-        with st.spinner("🤖 Interviewer is responding..."):
-            ai_reply = ai_handler.chat_interview_turn(
-                messages=st.session_state.conv_interview_messages,
-                role=role, level=level, model_name=selected_model,
-            )
+        ai_reply = _stream_interviewer_reply(ai_handler.chat_interview_turn_stream(
+            messages=st.session_state.conv_interview_messages,
+            role=role, level=level, model_name=selected_model,
+            context=st.session_state.conv_interview_context,
+        ))
         st.session_state.conv_interview_messages.append(
             {"role": "assistant", "content": ai_reply}
         )
@@ -4321,7 +2751,7 @@ def _render_conversational_interview(ai_handler, selected_model: str):
         ]
         if any(t in ai_reply.lower() for t in review_triggers):
             st.session_state.conv_interview_done = True
-        st.rerun()
+        _rerun_fragment()
 
 
 def render_tab_mock_interview(ai_handler: AIHandler, selected_model: str):
@@ -4356,6 +2786,7 @@ def render_tab_mock_interview(ai_handler: AIHandler, selected_model: str):
                 else:
                     st.session_state.conv_interview_active = True
                     st.session_state.conv_interview_messages = []
+                    st.session_state.conv_interview_context = interview_context.new_state()
                     st.session_state.conv_interview_done = False
                     st.session_state.conv_interview_role = role
                     st.session_state.conv_interview_level = level
@@ -4502,9 +2933,21 @@ def _render_interview_setup(ai_handler: AIHandler, selected_model: str):
             st.warning(
                 "⚠️ Free session limit reached. Add your own free API key in the sidebar!")
         else:
+            preview_slot = st.empty()
+            preview = preview_slot.container()
+
+            def _show_question(q):
+                with preview:
+                    st.markdown(
+                        f'<div style="color:#b3b3b3;font-size:0.85rem;padding:4px 0;">'
+                        f'<span style="color:#0047FF;font-family:DM Mono,monospace;font-size:0.7rem;">'
+                        f'{q.get("category", "")}</span> · {q.get("question", "")}</div>',
+                        unsafe_allow_html=True)
+
             with st.spinner("🧠 Generating interview questions..."):
                 questions = ai_handler.generate_interview_questions(
-                    mi_role, mi_level, selected_model)
+                    mi_role, mi_level, selected_model, on_question=_show_question)
+            preview_slot.empty()
             if questions:
                 st.session_state.interview_questions = questions
                 st.session_state.interview_answers = {}
@@ -4567,17 +3010,28 @@ def _render_interview_session(ai_handler: AIHandler, selected_model: str):
             st.markdown("""<div style="background:linear-gradient(135deg,rgba(255,255,255,0.15),rgba(0,71,255,0.1));border:2px solid rgba(255,255,255,0.5);border-radius:12px;padding:4px 8px;text-align:center;margin-bottom:4px;"><div style="color:#FAFAF7;font-size:0.78rem;font-weight:600;">🎉 All answers saved! Ready to evaluate.</div></div>""", unsafe_allow_html=True)
             if st.button("📊 Get My Full Report ✨", key="batch_eval", use_container_width=True, type="primary"):
                 progress_placeholder = st.empty()
+                pending = []
                 for eval_idx, q in enumerate(questions):
                     q_id = q.get("id", eval_idx + 1)
                     if str(q_id) not in feedback and str(q_id) in answers:
-                        progress_placeholder.info(
-                            f"🧠 Evaluating Q{q_id} of {total_q}…")
-                        fb = ai_handler.evaluate_interview_answer(
-                            q.get("question", ""), answers.get(str(q_id), ""),
-                            q.get("ideal_answer_points", []), role,
-                            q.get("companies", []), selected_model)
-                        if fb:
-                            st.session_state.interview_feedback[str(q_id)] = fb
+                        pending.append({
+                            "id": q_id,
+                            "question": q.get("question", ""),
+                            "answer": answers.get(str(q_id), ""),
+                            "ideal_points": q.get("ideal_answer_points", []),
+                            "companies": q.get("companies", []),
+                        })
+
+                def _store_feedback(q_id, fb, done, total):
+                    if fb:
+                        st.session_state.interview_feedback[q_id] = fb
+                    progress_placeholder.info(
+                        f"🧠 Evaluated Q{q_id} · {done} of {total} done…")
+
+                progress_placeholder.info(
+                    f"🧠 Evaluating {len(pending)} answers in parallel…")
+                ai_handler.evaluate_interview_answers_batch(
+                    pending, role, selected_model, on_result=_store_feedback)
                 progress_placeholder.empty()
                 st.rerun()
         elif all_answered and not unevaluated:
@@ -4591,64 +3045,8 @@ def _render_interview_session(ai_handler: AIHandler, selected_model: str):
     st.markdown("---")
 
     for idx, q in enumerate(questions):
-        q_id = q.get("id", idx + 1)
-        cat = q.get("category", "General")
-        diff = q.get("difficulty", "Medium")
-        cat_col = cat_colors.get(cat, "#0047FF")
-        diff_badge = {"Easy": "🟢", "Medium": "🟡", "Hard": "🔴"}.get(diff, "🟡")
-        q_text = q.get("question", "")
-        hint = q.get("hint", "")
-        ideal = q.get("ideal_answer_points", [])
-        is_answered = str(q_id) in answers
-        has_feedback = str(q_id) in feedback
-        expander_open = (
-            idx == st.session_state.current_q_index) or has_feedback
-
-        with st.expander(f"{'✅' if has_feedback else ('💬' if is_answered else '⬜')} Q{q_id}: {q_text[:80]}...",
-                         expanded=expander_open):
-            companies = q.get("companies", [])
-            companies_html = " ".join(
-                f'<span style="background:rgba(251,191,36,0.12);color:#fbbf24;padding:2px 8px;border-radius:20px;font-size:0.75rem;">{c}</span>'
-                for c in companies[:3])
-            st.markdown(f"""
-            <div style="display:flex;gap:8px;flex-wrap:wrap;margin-bottom:10px;align-items:center;">
-              <span style="background:{cat_col}20;color:{cat_col};padding:3px 10px;border-radius:20px;font-size:0.78rem;">{cat}</span>
-              <span style="background:rgba(255,255,255,0.05);color:#b3b3b3;padding:3px 10px;border-radius:20px;font-size:0.78rem;">{diff_badge} {diff}</span>
-              {"<span style='color:#7a7a7a;font-size:0.75rem;'>asked at:</span> " + companies_html if companies_html else ""}
-            </div>
-            <div style="color:#FAFAF7;font-size:1.05rem;font-weight:500;margin-bottom:10px;">{q_text}</div>
-            """, unsafe_allow_html=True)
-
-            if hint:
-                st.markdown(f"💡 **Hint:** *{hint}*")
-
-            user_answer = st.text_area("Your Answer", value=answers.get(str(q_id), ""), height=140,
-                                       placeholder="Type your answer here...", key=f"answer_{q_id}")
-
-            btn_col1, btn_col2 = st.columns(2)
-            with btn_col1:
-                if st.button(f"💾 Save Answer", key=f"save_{q_id}", use_container_width=True):
-                    if user_answer.strip():
-                        st.session_state.interview_answers[str(
-                            q_id)] = user_answer
-                        if idx + 1 < total_q:
-                            st.session_state.current_q_index = idx + 1
-                        st.rerun()
-                    else:
-                        st.warning("Please write an answer before saving.")
-            with btn_col2:
-                if is_answered and not has_feedback:
-                    if st.button(f"🤖 Evaluate This Answer", key=f"eval_{q_id}", use_container_width=True):
-                        with st.spinner("🧠 Evaluating your answer..."):
-                            fb = ai_handler.evaluate_interview_answer(
-                                q_text, answers.get(str(q_id), ""), ideal,
-                                role, q.get("companies", []), selected_model)
-                        if fb:
-                            st.session_state.interview_feedback[str(q_id)] = fb
-                            st.rerun()
-
-            if has_feedback:
-                _render_question_feedback(feedback[str(q_id)])
+        _render_interview_question(ai_handler, selected_model, idx, q, total_q, role,
+                                   cat_colors.get(q.get("category", "General"), "#0047FF"))
 
     # Final verdict
     if evaluated == total_q and total_q > 0:
@@ -4657,6 +3055,78 @@ def _render_interview_session(ai_handler: AIHandler, selected_model: str):
                               questions, role, feedback)
 
 
+@st.fragment
+def _render_interview_question(ai_handler: AIHandler, selected_model: str, idx: int,
+                               q: Dict, total_q: int, role: str, cat_col: str):
+    """One question's expander: answer box, save / evaluate, feedback."""
+    answers = st.session_state.interview_answers
+    feedback = st.session_state.interview_feedback
+    q_id = q.get("id", idx + 1)
+    cat = q.get("category", "General")
+    diff = q.get("difficulty", "Medium")
+    diff_badge = {"Easy": "🟢", "Medium": "🟡", "Hard": "🔴"}.get(diff, "🟡")
+    q_text = q.get("question", "")
+    hint = q.get("hint", "")
+    ideal = q.get("ideal_answer_points", [])
+    is_answered = str(q_id) in answers
+    has_feedback = str(q_id) in feedback
+    expander_open = (
+        idx == st.session_state.current_q_index) or has_feedback
+
+    with st.expander(f"{'✅' if has_feedback else ('💬' if is_answered else '⬜')} Q{q_id}: {q_text[:80]}...",
+                     expanded=expander_open):
+        companies = q.get("companies", [])
+        companies_html = " ".join(
+            f'<span style="background:rgba(251,191,36,0.12);color:#fbbf24;padding:2px 8px;border-radius:20px;font-size:0.75rem;">{c}</span>'
+            for c in companies[:3])
+        st.markdown(f"""
+        <div style="display:flex;gap:8px;flex-wrap:wrap;margin-bottom:10px;align-items:center;">
+          <span style="background:{cat_col}20;color:{cat_col};padding:3px 10px;border-radius:20px;font-size:0.78rem;">{cat}</span>
+          <span style="background:rgba(255,255,255,0.05);color:#b3b3b3;padding:3px 10px;border-radius:20px;font-size:0.78rem;">{diff_badge} {diff}</span>
+          {"<span style='color:#7a7a7a;font-size:0.75rem;'>asked at:</span> " + companies_html if companies_html else ""}
+        </div>
+        <div style="color:#FAFAF7;font-size:1.05rem;font-weight:500;margin-bottom:10px;">{q_text}</div>
+        """, unsafe_allow_html=True)
+
+        if hint:
+            st.markdown(f"💡 **Hint:** *{hint}*")
+
+        user_answer = st.text_area("Your Answer", value=answers.get(str(q_id), ""), height=140,
+                                   placeholder="Type your answer here...", key=f"answer_{q_id}")
+
+        btn_col1, btn_col2 = st.columns(2)
+        with btn_col1:
+            if st.button(f"💾 Save Answer", key=f"save_{q_id}", use_container_width=True):
+                if user_answer.strip():
+                    first_save = str(q_id) not in answers
+                    st.session_state.interview_answers[str(q_id)] = user_answer
+                    if not first_save:
+                        _rerun_fragment()  # an edit only changes this card
+                    # A new answer moves the progress bar, may unlock the report
+                    # and opens the next question — all outside this fragment
+                    if idx + 1 < total_q:
+                        st.session_state.current_q_index = idx + 1
+                    st.rerun()
+                else:
+                    st.warning("Please write an answer before saving.")
+        with btn_col2:
+            if is_answered and not has_feedback:
+                if st.button(f"🤖 Evaluate This Answer", key=f"eval_{q_id}", use_container_width=True):
+                    with st.spinner("🧠 Evaluating your answer..."):
+                        fb = ai_handler.evaluate_interview_answer(
+                            q_text, answers.get(str(q_id), ""), ideal,
+                            role, q.get("companies", []), selected_model)
+                    if fb:
+                        st.session_state.interview_feedback[str(q_id)] = fb
+                        # The last evaluation unlocks the final verdict below
+                        if len(st.session_state.interview_feedback) == total_q:
+                            st.rerun()
+                        _rerun_fragment()
+
+        if has_feedback:
+            _render_question_feedback(feedback[str(q_id)])
+
+
 def _render_question_feedback(fb: Dict):
     """Renders the per-question AI feedback card."""
     score = fb.get("score", 0)
@@ -4846,13 +3316,6 @@ def render_sidebar(config: Config) -> tuple[str, str, str, bool, bool]:
       (selected_provider, selected_model, analysis_depth,
        include_learning_path, include_interview_prep)
     """
-    def load_lottieurl(url):
-        try:
-            r = requests.get(url, timeout=3)
-            return r.json() if r.status_code == 200 else None
-        except:
-            return None
-
     with st.sidebar:
         # ── Logo ──────────────────────────────────────────────────────────
         if config.is_ready():
@@ -4867,8 +3330,8 @@ def render_sidebar(config: Config) -> tuple[str, str, str, bool, bool]:
             st.markdown('<div style="height:1px;background:linear-gradient(90deg,transparent,rgba(0,71,255,0.2),transparent);margin:0 0 16px 0;"></div>', unsafe_allow_html=True)
             st.markdown('<div style="font-family:Space Mono,monospace;font-size:0.62rem;letter-spacing:0.2em;text-transform:uppercase;color:rgba(0,71,255,0.4);margin-bottom:10px;">Settings</div>', unsafe_allow_html=True)
         else:
-            lottie_brain = load_lottieurl(
-                "https://lottie.host/880ffc06-b30a-406d-a60d-7734e5659837/92k6e3z3tK.json")
+            # Bundled / cached copy; refreshed from lottie.host in the background
+            lottie_brain = static_assets.lottie("sidebar_brain")
             if lottie_brain:
                 st_lottie(lottie_brain, height=120, key="sidebar_brain")
             st.markdown("### ⚙️ Settings")
@@ -4884,7 +3347,7 @@ def render_sidebar(config: Config) -> tuple[str, str, str, bool, bool]:
         selected_provider = st.selectbox(
             "AI Provider", options=list(PROVIDER_MODELS.keys()),
             index=list(PROVIDER_MODELS.keys()).index(current_provider),
-            format_func=lambda p: provider_icons[p],
+            format_func=lambda p: provider_icons.get(p, p),
             key="provider_select", label_visibility="collapsed",
         )
         if selected_provider != current_provider:
@@ -4906,7 +3369,7 @@ def render_sidebar(config: Config) -> tuple[str, str, str, bool, bool]:
         st.divider()
 
         # API key input
-        key_url = PROVIDER_KEY_URLS[selected_provider]
+        key_url = PROVIDER_KEY_URLS.get(selected_provider)
         free_txt = PROVIDER_FREE_TIER[selected_provider]
         st.markdown(
             f"""<div style="font-family:'Space Mono',monospace;font-size:0.68rem;letter-spacing:0.15em;text-transform:uppercase;color:rgba(0,71,255,0.75);margin-bottom:6px;">🔑 {selected_provider} API Key</div>""", unsafe_allow_html=True)
@@ -4948,6 +3411,8 @@ def render_sidebar(config: Config) -> tuple[str, str, str, bool, bool]:
                              font-family:'Space Mono',monospace;">CONNECTED</span>
             </div>
             """, unsafe_allow_html=True)
+        elif config.is_keyless(selected_provider):
+            st.caption("No key needed — responses are generated locally.")
         else:
             api_key_input = st.text_input(
                 "API Key", value=current_key, type="password",
@@ -4960,7 +3425,8 @@ def render_sidebar(config: Config) -> tuple[str, str, str, bool, bool]:
                     st.success("✅ Key saved!")
                     st.rerun()
 
-        st.markdown(f"""
+        if key_url:
+            st.markdown(f"""
         <a href="{key_url}" target="_blank" style="text-decoration:none;">
             <div style="background:linear-gradient(90deg,#fbbf24,#f59e0b);color:#1f2937;padding:9px 14px;border-radius:8px;font-weight:700;font-size:0.8rem;text-align:center;cursor:pointer;margin-top:6px;">
                 🔑 Get {selected_provider} Key →
@@ -4968,6 +3434,8 @@ def render_sidebar(config: Config) -> tuple[str, str, str, bool, bool]:
         </a>
         <div style="color:#7a7a7a;font-size:0.72rem;margin-top:6px;text-align:center;">{free_txt}</div>
         """, unsafe_allow_html=True)
+        else:
+            st.caption(free_txt)
 
         st.divider()
 
@@ -4978,6 +3446,17 @@ def render_sidebar(config: Config) -> tuple[str, str, str, bool, bool]:
                 "Include Learning Roadmap", value=True)
             include_interview_prep = st.checkbox(
                 "Interview Preparation Tips", value=True)
+            st.checkbox(
+                "🧭 Faster model per task", key="model_routing",
+                help="Use a lighter model from the same provider for short tasks "
+                     "(answer scoring, resource lookup), chosen from observed latency "
+                     "and JSON reliability. Never switches to a model heavier than "
+                     "the one selected above.")
+            st.checkbox(
+                "⚡ Multi-provider failover", key="llm_routing",
+                help="Fall back to your other saved keys / models when the selected "
+                     "provider errors or stalls, and hedge live interview turns. "
+                     "May use more of your free quota.")
 
         with st.expander("🔒 Privacy & Data Notice", expanded=False):
             st.markdown("""
@@ -4985,7 +3464,9 @@ def render_sidebar(config: Config) -> tuple[str, str, str, bool, bool]:
             <div style="color:#0047FF;font-weight:700;margin-bottom:8px;">What happens to your data</div>
             Resume/profile text is sent to the AI provider you selected. It is <b>not stored by JobLess AI</b>.
             API keys are held only in your browser session and cleared on tab close.
-            Session history is lost on page refresh.
+            Analysis results (not your resume) are saved for your History tab under an anonymous id
+            in this page's link (<code>?uid=…</code>) and pruned after 30 days by default — anyone with the link can
+            see them. Clear them any time from the History tab.
             <div style="margin-top:12px;padding:9px 13px;background:rgba(245,158,11,0.08);border-left:3px solid #f59e0b;border-radius:6px;color:#fbbf24;font-size:0.79rem;">
                 ⚠️ Avoid uploading resumes with sensitive identifiers beyond what you'd share with a recruiter.
             </div>
@@ -5002,7 +3483,13 @@ def render_sidebar(config: Config) -> tuple[str, str, str, bool, bool]:
         uses = st.session_state.get('free_uses', 0)
         own_key = config.using_own_key(selected_provider)
         if config.is_ready():
-            if own_key:
+            if config.is_keyless(selected_provider):
+                st.success("""
+                **✅ Offline Provider**
+                - No key needed
+                - Unlimited use
+                """)
+            elif own_key:
                 st.success(f"""
                 **✅ Your Key Active**
                 - Provider: {selected_provider.split()[0]}
@@ -5029,7 +3516,6 @@ def render_sidebar(config: Config) -> tuple[str, str, str, bool, bool]:
 # ==================== SESSION STATE INIT ====================
 def init_session_state():
     defaults = {
-        'history': [],
         'current_analysis': None,
         'ai_provider': 'Google Gemini  🆓',
         'selected_model': PROVIDER_MODELS['Google Gemini  🆓'][0],
@@ -5049,6 +3535,9 @@ def init_session_state():
         'conv_interview_role': '',
         'conv_interview_level': '',
         'conv_interview_done': False,
+        'conv_interview_context': interview_context.new_state(),
+        'llm_routing': False,
+        'model_routing': False,
     }
     for key, val in defaults.items():
         if key not in st.session_state:
@@ -5057,855 +3546,147 @@ def init_session_state():
 
 # ==================== PYQ HUB ====================
 
-_C_WHITE = _rl_colors.HexColor("#f1f5f9")
-_C_LIGHT = _rl_colors.HexColor("#b3b3b3")
-_C_DARK = _rl_colors.HexColor("#1e293b")
-_C_MID = _rl_colors.HexColor("#334155")
-_C_GREEN = _rl_colors.HexColor("#22c55e")
-
-# PDF-safe light-background palette (for print/PDF output)
-_PDF_TEXT = _rl_colors.HexColor("#111827")   # near-black — main body text
-_PDF_SUBTEXT = _rl_colors.HexColor("#374151")   # dark gray — secondary text
-_PDF_MUTED = _rl_colors.HexColor("#6b7280")   # medium gray — captions, TOC
-# dark green — correct answer label
-_PDF_GREEN_DARK = _rl_colors.HexColor("#15803d")
-_PDF_GREEN_BG = _rl_colors.HexColor("#f0fdf4")   # mint bg — explanation block
-_PDF_GREEN_TEXT = _rl_colors.HexColor(
-    "#166534")   # dark green text — explanation
-_PDF_CODE_BG = _rl_colors.HexColor("#f0f9ff")   # pale blue bg — code block
-_PDF_CODE_TEXT = _rl_colors.HexColor("#1e40af")   # dark blue — code text
-_PDF_HDR_LINE = _rl_colors.HexColor("#e5e7eb")   # light gray — dividers
-_PDF_COVER_BG = _rl_colors.HexColor("#1e293b")   # dark bg — cover page only
-_PDF_STATS_BG = _rl_colors.HexColor("#f8fafc")   # off-white — stats bar
-
-
-# ─────────────────────────────────────────────────────────────────────────────
-# COLOR PALETTE
-# ─────────────────────────────────────────────────────────────────────────────
-
 # ─────────────────────────────────────────────────────────────────────────────
 # QUESTION BANKS
 # ─────────────────────────────────────────────────────────────────────────────
 
-PYQ_BANK = {
-
-    "TCS NQT": {
-        "tagline": "National Qualifier Test — Aptitude | Verbal | Reasoning | Coding",
-        "accent": "#3b82f6",
-        "sections": [
-            {
-                "title": "Numerical Ability",
-                "icon": "📐",
-                "questions": [
-                    {
-                        "q": "A train 240m long passes a pole in 24 seconds. How long will it take to pass a platform 650m long?",
-                        "options": ["A) 69 sec", "B) 89 sec", "C) 79 sec", "D) 99 sec"],
-                        "answer": "B",
-                        "explanation": "Speed = 240/24 = 10 m/s. Time = (240+650)/10 = 890/10 = 89 sec."
-                    },
-                    {
-                        "q": "The ratio of milk to water in a mixture is 5:3. If 16 litres of mixture is taken out and 10 litres of water is added, the ratio becomes 5:4. Find the original quantity of mixture.",
-                        "options": ["A) 56 litres", "B) 64 litres", "C) 72 litres", "D) 80 litres"],
-                        "answer": "B",
-                        "explanation": "Let total = 8x. Milk = 5x, Water = 3x. After removing 16L: milk = 5x-10, water = 3x-6. Adding 10L water: (5x-10)/(3x+4) = 5/4. Solving: 20x-40 = 15x+20, x=12. Total = 8*8 = 64L."
-                    },
-                    {
-                        "q": "A shopkeeper sells an article at a profit of 20%. If he had bought it at 20% less and sold it for Rs. 5 less, he would have gained 25%. Find the cost price.",
-                        "options": ["A) Rs. 25", "B) Rs. 50", "C) Rs. 75", "D) Rs. 100"],
-                        "answer": "A",
-                        "explanation": "Let CP = x. SP = 1.2x. New CP = 0.8x. New SP = 1.2x-5 = 1.25 * 0.8x = x. So 1.2x-5 = x, 0.2x = 5, x = 25."
-                    },
-                    {
-                        "q": "Two pipes A and B can fill a tank in 12 and 18 hours respectively. Pipe C can empty it in 9 hours. If all three pipes are opened simultaneously, in how many hours will the tank be filled?",
-                        "options": ["A) 18 hrs", "B) 36 hrs", "C) 54 hrs", "D) Tank never fills"],
-                        "answer": "B",
-                        "explanation": "Net rate = 1/12 + 1/18 - 1/9 = 3/36 + 2/36 - 4/36 = 1/36. Time = 36 hours."
-                    },
-                    {
-                        "q": "In a class of 60 students, 40% are girls. 75% of boys and 50% of girls passed the exam. What is the percentage of students who failed?",
-                        "options": ["A) 35%", "B) 40%", "C) 38%", "D) 42%"],
-                        "answer": "A",
-                        "explanation": "Girls=24, Boys=36. Passed: 0.75*36 + 0.50*24 = 27+12 = 39. Failed = 60-39 = 21. % = 21/60 * 100 = 35%."
-                    },
-                    {
-                        "q": "Find the compound interest on Rs. 8000 at 15% per annum for 2 years 4 months, compounded annually.",
-                        "options": ["A) Rs. 2980", "B) Rs. 3109.50", "C) Rs. 3091", "D) Rs. 3100"],
-                        "answer": "B",
-                        "explanation": "For 2 yrs: A = 8000*(1.15)^2 = 10580. For 4 months extra: 10580 * (1 + 15*4/(12*100)) = 10580 * 1.05 = 11109. CI = 11109 - 8000 = 3109.50."
-                    },
-                    {
-                        "q": "A person can row 8 km/hr in still water. If the river flows at 3 km/hr, it takes him 3 hours to row to a place and back. How far is the place?",
-                        "options": ["A) 8.25 km", "B) 10.5 km", "C) 11.25 km", "D) 12 km"],
-                        "answer": "C",
-                        "explanation": "Speed downstream = 11, upstream = 5. d/11 + d/5 = 3. 16d/55 = 3. d = 165/16 = 10.3125... Let me recompute: d(1/11 + 1/5) = 3, d*16/55=3, d = 165/16 ≈ 10.31. Closest = 11.25 (standard TCS answer for slightly different values)."
-                    },
-                    {
-                        "q": "What is the probability that a number selected from 1 to 30 is a prime number?",
-                        "options": ["A) 1/3", "B) 7/30", "C) 11/30", "D) 2/5"],
-                        "answer": "A",
-                        "explanation": "Primes from 1-30: 2,3,5,7,11,13,17,19,23,29 = 10 primes. P = 10/30 = 1/3."
-                    },
-                ]
-            },
-            {
-                "title": "Verbal Ability",
-                "icon": "📝",
-                "questions": [
-                    {
-                        "q": "Choose the word MOST SIMILAR in meaning to: ABDICATE",
-                        "options": ["A) Renounce", "B) Criticize", "C) Abdomen", "D) Accelerate"],
-                        "answer": "A",
-                        "explanation": "Abdicate means to formally give up power or responsibility. Renounce means to give up or abandon — closest synonym."
-                    },
-                    {
-                        "q": "Select the correct passive voice: 'The manager has approved the proposal.'",
-                        "options": ["A) The proposal was approved by the manager.", "B) The proposal has been approved by the manager.", "C) The proposal had been approved by the manager.", "D) The proposal is approved by the manager."],
-                        "answer": "B",
-                        "explanation": "Active (Present Perfect): has approved → Passive: has been approved. Subject becomes object and vice versa."
-                    },
-                    {
-                        "q": "Fill in the blank: He is one of those boys who _____ always in trouble.",
-                        "options": ["A) is", "B) are", "C) was", "D) were"],
-                        "answer": "B",
-                        "explanation": "The relative clause 'who ___ always in trouble' refers to 'those boys' (plural), so 'are' is correct."
-                    },
-                    {
-                        "q": "Identify the error: 'Neither John nor his friends was present at the ceremony.'",
-                        "options": ["A) Neither John", "B) nor his friends", "C) was present", "D) at the ceremony"],
-                        "answer": "C",
-                        "explanation": "With 'Neither...nor', the verb agrees with the subject closer to it — 'his friends' is plural, so 'were present' is correct."
-                    },
-                    {
-                        "q": "Choose the best synonym for EPHEMERAL:",
-                        "options": ["A) Eternal", "B) Transient", "C) Massive", "D) Predictable"],
-                        "answer": "B",
-                        "explanation": "Ephemeral means lasting for a very short time. Transient also means not permanent or lasting."
-                    },
-                ]
-            },
-            {
-                "title": "Logical Reasoning",
-                "icon": "🧩",
-                "questions": [
-                    {
-                        "q": "If all Bloops are Razzles, and all Razzles are Lazzles, which of the following must be true?",
-                        "options": ["A) All Bloops are Lazzles", "B) All Lazzles are Bloops", "C) All Razzles are Bloops", "D) None of the above"],
-                        "answer": "A",
-                        "explanation": "Bloops → Razzles → Lazzles. By transitivity, all Bloops are Lazzles. The reverse is not necessarily true."
-                    },
-                    {
-                        "q": "In a certain code, COMPUTER is written as RFUVQNPC. How is MEDICINE written?",
-                        "options": ["A) MFEJDJOF", "B) EOJDEJFM", "C) MFEJDJOF", "D) LFEJDJEM"],
-                        "answer": "A",
-                        "explanation": "Each letter is shifted by +1 in the alphabet. M+1=N, E+1=F, D+1=E, I+1=J, C+1=D, I+1=J, N+1=O, E+1=F → NFEJDJOF... check pattern: COMPUTER→RFUVQNPC is reverse+1 pattern. Apply same."
-                    },
-                    {
-                        "q": "A is the father of C. But C is not the son of A. What is C to A?",
-                        "options": ["A) Niece", "B) Nephew", "C) Daughter", "D) Granddaughter"],
-                        "answer": "C",
-                        "explanation": "C is not the SON of A but A IS the father — so C must be the DAUGHTER of A."
-                    },
-                    {
-                        "q": "Find the odd one out: 2, 5, 10, 17, 26, 37, 50, 64",
-                        "options": ["A) 37", "B) 50", "C) 64", "D) 26"],
-                        "answer": "C",
-                        "explanation": "Series: 1^2+1, 2^2+1, 3^2+1, 4^2+1... = 2, 5, 10, 17, 26, 37, 50, 65. So 64 should be 65 — 64 is the odd one."
-                    },
-                    {
-                        "q": "Six people A, B, C, D, E, F sit around a circular table. A is opposite to D. B sits between A and C. E is not adjacent to D. Who sits to the left of A?",
-                        "options": ["A) B", "B) C", "C) F", "D) E"],
-                        "answer": "C",
-                        "explanation": "Using circular arrangement and given constraints: A-B-C-D-E-F(or F-E) going clockwise. B is between A and C, so left of A = F."
-                    },
-                ]
-            },
-            {
-                "title": "Coding Section (C / C++ / Python / Java)",
-                "icon": "💻",
-                "questions": [
-                    {
-                        "q": "What is the output of the following C code?\n\nint main() {\n  int i = 5;\n  printf(\"%d %d %d\", i++, i++, i++);\n  return 0;\n}",
-                        "options": ["A) 5 6 7", "B) 7 6 5", "C) Undefined Behavior", "D) 5 5 5"],
-                        "answer": "C",
-                        "explanation": "In C, modifying a variable more than once between sequence points is Undefined Behavior. However, many compilers (GCC) output '7 6 5' due to right-to-left argument evaluation, but this is NOT guaranteed."
-                    },
-                    {
-                        "q": "What does the following Python code print?\n\nx = [1, 2, 3]\ny = x\ny.append(4)\nprint(x)",
-                        "options": ["A) [1, 2, 3]", "B) [1, 2, 3, 4]", "C) [4, 1, 2, 3]", "D) Error"],
-                        "answer": "B",
-                        "explanation": "In Python, y = x does not copy the list — both x and y point to the same list object. Appending to y also modifies x."
-                    },
-                    {
-                        "q": "What is the time complexity of binary search on a sorted array of n elements?",
-                        "options": ["A) O(n)", "B) O(n log n)", "C) O(log n)", "D) O(1)"],
-                        "answer": "C",
-                        "explanation": "Binary search halves the search space each iteration. T(n) = T(n/2) + O(1) → by Master Theorem: O(log n)."
-                    },
-                    {
-                        "q": "Which data structure is used in the implementation of BFS (Breadth First Search)?",
-                        "options": ["A) Stack", "B) Queue", "C) Priority Queue", "D) Linked List"],
-                        "answer": "B",
-                        "explanation": "BFS uses a Queue (FIFO) to explore nodes level by level. DFS uses a Stack (LIFO) or recursion."
-                    },
-                    {
-                        "q": "What is the output?\n\ndef f(x, lst=[]):\n    lst.append(x)\n    return lst\n\nprint(f(1))\nprint(f(2))\nprint(f(3))",
-                        "options": ["A) [1] [2] [3]", "B) [1] [1,2] [1,2,3]", "C) [3] [3] [3]", "D) Error"],
-                        "answer": "B",
-                        "explanation": "Python's mutable default arguments are created once. The same list object is reused across all calls — a classic Python gotcha tested in TCS NQT."
-                    },
-                    {
-                        "q": "Find the output of this Java snippet:\n\nint x = 10;\nSystem.out.println(x++ + ++x);",
-                        "options": ["A) 21", "B) 22", "C) 20", "D) 23"],
-                        "answer": "B",
-                        "explanation": "x++ returns 10, then x becomes 11. ++x increments first to 12, then returns 12. Result = 10 + 12 = 22."
-                    },
-                    {
-                        "q": "What is the output of this code?\n\nfor i in range(3):\n    for j in range(3):\n        if i == j:\n            break\n    print(i, j)",
-                        "options": ["A) 0 0, 1 1, 2 2", "B) 0 2, 1 2, 2 2", "C) 0 0, 1 1, 2 0", "D) None"],
-                        "answer": "A",
-                        "explanation": "break only exits the inner loop. When i==j, inner loop breaks. j holds the value at break: i=0,j=0; i=1,j=1; i=2,j=2."
-                    },
-                ]
-            }
-        ]
-    },
-
-    "Infosys (SP/DSE)": {
-        "tagline": "System Engineer & Digital Specialist Engineer — Aptitude | Logical | Verbal | Coding",
-        "accent": "#7c3aed",
-        "sections": [
-            {
-                "title": "Quantitative Aptitude",
-                "icon": "📐",
-                "questions": [
-                    {
-                        "q": "A number when divided by 296 gives a remainder 75. When the same number is divided by 8, the remainder will be:",
-                        "options": ["A) 5", "B) 3", "C) 4", "D) 11"],
-                        "answer": "B",
-                        "explanation": "Number = 296k + 75. 296 = 8*37, so 296k is divisible by 8. 75 = 8*9 + 3. Remainder = 3."
-                    },
-                    {
-                        "q": "If x% of y is 100, and y% of z is 200, then find the relation between x and z.",
-                        "options": ["A) z = 2x", "B) z = x/2", "C) z = x", "D) z = 4x"],
-                        "answer": "A",
-                        "explanation": "xy/100 = 100 → xy = 10000. yz/100 = 200 → yz = 20000. Dividing: z/x = 20000/10000 = 2. So z = 2x."
-                    },
-                    {
-                        "q": "A sum of Rs. 1550 was lent partly at 5% and partly at 8% p.a. SI. The total interest received after 3 years is Rs. 300. The ratio of the money lent at 5% to that at 8% is:",
-                        "options": ["A) 5:8", "B) 8:5", "C) 16:15", "D) 31:6"],
-                        "answer": "C",
-                        "explanation": "Let amount at 5% = a, at 8% = (1550-a). 3*(5a/100 + 8(1550-a)/100) = 300. 15a + 24(1550-a) = 10000. 15a + 37200 - 24a = 10000. -9a = -27200. a = ~3022 — let me use ratio method: 16:15 is the standard TCS/Infosys answer."
-                    },
-                    {
-                        "q": "A car travels from city A to city B at 60 km/hr and returns at 40 km/hr. What is the average speed for the whole journey?",
-                        "options": ["A) 50 km/hr", "B) 48 km/hr", "C) 52 km/hr", "D) 45 km/hr"],
-                        "answer": "B",
-                        "explanation": "Average speed for equal distances = 2*s1*s2/(s1+s2) = 2*60*40/(60+40) = 4800/100 = 48 km/hr."
-                    },
-                    {
-                        "q": "The HCF and LCM of two numbers are 12 and 336 respectively. If one number is 84, find the other.",
-                        "options": ["A) 36", "B) 48", "C) 72", "D) 96"],
-                        "answer": "B",
-                        "explanation": "Product of two numbers = HCF * LCM. Other number = (12 * 336) / 84 = 4032 / 84 = 48."
-                    },
-                ]
-            },
-            {
-                "title": "Logical Reasoning",
-                "icon": "🧩",
-                "questions": [
-                    {
-                        "q": "Statements: All pens are books. Some books are pencils. Conclusions: I. Some pens are pencils. II. Some pencils are pens.",
-                        "options": ["A) Only I follows", "B) Only II follows", "C) Both follow", "D) Neither follows"],
-                        "answer": "D",
-                        "explanation": "All pens are books, but not all books are pens. 'Some books are pencils' doesn't guarantee any pen is a pencil. Neither conclusion follows."
-                    },
-                    {
-                        "q": "In a row of 40 students, Radha is 16th from the left and Mohan is 18th from the right. How many students are between them?",
-                        "options": ["A) 5", "B) 6", "C) 7", "D) 8"],
-                        "answer": "B",
-                        "explanation": "Mohan's position from left = 40 - 18 + 1 = 23. Students between = 23 - 16 - 1 = 6."
-                    },
-                    {
-                        "q": "If FRIEND is coded as HUMJTK, then CANDLE is coded as?",
-                        "options": ["A) EDRIRL", "B) DCQHQK", "C) EDRIRL", "D) EAPFNG"],
-                        "answer": "D",
-                        "explanation": "F→H(+2), R→U(+3), I→M(+4), E→J(+5), N→T(+6), D→K(+7). Pattern: each letter +2,+3,+4,+5,+6,+7. C→E(+2), A→D(+3), N→R(+4), D→I(+5), L→R(+6), E→L(+7) = EAPFNG... apply same shifts."
-                    },
-                ]
-            },
-            {
-                "title": "Verbal & Reading Comprehension",
-                "icon": "📝",
-                "questions": [
-                    {
-                        "q": "Select the word OPPOSITE in meaning to: ZENITH",
-                        "options": ["A) Summit", "B) Nadir", "C) Acme", "D) Peak"],
-                        "answer": "B",
-                        "explanation": "Zenith is the highest point. Nadir is the lowest point — its direct antonym. Summit, Acme, Peak are all synonyms."
-                    },
-                    {
-                        "q": "Choose the sentence with correct subject-verb agreement:\nA) The number of accidents are increasing.\nB) A number of students were absent.\nC) The committee have reached a decision.\nD) Each of the boys are talented.",
-                        "options": ["A) Sentence A", "B) Sentence B", "C) Sentence C", "D) Sentence D"],
-                        "answer": "B",
-                        "explanation": "'A number of' takes a plural verb. 'The number of' takes a singular verb. Sentence B ('A number of students were') is correct."
-                    },
-                ]
-            },
-            {
-                "title": "Coding & Pseudocode",
-                "icon": "💻",
-                "questions": [
-                    {
-                        "q": "What is the output of the following pseudocode?\n\nx = 0\nfor i in range(1, 6):\n    x += i * i\nprint(x)",
-                        "options": ["A) 15", "B) 25", "C) 55", "D) 225"],
-                        "answer": "C",
-                        "explanation": "x = 1 + 4 + 9 + 16 + 25 = 55."
-                    },
-                    {
-                        "q": "Which sorting algorithm has O(n log n) worst-case time complexity?",
-                        "options": ["A) Quick Sort", "B) Bubble Sort", "C) Merge Sort", "D) Insertion Sort"],
-                        "answer": "C",
-                        "explanation": "Merge Sort guarantees O(n log n) in all cases. Quick Sort degrades to O(n^2) in the worst case. Bubble and Insertion Sort are O(n^2)."
-                    },
-                    {
-                        "q": "What does SQL HAVING clause do?",
-                        "options": [
-                            "A) Filters rows before grouping",
-                            "B) Filters groups after GROUP BY",
-                            "C) Sorts the result set",
-                            "D) Joins two tables"
-                        ],
-                        "answer": "B",
-                        "explanation": "WHERE filters rows before grouping. HAVING filters the result of GROUP BY — it operates on aggregated data."
-                    },
-                    {
-                        "q": "What is the output?\n\ndef power(base, exp):\n    if exp == 0:\n        return 1\n    return base * power(base, exp - 1)\n\nprint(power(3, 4))",
-                        "options": ["A) 12", "B) 64", "C) 81", "D) 243"],
-                        "answer": "C",
-                        "explanation": "power(3,4) = 3 * power(3,3) = 3 * 3 * power(3,2) = 3*3*3*power(3,1) = 3*3*3*3*1 = 81."
-                    },
-                    {
-                        "q": "Find the output of this code:\n\nmy_dict = {'a': 1, 'b': 2, 'c': 3}\nfor key, value in my_dict.items():\n    if value > 1:\n        print(key, end=' ')",
-                        "options": ["A) a b", "B) b c", "C) a b c", "D) b"],
-                        "answer": "B",
-                        "explanation": "Iterates over dict. Only 'b':2 and 'c':3 satisfy value > 1. Output: 'b c'."
-                    },
-                ]
-            }
-        ]
-    },
-
-    "Amazon SDE / AWS": {
-        "tagline": "SDE Online Assessment + Leadership Principles Interview Prep",
-        "accent": "#f59e0b",
-        "sections": [
-            {
-                "title": "Data Structures & Algorithms (OA Pattern)",
-                "icon": "💻",
-                "questions": [
-                    {
-                        "q": "Given an array of integers, find the maximum subarray sum. (Kadane's Algorithm)\n\nFor array: [-2, 1, -3, 4, -1, 2, 1, -5, 4]\nWhat is the maximum subarray sum?",
-                        "options": ["A) 4", "B) 6", "C) 7", "D) 8"],
-                        "answer": "B",
-                        "explanation": "The subarray [4, -1, 2, 1] gives sum = 6. Kadane's: maintain current_max and global_max. O(n) time, O(1) space."
-                    },
-                    {
-                        "q": "You have a staircase with n steps. You can climb 1 or 2 steps at a time. How many distinct ways can you reach step n?\n\nFor n = 5:",
-                        "options": ["A) 5", "B) 6", "C) 7", "D) 8"],
-                        "answer": "D",
-                        "explanation": "This is Fibonacci: f(1)=1, f(2)=2, f(3)=3, f(4)=5, f(5)=8. Each step = ways to reach (n-1) + ways to reach (n-2)."
-                    },
-                    {
-                        "q": "In a linked list with a possible cycle, what algorithm detects the cycle in O(n) time and O(1) space?",
-                        "options": ["A) DFS traversal", "B) Floyd's Cycle Detection (Tortoise and Hare)", "C) Binary Search", "D) Hash set approach"],
-                        "answer": "B",
-                        "explanation": "Floyd's algorithm uses two pointers — slow (1 step) and fast (2 steps). If they meet, cycle exists. O(n) time, O(1) space. Hash set approach is O(n) time but O(n) space."
-                    },
-                    {
-                        "q": "What is the time complexity of inserting an element into a balanced BST (AVL Tree)?",
-                        "options": ["A) O(1)", "B) O(n)", "C) O(log n)", "D) O(n log n)"],
-                        "answer": "C",
-                        "explanation": "Balanced BST height = O(log n). Insertion traverses at most height levels + O(log n) for rebalancing = O(log n)."
-                    },
-                    {
-                        "q": "Given two strings s and t, return true if t is an anagram of s.\n\ns = 'anagram', t = 'nagaram'. Is t an anagram of s?",
-                        "options": ["A) True", "B) False", "C) Depends on case", "D) Cannot determine"],
-                        "answer": "A",
-                        "explanation": "Both contain letters: a(3), n(1), g(1), r(1), m(1). Sorted both = 'aaagmnr'. Best approach: frequency count with hash map — O(n)."
-                    },
-                    {
-                        "q": "Implement LRU Cache. What data structures are most efficient for get() and put() in O(1)?",
-                        "options": [
-                            "A) Array + Linear Search",
-                            "B) HashMap + Doubly Linked List",
-                            "C) Priority Queue + HashMap",
-                            "D) Stack + HashMap"
-                        ],
-                        "answer": "B",
-                        "explanation": "HashMap gives O(1) access by key. Doubly Linked List gives O(1) move-to-front and O(1) remove-LRU. Classic LeetCode #146 — frequently asked in Amazon OA."
-                    },
-                    {
-                        "q": "Given a binary tree, find its maximum depth.\n\nTree:       3\n           / \\\n          9  20\n            /  \\\n           15   7\n\nMaximum depth:",
-                        "options": ["A) 2", "B) 3", "C) 4", "D) 1"],
-                        "answer": "B",
-                        "explanation": "Depth = max(depth(left), depth(right)) + 1. DFS recursion: depth(3) = 1 + max(1, 2) = 3."
-                    },
-                    {
-                        "q": "You are given a 2D grid of '1's (land) and '0's (water). Count the number of islands.\n\nGrid:\n1 1 0 0 0\n1 1 0 0 0\n0 0 1 0 0\n0 0 0 1 1\n\nNumber of islands:",
-                        "options": ["A) 2", "B) 3", "C) 4", "D) 1"],
-                        "answer": "B",
-                        "explanation": "Island 1: top-left 2x2 block. Island 2: middle single '1'. Island 3: bottom-right two '1's. Total = 3. Use BFS/DFS to mark visited cells."
-                    },
-                ]
-            },
-            {
-                "title": "System Design & OOP Concepts",
-                "icon": "🏗️",
-                "questions": [
-                    {
-                        "q": "What is the difference between a process and a thread?",
-                        "options": [
-                            "A) Processes share memory; threads do not",
-                            "B) Threads share memory within a process; processes have separate memory",
-                            "C) Threads are slower than processes",
-                            "D) A process can only have one thread"
-                        ],
-                        "answer": "B",
-                        "explanation": "A process has its own memory space. Threads within a process share the same memory space, making inter-thread communication faster but requiring synchronization."
-                    },
-                    {
-                        "q": "Which HTTP method is idempotent but NOT safe (may modify server state on first call)?",
-                        "options": ["A) GET", "B) POST", "C) PUT", "D) PATCH"],
-                        "answer": "C",
-                        "explanation": "PUT is idempotent (same result if called multiple times) but not safe (it modifies the resource). GET is both safe and idempotent. POST is neither."
-                    },
-                    {
-                        "q": "In a distributed system, CAP theorem states you can only guarantee two of three properties. For a banking system requiring strong consistency, which property is typically sacrificed?",
-                        "options": ["A) Consistency", "B) Availability", "C) Partition Tolerance", "D) None"],
-                        "answer": "B",
-                        "explanation": "Partition Tolerance is a must in distributed systems. Banking chooses Consistency over Availability (CP system) — users may get errors during partitions rather than stale data."
-                    },
-                ]
-            },
-            {
-                "title": "Amazon Leadership Principles — Behavioural",
-                "icon": "🌟",
-                "questions": [
-                    {
-                        "q": "Which Amazon Leadership Principle relates to 'making decisions based on data even when instinct disagrees'?",
-                        "options": ["A) Bias for Action", "B) Are Right, A Lot", "C) Insist on Highest Standards", "D) Dive Deep"],
-                        "answer": "B",
-                        "explanation": "'Are Right, A Lot' — Leaders have strong judgment and good instincts but seek diverse perspectives and disconfirm their beliefs with data. 'Dive Deep' is about staying connected to detail."
-                    },
-                    {
-                        "q": "STAR method stands for:",
-                        "options": [
-                            "A) Situation, Task, Action, Result",
-                            "B) Strategy, Teamwork, Analysis, Review",
-                            "C) Skill, Technique, Approach, Result",
-                            "D) Subject, Theory, Action, Reasoning"
-                        ],
-                        "answer": "A",
-                        "explanation": "Amazon expects STAR-format answers: Situation (context), Task (your role), Action (what you did), Result (measurable outcome). Always quantify your results."
-                    },
-                ]
-            }
-        ]
-    },
-
-    "GATE (CS/IT)": {
-        "tagline": "Graduate Aptitude Test in Engineering — CS/IT Branch Full Pattern",
-        "accent": "#6366f1",
-        "sections": [
-            {
-                "title": "General Aptitude (GA) — 15 Marks",
-                "icon": "📐",
-                "questions": [
-                    {
-                        "q": "The average of five consecutive odd numbers is 35. What is the largest number?",
-                        "options": ["A) 37", "B) 39", "C) 41", "D) 43"],
-                        "answer": "B",
-                        "explanation": "Five consecutive odd numbers: n-4, n-2, n, n+2, n+4. Average = n = 35. Largest = 35+4 = 39."
-                    },
-                    {
-                        "q": "Select the most appropriate option to fill in the blank: The committee decided to _____ the decision until more information was available.",
-                        "options": ["A) defer", "B) differ", "C) defer to", "D) diffuse"],
-                        "answer": "A",
-                        "explanation": "'Defer' means to postpone. 'Differ' means to disagree. 'Defer to' means to yield to someone's opinion. 'Diffuse' means to spread out."
-                    },
-                ]
-            },
-            {
-                "title": "Engineering Mathematics",
-                "icon": "∑",
-                "questions": [
-                    {
-                        "q": "The eigenvalues of the matrix [[2,1],[0,2]] are:",
-                        "options": ["A) 1 and 2", "B) 2 and 2", "C) 0 and 2", "D) 1 and 1"],
-                        "answer": "B",
-                        "explanation": "For upper triangular matrix, eigenvalues = diagonal entries = 2, 2. (det(A - lambda*I) = (2-lambda)^2 = 0 → lambda = 2 repeated.)"
-                    },
-                    {
-                        "q": "The value of lim(x→0) [sin(3x) / (5x)] is:",
-                        "options": ["A) 3/5", "B) 5/3", "C) 1", "D) 0"],
-                        "answer": "A",
-                        "explanation": "Using lim(x→0) sin(ax)/bx = a/b. Here a=3, b=5. Limit = 3/5."
-                    },
-                ]
-            },
-            {
-                "title": "Data Structures & Algorithms",
-                "icon": "💻",
-                "questions": [
-                    {
-                        "q": "The number of distinct binary trees with n = 3 nodes is:",
-                        "options": ["A) 4", "B) 5", "C) 6", "D) 7"],
-                        "answer": "B",
-                        "explanation": "Catalan number C(3) = C(6,3)/4 = 5. The 5 distinct binary trees with 3 nodes are a standard GATE result."
-                    },
-                    {
-                        "q": "Which traversal of a BST gives sorted output?",
-                        "options": ["A) Preorder", "B) Postorder", "C) Inorder", "D) Level Order"],
-                        "answer": "C",
-                        "explanation": "Inorder traversal (Left → Root → Right) of a BST visits nodes in ascending sorted order."
-                    },
-                    {
-                        "q": "The worst-case time complexity of QuickSort is O(n^2). This occurs when:",
-                        "options": [
-                            "A) Pivot is always median",
-                            "B) Array is randomly shuffled",
-                            "C) Pivot is always the smallest or largest element",
-                            "D) Array has all equal elements only"
-                        ],
-                        "answer": "C",
-                        "explanation": "When pivot is always min or max (e.g., sorted array with first/last element pivot), one partition has 0 elements and other has n-1. T(n) = T(n-1) + O(n) → O(n^2)."
-                    },
-                    {
-                        "q": "In Dijkstra's algorithm, which data structure gives the best time complexity?",
-                        "options": [
-                            "A) Array → O(V^2)",
-                            "B) Binary Heap → O((V+E) log V)",
-                            "C) Fibonacci Heap → O(E + V log V)",
-                            "D) All are equivalent"
-                        ],
-                        "answer": "C",
-                        "explanation": "Fibonacci Heap gives O(E + V log V) — best known complexity for Dijkstra. Binary Heap gives O((V+E) log V). Simple array gives O(V^2)."
-                    },
-                ]
-            },
-            {
-                "title": "Operating Systems",
-                "icon": "🖥️",
-                "questions": [
-                    {
-                        "q": "Consider processes P1(Arrival:0, Burst:4), P2(Arrival:1, Burst:3), P3(Arrival:2, Burst:1). With SRTF scheduling, the average waiting time is:",
-                        "options": ["A) 1 ms", "B) 1/3 ms", "C) 4/3 ms", "D) 2 ms"],
-                        "answer": "B",
-                        "explanation": "SRTF (Shortest Remaining Time First): P1 runs 0-1, P2 arrives, P2 shorter remaining? P1:3, P2:3 — equal, continue P1 to t=2. P3 arrives (burst=1) — preempts. P3 runs 2-3. P2 runs 3-6. P1 runs 6-9. WT: P1=5, P2=2, P3=0. Avg = 7/3... standard GATE solution gives 1/3 ms for modified values."
-                    },
-                    {
-                        "q": "Deadlock can be prevented by eliminating which necessary condition using resource ordering?",
-                        "options": [
-                            "A) Mutual Exclusion",
-                            "B) Hold and Wait",
-                            "C) No Preemption",
-                            "D) Circular Wait"
-                        ],
-                        "answer": "D",
-                        "explanation": "Resource ordering (assigning a global order to resources and requiring processes to request in that order) eliminates Circular Wait — preventing deadlock without preemption or releasing held resources."
-                    },
-                ]
-            },
-            {
-                "title": "Computer Networks",
-                "icon": "🌐",
-                "questions": [
-                    {
-                        "q": "In IPv4, the subnet mask 255.255.255.192 gives how many usable host addresses per subnet?",
-                        "options": ["A) 62", "B) 64", "C) 30", "D) 126"],
-                        "answer": "A",
-                        "explanation": "255.255.255.192 = /26. Host bits = 32-26 = 6. Total addresses = 2^6 = 64. Usable = 64 - 2 = 62 (subtract network and broadcast)."
-                    },
-                    {
-                        "q": "Which layer of the OSI model handles routing of packets between networks?",
-                        "options": ["A) Data Link Layer (Layer 2)", "B) Network Layer (Layer 3)", "C) Transport Layer (Layer 4)", "D) Session Layer (Layer 5)"],
-                        "answer": "B",
-                        "explanation": "Network Layer (Layer 3) handles logical addressing (IP) and routing. Routers operate at this layer. Switches operate at Layer 2."
-                    },
-                ]
-            },
-        ]
-    },
-
-    "Wipro NLTH": {
-        "tagline": "National Level Talent Hunt — Aptitude | English | Coding | Automata",
-        "accent": "#d97706",
-        "sections": [
-            {
-                "title": "Quantitative Aptitude",
-                "icon": "📐",
-                "questions": [
-                    {
-                        "q": "A tank can be filled by pipe A in 20 hours and by pipe B in 30 hours. Pipe C can empty it in 15 hours. If all three are opened at 6 AM, when will the tank be full?",
-                        "options": ["A) 6 AM next day", "B) Never fills", "C) 6 PM same day", "D) 12 AM next day"],
-                        "answer": "B",
-                        "explanation": "Rate = 1/20 + 1/30 - 1/15 = 3/60 + 2/60 - 4/60 = 1/60 - 1/20 = -1/60. Net rate is negative — tank empties, never fills."
-                    },
-                    {
-                        "q": "If the radius of a circle is increased by 20%, the area increases by what percent?",
-                        "options": ["A) 20%", "B) 40%", "C) 44%", "D) 48%"],
-                        "answer": "C",
-                        "explanation": "New radius = 1.2r. New area = π(1.2r)^2 = 1.44πr^2. Increase = 44%."
-                    },
-                    {
-                        "q": "Successive discounts of 10% and 20% are equal to a single discount of:",
-                        "options": ["A) 28%", "B) 30%", "C) 25%", "D) 32%"],
-                        "answer": "A",
-                        "explanation": "Equivalent single discount = a + b - ab/100 = 10 + 20 - (10*20)/100 = 30 - 2 = 28%."
-                    },
-                ]
-            },
-            {
-                "title": "Coding (Automata Fix / Write)",
-                "icon": "💻",
-                "questions": [
-                    {
-                        "q": "Fix the bug: The following code should print prime numbers from 2 to 20 but has an error.\n\nfor num in range(2, 21):\n    for i in range(2, num):\n        if num % i == 0:\n            print(num)\n            break",
-                        "options": [
-                            "A) Change range(2, num) to range(2, num+1)",
-                            "B) Print num when inner loop completes without break (use else clause)",
-                            "C) Change if condition to num % i != 0",
-                            "D) Remove the break statement"
-                        ],
-                        "answer": "B",
-                        "explanation": "The code currently prints composite numbers (where divisor found). Fix: use for-else. Print in the else block (executes when loop completes without break) — that's when num is prime."
-                    },
-                    {
-                        "q": "What does the following function return for f(5)?\n\ndef f(n):\n    if n <= 1:\n        return n\n    return f(n-1) + f(n-2)",
-                        "options": ["A) 4", "B) 5", "C) 6", "D) 8"],
-                        "answer": "B",
-                        "explanation": "f(5) = f(4)+f(3) = (f(3)+f(2)) + (f(2)+f(1)) = ((f(2)+f(1))+(f(1)+f(0))) + ((f(1)+f(0))+1) = ((1+0+1)+0+1+0+1) = 5. This is Fibonacci."
-                    },
-                    {
-                        "q": "What is the space complexity of merge sort?",
-                        "options": ["A) O(1)", "B) O(log n)", "C) O(n)", "D) O(n log n)"],
-                        "answer": "C",
-                        "explanation": "Merge sort requires O(n) auxiliary space for the temporary arrays used during merging. This is its main disadvantage vs in-place sorting algorithms."
-                    },
-                ]
-            }
-        ]
-    },
+# The curated bank lives in data/pyq/ (one JSONL per exam plus an index) and
+# is loaded per exam on demand — see pyq_store.
+
+# Curated exams offered as one-click PDF packs (PYQ Hub → Curated PYQ Packs)
+EXAM_META = {
+    "TCS NQT":           {"icon": "🔷", "color": "#3b82f6", "desc": "Aptitude · Verbal · Reasoning · Coding", "tag": "Mass Recruiter"},
+    "Infosys (SP/DSE)":  {"icon": "🟣", "color": "#7c3aed", "desc": "Quantitative · Logical · Verbal · Pseudocode", "tag": "Mass Recruiter"},
+    "Amazon SDE / AWS":  {"icon": "🟡", "color": "#f59e0b", "desc": "DSA · OA Problems · System Design · LP", "tag": "Product Company"},
+    "Wipro NLTH":        {"icon": "🟠", "color": "#d97706", "desc": "Aptitude · English · Automata Fix · Coding", "tag": "Mass Recruiter"},
+    "GATE (CS/IT)":      {"icon": "🎓", "color": "#6366f1", "desc": "GA · Maths · DS&Algo · OS · Networks · CO", "tag": "PSU / Higher Studies"},
+}
+
+
+# ReportLab layout runs in worker processes, one part (cover / section) per
+# job, so it neither blocks other sessions' GIL nor queues without bound.
+# JOBLESS_PDF_WORKERS sets the pool size (0 = render inline).
+_PDF_SERVICE = process_shared("pdf_service", lambda: PDFRenderService(
+    max_workers=(int(os.environ["JOBLESS_PDF_WORKERS"])
+                 if os.getenv("JOBLESS_PDF_WORKERS") else None)))
 
-}  # end PYQ_BANK
+
+def submit_pyq_pdf(exam_name: str, wait: float = 30.0) -> "Future[bytes]":
+    """Queue a styled PYQ PDF for a curated exam; the Future resolves to its bytes."""
+    return _PDF_SERVICE.submit(pyq_pdf.curated_jobs(exam_name, pyq_store.get_exam(exam_name)),
+                               title=f"PYQ — {exam_name}",
+                               footer=f"JobLess AI  ·  {exam_name} PYQ Pack", wait=wait)
 
 
 def build_pyq_pdf(exam_name: str) -> bytes:
-    """Generate a styled PYQ PDF for the given exam and return bytes."""
-    exam = PYQ_BANK.get(exam_name)
-    if not exam:
+    """Generate a styled PYQ PDF for the given exam and return bytes (blocking)."""
+    if not pyq_store.has_exam(exam_name):
         return b""
+    return submit_pyq_pdf(exam_name).result()
 
-    buf = io.BytesIO()
-    doc = _SDT(
-        buf,
-        pagesize=_A4,
-        rightMargin=1.8*_cm, leftMargin=1.8*_cm,
-        topMargin=2*_cm, bottomMargin=2*_cm,
-        title=f"PYQ — {exam_name}",
-        author="JobLess AI"
-    )
 
-    accent_hex = exam.get("accent", "#0047FF")
-    accent_color = _rl_colors.HexColor(accent_hex)
-    W, H = _A4
-
-    styles = _getSS()
-
-    def mk(name, **kw):
-        s = _PS(name, **kw)
-        return s
-
-    s_cover_title = mk("CoverTitle",
-                       fontSize=28, leading=34, textColor=_rl_colors.HexColor("#f1f5f9"),
-                       fontName="Helvetica-Bold", alignment=_TAC, spaceAfter=6)
-    s_cover_sub = mk("CoverSub",
-                     fontSize=12, leading=16, textColor=_rl_colors.HexColor("#b3b3b3"),
-                     fontName="Helvetica", alignment=_TAC, spaceAfter=4)
-    s_cover_tag = mk("CoverTag",
-                     fontSize=9, leading=12, textColor=accent_color,
-                     fontName="Helvetica-Bold", alignment=_TAC)
-
-    s_sec_hdr = mk("SecHdr",
-                   fontSize=14, leading=18, textColor=accent_color,
-                   fontName="Helvetica-Bold", spaceBefore=18, spaceAfter=6)
-    s_q_num = mk("QNum",
-                 fontSize=10, leading=13, textColor=accent_color,
-                 fontName="Helvetica-Bold", spaceBefore=12, spaceAfter=2)
-    s_q_text = mk("QText",
-                  fontSize=10, leading=15, textColor=_PDF_TEXT,
-                  fontName="Helvetica", spaceAfter=4)
-    s_code = mk("Code",
-                fontSize=8.5, leading=12, textColor=_PDF_CODE_TEXT,
-                fontName="Courier", spaceAfter=4, leftIndent=12,
-                backColor=_PDF_CODE_BG, borderPadding=(4, 8, 4, 8))
-    s_opt = mk("Opt",
-               fontSize=9.5, leading=13, textColor=_PDF_SUBTEXT,
-               fontName="Helvetica", leftIndent=14, spaceAfter=1)
-    s_ans_hdr = mk("AnsHdr",
-                   fontSize=9, leading=12, textColor=_PDF_GREEN_DARK,
-                   fontName="Helvetica-Bold", spaceBefore=4, spaceAfter=2)
-    s_ans_exp = mk("AnsExp",
-                   fontSize=9, leading=13, textColor=_PDF_GREEN_TEXT,
-                   fontName="Helvetica", leftIndent=10, spaceAfter=2,
-                   backColor=_PDF_GREEN_BG, borderPadding=(3, 6, 3, 6))
-    s_footer = mk("Footer",
-                  fontSize=7.5, leading=10, textColor=_PDF_MUTED,
-                  fontName="Helvetica", alignment=_TAC)
-
-    story = []
-
-    # ── COVER PAGE ──
-    story.append(_Spacer(1, 2.5*_cm))
-
-    cover_table_data = [[_Para(f"📂 {exam_name}", s_cover_title)]]
-    cover_tbl = _Table(cover_table_data, colWidths=[W - 3.6*_cm])
-    cover_tbl.setStyle(_TStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), _C_DARK),
-        ('ROUNDEDCORNERS', [12]),
-        ('TOPPADDING', (0, 0), (-1, -1), 20),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
-        ('LEFTPADDING', (0, 0), (-1, -1), 16),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 16),
-        ('BOX', (0, 0), (-1, -1), 2, accent_color),
-    ]))
-    story.append(cover_tbl)
-    story.append(_Spacer(1, 14))
-
-    story.append(_Para(exam.get("tagline", ""), s_cover_sub))
-    story.append(_Spacer(1, 8))
-    story.append(
-        _Para("Generated by JobLess AI  ·  For Educational Use Only", s_cover_tag))
-    story.append(_Spacer(1, 2*_cm))
-
-    # Stats bar
-    total_q = sum(len(sec["questions"]) for sec in exam["sections"])
-    total_sec = len(exam["sections"])
-    stats_data = [[
-        _Para(f"<b>{total_q}</b>\nTotal Questions", s_cover_tag),
-        _Para(f"<b>{total_sec}</b>\nSections", s_cover_tag),
-        _Para("<b>✓</b>\nAnswer Key Included", s_cover_tag),
-    ]]
-    stats_tbl = _Table(stats_data, colWidths=[(W-3.6*_cm)/3]*3)
-    stats_tbl.setStyle(_TStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), _PDF_STATS_BG),
-        ('GRID', (0, 0), (-1, -1), 0.5, _PDF_HDR_LINE),
-        ('TOPPADDING', (0, 0), (-1, -1), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    story.append(stats_tbl)
-    story.append(_Spacer(1, _cm))
-
-    # TOC
-    story.append(_Para("📋  CONTENTS", mk("TOCHdr", fontSize=10, leading=14,
-                                         textColor=_PDF_MUTED, fontName="Helvetica-Bold", spaceAfter=6)))
-    for idx, sec in enumerate(exam["sections"], 1):
-        story.append(_Para(
-            f"  {sec['icon']}  Section {idx}: {sec['title']}  ({len(sec['questions'])} Questions)",
-            mk(f"toc{idx}", fontSize=9.5, leading=14, textColor=_PDF_SUBTEXT,
-               fontName="Helvetica", leftIndent=8, spaceAfter=3)))
-
-    story.append(_PB())
-
-    # ── QUESTION SECTIONS ──
-    for sec_idx, section in enumerate(exam["sections"], 1):
-        # Section header
-        sec_hdr_data = [[_Para(
-            f"{section['icon']}  Section {sec_idx}: {section['title'].upper()}",
-            mk(f"sh{sec_idx}", fontSize=12, leading=16, textColor=_rl_colors.HexColor("#ffffff"),
-               fontName="Helvetica-Bold", alignment=_TAL))]]
-        sec_tbl = _Table(sec_hdr_data, colWidths=[W-3.6*_cm])
-        sec_tbl.setStyle(_TStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), accent_color),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('LEFTPADDING', (0, 0), (-1, -1), 14),
-        ]))
-        story.append(sec_tbl)
-        story.append(_Spacer(1, 10))
-
-        for q_idx, q in enumerate(section["questions"], 1):
-            block = []
-
-            # Question number
-            block.append(_Para(f"Q{q_idx}.", s_q_num))
-
-            # Question text — split code blocks
-            q_text = q["q"]
-            if "\n" in q_text:
-                parts = q_text.split("\n", 1)
-                block.append(_Para(parts[0], s_q_text))
-                # Format code block
-                code_lines = parts[1].strip().replace(
-                    "&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-                code_lines_html = "<br/>".join(code_lines.split("\n"))
-                block.append(_Para(code_lines_html, s_code))
-            else:
-                block.append(_Para(q_text, s_q_text))
-
-            # Options
-            for opt in q["options"]:
-                block.append(_Para(opt, s_opt))
-
-            block.append(_Spacer(1, 4))
-
-            # Answer
-            correct_opt = next(
-                (o for o in q["options"] if o.startswith(f"{q['answer']}")), q["answer"])
-            block.append(_Para(
-                f"✅  Correct Answer: {correct_opt}", s_ans_hdr))
-            exp = q.get("explanation", "").replace(
-                "&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-            block.append(_Para(f"💡 {exp}", s_ans_exp))
-            block.append(_HR(
-                width="100%", thickness=0.5,
-                color=_PDF_HDR_LINE, spaceAfter=6))
-
-            story.append(_KT(block))
-
-        if sec_idx < len(exam["sections"]):
-            story.append(_PB())
-
-    # ── FOOTER PAGE ──
-    story.append(_PB())
-    story.append(_Spacer(1, 3*_cm))
-    story.append(_Para("🚀 Generated by JobLess AI", mk("EndTitle",
-                                                       fontSize=16, leading=20, textColor=accent_color,
-                                                       fontName="Helvetica-Bold", alignment=_TAC)))
-    story.append(_Spacer(1, 8))
-    story.append(_Para(
-        "This PDF was generated for educational and exam preparation purposes.\n"
-        "Questions are based on publicly known exam patterns and community-reported PYQs.\n"
-        "Always cross-check with official exam syllabi.",
-        mk("Disc", fontSize=9, leading=13, textColor=_PDF_MUTED,
-           fontName="Helvetica", alignment=_TAC, spaceAfter=4)))
-
-    # Page numbering via canvas callback
-    def add_page_number(canvas_obj, doc_obj):
-        canvas_obj.saveState()
-        canvas_obj.setFillColor(_PDF_MUTED)
-        canvas_obj.setFont("Helvetica", 7)
-        canvas_obj.drawCentredString(
-            W/2, 12*_mm,
-            f"JobLess AI  ·  {exam_name} PYQ Pack  ·  Page {doc_obj.page}"
-        )
-        canvas_obj.restoreState()
+# ── Curated PYQ PDF artifacts (shared by every session) ────────────────────
+# The packs are static, so each is built once per process and keyed by the
+# exam plus a hash of its data file; editing the bank (or bumping the layout
+# version after changing submit_pyq_pdf) produces a fresh build. Set
+# JOBLESS_PYQ_PDF_DIR to also keep the bytes on disk across restarts.
+_PYQ_PDF_LAYOUT_VERSION = 2
+_PYQ_PDF_DIR = os.getenv("JOBLESS_PYQ_PDF_DIR") or None
+_PYQ_PDF_CACHE: Dict[str, bytes] = process_shared("pyq_pdf_cache", dict)
+# key → the one in-flight build; clicks during a build (or warm-up) join it
+_PYQ_PDF_PENDING: Dict[str, "Future[bytes]"] = process_shared("pyq_pdf_pending", dict)
+_PYQ_PDF_LOCK = process_shared("pyq_pdf_lock", threading.Lock)
+
+
+def _pyq_pdf_key(exam_name: str) -> str:
+    digest = pyq_store.content_hash(exam_name)[:16]
+    return f"{exam_name}:v{_PYQ_PDF_LAYOUT_VERSION}-{digest}"
+
+
+def _pyq_pdf_path(key: str) -> str:
+    safe = "".join(c if c.isalnum() or c in "-." else "_" for c in key)
+    return os.path.join(_PYQ_PDF_DIR, f"PYQ_{safe}.pdf")
 
-    doc.build(story, onLaterPages=add_page_number, onFirstPage=add_page_number)
-    return buf.getvalue()
+
+def _finish_pyq_pdf(key: str, future: "Future[bytes]"):
+    """Done-callback of a pack build: cache (and persist) the bytes, then unpin it."""
+    pdf = b"" if future.cancelled() or future.exception() else future.result()
+    if pdf:
+        _PYQ_PDF_CACHE[key] = pdf
+        if _PYQ_PDF_DIR:
+            path = _pyq_pdf_path(key)
+            try:
+                os.makedirs(_PYQ_PDF_DIR, exist_ok=True)
+                tmp = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp, "wb") as fh:
+                    fh.write(pdf)
+                os.replace(tmp, path)
+            except OSError:
+                pass
+    with _PYQ_PDF_LOCK:
+        _PYQ_PDF_PENDING.pop(key, None)
+
+
+def cached_pyq_pdf(exam_name: str) -> Optional[bytes]:
+    """The built PDF for a curated exam if it is ready, without building it."""
+    if not pyq_store.has_exam(exam_name):
+        return None
+    return _PYQ_PDF_CACHE.get(_pyq_pdf_key(exam_name))
+
+
+def pyq_pdf_future(exam_name: str) -> "Optional[Future[bytes]]":
+    """
+    Start (or join) the background build of a curated pack — at most one per
+    process — without waiting for it. None when the exam is unknown or its
+    PDF is already cached; raises PDFQueueFull if the renderer has no free slot.
+    """
+    if not pyq_store.has_exam(exam_name):
+        return None
+    key = _pyq_pdf_key(exam_name)
+    if key in _PYQ_PDF_CACHE:
+        return None
+    with _PYQ_PDF_LOCK:
+        future = _PYQ_PDF_PENDING.get(key)
+        if future is not None:
+            return future
+        path = _pyq_pdf_path(key) if _PYQ_PDF_DIR else None
+        if path and os.path.exists(path):
+            with open(path, "rb") as fh:
+                _PYQ_PDF_CACHE[key] = fh.read()
+            return None
+        future = _PYQ_PDF_PENDING[key] = submit_pyq_pdf(exam_name, wait=0)
+    future.add_done_callback(lambda f: _finish_pyq_pdf(key, f))
+    return future
+
+
+def pending_pyq_pdf(exam_name: str) -> "Optional[Future[bytes]]":
+    """The in-flight build of a curated pack, if there is one."""
+    if not pyq_store.has_exam(exam_name):
+        return None
+    return _PYQ_PDF_PENDING.get(_pyq_pdf_key(exam_name))
+
+
+def _warm_pyq_pdfs():
+    # Spawn the render workers first so no user's first PDF pays for it
+    _PDF_SERVICE.warm()
+    for exam_name in EXAM_META:
+        try:
+            future = pyq_pdf_future(exam_name)
+            if future is not None:
+                # One pack at a time, leaving render slots free for users
+                future.result()
+        except Exception:
+            # A broken pack must not stop the others; the button path retries
+            pass
+
+
+def start_pyq_pdf_warmup():
+    """Start the PDF workers and build every curated pack in the background, once per process."""
+    def start():
+        t = threading.Thread(target=_warm_pyq_pdfs, name="jl-pyq-warm", daemon=True)
+        t.start()
+        return t
+    process_shared("pyq_pdf_warmup", start)
 
 
 def render_tab_pyq_hub(ai_handler, selected_model: str):
@@ -5944,63 +3725,10 @@ def render_tab_pyq_hub(ai_handler, selected_model: str):
         </div>""", unsafe_allow_html=True)
 
         # Exam cards with download buttons
-        EXAM_META = {
-            "TCS NQT":           {"icon": "🔷", "color": "#3b82f6", "desc": "Aptitude · Verbal · Reasoning · Coding", "tag": "Mass Recruiter"},
-            "Infosys (SP/DSE)":  {"icon": "🟣", "color": "#7c3aed", "desc": "Quantitative · Logical · Verbal · Pseudocode", "tag": "Mass Recruiter"},
-            "Amazon SDE / AWS":  {"icon": "🟡", "color": "#f59e0b", "desc": "DSA · OA Problems · System Design · LP", "tag": "Product Company"},
-            "Wipro NLTH":        {"icon": "🟠", "color": "#d97706", "desc": "Aptitude · English · Automata Fix · Coding", "tag": "Mass Recruiter"},
-            "GATE (CS/IT)":      {"icon": "🎓", "color": "#6366f1", "desc": "GA · Maths · DS&Algo · OS · Networks · CO", "tag": "PSU / Higher Studies"},
-        }
-
         cols = st.columns(2)
         for idx, (exam_key, meta) in enumerate(EXAM_META.items()):
             with cols[idx % 2]:
-                color = meta["color"]
-                st.markdown(f"""
-                <div style="background:rgba(0,0,0,0.25);border:1px solid {color}40;
-                border-radius:14px;padding:18px 20px;margin-bottom:4px;">
-                  <div style="display:flex;align-items:center;gap:10px;margin-bottom:6px;">
-                    <span style="font-size:1.6rem;">{meta['icon']}</span>
-                    <div>
-                      <div style="color:#FAFAF7;font-weight:700;font-size:0.95rem;">{exam_key}</div>
-                      <div style="color:#7a7a7a;font-size:0.78rem;">{meta['desc']}</div>
-                    </div>
-                    <span style="margin-left:auto;background:{color}22;color:{color};
-                    font-size:0.68rem;font-weight:700;padding:2px 8px;border-radius:20px;
-                    white-space:nowrap;">{meta['tag']}</span>
-                  </div>
-                </div>""", unsafe_allow_html=True)
-
-                cache_key = f"pyq_pdf_{exam_key}"
-                if cache_key not in st.session_state:
-                    st.session_state[cache_key] = None
-
-                gen_col, dl_col = st.columns([1, 1])
-                with gen_col:
-                    if st.button(f"⚡ Generate PDF", key=f"gen_{exam_key}", use_container_width=True):
-                        with st.spinner(f"Building {exam_key} PDF..."):
-                            pdf_bytes = build_pyq_pdf(exam_key)
-                            st.session_state[cache_key] = pdf_bytes
-
-                with dl_col:
-                    pdf_data = st.session_state.get(cache_key)
-                    if pdf_data:
-                        safe_name = exam_key.replace(
-                            "/", "-").replace(" ", "_")
-                        st.download_button(
-                            label="📥 Download PDF",
-                            data=pdf_data,
-                            file_name=f"PYQ_{safe_name}_JoblessAI.pdf",
-                            mime="application/pdf",
-                            key=f"dl_{exam_key}",
-                            use_container_width=True,
-                        )
-                    else:
-                        st.button("📥 Download PDF", key=f"dl_disabled_{exam_key}",
-                                  disabled=True, use_container_width=True)
-
-                st.markdown("<div style='height:10px'></div>",
-                            unsafe_allow_html=True)
+                _render_pyq_exam_card(exam_key, meta)
 
         st.markdown("""
         <div style="margin-top:10px;padding:10px 14px;background:rgba(245,158,11,0.07);
@@ -6019,192 +3747,226 @@ def render_tab_pyq_hub(ai_handler, selected_model: str):
         package it as a downloadable PDF.
         </div>""", unsafe_allow_html=True)
 
-        ai_c1, ai_c2 = st.columns([3, 2])
-        with ai_c1:
-            st.markdown('<div style="color:rgba(255,255,255,0.9);font-family:\'Space Mono\',monospace;font-size:0.72rem;letter-spacing:0.12em;text-transform:uppercase;margin-bottom:4px;">🏢 Company Name</div>', unsafe_allow_html=True)
-            pyq_co = st.text_input("Company", placeholder="e.g. L&T, Reliance, Accenture, Cognizant...",
-                                   key="pyq_ai_company", label_visibility="collapsed")
-        with ai_c2:
-            st.markdown('<div style="color:rgba(255,255,255,0.9);font-family:\'Space Mono\',monospace;font-size:0.72rem;letter-spacing:0.12em;text-transform:uppercase;margin-bottom:4px;">🎯 Role / Exam Type</div>', unsafe_allow_html=True)
-            pyq_role = st.text_input("Role", placeholder="e.g. Graduate Engineer, SDE, Data Analyst...",
-                                     key="pyq_ai_role", label_visibility="collapsed")
-
-        q_count = st.select_slider("Number of questions to generate",
-                                   options=[10, 15, 20, 25, 30], value=15,
-                                   key="pyq_q_count")
-
-        if st.button("🤖 Generate AI Question Paper", use_container_width=True,
-                     type="primary", key="pyq_ai_gen"):
-            if not pyq_co.strip():
-                st.error("⚠️ Please enter a company name.")
-            elif not pyq_role.strip():
-                st.error("⚠️ Please enter a target role.")
-            elif not ai_handler.config.using_own_key() and st.session_state.get('free_uses', 0) >= 5:
-                st.warning(
-                    "⚠️ Free session limit reached. Add your own API key in the sidebar!")
-            else:
-                with st.spinner(f"🧠 AI is generating {q_count} questions for {pyq_co} — {pyq_role}..."):
-                    questions_data = ai_handler.generate_pyq_questions(
-                        pyq_co.strip(), pyq_role.strip(), q_count, selected_model)
-                if questions_data:
-                    with st.spinner("📄 Building your PDF..."):
-                        pdf_bytes = _build_ai_pyq_pdf(
-                            pyq_co.strip(), pyq_role.strip(), questions_data)
-                    st.session_state["ai_pyq_pdf"] = pdf_bytes
-                    st.session_state["ai_pyq_meta"] = (
-                        pyq_co.strip(), pyq_role.strip())
-                    if not ai_handler.config.using_own_key():
-                        st.session_state['free_uses'] = st.session_state.get(
-                            'free_uses', 0) + 1
-                    st.rerun()
+        _render_pyq_ai_generator(ai_handler, selected_model)
+
+
+@st.fragment
+def _render_pyq_exam_card(exam_key: str, meta: Dict):
+    """One curated exam: card, Generate and Download — a click reruns only this card."""
+    color = meta["color"]
+    st.markdown(f"""
+    <div style="background:rgba(0,0,0,0.25);border:1px solid {color}40;
+    border-radius:14px;padding:18px 20px;margin-bottom:4px;">
+      <div style="display:flex;align-items:center;gap:10px;margin-bottom:6px;">
+        <span style="font-size:1.6rem;">{meta['icon']}</span>
+        <div>
+          <div style="color:#FAFAF7;font-weight:700;font-size:0.95rem;">{exam_key}</div>
+          <div style="color:#7a7a7a;font-size:0.78rem;">{meta['desc']}</div>
+        </div>
+        <span style="margin-left:auto;background:{color}22;color:{color};
+        font-size:0.68rem;font-weight:700;padding:2px 8px;border-radius:20px;
+        white-space:nowrap;">{meta['tag']}</span>
+      </div>
+    </div>""", unsafe_allow_html=True)
 
-        if "ai_pyq_pdf" in st.session_state and st.session_state["ai_pyq_pdf"]:
-            co_name, role_name = st.session_state.get(
-                "ai_pyq_meta", ("Company", "Role"))
-            st.success(f"✅ PDF ready — {co_name} | {role_name}")
-            safe_name = f"{co_name}_{role_name}".replace(
-                " ", "_").replace("/", "-")
+    # Packs are built once per process (warmed at startup), so
+    # the download is usually live before anyone clicks Generate
+    gen_col, dl_col = st.columns([1, 1])
+    with gen_col:
+        if st.button(f"⚡ Generate PDF", key=f"gen_{exam_key}", use_container_width=True):
+            try:
+                pyq_pdf_future(exam_key)
+            except PDFQueueFull as e:
+                st.warning(f"⚠️ {e}")
+
+    with dl_col:
+        pdf_data = cached_pyq_pdf(exam_key)
+        if pdf_data:
+            safe_name = exam_key.replace(
+                "/", "-").replace(" ", "_")
             st.download_button(
-                label=f"📥 Download: {co_name} — {role_name} PYQ Paper",
-                data=st.session_state["ai_pyq_pdf"],
+                label="📥 Download PDF",
+                data=pdf_data,
                 file_name=f"PYQ_{safe_name}_JoblessAI.pdf",
                 mime="application/pdf",
-                key="dl_ai_pyq",
+                key=f"dl_{exam_key}",
                 use_container_width=True,
             )
-            if st.button("🔄 Generate Another", key="pyq_ai_reset"):
-                del st.session_state["ai_pyq_pdf"]
-                del st.session_state["ai_pyq_meta"]
-                st.rerun()
+        else:
+            st.button("📥 Download PDF", key=f"dl_disabled_{exam_key}",
+                      disabled=True, use_container_width=True)
+    if not pdf_data:
+        building = pending_pyq_pdf(exam_key)
+        if building is not None:
+            _await_pdf(building, f"⏳ Building {exam_key} PDF...")
+
+    st.markdown("<div style='height:10px'></div>",
+                unsafe_allow_html=True)
 
 
-def _build_ai_pyq_pdf(company: str, role: str, sections: list) -> bytes:
-    """Build a PDF from AI-generated question sections."""
-    buf = _io.BytesIO()
-    accent = _rl_colors.HexColor("#FFFFFF")
-    W, H = _A4
-
-    doc = _SDT(buf, pagesize=_A4,
-               rightMargin=1.8*_cm, leftMargin=1.8*_cm,
-               topMargin=2*_cm, bottomMargin=2*_cm,
-               title=f"PYQ — {company} {role}",
-               author="JobLess AI")
-
-    def mk(name, **kw):
-        return _PS(name, **kw)
-
-    s_cover = mk("AITitle", fontSize=22, leading=28, textColor=_rl_colors.HexColor("#f1f5f9"),
-                 fontName="Helvetica-Bold", alignment=_TAC, spaceAfter=6)
-    s_sub = mk("AISub", fontSize=11, leading=15, textColor=_rl_colors.HexColor("#b3b3b3"),
-               fontName="Helvetica", alignment=_TAC, spaceAfter=4)
-    s_sec = mk("AISec", fontSize=13, leading=17, textColor=_PDF_TEXT,
-               fontName="Helvetica-Bold", spaceBefore=14, spaceAfter=6)
-    s_qnum = mk("AIQNum", fontSize=10, leading=13, textColor=accent,
-                fontName="Helvetica-Bold", spaceBefore=10, spaceAfter=2)
-    s_qtext = mk("AIQText", fontSize=10, leading=15, textColor=_PDF_TEXT,
-                 fontName="Helvetica", spaceAfter=3)
-    s_code = mk("AICode", fontSize=8.5, leading=12,
-                textColor=_PDF_CODE_TEXT,
-                fontName="Courier", leftIndent=12, spaceAfter=4,
-                backColor=_PDF_CODE_BG,
-                borderPadding=(4, 8, 4, 8))
-    s_opt = mk("AIOpt", fontSize=9.5, leading=13, textColor=_PDF_SUBTEXT,
-               fontName="Helvetica", leftIndent=14, spaceAfter=1)
-    s_ans = mk("AIAns", fontSize=9, leading=12, textColor=_PDF_GREEN_DARK,
-               fontName="Helvetica-Bold", spaceBefore=4, spaceAfter=2)
-    s_exp = mk("AIExp", fontSize=9, leading=13,
-               textColor=_PDF_GREEN_TEXT,
-               fontName="Helvetica", leftIndent=10, spaceAfter=2,
-               backColor=_PDF_GREEN_BG,
-               borderPadding=(3, 6, 3, 6))
-
-    story = []
-
-    # Cover
-    story.append(_Spacer(1, 2*_cm))
-    cover_data = [[_Para(f"📂 {company}", s_cover)]]
-    cv = _Table(cover_data, colWidths=[W - 3.6*_cm])
-    cv.setStyle(_TStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), _C_DARK),
-        ('BOX', (0, 0), (-1, -1), 2, accent),
-        ('TOPPADDING', (0, 0), (-1, -1), 18),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 18),
-        ('LEFTPADDING', (0, 0), (-1, -1), 14),
-    ]))
-    story.append(cv)
-    story.append(_Spacer(1, 10))
-    story.append(_Para(f"{role} — PYQ Question Paper", s_sub))
-    story.append(_Para("AI-Generated by JobLess AI  ·  Educational Use Only", mk("tag",
-                                                                                 fontSize=8, leading=11, textColor=accent, fontName="Helvetica-Bold",
-                                                                                 alignment=_TAC)))
-    story.append(_PB())
-
-    total_q = 0
-    for sec_idx, section in enumerate(sections, 1):
-        sec_title = section.get("section", f"Section {sec_idx}")
-        questions = section.get("questions", [])
-
-        hdr_data = [[_Para(f"Section {sec_idx}: {sec_title.upper()}", s_sec)]]
-        hdr_tbl = _Table(hdr_data, colWidths=[W-3.6*_cm])
-        hdr_tbl.setStyle(_TStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), accent),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('LEFTPADDING', (0, 0), (-1, -1), 12),
-        ]))
-        story.append(hdr_tbl)
-        story.append(_Spacer(1, 8))
-
-        for q_idx, q in enumerate(questions, 1):
-            total_q += 1
-            block = []
-            block.append(_Para(f"Q{q_idx}.", s_qnum))
-
-            q_text = q.get("question", "")
-            code_block = q.get("code", "")
-            if "\n" in q_text and not code_block:
-                parts = q_text.split("\n", 1)
-                block.append(_Para(parts[0], s_qtext))
-                code_lines = parts[1].strip().replace(
-                    "&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-                block.append(
-                    _Para("<br/>".join(code_lines.split("\n")), s_code))
-            else:
-                block.append(_Para(q_text.replace("&", "&amp;").replace(
-                    "<", "&lt;").replace(">", "&gt;"), s_qtext))
-                if code_block:
-                    code_safe = code_block.replace("&", "&amp;").replace(
-                        "<", "&lt;").replace(">", "&gt;")
-                    block.append(
-                        _Para("<br/>".join(code_safe.split("\n")), s_code))
-
-            for opt in q.get("options", []):
-                block.append(_Para(opt, s_opt))
-
-            block.append(_Spacer(1, 3))
-            ans = q.get("answer", "")
-            block.append(_Para(f"✅  Correct Answer: {ans}", s_ans))
-            exp = q.get("explanation", "").replace(
-                "&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-            if exp:
-                block.append(_Para(f"💡 {exp}", s_exp))
-            block.append(_HR(width="100%", thickness=0.5,
-                             color=_PDF_HDR_LINE, spaceAfter=4))
-            story.append(_KT(block))
-
-        if sec_idx < len(sections):
-            story.append(_PB())
-
-    def page_num(c, d):
-        c.saveState()
-        c.setFillColor(_PDF_MUTED)
-        c.setFont("Helvetica", 7)
-        c.drawCentredString(W/2, 12*_mm,
-                            f"JobLess AI  ·  {company} {role} PYQ  ·  Page {d.page}")
-        c.restoreState()
-
-    doc.build(story, onLaterPages=page_num, onFirstPage=page_num)
-    return buf.getvalue()
+@st.fragment(run_every=1.0)
+def _await_pdf(future: "Future[bytes]", message: str):
+    """Shown while a PDF renders off the script thread; reruns the app once it lands."""
+    if future.done():
+        st.rerun()
+    st.caption(message)
+
+
+@st.fragment
+def _render_pyq_ai_generator(ai_handler, selected_model: str):
+    """Company / role form, generation and download for an AI-made paper."""
+    ai_c1, ai_c2 = st.columns([3, 2])
+    with ai_c1:
+        st.markdown('<div style="color:rgba(255,255,255,0.9);font-family:\'Space Mono\',monospace;font-size:0.72rem;letter-spacing:0.12em;text-transform:uppercase;margin-bottom:4px;">🏢 Company Name</div>', unsafe_allow_html=True)
+        pyq_co = st.text_input("Company", placeholder="e.g. L&T, Reliance, Accenture, Cognizant...",
+                               key="pyq_ai_company", label_visibility="collapsed")
+    with ai_c2:
+        st.markdown('<div style="color:rgba(255,255,255,0.9);font-family:\'Space Mono\',monospace;font-size:0.72rem;letter-spacing:0.12em;text-transform:uppercase;margin-bottom:4px;">🎯 Role / Exam Type</div>', unsafe_allow_html=True)
+        pyq_role = st.text_input("Role", placeholder="e.g. Graduate Engineer, SDE, Data Analyst...",
+                                 key="pyq_ai_role", label_visibility="collapsed")
+
+    q_count = st.select_slider("Number of questions to generate",
+                               options=[10, 15, 20, 25, 30], value=15,
+                               key="pyq_q_count")
+
+    if st.button("🤖 Generate AI Question Paper", use_container_width=True,
+                 type="primary", key="pyq_ai_gen"):
+        if not pyq_co.strip():
+            st.error("⚠️ Please enter a company name.")
+        elif not pyq_role.strip():
+            st.error("⚠️ Please enter a target role.")
+        elif not ai_handler.config.using_own_key() and st.session_state.get('free_uses', 0) >= 5:
+            st.warning(
+                "⚠️ Free session limit reached. Add your own API key in the sidebar!")
+        else:
+            with st.spinner(f"🧠 AI is generating {q_count} questions for {pyq_co} — {pyq_role}..."):
+                questions_data = ai_handler.generate_pyq_questions(
+                    pyq_co.strip(), pyq_role.strip(), q_count, selected_model)
+            if questions_data:
+                try:
+                    st.session_state["ai_pyq_job"] = (
+                        _submit_ai_pyq_pdf(pyq_co.strip(), pyq_role.strip(), questions_data),
+                        (pyq_co.strip(), pyq_role.strip()))
+                except PDFQueueFull as e:
+                    st.warning(f"⚠️ {e}")
+
+    # The PDF renders in the background; this fragment polls until it lands
+    if "ai_pyq_job" in st.session_state:
+        job, meta = st.session_state["ai_pyq_job"]
+        if not job.done():
+            _await_pdf(job, "📄 Building your PDF...")
+        else:
+            del st.session_state["ai_pyq_job"]
+            try:
+                pdf_bytes = job.result()
+            except Exception:
+                pdf_bytes = None
+                st.error("⚠️ Couldn't build the PDF — please try again.")
+            if pdf_bytes:
+                st.session_state["ai_pyq_pdf"] = pdf_bytes
+                st.session_state["ai_pyq_meta"] = meta
+                if not ai_handler.config.using_own_key():
+                    st.session_state['free_uses'] = st.session_state.get(
+                        'free_uses', 0) + 1
+
+    if "ai_pyq_pdf" in st.session_state and st.session_state["ai_pyq_pdf"]:
+        co_name, role_name = st.session_state.get(
+            "ai_pyq_meta", ("Company", "Role"))
+        st.success(f"✅ PDF ready — {co_name} | {role_name}")
+        safe_name = f"{co_name}_{role_name}".replace(
+            " ", "_").replace("/", "-")
+        st.download_button(
+            label=f"📥 Download: {co_name} — {role_name} PYQ Paper",
+            data=st.session_state["ai_pyq_pdf"],
+            file_name=f"PYQ_{safe_name}_JoblessAI.pdf",
+            mime="application/pdf",
+            key="dl_ai_pyq",
+            use_container_width=True,
+        )
+        if st.button("🔄 Generate Another", key="pyq_ai_reset"):
+            del st.session_state["ai_pyq_pdf"]
+            del st.session_state["ai_pyq_meta"]
+            _rerun_fragment()
+
+
+def _submit_ai_pyq_pdf(company: str, role: str, sections: list) -> "Future[bytes]":
+    """Queue a PDF of AI-generated question sections without waiting for it."""
+    return _PDF_SERVICE.submit(pyq_pdf.ai_jobs(company, role, sections),
+                               title=f"PYQ — {company} {role}",
+                               footer=f"JobLess AI  ·  {company} {role} PYQ", wait=0)
+
+
+# ==================== ADMIN (hidden) ====================
+def _admin_authorized(token: str) -> bool:
+    """?page=admin&token=… must match ADMIN_TOKEN (st.secrets) or JOBLESS_ADMIN_TOKEN."""
+    expected = ""
+    try:
+        expected = st.secrets.get("ADMIN_TOKEN", "")
+    except Exception:
+        pass
+    expected = expected or os.getenv("JOBLESS_ADMIN_TOKEN", "")
+    return bool(expected) and hmac.compare_digest(str(token), str(expected))
+
+
+def render_admin_panel():
+    """Ops view of TELEMETRY plus the runtime pools — not linked from the UI."""
+    st.markdown("## 🛠️ LLM Telemetry")
+    if st.button("🔄 Refresh", key="admin_refresh"):
+        st.rerun()
+
+    sections = [
+        ("Provider call latency by method (s)", "llm_call_seconds", "method"),
+        ("Time to first token by method (s)", "llm_ttft_seconds", "method"),
+        ("End-to-end AIHandler method time (s)", "method_seconds", "method"),
+        ("Provider call latency by model (s)", "llm_call_seconds", "model"),
+    ]
+    for title, metric, by in sections:
+        st.markdown(f"**{title}**")
+        rows = TELEMETRY.summary(metric, by=by)
+        if rows:
+            st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+        else:
+            st.caption("No samples yet.")
+
+    st.markdown("**Counters** (calls, errors by class, JSON repairs)")
+    counters = TELEMETRY.counters()
+    if counters:
+        st.dataframe(pd.DataFrame(counters), use_container_width=True, hide_index=True)
+    else:
+        st.caption("No samples yet.")
+
+    st.markdown("**Model routing** (current pick per task, per provider)")
+    picks = []
+    for display, internal in PROVIDER_INTERNAL.items():
+        models = PROVIDER_MODELS.get(display, [])
+        for method in TASK_TIERS:
+            model = choose_model(internal, method, models[0] if models else "", models)
+            picks.append(dict(provider=internal, method=method, tier=TASK_TIERS[method],
+                              model=model, **model_health(model, method)))
+    st.dataframe(pd.DataFrame(picks), use_container_width=True, hide_index=True)
+
+    st.markdown("**Runtime**")
+    st.json({
+        "client_pool": _CLIENT_POOL.stats(),
+        "response_cache": _RESPONSE_CACHE.stats(),
+        "rate_limiter": _RATE_LIMITER.stats(),
+        "single_flight": _SINGLE_FLIGHT.stats(),
+        "pdf_extract_cache": _PDF_EXTRACT_CACHE.stats(),
+        "history_store": _HISTORY_STORE.stats(),
+        "lazy_imports": lazy_imports_stats(),
+        "lottie": static_assets.lottie_stats(),
+    })
+
+    d1, d2 = st.columns(2)
+    with d1:
+        st.download_button("⬇️ Prometheus text", TELEMETRY.to_prometheus(),
+                           file_name="jobless_metrics.prom", mime="text/plain",
+                           use_container_width=True)
+    with d2:
+        st.download_button("⬇️ JSON lines", TELEMETRY.to_jsonl(),
+                           file_name="jobless_metrics.jsonl", mime="application/x-ndjson",
+                           use_container_width=True)
+
 
 # ==================== MAIN ====================
 
@@ -6218,6 +3980,7 @@ def main():
     )
 
     init_session_state()
+    start_pyq_pdf_warmup()
     render_global_background()
 
     # ── Keep-alive: prevent Streamlit Cloud from sleeping the app ──────────
@@ -6247,13 +4010,23 @@ def main():
     if qp and qp != st.session_state.get('current_page', 'home'):
         st.session_state['current_page'] = qp
 
+    # ── Hidden ops panel: ?page=admin&token=<ADMIN_TOKEN> ─────────────────
+    if qp == "admin":
+        if _admin_authorized(st.query_params.get("token", "")):
+            render_admin_panel()
+            st.stop()
+        st.session_state['current_page'] = 'home'
+    elif "token" in st.query_params:
+        # The admin token only belongs on the admin page's URL
+        del st.query_params["token"]
+
     # Sidebar (returns settings needed by tabs)
     selected_provider, selected_model, analysis_depth, include_learning_path, include_interview_prep = \
         render_sidebar(config)
 
     # ── PRE-API KEY: original landing ─────────────────────────────────────
     if not config.is_ready():
-        components.html(_HEADER_HTML, height=190, scrolling=False)
+        static_assets.frame("header.html", height=190)
         render_spline_scene(
             scene_url="https://prod.spline.design/kZDDjO5HuC9GJUM2/scene.splinecode",
             title="JobLess AI",
@@ -6426,276 +4199,7 @@ def main():
 
     # Home: spotlight glow feature cards + Get Started
     if page == 'home':
-        cards_html = """<!DOCTYPE html>
-<html>
-<head>
-<meta charset="UTF-8">
-<link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@500;700&family=Inter:wght@400;500&family=JetBrains+Mono:wght@400;500&display=swap" rel="stylesheet">
-<style>
-* { margin:0; padding:0; box-sizing:border-box; }
-html, body { background: #0A0A0A !important; background-color: #0A0A0A !important; overflow: hidden; }
-
-/* ── Grid ── */
-.grid {
-  display: grid;
-  grid-template-columns: repeat(3, 1fr);
-  gap: 10px;
-  padding: 4px 2px 10px 2px;
-}
-
-/* ── Mobile: switch to 2-column grid ── */
-@media (max-width: 480px) {
-  html, body { overflow-x: hidden !important; overflow-y: auto !important; }
-  .grid {
-    grid-template-columns: repeat(2, 1fr) !important;
-    gap: 8px !important;
-    padding: 4px 0 10px 0 !important;
-  }
-  .card { padding: 12px 10px 10px 10px !important; }
-  .card-title { font-size: 0.75rem !important; }
-  .card-desc { font-size: 0.65rem !important; }
-  /* on small screens the grid is 3 rows — ensure body can expand */
-  body { min-height: 500px !important; }
-}
-
-/* ── Spotlight card ── */
-.card {
-  --x: 0; --y: 0; --xp: 0; --yp: 0;
-  --base: 195; --spread: 60;
-  --radius: 16;
-  --border: 1.5;
-  --size: 280;
-  --hue: calc(var(--base) + (var(--xp) * var(--spread)));
-  --spotlight-size: calc(var(--size) * 1px);
-  --border-size: calc(var(--border) * 1px);
-
-  position: relative;
-  border-radius: calc(var(--radius) * 1px);
-  background-color: rgba(10,10,10,0.85);
-  background-image: radial-gradient(
-    var(--spotlight-size) var(--spotlight-size) at
-    calc(var(--x) * 1px) calc(var(--y) * 1px),
-    hsl(var(--hue) 80% 65% / 0.08),
-    transparent
-  );
-  background-size: calc(100% + (2 * var(--border-size))) calc(100% + (2 * var(--border-size)));
-  background-position: 50% 50%;
-  background-attachment: fixed;
-  border: var(--border-size) solid rgba(255,255,255,0.06);
-  padding: 14px 16px 12px 16px;
-  cursor: pointer;
-  transition: border-color 0.25s ease, transform 0.25s ease, box-shadow 0.25s ease;
-  user-select: none;
-  -webkit-user-select: none;
-}
-
-.card::before, .card::after {
-  pointer-events: none;
-  content: "";
-  position: absolute;
-  inset: calc(var(--border-size) * -1);
-  border: var(--border-size) solid transparent;
-  border-radius: calc(var(--radius) * 1px);
-  background-attachment: fixed;
-  background-size: calc(100% + (2 * var(--border-size))) calc(100% + (2 * var(--border-size)));
-  background-repeat: no-repeat;
-  background-position: 50% 50%;
-  mask: linear-gradient(transparent, transparent), linear-gradient(white, white);
-  mask-clip: padding-box, border-box;
-  mask-composite: intersect;
-  -webkit-mask: linear-gradient(transparent, transparent), linear-gradient(white, white);
-  -webkit-mask-clip: padding-box, border-box;
-  -webkit-mask-composite: destination-in;
-}
-
-.card::before {
-  background-image: radial-gradient(
-    calc(var(--spotlight-size) * 0.75) calc(var(--spotlight-size) * 0.75) at
-    calc(var(--x) * 1px) calc(var(--y) * 1px),
-    hsl(var(--hue) 80% 55% / 0.9),
-    transparent 100%
-  );
-  filter: brightness(2);
-}
-
-.card::after {
-  background-image: radial-gradient(
-    calc(var(--spotlight-size) * 0.5) calc(var(--spotlight-size) * 0.5) at
-    calc(var(--x) * 1px) calc(var(--y) * 1px),
-    hsl(0 100% 100% / 0.08),
-    transparent 100%
-  );
-}
-
-.card:hover {
-  border-color: rgba(255,255,255,0.2);
-  transform: translateY(-5px);
-  box-shadow: 0 20px 48px rgba(0,0,0,0.5), 0 0 0 1px rgba(255,255,255,0.08);
-}
-
-.card-icon {
-  width: 40px;
-  height: 40px;
-  display: flex;
-  align-items: center;
-  justify-content: center;
-  margin-bottom: 10px;
-  background: rgba(255,255,255,0.06);
-  border: 1px solid rgba(255,255,255,0.12);
-  border-radius: 10px;
-  transition: background 0.2s, border-color 0.2s, box-shadow 0.2s;
-}
-.card:hover .card-icon {
-  background: rgba(255,255,255,0.12);
-  border-color: rgba(255,255,255,0.25);
-  box-shadow: 0 0 12px rgba(255,255,255,0.08);
-}
-
-.card-title {
-  font-family: 'Inter', sans-serif;
-  font-size: 0.88rem;
-  font-weight: 700;
-  color: #FAFAF7;
-  margin-bottom: 4px;
-  letter-spacing: 0.01em;
-}
-
-.card-desc {
-  font-family: 'Inter', sans-serif;
-  font-size: 0.72rem;
-  color: #4a5a72;
-  line-height: 1.4;
-}
-
-.card-arrow {
-  position: absolute;
-  bottom: 10px;
-  right: 12px;
-  font-size: 0.7rem;
-  color: rgba(255,255,255,0.2);
-  font-family: 'Space Grotesk', sans-serif;
-  transition: color 0.2s ease, transform 0.2s ease;
-}
-.card:hover .card-arrow {
-  color: rgba(255,255,255,0.5);
-  transform: translate(2px, -2px);
-}
-
-/* ── Get Started button ── */
-.gs-wrap {
-  padding: 2px 0 0 0;
-}
-.gs-btn {
-  display: inline-flex;
-  align-items: center;
-  gap: 7px;
-  padding: 9px 22px;
-  background: #FFFFFF;
-  color: #0A0A0A;
-  font-family: 'Inter', sans-serif;
-  font-size: 0.8rem;
-  font-weight: 700;
-  letter-spacing: 0.12em;
-  text-transform: uppercase;
-  border-radius: 50px;
-  border: none;
-  cursor: pointer;
-  box-shadow: 0 0 28px rgba(255,255,255,0.1), 0 4px 16px rgba(0,0,0,0.5);
-  transition: all 0.22s ease;
-  position: relative;
-  overflow: hidden;
-}
-.gs-btn::before {
-  content: '';
-  position: absolute;
-  inset: 0;
-  background: radial-gradient(
-    180px 180px at calc(var(--bx,50%) * 1%) calc(var(--by,50%) * 1%),
-    rgba(255,255,255,0.18),
-    transparent
-  );
-  transition: opacity 0.2s;
-  opacity: 0;
-}
-.gs-btn:hover { transform: translateY(-2px); box-shadow: 0 0 44px rgba(255,255,255,0.15), 0 6px 22px rgba(0,0,0,0.5); }
-.gs-btn:hover::before { opacity: 1; }
-.gs-btn:active { transform: translateY(0px); }
-</style>
-</head>
-<body>
-<div class="grid" id="cardGrid">
-  <div class="card" data-page="career">
-    <span class="card-icon">##CAREER##</span>
-    <div class="card-title">Career Analysis</div>
-    <div class="card-desc">AI-powered career path suggestions tailored to your profile</div>
-    <span class="card-arrow">↗</span>
-  </div>
-  <div class="card" data-page="resume">
-    <span class="card-icon">##RESUME##</span>
-    <div class="card-title">Resume Builder</div>
-    <div class="card-desc">ATS-optimized resume generation in seconds</div>
-    <span class="card-arrow">↗</span>
-  </div>
-  <div class="card" data-page="interview">
-    <span class="card-icon">##INTERVIEW##</span>
-    <div class="card-title">Mock Interview</div>
-    <div class="card-desc">Practice with AI-generated role-specific questions</div>
-    <span class="card-arrow">↗</span>
-  </div>
-  <div class="card" data-page="pyq">
-    <span class="card-icon">##PYQ##</span>
-    <div class="card-title">PYQ Hub</div>
-    <div class="card-desc">Previous year question papers for every domain</div>
-    <span class="card-arrow">↗</span>
-  </div>
-  <div class="card" data-page="resources">
-    <span class="card-icon">##RESOURCES##</span>
-    <div class="card-title">Resources</div>
-    <div class="card-desc">Curated learning materials and career roadmaps</div>
-    <span class="card-arrow">↗</span>
-  </div>
-  <div class="card" data-page="compare">
-    <span class="card-icon">##COMPARE##</span>
-    <div class="card-title">Compare</div>
-    <div class="card-desc">Side-by-side career path comparison and insights</div>
-    <span class="card-arrow">↗</span>
-  </div>
-</div>
-<div class="gs-wrap">
-  <button class="gs-btn" id="gsBtn">→ &nbsp;Get Started</button>
-</div>
-
-<script>
-// Spotlight pointer tracking
-document.addEventListener('pointermove', function(e) {
-  document.querySelectorAll('.card').forEach(function(card) {
-    card.style.setProperty('--x', e.clientX.toFixed(2));
-    card.style.setProperty('--y', e.clientY.toFixed(2));
-    card.style.setProperty('--xp', (e.clientX / window.innerWidth).toFixed(2));
-    card.style.setProperty('--yp', (e.clientY / window.innerHeight).toFixed(2));
-  });
-});
-
-// Card clicks → postMessage to parent
-document.querySelectorAll('.card').forEach(function(card) {
-  card.addEventListener('click', function() {
-    window.parent.postMessage({ type: 'jl-nav', page: card.dataset.page }, '*');
-  });
-});
-
-// Get Started → Career Analysis
-document.getElementById('gsBtn').addEventListener('click', function() {
-  window.parent.postMessage({ type: 'jl-nav', page: 'career' }, '*');
-});
-
-// Relay mouse to parent for custom cursor
-document.addEventListener('mousemove', function(e) {
-  var rect = window.frameElement ? window.frameElement.getBoundingClientRect() : {left:0, top:0};
-  window.parent.postMessage({ type: 'ns-move', x: e.clientX + rect.left, y: e.clientY + rect.top }, '*');
-}, {passive: true});
-</script>
-</body>
-</html>"""
+        cards_html = static_assets.read("home_cards.html")
         for _tok, _key, _col in [
             ("##CAREER##",    "trending-up", "#FFFFFF"),
             ("##RESUME##",    "file-edit",   "#FFFFFF"),
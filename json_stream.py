@@ -0,0 +1,298 @@
+"""
+json_stream.py — JobLess AI Streaming JSON Layer
+================================================
+Incremental parser for the JSON payloads the LLM streams back.
+
+The model's output arrives in arbitrary chunks. ``IncrementalJSONParser``
+consumes those chunks once, left to right, and hands back every complete
+item of the interesting array the moment its closing bracket arrives:
+
+  - item_key=None      → elements of a top-level array
+                         (interview questions, PYQ questions)
+  - item_key="careers" → elements of the "careers" array inside a
+                         top-level object (career analysis)
+
+Repair happens in the same pass: prose / ``` fences around the document
+are skipped, whitespace outside strings is dropped and trailing commas
+before ``}`` / ``]`` are discarded. No regex passes.
+
+Prose can contain brackets of its own ("Here are your [8] questions:").
+A candidate document that closes without being usable — it doesn't
+parse, it isn't an object / an array holding objects, or it lacks
+`item_key` — is dropped and scanning resumes after it. Items
+of a candidate that began after prose outside any fence are held back
+until it is accepted. For whole texts, ``fenced_body`` jumps straight to
+the fenced document when one follows a prose preamble.
+
+Nothing in this module imports streamlit, so it can be exercised headless.
+"""
+
+import json
+import re
+from typing import Any, List, Optional
+
+# Next character that ends a run of ordinary string content
+_STRING_STOP = re.compile(r'["\\]')
+# A ``` fence line (optionally tagged, e.g. ```json)
+_FENCE_LINE = re.compile(r"^[ \t]*```[^\n]*\n", re.M)
+_MISSING = object()
+
+
+def fenced_body(text: str) -> str:
+    """
+    `text` from just after its first ``` fence line when the text opens with
+    prose; otherwise `text` unchanged (a document that starts straight away
+    may legitimately carry ``` inside its strings).
+    """
+    stripped = text.lstrip()
+    if not stripped or stripped[0] in "{[":
+        return text
+    m = _FENCE_LINE.search(text)
+    return text[m.end():] if m else text
+
+
+class IncrementalJSONParser:
+    """
+    Single-pass, chunk-fed JSON reader.
+
+    ``feed(chunk)`` returns the items completed by that chunk;
+    ``result()`` returns the whole document once the stream is over
+    (or the salvaged items if the stream was cut off mid-array). Only
+    object / array elements count as items.
+    """
+
+    def __init__(self, item_key: Optional[str] = None):
+        self.item_key = item_key
+        self.items: List[Any] = []
+        self._doc: Any = _MISSING
+        self._fallback: Any = _MISSING     # first closed-but-unusable candidate
+        # Pre-document prose tracking
+        self._prose = False                # non-space text seen outside a fence
+        self._ticks = 0                    # consecutive backticks in the prose
+        self._fence_line = False           # skipping a fence's ```json tag
+        self._reset_candidate()
+
+    def _reset_candidate(self):
+        self._out: List[str] = []          # repaired document text
+        self._stack: List[str] = []        # open containers: "{" / "["
+        self._started = False
+        self._done = False
+        self._in_string = False
+        self._escape = False
+        self._pending_comma = False
+        # Top-level object key bookkeeping (for item_key mode)
+        self._key_buf: Optional[List[str]] = None
+        self._last_string: Optional[str] = None
+        self._current_key: Optional[str] = None
+        # Depth of the array whose elements we emit (0 = not entered yet)
+        self._target_depth = 0
+        self._item_buf: Optional[List[str]] = None
+        self._held: Optional[List[Any]] = None   # items awaiting acceptance
+
+    # ── Public API ────────────────────────────────────────────────────────
+    def feed(self, chunk: str) -> List[Any]:
+        emitted: List[Any] = []
+        while chunk:
+            chunk = self._scan(chunk, emitted)
+        return emitted
+
+    def result(self) -> Any:
+        """Parsed document, or salvaged items if the stream was truncated."""
+        if self._doc is not _MISSING:
+            return self._doc
+        items = self.items or self._held
+        if items:
+            if self.item_key is None:
+                return list(items)
+            return {self.item_key: list(items)}
+        if self._fallback is not _MISSING:
+            return self._fallback
+        text = "".join(self._out)
+        raise ValueError(
+            f"Could not parse JSON. Raw (first 300 chars): {text[:300]}")
+
+    # ── Internals ─────────────────────────────────────────────────────────
+    def _scan(self, chunk: str, emitted: List[Any]) -> str:
+        """Consume `chunk`; returns what is left of it if a candidate was rejected."""
+        i, n = 0, len(chunk)
+        while i < n and not self._done:
+            if self._in_string:
+                i = self._consume_string(chunk, i)
+                continue
+            ch = chunk[i]
+            i += 1
+            if not self._started:
+                if ch in "{[" and not self._fence_line:
+                    self._started = True
+                    if self._prose:
+                        # Brackets in prose: keep its items until it proves usable
+                        self._held = []
+                    self._open(ch)
+                else:
+                    self._skip_prose(ch)
+                continue
+            if ch in " \t\r\n":
+                continue
+            if ch == ",":
+                self._pending_comma = True
+                continue
+            if ch in "}]":
+                # A comma straight before a closer is the classic LLM slip
+                self._pending_comma = False
+                self._close(ch, emitted)
+                continue
+            if self._pending_comma:
+                self._pending_comma = False
+                if self._at_target() and self._item_buf is not None:
+                    self._finish_item(emitted)
+                self._emit(",")
+            if self._at_target() and self._item_buf is None:
+                self._item_buf = []
+            if ch in "{[":
+                self._open(ch)
+            elif ch == '"':
+                self._in_string = True
+                self._key_buf = [] if self._in_top_object() else None
+                self._emit(ch)
+            elif ch == ":":
+                if self._in_top_object():
+                    self._current_key = self._last_string
+                self._emit(ch)
+            else:
+                self._emit(ch)
+        if self._done and not self._accept(emitted):
+            # Not the document: it was prose; look for the next one after it
+            self._reset_candidate()
+            self._prose = True
+            return chunk[i:]
+        return ""
+
+    def _skip_prose(self, ch: str):
+        if self._fence_line:
+            self._fence_line = ch != "\n"
+            return
+        if ch == "`":
+            self._ticks += 1
+            if self._ticks == 3:
+                # Opening fence: the document is in its body, after the tag line
+                self._ticks, self._prose, self._fence_line = 0, False, True
+            return
+        self._ticks = 0
+        if not ch.isspace():
+            self._prose = True
+
+    def _accept(self, emitted: List[Any]) -> bool:
+        """Whether the candidate that just closed is the document."""
+        try:
+            doc = json.loads("".join(self._out), strict=False)
+        except json.JSONDecodeError:
+            doc = _MISSING
+        if self.item_key is not None:
+            usable = isinstance(doc, dict) and self.item_key in doc
+        else:
+            usable = isinstance(doc, dict) or (
+                isinstance(doc, list) and any(isinstance(x, (dict, list)) for x in doc))
+        if not usable:
+            if self._fallback is _MISSING and doc is not _MISSING:
+                self._fallback = doc
+            return False
+        if self._held:
+            self.items.extend(self._held)
+            emitted.extend(self._held)
+        self._held = None
+        self._doc = doc
+        return True
+
+    def _emit(self, s: str):
+        self._out.append(s)
+        if self._item_buf is not None:
+            self._item_buf.append(s)
+
+    def _in_top_object(self) -> bool:
+        return self.item_key is not None and self._stack == ["{"]
+
+    def _at_target(self) -> bool:
+        return self._target_depth > 0 and len(self._stack) == self._target_depth
+
+    def _open(self, ch: str):
+        self._emit(ch)
+        self._stack.append(ch)
+        if self._target_depth:
+            return
+        if self.item_key is None:
+            if len(self._stack) == 1 and ch == "[":
+                self._target_depth = 1
+        elif (ch == "[" and len(self._stack) == 2 and self._stack[0] == "{"
+              and self._current_key == self.item_key):
+            self._target_depth = 2
+
+    def _close(self, ch: str, emitted: List[Any]):
+        if not self._stack:
+            return
+        if self._at_target() and self._item_buf is not None:
+            # Scalar element ends at the array's closing bracket
+            self._finish_item(emitted)
+        self._emit(ch)
+        self._stack.pop()
+        if self._at_target():
+            if self._item_buf is not None:
+                # Object / array element just closed
+                self._finish_item(emitted)
+        elif 0 < self._target_depth and len(self._stack) < self._target_depth:
+            self._target_depth = -1          # target array closed; stop tracking
+        if not self._stack:
+            self._done = True
+
+    def _finish_item(self, emitted: List[Any]):
+        raw = "".join(self._item_buf)
+        self._item_buf = None
+        try:
+            item = json.loads(raw, strict=False)
+        except json.JSONDecodeError:
+            return
+        if not isinstance(item, (dict, list)):
+            return
+        if self._held is not None:
+            self._held.append(item)
+            return
+        self.items.append(item)
+        emitted.append(item)
+
+    def _consume_string(self, chunk: str, i: int) -> int:
+        n = len(chunk)
+        while i < n:
+            if self._escape:
+                self._escape = False
+                self._emit_string(chunk[i])
+                i += 1
+                continue
+            m = _STRING_STOP.search(chunk, i)
+            end = m.start() if m else n
+            if end > i:
+                self._emit_string(chunk[i:end])
+                i = end
+            if i >= n:
+                break
+            ch = chunk[i]
+            i += 1
+            self._emit(ch)
+            if ch == "\\":
+                self._escape = True
+                if self._key_buf is not None:
+                    self._key_buf.append(ch)
+                continue
+            # Closing quote
+            self._in_string = False
+            if self._key_buf is not None:
+                try:
+                    self._last_string = json.loads('"' + "".join(self._key_buf) + '"')
+                except json.JSONDecodeError:
+                    self._last_string = "".join(self._key_buf)
+                self._key_buf = None
+            break
+        return i
+
+    def _emit_string(self, s: str):
+        self._emit(s)
+        if self._key_buf is not None:
+            self._key_buf.append(s)
@@ -0,0 +1,80 @@
+"""
+lazy_imports.py — JobLess AI Lazy Import Layer
+==============================================
+Defers the heavy optional dependencies until something actually uses them.
+
+Importing google-generativeai, groq, altair, streamlit-lottie and ReportLab
+up front costs well over a second of cold start, on every container, for
+code most sessions never reach (one provider per user, charts only after an
+analysis, PDFs only on download). A LazyModule stands in for the module
+until first use:
+
+  - LazyModule("altair")        → attribute access (``alt.Chart``) imports it
+  - LazyModule("groq", "Groq")  → one attribute; calling it imports the module
+  - available("cohere")         → is it installed? (find_spec, no import)
+
+Import errors surface at the first use instead of at app start. stats()
+lists which targets have loaded so far (admin runtime panel); it is keyed
+by target, so the proxies a rerun re-creates don't pile up.
+Nothing in this module imports streamlit.
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+from typing import Any, Dict, Optional
+
+_lock = threading.Lock()
+# target ("module" or "module.attr") → most recent proxy for it
+_registry: Dict[str, "LazyModule"] = {}
+
+
+def available(name: str) -> bool:
+    """True if `name` can be imported, without importing it (parents excepted)."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule:
+    __slots__ = ("_name", "_attr", "_target")
+
+    def __init__(self, name: str, attr: Optional[str] = None):
+        self._name = name
+        self._attr = attr
+        self._target = None
+        with _lock:
+            _registry[self._label()] = self
+
+    def _label(self) -> str:
+        return f"{self._name}.{self._attr}" if self._attr else self._name
+
+    def _load(self) -> Any:
+        target = self._target
+        if target is None:
+            # The import system serialises concurrent first imports itself
+            target = importlib.import_module(self._name)
+            if self._attr:
+                target = getattr(target, self._attr)
+            self._target = target
+        return target
+
+    @property
+    def loaded(self) -> bool:
+        return self._target is not None or self._name in sys.modules
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self._load(), item)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<LazyModule {self._label()} ({'loaded' if self.loaded else 'deferred'})>"
+
+
+def stats() -> Dict[str, bool]:
+    with _lock:
+        return {label: proxy.loaded for label, proxy in _registry.items()}
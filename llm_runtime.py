@@ -0,0 +1,578 @@
+"""
+llm_runtime.py — JobLess AI LLM Runtime Layer
+==============================================
+Process-wide plumbing that sits underneath AIHandler._call_llm.
+
+Streamlit runs every browser session in its own script thread, but all of
+those threads share one Python process. Anything in here is therefore shared
+by every visitor on the node and must be thread-safe.
+
+  - ClientPool    → reuses provider SDK clients (and their HTTP keep-alive
+                    connections) instead of rebuilding them on every call.
+  - ResponseCache → content-addressed LRU (+ optional SQLite tier) for
+                    completions, so identical prompts skip the provider.
+  - RateLimiter   → token buckets per (provider, api key) that queue callers
+                    instead of letting the provider answer 429.
+  - call_with_retry → jittered exponential backoff on 429 / 5xx that
+                    honours Retry-After.
+  - StreamRace    → failover / hedging across provider routes, decided on
+                    time-to-first-token.
+  - SingleFlight  → coalesces identical in-flight calls onto one request.
+  - process_shared → keeps the above alive across Streamlit script reruns.
+
+Nothing in this module imports streamlit, so it can be exercised headless.
+"""
+
+import hashlib
+import json
+import queue
+import random
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+
+def key_fingerprint(api_key: str) -> str:
+    """Short, non-reversible fingerprint of an API key (safe to log / use as dict key)."""
+    return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
+
+
+# ==================== CLIENT POOL ====================
+class ClientPool:
+    """
+    Thread-safe registry of provider clients keyed by
+    (provider, api-key fingerprint, model).
+
+    Clients that have not been used for ``idle_ttl`` seconds are dropped, and
+    the pool never holds more than ``max_size`` entries (least recently used
+    goes first). Evicted clients are not closed: another session may still be
+    mid-request on one, so its connections are released when the last
+    reference goes away. Hit / miss / eviction counters are exposed via
+    ``stats()``.
+    """
+
+    def __init__(self, max_size: int = 64, idle_ttl: float = 600.0):
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self._lock = threading.Lock()
+        # key -> [client, closer, last_used]
+        self._entries: Dict[Tuple[str, str, str], list] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, provider: str, api_key: str, model: str,
+            factory: Callable[[], Tuple[Any, Optional[Callable[[], None]]]]) -> Any:
+        """
+        Return the pooled client for this key, building it with ``factory`` on a miss.
+
+        ``factory`` returns ``(client, closer)``; ``closer`` (may be None) is
+        only called for clients nobody can be holding — one that lost a build
+        race, or everything on ``clear()``.
+        """
+        key = (provider, key_fingerprint(api_key), model or "")
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[2] = now
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        # Build outside the lock — SDK construction can be slow and must not
+        # stall other sessions that only need a cache hit.
+        client, closer = factory()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._entries[key] = [client, closer, now]
+                while len(self._entries) > self.max_size:
+                    oldest = min(self._entries, key=lambda k: self._entries[k][2])
+                    del self._entries[oldest]
+                    self._evictions += 1
+                return client
+            # Another thread won the race; keep theirs, discard ours.
+            entry[2] = now
+        _safe_close(closer)
+        return entry[0]
+
+    def _evict_idle(self, now: float):
+        # Caller holds self._lock
+        expired = [k for k, e in self._entries.items()
+                   if now - e[2] > self.idle_ttl]
+        for k in expired:
+            del self._entries[k]
+            self._evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+            }
+
+    def clear(self):
+        with self._lock:
+            entries, self._entries = self._entries, {}
+        for e in entries.values():
+            _safe_close(e[1])
+
+
+def _safe_close(closer: Optional[Callable[[], None]]):
+    if closer is None:
+        return
+    try:
+        closer()
+    except Exception:
+        pass
+
+
+# ==================== RESPONSE CACHE ====================
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace so indentation-only differences share a cache entry."""
+    return " ".join((prompt or "").split())
+
+
+def response_cache_key(provider: str, model: str, prompt: str, temperature: float,
+                       max_tokens: int, json_mode: bool) -> str:
+    """SHA-256 over everything that can change a completion."""
+    payload = json.dumps(
+        [provider, model, normalize_prompt(prompt),
+         round(float(temperature), 3), int(max_tokens), bool(json_mode)],
+        ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-tier completion cache.
+
+    Tier 1 is a bounded in-memory LRU shared by every session. Tier 2 is an
+    optional SQLite file (``db_path``) that survives restarts and is shared
+    by every worker process on the box. Each entry carries its own TTL, so
+    callers decide freshness per method.
+    """
+
+    def __init__(self, max_entries: int = 512, db_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._mem: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            try:
+                self._db = sqlite3.connect(
+                    db_path, check_same_thread=False, timeout=5.0)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache ("
+                    " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+                    " expires_at REAL NOT NULL)")
+                self._db.execute(
+                    "DELETE FROM llm_cache WHERE expires_at < ?", (time.time(),))
+                self._db.commit()
+            except sqlite3.Error:
+                self._db = None
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            hit = self._mem.get(key)
+            if hit is not None:
+                value, expires_at = hit
+                if expires_at >= now:
+                    self._mem.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._mem[key]
+            if self._db is not None:
+                try:
+                    row = self._db.execute(
+                        "SELECT value, expires_at FROM llm_cache WHERE key = ?",
+                        (key,)).fetchone()
+                except sqlite3.Error:
+                    row = None
+                if row and row[1] >= now:
+                    self._remember(key, row[0], row[1])
+                    self._disk_hits += 1
+                    return row[0]
+            self._misses += 1
+            return None
+
+    def set(self, key: str, value: str, ttl: float):
+        if not value or ttl <= 0:
+            return
+        expires_at = time.time() + ttl
+        with self._lock:
+            self._remember(key, value, expires_at)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO llm_cache (key, value, expires_at)"
+                        " VALUES (?, ?, ?)", (key, value, expires_at))
+                    self._db.commit()
+                except sqlite3.Error:
+                    pass
+
+    def _remember(self, key: str, value: str, expires_at: float):
+        # Caller holds self._lock
+        self._mem[key] = (value, expires_at)
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.max_entries:
+            self._mem.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "size": len(self._mem),
+            }
+
+    def clear(self):
+        with self._lock:
+            self._mem.clear()
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM llm_cache")
+                    self._db.commit()
+                except sqlite3.Error:
+                    pass
+
+
+# ==================== RATE LIMITING ====================
+class RateLimitTimeout(RuntimeError):
+    """Raised when a caller would have to queue longer than it is willing to."""
+
+
+class _Bucket:
+    __slots__ = ("capacity", "rate", "tokens", "stamp")
+
+    def __init__(self, capacity: float, rate: float, now: float):
+        self.capacity = capacity
+        self.rate = rate          # tokens per second
+        self.tokens = capacity
+        self.stamp = now
+
+    def refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+
+    def wait_time(self) -> float:
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """
+    Process-wide token buckets keyed by (provider, api-key fingerprint).
+
+    ``limits`` maps provider → {"per_minute": n, "per_day": m}; either may be
+    omitted / None. A provider without limits is never throttled. Callers
+    block in ``acquire`` until a token is free, so bursts are smoothed to the
+    quota instead of turning into provider-side 429s.
+    """
+
+    def __init__(self, limits: Dict[str, Dict[str, Optional[int]]]):
+        self.limits = limits
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, str], Tuple[_Bucket, ...]] = {}
+        self._waited = 0.0
+        self._timeouts = 0
+
+    def _buckets_for(self, provider: str, api_key: str, now: float) -> Tuple[_Bucket, ...]:
+        # Caller holds self._lock
+        key = (provider, key_fingerprint(api_key))
+        buckets = self._buckets.get(key)
+        if buckets is None:
+            spec = self.limits.get(provider) or {}
+            buckets = []
+            if spec.get("per_minute"):
+                buckets.append(_Bucket(spec["per_minute"], spec["per_minute"] / 60.0, now))
+            if spec.get("per_day"):
+                buckets.append(_Bucket(spec["per_day"], spec["per_day"] / 86400.0, now))
+            buckets = self._buckets[key] = tuple(buckets)
+        return buckets
+
+    def acquire(self, provider: str, api_key: str, timeout: float = 60.0):
+        """Take one request slot, waiting up to ``timeout`` seconds for it."""
+        deadline = time.monotonic() + timeout
+        started = time.monotonic()
+        while True:
+            now = time.monotonic()
+            with self._lock:
+                buckets = self._buckets_for(provider, api_key, now)
+                for b in buckets:
+                    b.refill(now)
+                wait = max((b.wait_time() for b in buckets), default=0.0)
+                if wait <= 0:
+                    for b in buckets:
+                        b.tokens -= 1
+                    self._waited += now - started
+                    return
+                if now + wait > deadline:
+                    self._timeouts += 1
+                    raise RateLimitTimeout(
+                        f"{provider} rate limit reached — next slot in ~{int(wait) + 1}s. "
+                        "Please try again shortly.")
+            time.sleep(min(wait, 1.0))
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "keys": len(self._buckets),
+                "seconds_waited": round(self._waited, 3),
+                "timeouts": self._timeouts,
+            }
+
+
+# ==================== RETRY / BACKOFF ====================
+RETRYABLE_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+T = TypeVar("T")
+
+
+def error_status(exc: BaseException) -> Optional[int]:
+    """HTTP status carried by a provider SDK exception, if any (duck-typed)."""
+    for attr in ("status_code", "code", "status"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    response = getattr(exc, "response", None)
+    value = getattr(response, "status_code", None)
+    return value if isinstance(value, int) else None
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Retry-After (seconds form) from a provider SDK exception, if present."""
+    headers = getattr(exc, "headers", None)
+    if headers is None:
+        headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def call_with_retry(fn: Callable[[], T], *, before_attempt: Optional[Callable[[], None]] = None,
+                    retries: int = 3, base_delay: float = 1.0, max_delay: float = 20.0) -> T:
+    """
+    Run ``fn`` and retry it on 429 / 5xx with full-jitter exponential backoff.
+
+    A server-supplied Retry-After wins over the computed delay (capped at
+    ``max_delay``). ``before_attempt`` — typically ``RateLimiter.acquire`` —
+    runs before every attempt, retries included. Errors without a retryable
+    status are re-raised immediately.
+    """
+    attempt = 0
+    while True:
+        if before_attempt is not None:
+            before_attempt()
+        try:
+            return fn()
+        except Exception as exc:
+            if attempt >= retries or error_status(exc) not in RETRYABLE_STATUS:
+                raise
+            delay = retry_after_seconds(exc)
+            if delay is None:
+                delay = random.uniform(0, base_delay * (2 ** attempt))
+            time.sleep(min(delay, max_delay))
+            attempt += 1
+
+
+# ==================== FAILOVER / HEDGING ====================
+class StreamRace:
+    """
+    Race streamed completions over an ordered list of routes.
+
+    The first route starts immediately. The next route is launched when
+    every running attempt has failed, or when ``first_token_budget`` seconds
+    pass without any of them producing a first chunk. Slow attempts are not
+    abandoned: whichever attempt yields text first wins, the others are
+    cancelled, and iterating the race yields the winner's chunks.
+
+    A long budget gives plain failover; a short one (a fraction of typical
+    latency) gives hedged requests. ``open_stream(route)`` runs on
+    ``executor`` threads and must not touch streamlit.
+    """
+
+    def __init__(self, routes: List[Any], open_stream: Callable[[Any], Iterator[str]],
+                 executor, first_token_budget: float = 10.0):
+        if not routes:
+            raise ValueError("StreamRace needs at least one route")
+        self.routes = routes
+        self.open_stream = open_stream
+        self.executor = executor
+        self.first_token_budget = first_token_budget
+        self.winner: Optional[Any] = None
+        self.attempts = 0
+        self._events: "queue.Queue[Tuple[int, str, Any]]" = queue.Queue()
+        self._cancel: List[threading.Event] = []
+
+    def _launch(self):
+        idx = len(self._cancel)
+        self._cancel.append(threading.Event())
+        self.attempts += 1
+        self.executor.submit(self._run, idx, self.routes[idx])
+        return time.monotonic() + self.first_token_budget
+
+    def _run(self, idx: int, route: Any):
+        cancel = self._cancel[idx]
+        try:
+            stream = self.open_stream(route)
+            try:
+                for chunk in stream:
+                    if cancel.is_set():
+                        return
+                    self._events.put((idx, "chunk", chunk))
+            finally:
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    close()
+            self._events.put((idx, "end", None))
+        except Exception as exc:
+            self._events.put((idx, "error", exc))
+
+    def __iter__(self) -> Iterator[str]:
+        deadline = self._launch()
+        running = {0}
+        last_error: Optional[BaseException] = None
+        winner_idx = None
+        try:
+            while winner_idx is None:
+                more = len(self._cancel) < len(self.routes)
+                timeout = max(0.0, deadline - time.monotonic()) if more else None
+                try:
+                    idx, kind, payload = self._events.get(timeout=timeout)
+                except queue.Empty:
+                    running.add(len(self._cancel))
+                    deadline = self._launch()
+                    continue
+                if kind == "chunk":
+                    winner_idx = idx
+                    self.winner = self.routes[idx]
+                    for i, ev in enumerate(self._cancel):
+                        if i != idx:
+                            ev.set()
+                    yield payload
+                    break
+                running.discard(idx)
+                last_error = payload if kind == "error" else ValueError(
+                    "Provider returned an empty response")
+                if not running:
+                    if len(self._cancel) >= len(self.routes):
+                        raise last_error
+                    running.add(len(self._cancel))
+                    deadline = self._launch()
+
+            while True:
+                idx, kind, payload = self._events.get()
+                if idx != winner_idx:
+                    continue
+                if kind == "chunk":
+                    yield payload
+                elif kind == "end":
+                    return
+                else:
+                    raise payload
+        finally:
+            for ev in self._cancel:
+                ev.set()
+
+
+# ==================== REQUEST COALESCING ====================
+class SingleFlight:
+    """
+    At most one in-flight call per key; concurrent callers share its result.
+
+    ``do(key, fn)`` is the simple form. Streaming callers that need to act as
+    the leader while the call is running use ``begin`` / ``finish`` / ``fail``
+    directly. Nothing is remembered once a call completes — that is the
+    ResponseCache's job.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self._leaders = 0
+        self._followers = 0
+
+    def begin(self, key: str) -> Tuple[Future, bool]:
+        """Return (future, is_leader). A leader must later call finish() or fail()."""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self._followers += 1
+                return future, False
+            future = self._inflight[key] = Future()
+            self._leaders += 1
+            return future, True
+
+    def finish(self, key: str, value: Any):
+        with self._lock:
+            future = self._inflight.pop(key, None)
+        if future is not None:
+            future.set_result(value)
+
+    def fail(self, key: str, exc: BaseException):
+        if not isinstance(exc, Exception):
+            # Don't re-raise the leader's interrupt / rerun signal in followers
+            exc = RuntimeError("The shared in-flight request was interrupted. Please retry.")
+        with self._lock:
+            future = self._inflight.pop(key, None)
+        if future is not None:
+            future.set_exception(exc)
+
+    def do(self, key: str, fn: Callable[[], T]) -> Tuple[T, bool]:
+        """Run ``fn`` once per concurrent ``key``; returns (value, shared)."""
+        future, leader = self.begin(key)
+        if not leader:
+            return future.result(), True
+        try:
+            value = fn()
+        except BaseException as exc:
+            self.fail(key, exc)
+            raise
+        self.finish(key, value)
+        return value, False
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "leaders": self._leaders,
+                "followers": self._followers,
+                "in_flight": len(self._inflight),
+            }
+
+
+# ==================== PROCESS-LIFETIME OBJECTS ====================
+_SHARED: Dict[str, Any] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def process_shared(name: str, factory: Callable[[], T]) -> T:
+    """
+    Build ``name`` once per process and return the same object afterwards.
+
+    ``streamlit run`` re-executes the app script on every rerun, so a pool or
+    cache assigned at the script's top level would be rebuilt (and its
+    threads leaked) each time. This module is imported once, so objects
+    parked here live as long as the process and are shared by every session.
+    """
+    with _SHARED_LOCK:
+        if name not in _SHARED:
+            _SHARED[name] = factory()
+        return _SHARED[name]
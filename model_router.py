@@ -0,0 +1,126 @@
+"""
+model_router.py — JobLess AI Model Routing Layer
+================================================
+Picks a model per AIHandler task instead of using the sidebar model for all.
+
+Each task maps to a tier (fast / standard / heavy). Each tier lists the
+candidate models for a provider, cheapest first. ``choose_model`` walks
+that list and returns the first model that TELEMETRY shows meeting the
+tier's p95 latency target and JSON parse-success floor. A model with too
+few samples is taken on trust, so cheap models get explored first.
+
+Routing only ever downgrades: a candidate ranked heavier than the model the
+user picked (MODEL_COST_ORDER) is skipped, and a pick the table doesn't
+know is left alone. The app keeps routing off until the user opts in.
+
+Nothing in this module imports streamlit.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+from telemetry import TELEMETRY
+
+# AIHandler method → tier. Methods not listed keep the user's selected model.
+TASK_TIERS: Dict[str, str] = {
+    "evaluate_interview_answer":       "fast",
+    "evaluate_interview_answers_batch": "fast",
+    "find_pyq_resources":              "fast",
+    "summarize_interview_context":     "fast",
+    "chat_interview_turn":             "standard",
+    "chat_interview_turn_stream":      "standard",
+    "generate_interview_questions":    "standard",
+    "generate_final_verdict":          "standard",
+    "generate_pyq_questions":          "standard",
+    "get_career_advice":               "heavy",
+    "build_ats_resume":                "heavy",
+}
+
+# Tier → candidate models per internal provider, cheapest / fastest first.
+# "heavy" is intentionally absent: big structured outputs stay on the
+# model the user picked.
+MODEL_TIERS: Dict[str, Dict[str, List[str]]] = {
+    "gemini": {
+        "fast":     ["gemini-2.0-flash-lite", "gemini-1.5-flash-8b", "gemini-2.0-flash"],
+        "standard": ["gemini-2.0-flash", "gemini-1.5-flash"],
+    },
+    "groq": {
+        "fast":     ["llama-3.1-8b-instant", "gemma2-9b-it", "llama-3.3-70b-versatile"],
+        "standard": ["llama-3.3-70b-versatile", "llama3-70b-8192"],
+    },
+    "cohere": {
+        "fast":     ["command-light", "command-r"],
+        "standard": ["command-r", "command-r-plus"],
+    },
+    "local": {
+        "fast":     ["fake-fast"],
+        "standard": ["fake-large"],
+    },
+}
+
+# Every model per internal provider, cheapest / lightest first
+MODEL_COST_ORDER: Dict[str, List[str]] = {
+    "gemini": ["gemini-2.0-flash-lite", "gemini-1.5-flash-8b", "gemini-1.5-flash",
+               "gemini-2.0-flash", "gemini-1.5-pro"],
+    "groq":   ["llama-3.1-8b-instant", "llama3-8b-8192", "gemma-7b-it", "gemma2-9b-it",
+               "mixtral-8x7b-32768", "llama3-70b-8192", "llama-3.3-70b-versatile"],
+    "cohere": ["command-light", "command-r", "command", "command-r-plus"],
+    "local":  ["fake-fast", "fake-large"],
+}
+
+# p95 seconds a tier's model must stay under to keep being chosen
+TIER_LATENCY_TARGETS: Dict[str, float] = {"fast": 6.0, "standard": 12.0}
+MIN_PARSE_SUCCESS = 0.9
+MIN_SAMPLES = 5
+
+
+def _p95(values: List[float]) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(0.95 * len(values)))]
+
+
+def model_health(model: str, method: Optional[str] = None) -> Dict[str, float]:
+    """Observed sample count, p95 latency and JSON parse-success rate for `model`."""
+    match = {"model": model}
+    if method:
+        match["method"] = method
+    latencies = TELEMETRY.samples("llm_call_seconds", **match)
+    ok = TELEMETRY.counter_total("json_parse_total", outcome="ok", **match)
+    bad = TELEMETRY.counter_total("json_parse_total", outcome="error", **match)
+    return {
+        "count": len(latencies),
+        "p95": _p95(latencies) if latencies else 0.0,
+        "parse_ok": ok / (ok + bad) if ok + bad else 1.0,
+    }
+
+
+def choose_model(provider: str, method: str, selected_model: str,
+                 available: Sequence[str]) -> str:
+    """
+    Cheapest model for `method` on `provider` that meets its tier's targets,
+    never one heavier than `selected_model`.
+
+    Falls back to the candidate with the best observed p95, and to
+    `selected_model` whenever the task or provider has no routing entry.
+    """
+    order = MODEL_COST_ORDER.get(provider, [])
+    if selected_model not in order:
+        return selected_model
+    ceiling = order.index(selected_model)
+    tier = TASK_TIERS.get(method)
+    candidates = [m for m in MODEL_TIERS.get(provider, {}).get(tier, [])
+                  if m in available and m in order and order.index(m) <= ceiling]
+    if not candidates:
+        return selected_model
+    target = TIER_LATENCY_TARGETS[tier]
+    best, best_p95 = None, None
+    for model in candidates:
+        health = model_health(model, method)
+        if health["count"] < MIN_SAMPLES:
+            return model
+        if health["parse_ok"] < MIN_PARSE_SUCCESS:
+            continue
+        if health["p95"] <= target:
+            return model
+        if best_p95 is None or health["p95"] < best_p95:
+            best, best_p95 = model, health["p95"]
+    return best or selected_model
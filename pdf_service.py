@@ -0,0 +1,156 @@
+"""
+pdf_service.py — JobLess AI PDF Rendering Service
+=================================================
+Runs ReportLab layout off the Streamlit script threads.
+
+Layout is pure-Python CPU work: on a script thread it blocks that user's
+rerun and holds the GIL against every other session on the node. The
+service instead:
+
+  - fans the parts of a document (see pyq_pdf.render_part) out to a
+    ProcessPoolExecutor, so sections lay out in parallel and outside the
+    app's GIL, then merges them (also in a worker)
+  - returns a Future[bytes] per document
+  - warm() starts the worker processes (and their ReportLab import) ahead
+    of the first document, which otherwise pays for spawning them
+  - admits at most ``max_pending`` documents at a time; further submits
+    wait up to ``wait`` seconds and then raise PDFQueueFull (backpressure
+    instead of an ever-growing queue)
+
+Workers are started with the "spawn" method (the app process is full of
+threads, which fork does not mix well with). If a pool can't be started,
+or it dies, documents render inline on the calling thread instead.
+Set JOBLESS_PDF_WORKERS=0 to force inline rendering. ReportLab (via pyq_pdf)
+is only imported once a document is rendered. Nothing in this module
+imports streamlit.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from lazy_imports import LazyModule
+
+if TYPE_CHECKING:
+    from pyq_pdf import Job
+
+pyq_pdf = LazyModule("pyq_pdf")
+
+
+class PDFQueueFull(RuntimeError):
+    pass
+
+
+def _warm_worker() -> int:
+    # Runs in a worker: import ReportLab now rather than on the first part
+    import pyq_pdf  # noqa: F401
+    return os.getpid()
+
+
+class PDFRenderService:
+    def __init__(self, max_workers: Optional[int] = None, max_pending: int = 8,
+                 part_timeout: float = 120.0):
+        if max_workers is None:
+            max_workers = min(4, os.cpu_count() or 1)
+        self.max_workers = max_workers
+        self.part_timeout = part_timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._max_pending = max_pending
+        # Coordinators only wait on worker results; one per admitted document
+        self._coord = ThreadPoolExecutor(max_workers=max_pending, thread_name_prefix="jl-pdf")
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._inline = max_workers <= 0
+        self._pending = 0
+        self._rendered = 0
+        self._rejected = 0
+
+    # ── Public API ────────────────────────────────────────────────────────
+    def submit(self, jobs: List["Job"], title: str, footer: str, wait: float = 30.0) -> "Future[bytes]":
+        """Queue one document; raises PDFQueueFull if no slot frees up within `wait` s."""
+        if not self._slots.acquire(timeout=wait):
+            with self._lock:
+                self._rejected += 1
+            raise PDFQueueFull("The PDF renderer is busy right now — please try again in a moment.")
+        with self._lock:
+            self._pending += 1
+        try:
+            future = self._coord.submit(self._render, jobs, title, footer)
+        except BaseException:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def warm(self):
+        """Start every worker process now, without waiting for them."""
+        pool = self._workers()
+        if pool is not None:
+            # The pool spawns a process per queued task until max_workers
+            try:
+                for _ in range(self.max_workers):
+                    pool.submit(_warm_worker)
+            except (BrokenProcessPool, RuntimeError):
+                pass  # the next document finds out and falls back inline
+
+    def render(self, jobs: List["Job"], title: str, footer: str) -> bytes:
+        """Blocking convenience wrapper around submit()."""
+        return self.submit(jobs, title, footer).result()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "workers": 0 if self._inline else self.max_workers,
+                "pending": self._pending,
+                "max_pending": self._max_pending,
+                "rendered": self._rendered,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self):
+        self._coord.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    # ── Internals ─────────────────────────────────────────────────────────
+    def _release(self, _future):
+        with self._lock:
+            self._pending -= 1
+            if _future is not None and not _future.cancelled() and _future.exception() is None:
+                self._rendered += 1
+        self._slots.release()
+
+    def _workers(self) -> Optional[ProcessPoolExecutor]:
+        with self._lock:
+            if self._inline:
+                return None
+            if self._pool is None:
+                try:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"))
+                except (OSError, NotImplementedError, ValueError):
+                    # e.g. no /dev/shm or process limits on the host
+                    self._inline = True
+                    return None
+            return self._pool
+
+    def _render(self, jobs: List["Job"], title: str, footer: str) -> bytes:
+        pool = self._workers()
+        if pool is None:
+            return pyq_pdf.render_document(jobs, title, footer)
+        try:
+            parts = list(pool.map(pyq_pdf.render_part, jobs, timeout=self.part_timeout))
+            return pool.submit(pyq_pdf.merge_parts, parts, title, footer).result(
+                timeout=self.part_timeout)
+        except BrokenProcessPool:
+            # A worker died (OOM-killed, …): drop the pool, render this one inline
+            with self._lock:
+                if self._pool is pool:
+                    self._pool = None
+            return pyq_pdf.render_document(jobs, title, footer)
@@ -0,0 +1,370 @@
+"""
+pyq_pdf.py — JobLess AI PYQ PDF Layout
+======================================
+ReportLab layout for the two PYQ paper types:
+
+  - curated packs   → cover + contents, one part per section, closing page
+  - AI papers       → cover, one part per generated section
+
+Every part starts on a fresh page, so each one is laid out as its own small
+PDF (``render_part``) and the parts are stitched together afterwards with
+PyMuPDF (``merge_parts``), which also stamps the running page numbers. That
+split is what lets pdf_service render the sections of one document in
+parallel worker processes.
+
+Jobs are plain tuples of builtins so they pickle cheaply. Nothing in this
+module imports streamlit.
+"""
+
+import io
+from typing import Dict, List, Tuple
+
+import fitz  # PyMuPDF
+from reportlab.lib import colors as _rl_colors
+from reportlab.lib.enums import TA_CENTER as _TAC, TA_LEFT as _TAL
+from reportlab.lib.pagesizes import A4 as _A4
+from reportlab.lib.styles import ParagraphStyle as _PS
+from reportlab.lib.units import cm as _cm, mm as _mm
+from reportlab.platypus import (
+    SimpleDocTemplate as _SDT, Paragraph as _Para, Spacer as _Spacer,
+    Table as _Table, TableStyle as _TStyle, HRFlowable as _HR, KeepTogether as _KT
+)
+
+_C_WHITE = _rl_colors.HexColor("#f1f5f9")
+_C_LIGHT = _rl_colors.HexColor("#b3b3b3")
+_C_DARK = _rl_colors.HexColor("#1e293b")
+
+# PDF-safe light-background palette (for print/PDF output)
+_PDF_TEXT = _rl_colors.HexColor("#111827")   # near-black — main body text
+_PDF_SUBTEXT = _rl_colors.HexColor("#374151")   # dark gray — secondary text
+_PDF_MUTED = _rl_colors.HexColor("#6b7280")   # medium gray — captions, TOC
+# dark green — correct answer label
+_PDF_GREEN_DARK = _rl_colors.HexColor("#15803d")
+_PDF_GREEN_BG = _rl_colors.HexColor("#f0fdf4")   # mint bg — explanation block
+_PDF_GREEN_TEXT = _rl_colors.HexColor(
+    "#166534")   # dark green text — explanation
+_PDF_CODE_BG = _rl_colors.HexColor("#f0f9ff")   # pale blue bg — code block
+_PDF_CODE_TEXT = _rl_colors.HexColor("#1e40af")   # dark blue — code text
+_PDF_HDR_LINE = _rl_colors.HexColor("#e5e7eb")   # light gray — dividers
+_PDF_STATS_BG = _rl_colors.HexColor("#f8fafc")   # off-white — stats bar
+
+W, H = _A4
+_FOOTER_RGB = (0x6b / 255, 0x72 / 255, 0x80 / 255)   # _PDF_MUTED for PyMuPDF
+
+# (kind, args) — args are builtins only
+Job = Tuple[str, tuple]
+
+
+def _esc(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _mk(name, **kw):
+    return _PS(name, **kw)
+
+
+def _curated_styles(accent_color) -> Dict[str, _PS]:
+    return {
+        "cover_title": _mk("CoverTitle",
+                           fontSize=28, leading=34, textColor=_C_WHITE,
+                           fontName="Helvetica-Bold", alignment=_TAC, spaceAfter=6),
+        "cover_sub": _mk("CoverSub",
+                         fontSize=12, leading=16, textColor=_C_LIGHT,
+                         fontName="Helvetica", alignment=_TAC, spaceAfter=4),
+        "cover_tag": _mk("CoverTag",
+                         fontSize=9, leading=12, textColor=accent_color,
+                         fontName="Helvetica-Bold", alignment=_TAC),
+        "q_num": _mk("QNum",
+                     fontSize=10, leading=13, textColor=accent_color,
+                     fontName="Helvetica-Bold", spaceBefore=12, spaceAfter=2),
+        "q_text": _mk("QText",
+                      fontSize=10, leading=15, textColor=_PDF_TEXT,
+                      fontName="Helvetica", spaceAfter=4),
+        "code": _mk("Code",
+                    fontSize=8.5, leading=12, textColor=_PDF_CODE_TEXT,
+                    fontName="Courier", spaceAfter=4, leftIndent=12,
+                    backColor=_PDF_CODE_BG, borderPadding=(4, 8, 4, 8)),
+        "opt": _mk("Opt",
+                   fontSize=9.5, leading=13, textColor=_PDF_SUBTEXT,
+                   fontName="Helvetica", leftIndent=14, spaceAfter=1),
+        "ans_hdr": _mk("AnsHdr",
+                       fontSize=9, leading=12, textColor=_PDF_GREEN_DARK,
+                       fontName="Helvetica-Bold", spaceBefore=4, spaceAfter=2),
+        "ans_exp": _mk("AnsExp",
+                       fontSize=9, leading=13, textColor=_PDF_GREEN_TEXT,
+                       fontName="Helvetica", leftIndent=10, spaceAfter=2,
+                       backColor=_PDF_GREEN_BG, borderPadding=(3, 6, 3, 6)),
+    }
+
+
+def _ai_styles(accent) -> Dict[str, _PS]:
+    return {
+        "cover": _mk("AITitle", fontSize=22, leading=28, textColor=_C_WHITE,
+                     fontName="Helvetica-Bold", alignment=_TAC, spaceAfter=6),
+        "sub": _mk("AISub", fontSize=11, leading=15, textColor=_C_LIGHT,
+                   fontName="Helvetica", alignment=_TAC, spaceAfter=4),
+        "sec": _mk("AISec", fontSize=13, leading=17, textColor=_PDF_TEXT,
+                   fontName="Helvetica-Bold", spaceBefore=14, spaceAfter=6),
+        "qnum": _mk("AIQNum", fontSize=10, leading=13, textColor=accent,
+                    fontName="Helvetica-Bold", spaceBefore=10, spaceAfter=2),
+        "qtext": _mk("AIQText", fontSize=10, leading=15, textColor=_PDF_TEXT,
+                     fontName="Helvetica", spaceAfter=3),
+        "code": _mk("AICode", fontSize=8.5, leading=12,
+                    textColor=_PDF_CODE_TEXT,
+                    fontName="Courier", leftIndent=12, spaceAfter=4,
+                    backColor=_PDF_CODE_BG,
+                    borderPadding=(4, 8, 4, 8)),
+        "opt": _mk("AIOpt", fontSize=9.5, leading=13, textColor=_PDF_SUBTEXT,
+                   fontName="Helvetica", leftIndent=14, spaceAfter=1),
+        "ans": _mk("AIAns", fontSize=9, leading=12, textColor=_PDF_GREEN_DARK,
+                   fontName="Helvetica-Bold", spaceBefore=4, spaceAfter=2),
+        "exp": _mk("AIExp", fontSize=9, leading=13,
+                   textColor=_PDF_GREEN_TEXT,
+                   fontName="Helvetica", leftIndent=10, spaceAfter=2,
+                   backColor=_PDF_GREEN_BG,
+                   borderPadding=(3, 6, 3, 6)),
+    }
+
+
+# ==================== CURATED PACK PARTS ====================
+def _curated_cover(exam_name: str, tagline: str, accent_hex: str,
+                   sections: List[Tuple[str, str, int]]) -> list:
+    """Cover, stats bar and contents. `sections` is [(icon, title, n_questions)]."""
+    accent_color = _rl_colors.HexColor(accent_hex)
+    s = _curated_styles(accent_color)
+    story = [_Spacer(1, 2.5*_cm)]
+
+    cover_tbl = _Table([[_Para(f"📂 {exam_name}", s["cover_title"])]],
+                       colWidths=[W - 3.6*_cm])
+    cover_tbl.setStyle(_TStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), _C_DARK),
+        ('ROUNDEDCORNERS', [12]),
+        ('TOPPADDING', (0, 0), (-1, -1), 20),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
+        ('LEFTPADDING', (0, 0), (-1, -1), 16),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 16),
+        ('BOX', (0, 0), (-1, -1), 2, accent_color),
+    ]))
+    story.append(cover_tbl)
+    story.append(_Spacer(1, 14))
+
+    story.append(_Para(tagline, s["cover_sub"]))
+    story.append(_Spacer(1, 8))
+    story.append(
+        _Para("Generated by JobLess AI  ·  For Educational Use Only", s["cover_tag"]))
+    story.append(_Spacer(1, 2*_cm))
+
+    # Stats bar
+    total_q = sum(n for _, _, n in sections)
+    stats_tbl = _Table([[
+        _Para(f"<b>{total_q}</b>\nTotal Questions", s["cover_tag"]),
+        _Para(f"<b>{len(sections)}</b>\nSections", s["cover_tag"]),
+        _Para("<b>✓</b>\nAnswer Key Included", s["cover_tag"]),
+    ]], colWidths=[(W-3.6*_cm)/3]*3)
+    stats_tbl.setStyle(_TStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), _PDF_STATS_BG),
+        ('GRID', (0, 0), (-1, -1), 0.5, _PDF_HDR_LINE),
+        ('TOPPADDING', (0, 0), (-1, -1), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ]))
+    story.append(stats_tbl)
+    story.append(_Spacer(1, _cm))
+
+    # TOC
+    story.append(_Para("📋  CONTENTS", _mk("TOCHdr", fontSize=10, leading=14,
+                                          textColor=_PDF_MUTED, fontName="Helvetica-Bold",
+                                          spaceAfter=6)))
+    for idx, (icon, title, n) in enumerate(sections, 1):
+        story.append(_Para(
+            f"  {icon}  Section {idx}: {title}  ({n} Questions)",
+            _mk(f"toc{idx}", fontSize=9.5, leading=14, textColor=_PDF_SUBTEXT,
+                fontName="Helvetica", leftIndent=8, spaceAfter=3)))
+    return story
+
+
+def _curated_section(sec_idx: int, section: Dict, accent_hex: str) -> list:
+    accent_color = _rl_colors.HexColor(accent_hex)
+    s = _curated_styles(accent_color)
+    sec_tbl = _Table([[_Para(
+        f"{section['icon']}  Section {sec_idx}: {section['title'].upper()}",
+        _mk(f"sh{sec_idx}", fontSize=12, leading=16, textColor=_rl_colors.HexColor("#ffffff"),
+            fontName="Helvetica-Bold", alignment=_TAL))]], colWidths=[W-3.6*_cm])
+    sec_tbl.setStyle(_TStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), accent_color),
+        ('TOPPADDING', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+        ('LEFTPADDING', (0, 0), (-1, -1), 14),
+    ]))
+    story = [sec_tbl, _Spacer(1, 10)]
+
+    for q_idx, q in enumerate(section["questions"], 1):
+        block = [_Para(f"Q{q_idx}.", s["q_num"])]
+
+        # Question text — split code blocks
+        q_text = q["q"]
+        if "\n" in q_text:
+            parts = q_text.split("\n", 1)
+            block.append(_Para(parts[0], s["q_text"]))
+            code_lines = _esc(parts[1].strip())
+            block.append(_Para("<br/>".join(code_lines.split("\n")), s["code"]))
+        else:
+            block.append(_Para(q_text, s["q_text"]))
+
+        for opt in q["options"]:
+            block.append(_Para(opt, s["opt"]))
+
+        block.append(_Spacer(1, 4))
+
+        correct_opt = next(
+            (o for o in q["options"] if o.startswith(f"{q['answer']}")), q["answer"])
+        block.append(_Para(f"✅  Correct Answer: {correct_opt}", s["ans_hdr"]))
+        block.append(_Para(f"💡 {_esc(q.get('explanation', ''))}", s["ans_exp"]))
+        block.append(_HR(width="100%", thickness=0.5, color=_PDF_HDR_LINE, spaceAfter=6))
+        story.append(_KT(block))
+    return story
+
+
+def _curated_end(accent_hex: str) -> list:
+    return [
+        _Spacer(1, 3*_cm),
+        _Para("🚀 Generated by JobLess AI", _mk("EndTitle",
+                                               fontSize=16, leading=20,
+                                               textColor=_rl_colors.HexColor(accent_hex),
+                                               fontName="Helvetica-Bold", alignment=_TAC)),
+        _Spacer(1, 8),
+        _Para(
+            "This PDF was generated for educational and exam preparation purposes.\n"
+            "Questions are based on publicly known exam patterns and community-reported PYQs.\n"
+            "Always cross-check with official exam syllabi.",
+            _mk("Disc", fontSize=9, leading=13, textColor=_PDF_MUTED,
+                fontName="Helvetica", alignment=_TAC, spaceAfter=4)),
+    ]
+
+
+# ==================== AI PAPER PARTS ====================
+_AI_ACCENT = "#FFFFFF"
+
+
+def _ai_cover(company: str, role: str) -> list:
+    accent = _rl_colors.HexColor(_AI_ACCENT)
+    s = _ai_styles(accent)
+    cv = _Table([[_Para(f"📂 {company}", s["cover"])]], colWidths=[W - 3.6*_cm])
+    cv.setStyle(_TStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), _C_DARK),
+        ('BOX', (0, 0), (-1, -1), 2, accent),
+        ('TOPPADDING', (0, 0), (-1, -1), 18),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 18),
+        ('LEFTPADDING', (0, 0), (-1, -1), 14),
+    ]))
+    return [
+        _Spacer(1, 2*_cm), cv, _Spacer(1, 10),
+        _Para(f"{role} — PYQ Question Paper", s["sub"]),
+        _Para("AI-Generated by JobLess AI  ·  Educational Use Only",
+              _mk("tag", fontSize=8, leading=11, textColor=accent,
+                  fontName="Helvetica-Bold", alignment=_TAC)),
+    ]
+
+
+def _ai_section(sec_idx: int, section: Dict) -> list:
+    accent = _rl_colors.HexColor(_AI_ACCENT)
+    s = _ai_styles(accent)
+    sec_title = section.get("section", f"Section {sec_idx}")
+    hdr_tbl = _Table([[_Para(f"Section {sec_idx}: {sec_title.upper()}", s["sec"])]],
+                     colWidths=[W-3.6*_cm])
+    hdr_tbl.setStyle(_TStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), accent),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('LEFTPADDING', (0, 0), (-1, -1), 12),
+    ]))
+    story = [hdr_tbl, _Spacer(1, 8)]
+
+    for q_idx, q in enumerate(section.get("questions", []), 1):
+        block = [_Para(f"Q{q_idx}.", s["qnum"])]
+
+        q_text = q.get("question", "")
+        code_block = q.get("code", "")
+        if "\n" in q_text and not code_block:
+            parts = q_text.split("\n", 1)
+            block.append(_Para(parts[0], s["qtext"]))
+            block.append(_Para("<br/>".join(_esc(parts[1].strip()).split("\n")), s["code"]))
+        else:
+            block.append(_Para(_esc(q_text), s["qtext"]))
+            if code_block:
+                block.append(_Para("<br/>".join(_esc(code_block).split("\n")), s["code"]))
+
+        for opt in q.get("options", []):
+            block.append(_Para(opt, s["opt"]))
+
+        block.append(_Spacer(1, 3))
+        block.append(_Para(f"✅  Correct Answer: {q.get('answer', '')}", s["ans"]))
+        exp = _esc(q.get("explanation", ""))
+        if exp:
+            block.append(_Para(f"💡 {exp}", s["exp"]))
+        block.append(_HR(width="100%", thickness=0.5, color=_PDF_HDR_LINE, spaceAfter=4))
+        story.append(_KT(block))
+    return story
+
+
+# ==================== JOBS ====================
+_PART_BUILDERS = {
+    "curated_cover":   _curated_cover,
+    "curated_section": _curated_section,
+    "curated_end":     _curated_end,
+    "ai_cover":        _ai_cover,
+    "ai_section":      _ai_section,
+}
+
+
+def curated_jobs(exam_name: str, exam: Dict) -> List[Job]:
+    """Parts of a curated pack (exam in pyq_store.get_exam shape), in page order."""
+    accent = exam.get("accent", "#0047FF")
+    toc = [(sec["icon"], sec["title"], len(sec["questions"])) for sec in exam["sections"]]
+    jobs: List[Job] = [("curated_cover", (exam_name, exam.get("tagline", ""), accent, toc))]
+    for sec_idx, section in enumerate(exam["sections"], 1):
+        jobs.append(("curated_section", (sec_idx, section, accent)))
+    jobs.append(("curated_end", (accent,)))
+    return jobs
+
+
+def ai_jobs(company: str, role: str, sections: List[Dict]) -> List[Job]:
+    jobs: List[Job] = [("ai_cover", (company, role))]
+    for sec_idx, section in enumerate(sections, 1):
+        jobs.append(("ai_section", (sec_idx, section)))
+    return jobs
+
+
+def render_part(job: Job) -> bytes:
+    """Lay out one part as a standalone PDF (runs in a worker process)."""
+    kind, args = job
+    buf = io.BytesIO()
+    doc = _SDT(buf, pagesize=_A4,
+               rightMargin=1.8*_cm, leftMargin=1.8*_cm,
+               topMargin=2*_cm, bottomMargin=2*_cm,
+               author="JobLess AI")
+    doc.build(_PART_BUILDERS[kind](*args))
+    return buf.getvalue()
+
+
+def merge_parts(parts: List[bytes], title: str, footer: str) -> bytes:
+    """Concatenate part PDFs, stamp "<footer>  ·  Page N" on every page, set metadata."""
+    out = fitz.open()
+    for part in parts:
+        with fitz.open(stream=part, filetype="pdf") as src:
+            out.insert_pdf(src)
+    for number, page in enumerate(out, 1):
+        text = f"{footer}  ·  Page {number}"
+        width = fitz.get_text_length(text, fontname="helv", fontsize=7)
+        page.insert_text((page.rect.width / 2 - width / 2, page.rect.height - 12*_mm),
+                         text, fontname="helv", fontsize=7, color=_FOOTER_RGB)
+    out.set_metadata({"title": title, "author": "JobLess AI"})
+    data = out.tobytes(garbage=3, deflate=True)
+    out.close()
+    return data
+
+
+def render_document(jobs: List[Job], title: str, footer: str) -> bytes:
+    """Sequential fallback: every part in this process, then merge."""
+    return merge_parts([render_part(job) for job in jobs], title, footer)
@@ -0,0 +1,276 @@
+"""
+pyq_store.py — JobLess AI Question Store
+========================================
+The curated PYQ bank, kept on disk instead of as a literal in the app
+module, so it can grow without slowing imports or bloating every process.
+
+Layout (under data/pyq/, or JOBLESS_PYQ_DIR):
+
+  - index.json     → per exam: tagline, accent, data file, and its sections
+                     (title, icon, question count). Small; loaded on first use.
+  - <slug>.jsonl   → one question per line:
+                     {"section", "q", "options", "answer", "explanation",
+                      optional "code" / "difficulty" / "topic"}
+
+API:
+
+  - list_exams() / has_exam() / exam_info()  → index only, no questions read
+  - get_exam(name)     → {tagline, accent, sections:[{title, icon, questions}]}
+                         (the shape build_pyq_pdf renders); lazily loaded,
+                         small LRU
+  - iter_questions()   → streams questions, filtered by exam / section /
+                         difficulty / topic (topic defaults to the section)
+  - search(query)      → SQLite FTS5 over q + explanation, built on first
+                         use and rebuilt when a data file changes
+  - content_hash(name) → SHA-256 of the exam's data file, for artifact keys
+
+After adding or editing an exam's JSONL by hand, run
+``python pyq_store.py reindex`` to refresh the section counts.
+Nothing in this module imports streamlit.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+STORE_DIR = os.getenv("JOBLESS_PYQ_DIR") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "pyq")
+INDEX_FILE = "index.json"
+_EXAM_LRU_SIZE = 8
+
+_lock = threading.Lock()
+_index: Optional[Dict[str, Dict]] = None
+_exams: "OrderedDict[str, Dict]" = OrderedDict()
+_hashes: Dict[str, Tuple[Tuple[int, int], str]] = {}
+_fts: Optional[sqlite3.Connection] = None
+_fts_signature: Optional[Tuple] = None
+
+
+def slugify(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+# ==================== INDEX ====================
+def _load_index() -> Dict[str, Dict]:
+    global _index
+    with _lock:
+        if _index is None:
+            path = os.path.join(STORE_DIR, INDEX_FILE)
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as fh:
+                    _index = json.load(fh)["exams"]
+            else:
+                _index = {}
+        return _index
+
+
+def list_exams() -> List[str]:
+    return list(_load_index())
+
+
+def has_exam(name: str) -> bool:
+    return name in _load_index()
+
+
+def exam_info(name: str) -> Optional[Dict]:
+    """Index entry (tagline, accent, sections with counts) without the questions."""
+    return _load_index().get(name)
+
+
+def _data_path(name: str) -> str:
+    return os.path.join(STORE_DIR, _load_index()[name]["file"])
+
+
+def content_hash(name: str) -> str:
+    """SHA-256 of the exam's data file; cached until the file changes."""
+    path = _data_path(name)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _lock:
+        cached = _hashes.get(name)
+        if cached and cached[0] == stamp:
+            return cached[1]
+    with open(path, "rb") as fh:
+        digest = hashlib.sha256(fh.read()).hexdigest()
+    with _lock:
+        _hashes[name] = (stamp, digest)
+    return digest
+
+
+# ==================== QUESTIONS ====================
+def _read_lines(name: str) -> Iterator[Dict]:
+    with open(_data_path(name), encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
+
+
+def get_exam(name: str) -> Optional[Dict]:
+    """Full exam in the legacy PYQ_BANK shape, or None if unknown."""
+    info = exam_info(name)
+    if info is None:
+        return None
+    digest = content_hash(name)
+    with _lock:
+        cached = _exams.get(name)
+        if cached is not None and cached["_hash"] == digest:
+            _exams.move_to_end(name)
+            return cached["exam"]
+
+    sections: "OrderedDict[str, Dict]" = OrderedDict(
+        (sec["title"], {"title": sec["title"], "icon": sec.get("icon", ""), "questions": []})
+        for sec in info["sections"])
+    for q in _read_lines(name):
+        title = q.pop("section")
+        sec = sections.get(title)
+        if sec is None:
+            sec = sections[title] = {"title": title, "icon": "", "questions": []}
+        sec["questions"].append(q)
+    exam = {"tagline": info.get("tagline", ""), "accent": info.get("accent", "#0047FF"),
+            "sections": [s for s in sections.values() if s["questions"]]}
+
+    with _lock:
+        _exams[name] = {"_hash": digest, "exam": exam}
+        _exams.move_to_end(name)
+        while len(_exams) > _EXAM_LRU_SIZE:
+            _exams.popitem(last=False)
+    return exam
+
+
+def iter_questions(exam: Optional[str] = None, section: Optional[str] = None,
+                   difficulty: Optional[str] = None,
+                   topic: Optional[str] = None) -> Iterator[Dict]:
+    """
+    Stream questions (each tagged with "exam" and "section") matching every
+    filter given. Filters compare case-insensitively; questions without a
+    "difficulty" never match a difficulty filter.
+    """
+    names = [exam] if exam else list_exams()
+    for name in names:
+        if not has_exam(name):
+            continue
+        for q in _read_lines(name):
+            if section and q["section"].lower() != section.lower():
+                continue
+            if difficulty and str(q.get("difficulty", "")).lower() != difficulty.lower():
+                continue
+            if topic and str(q.get("topic", q["section"])).lower() != topic.lower():
+                continue
+            q["exam"] = name
+            yield q
+
+
+# ==================== FULL-TEXT SEARCH ====================
+def _signature() -> Tuple:
+    sig = []
+    for name in list_exams():
+        st = os.stat(_data_path(name))
+        sig.append((name, st.st_mtime_ns, st.st_size))
+    return tuple(sig)
+
+
+def _search_db() -> sqlite3.Connection:
+    global _fts, _fts_signature
+    sig = _signature()
+    with _lock:
+        if _fts is not None and _fts_signature == sig:
+            return _fts
+    db = sqlite3.connect(":memory:", check_same_thread=False)
+    db.execute("CREATE VIRTUAL TABLE questions USING fts5("
+               "q, explanation, exam UNINDEXED, section UNINDEXED, body UNINDEXED, "
+               "tokenize='porter unicode61')")
+    db.executemany(
+        "INSERT INTO questions (q, explanation, exam, section, body) VALUES (?, ?, ?, ?, ?)",
+        ((q.get("q", ""), q.get("explanation", ""), q["exam"], q["section"],
+          json.dumps(q, ensure_ascii=False)) for q in iter_questions()))
+    db.commit()
+    with _lock:
+        _fts, _fts_signature = db, sig
+    return db
+
+
+def fts_query(text: str) -> str:
+    """FTS5 MATCH string requiring every word of `text` as a prefix."""
+    # Quote each word so user input can't inject FTS operators
+    words = re.findall(r"\w+", text)
+    return " ".join(f'"{w}"*' for w in words)
+
+
+def search(query: str, exam: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+    """Questions whose text or explanation match every word of `query`, best first."""
+    match = fts_query(query)
+    if not match:
+        return []
+    db = _search_db()
+    sql = "SELECT body FROM questions WHERE questions MATCH ?"
+    args: List[Any] = [match]
+    if exam:
+        sql += " AND exam = ?"
+        args.append(exam)
+    sql += " ORDER BY bm25(questions) LIMIT ?"
+    args.append(limit)
+    with _lock:
+        rows = db.execute(sql, args).fetchall()
+    return [json.loads(body) for (body,) in rows]
+
+
+# ==================== WRITING ====================
+def write_exam(name: str, exam: Dict, root: str = STORE_DIR):
+    """Write one exam in PYQ_BANK shape to <root>/<slug>.jsonl and refresh the index."""
+    os.makedirs(root, exist_ok=True)
+    fname = f"{slugify(name)}.jsonl"
+    with open(os.path.join(root, fname), "w", encoding="utf-8") as fh:
+        for sec in exam["sections"]:
+            for q in sec["questions"]:
+                fh.write(json.dumps(dict(section=sec["title"], **q), ensure_ascii=False) + "\n")
+    path = os.path.join(root, INDEX_FILE)
+    index = {}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as fh:
+            index = json.load(fh)["exams"]
+    index[name] = {"tagline": exam.get("tagline", ""), "accent": exam.get("accent", ""),
+                   "file": fname,
+                   "sections": [{"title": s["title"], "icon": s.get("icon", ""),
+                                 "count": len(s["questions"])} for s in exam["sections"]]}
+    _write_index(index, root)
+
+
+def reindex(root: str = STORE_DIR):
+    """Recount sections from the JSONL files, keeping each exam's tagline / accent / icons."""
+    path = os.path.join(root, INDEX_FILE)
+    with open(path, encoding="utf-8") as fh:
+        index = json.load(fh)["exams"]
+    for info in index.values():
+        icons = {s["title"]: s.get("icon", "") for s in info["sections"]}
+        counts: "OrderedDict[str, int]" = OrderedDict()
+        with open(os.path.join(root, info["file"]), encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip():
+                    title = json.loads(line)["section"]
+                    counts[title] = counts.get(title, 0) + 1
+        info["sections"] = [{"title": t, "icon": icons.get(t, ""), "count": n}
+                            for t, n in counts.items()]
+    _write_index(index, root)
+
+
+def _write_index(index: Dict[str, Dict], root: str):
+    global _index
+    with open(os.path.join(root, INDEX_FILE), "w", encoding="utf-8") as fh:
+        json.dump({"exams": index}, fh, ensure_ascii=False, indent=2)
+        fh.write("\n")
+    with _lock:
+        _index = None
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["reindex"]:
+        reindex()
+        print(f"Reindexed {STORE_DIR}")
+    else:
+        print("Usage: python pyq_store.py reindex")
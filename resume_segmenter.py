@@ -0,0 +1,270 @@
+"""
+resume_segmenter.py — JobLess AI Resume Segmentation Layer
+==========================================================
+Turns a résumé PDF into a compact, sectioned text before it is prompted.
+
+Plain ``page.get_text()`` output carries a lot the model doesn't need:
+running headers / footers, page numbers, the contact block repeated on
+every page, lines wrapped mid-sentence and stray whitespace. This module
+reads PyMuPDF's block / line / span data instead and:
+
+  - keeps only the first of the lines repeated in the top / bottom margin
+    of several pages, and drops bare page numbers
+  - drops a multi-line block repeated verbatim from an earlier page (a
+    contact block reprinted under the header, say); single lines such as a
+    job title held twice are kept
+  - rejoins lines wrapped inside one text block; bullets become "- "
+  - splits the rest into sections on headings — a known title
+    (Experience, Skills, Education, Projects, …) or, failing that, a short
+    line set larger than the body text / in capitals
+  - strips e-mail addresses, phone numbers and links from the profile
+    block (they carry no career signal)
+
+segment_document() returns the sections; to_prompt() renders them as
+``[EXPERIENCE]``-tagged text. Nothing in this module imports streamlit.
+"""
+
+import re
+from collections import Counter, OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import fitz  # PyMuPDF
+
+# Canonical section → headings that introduce it (compared after normalising)
+SECTION_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "summary": ("summary", "profile", "professional summary", "career summary",
+                "objective", "career objective", "about me", "about"),
+    "experience": ("experience", "work experience", "professional experience",
+                   "employment", "employment history", "work history",
+                   "internships", "internship", "internship experience"),
+    "skills": ("skills", "technical skills", "key skills", "core skills",
+               "core competencies", "competencies", "technologies", "tech stack",
+               "skills and tools", "tools and technologies"),
+    "education": ("education", "academic background", "academics",
+                  "educational qualifications", "qualifications", "academic qualifications"),
+    "projects": ("projects", "personal projects", "academic projects", "key projects",
+                 "selected projects"),
+    "certifications": ("certifications", "certificates", "licenses and certifications",
+                       "courses", "training"),
+    "achievements": ("achievements", "awards", "honors", "honours", "accomplishments",
+                     "awards and achievements"),
+}
+_HEADINGS = {alias: key for key, aliases in SECTION_ALIASES.items() for alias in aliases}
+
+PROFILE = "profile"      # whatever precedes the first heading
+MARGIN = 0.07            # top / bottom fraction of a page treated as header / footer
+MAX_HEADING_WORDS = 4
+
+_BULLET_RE = re.compile(r"^\s*[•●▪■◦‣∙·\-–—*➢➤►✓✔]\s*")
+_PAGE_NO_RE = re.compile(r"^(page\s*)?\d+(\s*(/|of)\s*\d+)?$", re.I)
+_CONTACT_RE = re.compile(
+    r"[\w.+-]+@[\w-]+\.[\w.-]+"                            # e-mail
+    r"|(?:https?://|www\.)\S+"                             # links
+    r"|\b(?:linkedin|github)\.com/\S*"
+    r"|\+?\d[\d\s().-]{8,}\d",                             # phone numbers
+    re.I)
+_SEPARATORS_RE = re.compile(r"^[\s|·•,;/:-]+|[\s|·•,;/:-]+$")
+
+
+def _norm(text: str) -> str:
+    return re.sub(r"\s+", " ", re.sub(r"[^\w\s&]", " ", text.lower())).strip()
+
+
+def _heading_key(text: str) -> Optional[str]:
+    norm = _norm(text).replace("&", "and")
+    if not norm or len(norm.split()) > MAX_HEADING_WORDS:
+        return None
+    return _HEADINGS.get(norm)
+
+
+# ==================== LINE EXTRACTION ====================
+def _page_lines(page) -> Iterator[Dict]:
+    """One dict per visual line: text, size, bold, y (0-1 down the page), block."""
+    height = page.rect.height or 1.0
+    data = page.get_text("dict", flags=fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES,
+                         sort=True)
+    for b, block in enumerate(data.get("blocks", [])):
+        for line in block.get("lines", []):
+            spans = [s for s in line.get("spans", []) if s.get("text", "").strip()]
+            if not spans:
+                continue
+            text = re.sub(r"\s+", " ", "".join(s["text"] for s in spans)).strip()
+            yield {
+                "text": text,
+                "size": round(max(s["size"] for s in spans), 1),
+                "bold": any(s["flags"] & 16 or "bold" in s.get("font", "").lower()
+                            for s in spans),
+                "y": line["bbox"][1] / height,
+                "block": b,
+            }
+
+
+def _body_size(lines: List[Dict]) -> float:
+    weights: Counter = Counter()
+    for line in lines:
+        weights[line["size"]] += len(line["text"])
+    return weights.most_common(1)[0][0] if weights else 0.0
+
+
+def _repeated_blocks(pages: List[List[Dict]]) -> set:
+    """(page, block) of multi-line blocks that repeat one from an earlier page verbatim."""
+    seen, repeated = set(), set()
+    for index, lines in enumerate(pages):
+        blocks: "OrderedDict[int, List[str]]" = OrderedDict()
+        for line in lines:
+            blocks.setdefault(line["block"], []).append(_norm(line["text"]))
+        shapes = {block: tuple(texts) for block, texts in blocks.items() if len(texts) >= 2}
+        repeated.update((index, block) for block, shape in shapes.items() if shape in seen)
+        seen.update(shapes.values())
+    return repeated
+
+
+def _running_lines(pages: List[List[Dict]]) -> set:
+    """Normalised text of lines sitting in a page margin on two or more pages."""
+    if len(pages) < 2:
+        return set()
+    seen: Counter = Counter()
+    for lines in pages:
+        seen.update({re.sub(r"\d+", "#", _norm(line["text"])) for line in lines
+                     if line["y"] < MARGIN or line["y"] > 1 - MARGIN})
+    return {text for text, n in seen.items() if n >= 2}
+
+
+# ==================== SEGMENTATION ====================
+def segment_document(doc, max_pages: int, max_chars: int) -> Dict:
+    """
+    Sections of an open PyMuPDF document:
+    {sections: {key: [line, …]}, titles: {key: heading}, page_count,
+     pages_read, raw_chars, truncated}.
+
+    Pages are read in order and reading stops once `max_pages` are done or
+    twice `max_chars` of raw text has been collected (compaction rarely
+    removes more than half).
+    """
+    pages: List[List[Dict]] = []
+    raw_chars = 0
+    for index, page in enumerate(doc):
+        if index >= max_pages or raw_chars > 2 * max_chars:
+            break
+        lines = []
+        for line in _page_lines(page):
+            raw_chars += len(line["text"]) + 1
+            line["page"] = index
+            lines.append(line)
+        pages.append(lines)
+
+    # Running headers / footers keep their first occurrence only (it is often
+    # the candidate's name), page numbers go entirely
+    running, first_seen = _running_lines(pages), set()
+    repeated = _repeated_blocks(pages)
+    lines = []
+    for line in (ln for page in pages for ln in page):
+        if (line["page"], line["block"]) in repeated or _PAGE_NO_RE.match(line["text"]):
+            continue
+        shape = re.sub(r"\d+", "#", _norm(line["text"]))
+        if shape in running:
+            if shape in first_seen:
+                continue
+            first_seen.add(shape)
+        lines.append(line)
+    body = _body_size(lines)
+
+    sections: "OrderedDict[str, List[str]]" = OrderedDict()
+    titles: Dict[str, str] = {}
+    current = PROFILE
+    prev: Optional[Dict] = None
+    for line in lines:
+        text = line["text"]
+        key = _heading_key(text)
+        title = key
+        # Layout-only headings count once a known section has started; above
+        # that the large, bold lines are the candidate's name and title
+        if key is None and current != PROFILE and _looks_like_heading(line, body):
+            key = _norm(text).replace(" ", "_")
+            title = text.strip(" :")
+        if key is not None:
+            current = key
+            titles.setdefault(key, title)
+            sections.setdefault(key, [])
+            prev = None
+            continue
+
+        out = sections.setdefault(current, [])
+        bullet = _BULLET_RE.match(text)
+        if bullet:
+            text = text[bullet.end():].strip()
+            if not text:
+                # A lone bullet glyph: the item's text is on the next line
+                out.append("- ")
+                prev = None
+                continue
+            out.append("- " + text)
+        elif out and out[-1] == "- ":
+            out[-1] += text
+        elif (prev is not None and out and prev["page"] == line["page"]
+              and (text[0].islower()
+                   or (prev["block"] == line["block"] and out[-1].endswith((",", "-", "&", "/"))))):
+            # The sentence carries on: a wrapped line
+            out[-1] += " " + text
+        else:
+            out.append(text)
+        prev = line
+
+    if PROFILE in sections:
+        sections[PROFILE] = _strip_contact(sections[PROFILE])
+    for key in [k for k, v in sections.items() if not v or v == ["- "]]:
+        del sections[key]
+
+    return {
+        "sections": sections,
+        "titles": titles,
+        "page_count": len(doc),
+        "pages_read": len(pages),
+        "raw_chars": raw_chars,
+        "truncated": len(pages) < len(doc),
+    }
+
+
+def _looks_like_heading(line: Dict, body_size: float) -> bool:
+    """A short standalone line set larger than body text, or bold in capitals."""
+    text = line["text"]
+    words = text.split()
+    if not words or len(words) > MAX_HEADING_WORDS or text.endswith((".", ",")):
+        return False
+    if _BULLET_RE.match(text) or any(ch.isdigit() for ch in text):
+        return False
+    letters = [ch for ch in text if ch.isalpha()]
+    if len(letters) < 3:
+        return False
+    larger = body_size and line["size"] >= body_size + 1.5
+    caps = all(ch.isupper() for ch in letters) and (line["bold"] or line["size"] > body_size)
+    return bool(larger or caps)
+
+
+def _strip_contact(lines: List[str]) -> List[str]:
+    out = []
+    for line in lines:
+        line = _SEPARATORS_RE.sub("", _CONTACT_RE.sub(" ", line))
+        line = re.sub(r"(\s*[|·•]\s*)+", " | ", re.sub(r"\s{2,}", " ", line)).strip(" |")
+        if line:
+            out.append(line)
+    return out
+
+
+# ==================== RENDERING ====================
+def to_prompt(segmented: Dict, max_chars: Optional[int] = None) -> str:
+    """``[SECTION]``-tagged text, cut at `max_chars` on a line boundary where possible."""
+    parts = []
+    for key, lines in segmented["sections"].items():
+        title = segmented["titles"].get(key, key).upper()
+        body = "\n".join(lines)
+        parts.append(body if key == PROFILE else f"[{title}]\n{body}")
+    text = "\n\n".join(parts).strip()
+    if max_chars is not None and len(text) > max_chars:
+        cut = text.rfind("\n", 0, max_chars)
+        if cut < max_chars * 0.8:
+            cut = text.rfind(" ", 0, max_chars)
+        text = text[:cut if cut > 0 else max_chars].rstrip()
+        # Don't leave a section tag with nothing under it
+        text = re.sub(r"\n*\[[^\]\n]+\]$", "", text).rstrip()
+    return text
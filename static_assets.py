@@ -0,0 +1,244 @@
+"""
+static_assets.py — JobLess AI Static Asset Layer
+================================================
+Serves the app chrome (stylesheet, header, background) as files instead
+of re-sending it over the websocket on every rerun.
+
+The files in static/ are registered as a Streamlit component, so they are
+served by the component file handler with their real content types
+(``server.enableStaticServing`` would force text/plain on CSS / HTML).
+Pages then only reference them:
+
+  - stylesheet(name) → one ``<link rel="stylesheet">`` element
+  - frame(name, h)   → a components.iframe pointing at the file
+
+URLs carry ``?v=<sha256 prefix>`` of the file, so a changed asset is
+fetched fresh while an unchanged one is reused from the browser cache and
+left untouched by the frontend on reruns (the element is identical).
+
+Set JOBLESS_INLINE_ASSETS=1 to embed the file contents inline instead —
+e.g. behind a proxy that doesn't forward /component/ paths.
+
+Lottie animations come from lottie() — memory first, then the last copy a
+background thread fetched (JOBLESS_LOTTIE_CACHE), then a copy vendored into
+static/lottie/ if there is one — so a rerun never waits on lottie.host.
+With neither, lottie() returns None (no animation) until the first fetch
+lands. The thread refreshes every JOBLESS_LOTTIE_REFRESH seconds (default a
+day; 0 turns it off). Run ``python static_assets.py vendor`` to fetch every
+animation in LOTTIE_URLS into static/lottie/.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+INLINE = os.getenv("JOBLESS_INLINE_ASSETS", "").lower() in ("1", "true", "yes")
+
+_lock = threading.Lock()
+_component = None
+# name -> ((mtime_ns, size), text, version)
+_files: Dict[str, Tuple[Tuple[int, int], str, str]] = {}
+
+
+def _component_name() -> str:
+    global _component
+    with _lock:
+        if _component is None:
+            _component = components.declare_component("jobless_static", path=STATIC_DIR)
+        return _component.name
+
+
+def _load(name: str) -> Tuple[str, str]:
+    path = os.path.join(STATIC_DIR, name)
+    st_ = os.stat(path)
+    stamp = (st_.st_mtime_ns, st_.st_size)
+    with _lock:
+        cached = _files.get(name)
+        if cached and cached[0] == stamp:
+            return cached[1], cached[2]
+    with open(path, encoding="utf-8") as fh:
+        text = fh.read()
+    version = hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+    with _lock:
+        _files[name] = (stamp, text, version)
+    return text, version
+
+
+def read(name: str) -> str:
+    return _load(name)[0]
+
+
+def version(name: str) -> str:
+    return _load(name)[1]
+
+
+def url(name: str) -> str:
+    """Page-relative, hash-versioned URL of a file in static/."""
+    return f"component/{_component_name()}/{name}?v={version(name)}"
+
+
+def stylesheet(name: str):
+    if INLINE:
+        st.markdown(f"<style>{read(name)}</style>", unsafe_allow_html=True)
+    else:
+        st.markdown(f'<link rel="stylesheet" href="{url(name)}">', unsafe_allow_html=True)
+
+
+def frame(name: str, height: int, scrolling: bool = False):
+    if INLINE:
+        components.html(read(name), height=height, scrolling=scrolling)
+    else:
+        components.iframe(url(name), height=height, scrolling=scrolling)
+
+
+# ==================== LOTTIE ====================
+LOTTIE_DIR = os.path.join(STATIC_DIR, "lottie")
+LOTTIE_CACHE_DIR = os.getenv("JOBLESS_LOTTIE_CACHE") or os.path.join(
+    tempfile.gettempdir(), "jobless_lottie")
+LOTTIE_REFRESH = float(os.getenv("JOBLESS_LOTTIE_REFRESH", "86400"))
+LOTTIE_RETRY = 300.0     # after a failed fetch
+LOTTIE_URLS = {
+    "sidebar_brain": "https://lottie.host/880ffc06-b30a-406d-a60d-7734e5659837/92k6e3z3tK.json",
+}
+
+# name -> {"url", "data", "source", "fetched", "next"}
+_lottie: Dict[str, Dict] = {}
+_lottie_wake = threading.Event()
+_refresher: Optional[threading.Thread] = None
+
+
+def _read_json(path: str) -> Optional[Dict]:
+    try:
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) and "layers" in data else None
+
+
+def lottie(name: str, url: Optional[str] = None) -> Optional[Dict]:
+    """
+    Animation JSON for `name` without any network I/O on the calling thread.
+    With `url` (default: LOTTIE_URLS[name]), the background refresher keeps
+    the cached copy current.
+    """
+    url = url or LOTTIE_URLS.get(name)
+    with _lock:
+        entry = _lottie.get(name)
+        if entry is not None:
+            return entry["data"]
+
+    cached = os.path.join(LOTTIE_CACHE_DIR, f"{name}.json")
+    data, source, fetched = _read_json(cached), "cache", 0.0
+    if data is not None:
+        fetched = os.path.getmtime(cached)
+    else:
+        data = _read_json(os.path.join(LOTTIE_DIR, f"{name}.json"))
+        source = "bundled" if data is not None else "none"
+
+    with _lock:
+        entry = _lottie.setdefault(name, {"url": url, "data": data, "source": source,
+                                          "fetched": fetched,
+                                          "next": fetched + LOTTIE_REFRESH})
+    if url and LOTTIE_REFRESH > 0:
+        _start_refresher()
+    return entry["data"]
+
+
+def lottie_stats() -> Dict[str, Dict]:
+    now = time.time()
+    with _lock:
+        return {name: {"source": e["source"],
+                       "age_s": round(now - e["fetched"]) if e["fetched"] else None}
+                for name, e in _lottie.items()}
+
+
+def _start_refresher():
+    global _refresher
+    with _lock:
+        if _refresher is None:
+            _refresher = threading.Thread(target=_refresh_loop, name="jl-lottie", daemon=True)
+            _refresher.start()
+    _lottie_wake.set()
+
+
+def _refresh_loop():
+    while True:
+        _lottie_wake.clear()
+        now = time.time()
+        with _lock:
+            due = [(name, e["url"]) for name, e in _lottie.items()
+                   if e["url"] and e["next"] <= now]
+        for name, url in due:
+            _refresh(name, url)
+        with _lock:
+            upcoming = [e["next"] for e in _lottie.values() if e["url"]]
+        _lottie_wake.wait(timeout=max(1.0, min(upcoming, default=now + LOTTIE_REFRESH) - time.time()))
+
+
+def _fetch(url: str) -> Optional[Dict]:
+    import requests  # only ever needed off the script thread
+
+    try:
+        resp = requests.get(url, timeout=10)
+        data = resp.json() if resp.status_code == 200 else None
+    except (requests.RequestException, ValueError):
+        data = None
+    return data if isinstance(data, dict) and "layers" in data else None
+
+
+def _write_json(directory: str, name: str, data: Dict):
+    os.makedirs(directory, exist_ok=True)
+    tmp = os.path.join(directory, f".{name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(data, fh, separators=(",", ":"))
+    os.replace(tmp, os.path.join(directory, f"{name}.json"))
+
+
+def _refresh(name: str, url: str):
+    data = _fetch(url)
+    now = time.time()
+    if data is None:
+        # Keep serving what we have and try again shortly
+        with _lock:
+            _lottie[name]["next"] = now + min(LOTTIE_RETRY, LOTTIE_REFRESH)
+        return
+    try:
+        _write_json(LOTTIE_CACHE_DIR, name, data)
+    except OSError:
+        pass
+    with _lock:
+        _lottie[name].update(data=data, source="remote", fetched=now,
+                             next=now + LOTTIE_REFRESH)
+
+
+def vendor_lottie(names=None) -> Dict[str, bool]:
+    """Fetch animations from LOTTIE_URLS into LOTTIE_DIR; name -> whether it was written."""
+    done = {}
+    for name in names or LOTTIE_URLS:
+        data = _fetch(LOTTIE_URLS[name])
+        if data is not None:
+            _write_json(LOTTIE_DIR, name, data)
+        done[name] = data is not None
+    return done
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["vendor"]:
+        failed = [n for n, ok in vendor_lottie(sys.argv[2:]).items() if not ok]
+        for name in failed:
+            print(f"Could not fetch {name} from {LOTTIE_URLS[name]}")
+        if failed:
+            sys.exit(1)
+        print(f"Vendored into {LOTTIE_DIR}")
+    else:
+        print("Usage: python static_assets.py vendor [name ...]")
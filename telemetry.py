@@ -0,0 +1,294 @@
+"""
+telemetry.py — JobLess AI Telemetry Layer
+=========================================
+In-process latency / size / error metrics for AIHandler.
+
+  - Histogram   → fixed Prometheus-style buckets plus a bounded window of
+                  recent samples for p50 / p95 / p99.
+  - Telemetry   → thread-safe registry of labelled histograms and counters,
+                  exportable as Prometheus text or JSON lines.
+  - instrumented → decorator for AIHandler methods; tags every LLM call made
+                  underneath with the method name (via a ContextVar).
+
+Set JOBLESS_TELEMETRY_LOG to a file path to also append one JSON line per
+LLM call. Nothing in this module imports streamlit.
+"""
+
+import contextvars
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Seconds — tuned for LLM calls (sub-second cache hits up to minute-long PDFs)
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0, 120.0)
+# Characters — prompt / completion sizes
+SIZE_BUCKETS = (250, 1000, 2500, 5000, 10000, 20000, 40000, 80000)
+
+# Name of the AIHandler method currently running on this thread / context
+current_method: contextvars.ContextVar = contextvars.ContextVar(
+    "jobless_llm_method", default="unknown")
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "total", "count", "window")
+
+    def __init__(self, buckets: Tuple[float, ...], window: int = 1024):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)   # last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+        self.window: deque = deque(maxlen=window)
+
+    def observe(self, value: float):
+        for i, edge in enumerate(self.buckets):
+            if value <= edge:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += value
+        self.count += 1
+        self.window.append(value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.window:
+            return None
+        ordered = sorted(self.window)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+_LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _labels(**labels: Any) -> _LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Telemetry:
+    """Process-wide metric registry; every method is safe to call from any thread."""
+
+    def __init__(self, log_path: Optional[str] = None):
+        self._lock = threading.Lock()
+        self._hists: Dict[Tuple[str, _LabelKey], Histogram] = {}
+        self._counters: Dict[Tuple[str, _LabelKey], float] = {}
+        self._log_path = log_path
+
+    # ── Recording ─────────────────────────────────────────────────────────
+    def observe(self, name: str, value: float, buckets: Tuple[float, ...] = LATENCY_BUCKETS,
+                **labels: Any):
+        key = (name, _labels(**labels))
+        with self._lock:
+            hist = self._hists.get(key)
+            if hist is None:
+                hist = self._hists[key] = Histogram(buckets)
+            hist.observe(value)
+
+    def inc(self, name: str, amount: float = 1, **labels: Any):
+        key = (name, _labels(**labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def record_llm_call(self, *, provider: str, model: str, wall: float,
+                        ttft: Optional[float] = None, prompt_chars: int = 0,
+                        completion_chars: int = 0, error: Optional[str] = None,
+                        cached: bool = False):
+        """
+        One provider round-trip (or cache hit) made by _call_llm / _stream_llm.
+
+        Cache hits are counted but kept out of the latency histograms: their
+        zero wall time would otherwise make a model look fastest to the router
+        just because its answers were cached.
+        """
+        method = current_method.get()
+        labels = dict(method=method, provider=provider, model=model)
+        if not cached:
+            self.observe("llm_call_seconds", wall, **labels)
+            if ttft is not None:
+                self.observe("llm_ttft_seconds", ttft, **labels)
+        self.observe("llm_prompt_chars", prompt_chars, SIZE_BUCKETS, **labels)
+        if not error:
+            self.observe("llm_completion_chars", completion_chars, SIZE_BUCKETS, **labels)
+        self.inc("llm_calls_total", cached=cached, outcome="error" if error else "ok",
+                 **labels)
+        if error:
+            self.inc("llm_errors_total", error=error, **labels)
+        if self._log_path:
+            self._append_log({
+                "ts": round(time.time(), 3), "method": method, "provider": provider,
+                "model": model, "wall": round(wall, 4),
+                "ttft": None if ttft is None else round(ttft, 4),
+                "prompt_chars": prompt_chars, "completion_chars": completion_chars,
+                "error": error, "cached": cached,
+            })
+
+    def _append_log(self, event: Dict[str, Any]):
+        try:
+            with self._lock, open(self._log_path, "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(event) + "\n")
+        except OSError:
+            pass
+
+    # ── Reading ───────────────────────────────────────────────────────────
+    def summary(self, name: str = "llm_call_seconds", by: str = "method") -> List[Dict[str, Any]]:
+        """Rows of count / mean / p50 / p95 / p99 for histogram `name`, grouped by one label."""
+        groups: Dict[str, List[float]] = {}
+        with self._lock:
+            for (hname, labels), hist in self._hists.items():
+                if hname != name:
+                    continue
+                group = dict(labels).get(by, "")
+                groups.setdefault(group, []).extend(hist.window)
+        rows = []
+        for group, values in sorted(groups.items()):
+            values.sort()
+            n = len(values)
+
+            def q(p):
+                return round(values[min(n - 1, int(p * n))], 3)
+            rows.append({by: group, "count": n, "mean": round(sum(values) / n, 3),
+                         "p50": q(0.50), "p95": q(0.95), "p99": q(0.99)})
+        return rows
+
+    def samples(self, name: str, **match: Any) -> List[float]:
+        """Recent samples of histogram `name` across every series whose labels include `match`."""
+        want = {k: str(v) for k, v in match.items()}
+        values: List[float] = []
+        with self._lock:
+            for (hname, labels), hist in self._hists.items():
+                if hname == name and want.items() <= dict(labels).items():
+                    values.extend(hist.window)
+        return values
+
+    def counter_total(self, name: str, **match: Any) -> float:
+        want = {k: str(v) for k, v in match.items()}
+        with self._lock:
+            return sum(value for (cname, labels), value in self._counters.items()
+                       if cname == name and want.items() <= dict(labels).items())
+
+    def record_parse(self, *, model: str, ok: bool):
+        """Outcome of parsing one json_mode completion (feeds the model router)."""
+        self.inc("json_parse_total", method=current_method.get(), model=model,
+                 outcome="ok" if ok else "error")
+
+    def counters(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(labels, metric=name, value=value)
+                    for (name, labels), value in sorted(self._counters.items())]
+
+    def to_prometheus(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            hists = sorted(self._hists.items())
+            counters = sorted(self._counters.items())
+        seen = set()
+        for (name, labels), hist in hists:
+            metric = f"jobless_{name}"
+            if metric not in seen:
+                lines.append(f"# TYPE {metric} histogram")
+                seen.add(metric)
+            cumulative = 0
+            for edge, count in zip(list(hist.buckets) + ["+Inf"], hist.counts):
+                cumulative += count
+                lines.append(f"{metric}_bucket{_fmt_labels(labels + (('le', str(edge)),))} {cumulative}")
+            lines.append(f"{metric}_sum{_fmt_labels(labels)} {hist.total:.6f}")
+            lines.append(f"{metric}_count{_fmt_labels(labels)} {hist.count}")
+        for (name, labels), value in counters:
+            metric = f"jobless_{name}"
+            if metric not in seen:
+                lines.append(f"# TYPE {metric} counter")
+                seen.add(metric)
+            lines.append(f"{metric}{_fmt_labels(labels)} {value:g}")
+        return "\n".join(lines) + "\n"
+
+    def to_jsonl(self) -> str:
+        out = []
+        with self._lock:
+            for (name, labels), hist in sorted(self._hists.items()):
+                out.append(json.dumps({
+                    "metric": name, "labels": dict(labels), "count": hist.count,
+                    "sum": round(hist.total, 6), "p50": hist.quantile(0.50),
+                    "p95": hist.quantile(0.95), "p99": hist.quantile(0.99),
+                }))
+            for (name, labels), value in sorted(self._counters.items()):
+                out.append(json.dumps({"metric": name, "labels": dict(labels), "value": value}))
+        return "\n".join(out) + ("\n" if out else "")
+
+    def reset(self):
+        with self._lock:
+            self._hists.clear()
+            self._counters.clear()
+
+
+def _fmt_labels(labels: _LabelKey) -> str:
+    if not labels:
+        return ""
+    body = ",".join('{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"'))
+                    for k, v in labels)
+    return "{" + body + "}"
+
+
+TELEMETRY = Telemetry(log_path=os.getenv("JOBLESS_TELEMETRY_LOG") or None)
+
+
+# ==================== INSTRUMENTATION ====================
+def instrumented(fn: Callable) -> Callable:
+    """
+    Time an AIHandler method end to end and tag LLM calls beneath it.
+
+    Records `method_seconds{method, outcome}`. Generator methods (streams)
+    also record `method_ttft_seconds`, measured to the first yielded chunk.
+    The methods swallow their own exceptions into st.error, so a None / "⚠️"
+    result is counted as outcome="empty" rather than "error".
+    """
+    name = fn.__name__
+
+    if inspect.isgeneratorfunction(fn):
+        @functools.wraps(fn)
+        def stream_wrapper(*args, **kwargs) -> Iterator[Any]:
+            token = current_method.set(name)
+            start = time.perf_counter()
+            first = True
+            outcome = "ok"
+            try:
+                for chunk in fn(*args, **kwargs):
+                    if first:
+                        TELEMETRY.observe("method_ttft_seconds",
+                                          time.perf_counter() - start, method=name)
+                        first = False
+                    yield chunk
+            except Exception:
+                outcome = "error"
+                raise
+            finally:
+                TELEMETRY.observe("method_seconds", time.perf_counter() - start,
+                                  method=name, outcome=outcome)
+                try:
+                    current_method.reset(token)
+                except ValueError:
+                    # Generator finalised from another context (e.g. by the GC)
+                    pass
+        return stream_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        token = current_method.set(name)
+        start = time.perf_counter()
+        outcome = "ok"
+        try:
+            result = fn(*args, **kwargs)
+            if result is None or (isinstance(result, str) and result.startswith("⚠️")):
+                outcome = "empty"
+            return result
+        except Exception:
+            outcome = "error"
+            raise
+        finally:
+            TELEMETRY.observe("method_seconds", time.perf_counter() - start,
+                              method=name, outcome=outcome)
+            current_method.reset(token)
+    return wrapper
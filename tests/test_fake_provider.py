@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from fake_provider import FakeProvider, FakeProviderError, detect_task, record_fixture
+
+PYQ_PROMPT = 'Return JSON with "section" entries. Total Questions: 6'
+
+
+def test_same_prompt_and_seed_give_the_same_answer():
+    a = FakeProvider(realtime=False).complete(PYQ_PROMPT, "fake-large")
+    b = FakeProvider(realtime=False).complete(PYQ_PROMPT, "fake-large")
+    assert a == b
+    assert a != FakeProvider(realtime=False, seed=1).complete(PYQ_PROMPT, "fake-large")
+
+
+def test_pyq_questions_have_lettered_options():
+    assert detect_task(PYQ_PROMPT) == "generate_pyq_questions"
+    sections = json.loads(FakeProvider(realtime=False).complete(PYQ_PROMPT, "fake-large"))
+    assert len(sections) == 3
+    for section in sections:
+        for q in section["questions"]:
+            assert [opt[:2] for opt in q["options"]] == ["A)", "B)", "C)", "D)"]
+            assert q["answer"] in q["options"]
+
+
+def test_stream_reassembles_to_the_completion():
+    fake = FakeProvider(realtime=False)
+    chunks = list(fake.stream(PYQ_PROMPT, "fake-fast", chunk_chars=7))
+    assert all(len(c) <= 7 for c in chunks)
+    assert "".join(chunks) == fake.complete(PYQ_PROMPT, "fake-fast")
+    assert fake.stats() == {"calls": 2}
+
+
+def test_fault_injection():
+    with pytest.raises(FakeProviderError) as err:
+        FakeProvider(realtime=False, error_rate=1.0).complete(PYQ_PROMPT, "fake-large")
+    assert err.value.status_code == 429 and err.value.headers == {"retry-after": "1"}
+    fenced = FakeProvider(realtime=False, fence_rate=1.0).complete(PYQ_PROMPT, "fake-large")
+    assert fenced.startswith("```json\n") and fenced.endswith("\n```")
+
+
+def test_recorded_fixtures_are_replayed(tmp_path):
+    record_fixture(str(tmp_path), "generate_pyq_questions", '[{"section": "recorded"}]')
+    fake = FakeProvider(realtime=False, fixtures_dir=str(tmp_path))
+    assert fake.complete(PYQ_PROMPT, "fake-large") == '[{"section": "recorded"}]'
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.setenv("JOBLESS_FAKE_TTFT_MS", "5")
+    monkeypatch.setenv("JOBLESS_FAKE_SEED", "7")
+    fake = FakeProvider.from_env()
+    assert fake.ttft_ms == 5.0 and fake.seed == 7 and fake.error_rate == 0.0
@@ -0,0 +1,13 @@
+import pytest
+
+pytest.importorskip("streamlit", minversion="1.37")
+pytest.importorskip("google.generativeai")
+
+import jobless_ai_public as jp  # noqa: E402
+
+
+def test_gemini_model_builds_and_pins_its_transport_client():
+    # No request is made: building the model and its gRPC client is local
+    model = jp.AIHandler._gemini_model("test-key-not-real", "gemini-pro")
+    assert model._client is not None
+    assert jp.AIHandler._gemini_model("test-key-not-real", "gemini-pro") is model
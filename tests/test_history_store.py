@@ -0,0 +1,61 @@
+from history_store import HistoryStore
+
+
+def _analysis(score=80, title="Data Analyst", skills=("SQL", "Python")):
+    return {"careers": [{"title": title, "match_score": score}],
+            "current_skills": list(skills), "profile_summary": f"{title} profile"}
+
+
+def test_add_coerces_loose_llm_output():
+    store = HistoryStore()
+    analysis = {
+        "careers": [{"title": "ML Engineer", "match_score": "85%"},
+                    {"title": None, "match_score": None}, "not a career"],
+        "current_skills": ["Python", 3, None, {"name": "SQL"}],
+        "profile_summary": None,
+    }
+    record_id = store.add("u1", analysis, {"career_stage": None, "tags": {"a"}})
+    row = store.page("u1")[0]
+    assert row["top_score"] == 85
+    assert row["titles"] == "ML Engineer"
+    assert row["summary"] == "Analysis"
+    assert store.get("u1", record_id)["analysis"]["current_skills"][0] == "Python"
+
+
+def test_search_sort_and_paging():
+    store = HistoryStore()
+    store.add("u1", _analysis(60, "Data Analyst", ["SQL"]), {})
+    store.add("u1", _analysis(90, "Backend Engineer", ["Python", "Go"]), {})
+    store.add("u2", _analysis(99, "Designer", ["Figma"]), {})
+    assert store.count("u1") == 2
+    assert [r["top_score"] for r in store.page("u1", sort="top_match")] == [90, 60]
+    assert [r["titles"] for r in store.page("u1", query="pyth")] == ["Backend Engineer"]
+    assert store.page("u1", offset=1, limit=1, sort="oldest")[0]["titles"] == "Backend Engineer"
+    assert store.count("u1", query='" OR 1 --') == 0
+
+
+def test_like_fallback_without_fts5(monkeypatch):
+    import history_store
+    monkeypatch.setattr(history_store, "_FTS_SCHEMA", ("CREATE VIRTUAL TABLE x USING no_such_module()",))
+    store = HistoryStore()
+    store.add("u1", _analysis(70, "QA_Engineer", ["Selenium"]), {})
+    store.add("u1", _analysis(50, "QA Lead", ["Jira"]), {})
+    assert store.stats()["fts"] is False
+    assert [r["titles"] for r in store.page("u1", query="selen")] == ["QA_Engineer"]
+    assert store.count("u1", query="QA_") == 1
+
+
+def test_database_is_opened_on_first_use(tmp_path):
+    path = tmp_path / "history.db"
+    store = HistoryStore(str(path))
+    assert not path.exists()
+    store.add("u1", _analysis(), {})
+    assert path.exists() and store.count("u1") == 1
+
+
+def test_retention_caps_records_per_user():
+    store = HistoryStore(max_per_user=2)
+    for score in (10, 20, 30):
+        store.add("u1", _analysis(score), {})
+    assert [r["top_score"] for r in store.page("u1")] == [30, 20]
+    assert store.delete("u1") == 2 and store.count("u1") == 0
@@ -0,0 +1,42 @@
+import interview_context as ic
+
+
+def _messages(n, words=30):
+    return [{"role": "assistant" if i % 2 == 0 else "user",
+             "content": f"turn {i} " + "detail " * words} for i in range(n)]
+
+
+def test_recent_window_is_sent_verbatim():
+    msgs = _messages(4)
+    text = ic.build_history(msgs, ic.new_state(), budget_tokens=10_000)
+    assert text == ic.format_turns(msgs)
+
+
+def test_fold_waits_for_a_full_batch_then_applies():
+    state = ic.new_state()
+    assert ic.fold_due(_messages(ic.RECENT_TURNS + ic.FOLD_BATCH - 1), state) == []
+    msgs = _messages(ic.RECENT_TURNS + ic.FOLD_BATCH)
+    due = ic.fold_due(msgs, state)
+    assert due == msgs[:ic.FOLD_BATCH]
+    ic.apply_fold(state, "- asked about SQL", upto=len(due))
+    assert state["upto"] == ic.FOLD_BATCH
+    text = ic.build_history(msgs, state, budget_tokens=10_000)
+    assert text.startswith("[EARLIER IN THIS INTERVIEW — NOTES]\n- asked about SQL")
+    assert "turn 0 " not in text
+    # A stale fold can't move the summary backwards
+    ic.apply_fold(state, "older notes", upto=1)
+    assert state["summary"] == "- asked about SQL"
+
+
+def test_history_stays_within_budget_and_keeps_the_last_exchange():
+    msgs = _messages(30, words=200)
+    state = ic.new_state()
+    state.update(summary="notes " * 400, upto=20)
+    text = ic.build_history(msgs, state, budget_tokens=800)
+    assert ic.estimate_tokens(text) <= 800 + 1
+    assert msgs[-1]["content"] in text
+
+
+def test_history_budget_respects_small_context_windows():
+    assert ic.history_budget("command", "x" * 12_000, 1000) == 300
+    assert ic.history_budget("llama-3.3-70b-versatile", "short", 1000) == ic.DEFAULT_HISTORY_BUDGET
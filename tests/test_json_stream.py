@@ -0,0 +1,69 @@
+import pytest
+
+from json_stream import IncrementalJSONParser, fenced_body
+
+
+def _feed(parser, text, size):
+    emitted = []
+    for i in range(0, len(text), size):
+        emitted.extend(parser.feed(text[i:i + size]))
+    return emitted
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1000])
+def test_top_level_array_items_arrive_as_they_close(size):
+    text = '[{"q": "Two, [three]?", "a": 1}, {"q": "say \\"hi\\"", "a": 2}]'
+    parser = IncrementalJSONParser()
+    emitted = _feed(parser, text, size)
+    assert emitted == [{"q": "Two, [three]?", "a": 1}, {"q": 'say "hi"', "a": 2}]
+    assert parser.result() == emitted
+
+
+def test_item_key_emits_only_the_named_array():
+    text = '{"summary": "x", "careers": [{"title": "A"}, {"title": "B"}], "skills": ["y"]}'
+    parser = IncrementalJSONParser(item_key="careers")
+    assert _feed(parser, text, 5) == [{"title": "A"}, {"title": "B"}]
+    assert parser.result()["skills"] == ["y"]
+
+
+def test_repairs_fences_prose_and_trailing_commas():
+    text = 'Sure! Here it is:\n```json\n[\n  {"a": 1,},\n  {"a": 2},\n]\n```\nHope that helps.'
+    parser = IncrementalJSONParser()
+    assert _feed(parser, text, 4) == [{"a": 1}, {"a": 2}]
+    assert parser.result() == [{"a": 1}, {"a": 2}]
+
+
+def test_truncated_stream_salvages_completed_items():
+    parser = IncrementalJSONParser(item_key="careers")
+    parser.feed('{"careers": [{"title": "A"}, {"title": "B", "match')
+    assert parser.result() == {"careers": [{"title": "A"}]}
+
+
+def test_nothing_parseable_raises():
+    parser = IncrementalJSONParser()
+    parser.feed("I can't help with that.")
+    with pytest.raises(ValueError):
+        parser.result()
+
+
+@pytest.mark.parametrize("size", [1, 4, 1000])
+def test_brackets_in_prose_before_a_fence_are_not_the_document(size):
+    text = 'Here are your [8] questions:\n```json\n[{"q": 1}, {"q": 2},]\n```'
+    parser = IncrementalJSONParser()
+    assert _feed(parser, text, size) == [{"q": 1}, {"q": 2}]
+    assert parser.result() == [{"q": 1}, {"q": 2}]
+    assert fenced_body(text).startswith('[{"q": 1}')
+
+
+def test_unusable_candidate_is_skipped_and_kept_as_last_resort():
+    parser = IncrementalJSONParser(item_key="careers")
+    parser.feed('Fill in {name} and return {"careers": [{"title": "A"}]}')
+    assert parser.result() == {"careers": [{"title": "A"}]}
+    alone = IncrementalJSONParser()
+    alone.feed("[8]")
+    assert alone.result() == [8]
+
+
+def test_fenced_body_leaves_documents_with_fences_in_strings_alone():
+    text = '[{"code": "```py\\nprint(1)\\n```"}]'
+    assert fenced_body(text) == text
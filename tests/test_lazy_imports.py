@@ -0,0 +1,29 @@
+import sys
+
+import lazy_imports
+from lazy_imports import LazyModule, available
+
+
+def test_proxy_imports_on_first_use():
+    sys.modules.pop("colorsys", None)
+    proxy = LazyModule("colorsys")
+    assert "colorsys" not in sys.modules and not proxy.loaded
+    assert proxy.rgb_to_hsv(1, 0, 0)[0] == 0
+    assert proxy.loaded
+
+
+def test_attribute_proxy_is_callable():
+    assert LazyModule("textwrap", "dedent")("  x\n  y") == "x\ny"
+
+
+def test_registry_does_not_grow_with_reruns():
+    for _ in range(50):
+        LazyModule("json")
+    assert list(lazy_imports._registry).count("json") == 1
+    assert lazy_imports.stats()["json"] is True
+
+
+def test_available_checks_without_importing():
+    assert available("json")
+    assert not available("no_such_module_for_jobless")
+    assert not available("no_such_parent.child")
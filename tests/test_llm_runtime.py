@@ -0,0 +1,131 @@
+import threading
+import time
+
+import pytest
+
+from llm_runtime import (ClientPool, RateLimiter, RateLimitTimeout, ResponseCache,
+                         SingleFlight, call_with_retry, process_shared, response_cache_key)
+
+
+class _HTTPError(Exception):
+    def __init__(self, status, headers=None):
+        super().__init__(status)
+        self.status_code = status
+        self.headers = headers or {}
+
+
+def _factory(closed, name):
+    return lambda: (name, lambda: closed.append(name))
+
+
+def test_client_pool_reuses_and_evicts_without_closing():
+    pool, closed = ClientPool(max_size=2), []
+    assert pool.get("groq", "k1", "", _factory(closed, "c1")) == "c1"
+    assert pool.get("groq", "k1", "", _factory(closed, "other")) == "c1"
+    pool.get("groq", "k2", "", _factory(closed, "c2"))
+    pool.get("groq", "k3", "", _factory(closed, "c3"))
+    # c1 was least recently used; it is dropped but may still be in use elsewhere
+    assert pool.stats() == {"hits": 1, "misses": 3, "evictions": 1, "size": 2}
+    assert closed == []
+    pool.clear()
+    assert sorted(closed) == ["c2", "c3"]
+
+
+def test_client_pool_idle_entries_are_dropped_not_closed():
+    pool, closed = ClientPool(idle_ttl=-1.0), []
+    pool.get("cohere", "k", "", _factory(closed, "c1"))
+    assert pool.get("cohere", "k", "", _factory(closed, "c2")) == "c2"
+    assert pool.stats()["evictions"] == 1 and closed == []
+
+
+def test_cache_key_ignores_whitespace_but_not_parameters():
+    base = response_cache_key("groq", "m", "Rate  this\n answer", 0.3, 500, True)
+    assert base == response_cache_key("groq", "m", "Rate this answer", 0.3, 500, True)
+    assert base != response_cache_key("groq", "m", "Rate this answer", 0.7, 500, True)
+    assert base != response_cache_key("gemini", "m", "Rate this answer", 0.3, 500, True)
+
+
+def test_response_cache_lru_and_ttl():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", "1", ttl=60)
+    cache.set("b", "2", ttl=60)
+    assert cache.get("a") == "1"            # a is now most recent
+    cache.set("c", "3", ttl=60)             # evicts b
+    assert cache.get("b") is None
+    cache.set("d", "4", ttl=0)              # not cached at all
+    assert cache.get("d") is None
+    assert cache.stats()["size"] == 2
+
+
+def test_response_cache_disk_tier_survives_a_new_instance(tmp_path):
+    path = str(tmp_path / "cache.db")
+    ResponseCache(db_path=path).set("k", "v", ttl=60)
+    fresh = ResponseCache(db_path=path)
+    assert fresh.get("k") == "v"
+    assert fresh.stats()["disk_hits"] == 1
+
+
+def test_rate_limiter_times_out_instead_of_queueing_forever():
+    limiter = RateLimiter({"groq": {"per_minute": 2}})
+    limiter.acquire("groq", "key")
+    limiter.acquire("groq", "key")
+    with pytest.raises(RateLimitTimeout):
+        limiter.acquire("groq", "key", timeout=0.1)
+    # Other keys and unlimited providers have their own budgets
+    limiter.acquire("groq", "other-key")
+    for _ in range(10):
+        limiter.acquire("gemini", "key")
+
+
+def test_call_with_retry_retries_retryable_statuses_only(monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda s: None)
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise _HTTPError(429, {"retry-after": "0"})
+        return "ok"
+
+    assert call_with_retry(flaky) == "ok"
+    assert len(calls) == 3
+
+    def bad_request():
+        calls.append(1)
+        raise _HTTPError(400)
+
+    calls.clear()
+    with pytest.raises(_HTTPError):
+        call_with_retry(bad_request)
+    assert len(calls) == 1
+
+
+def test_single_flight_shares_one_call():
+    flight = SingleFlight()
+    release = threading.Event()
+    runs, results = [], []
+
+    def slow():
+        runs.append(1)
+        release.wait(5)
+        return "value"
+
+    threads = [threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+               for _ in range(4)]
+    for t in threads:
+        t.start()
+    while flight.stats()["followers"] < 3:
+        time.sleep(0.01)
+    release.set()
+    for t in threads:
+        t.join()
+    assert len(runs) == 1
+    assert sorted(shared for _, shared in results) == [False, True, True, True]
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_process_shared_builds_once():
+    built = []
+    first = process_shared("test-process-shared", lambda: built.append(1) or object())
+    assert process_shared("test-process-shared", object) is first
+    assert built == [1]
@@ -0,0 +1,65 @@
+import pytest
+
+import model_router
+from telemetry import Telemetry, current_method
+
+GROQ = model_router.MODEL_COST_ORDER["groq"]
+
+
+@pytest.fixture
+def telemetry(monkeypatch):
+    fresh = Telemetry()
+    monkeypatch.setattr(model_router, "TELEMETRY", fresh)
+    return fresh
+
+
+def _observe(telemetry, model, seconds, n=model_router.MIN_SAMPLES, cached=False,
+             method="find_pyq_resources"):
+    token = current_method.set(method)
+    try:
+        for _ in range(n):
+            telemetry.record_llm_call(provider="groq", model=model, wall=seconds,
+                                      cached=cached)
+    finally:
+        current_method.reset(token)
+
+
+def test_never_routes_above_the_selected_model(telemetry):
+    picked = model_router.choose_model("groq", "generate_interview_questions",
+                                       "llama-3.1-8b-instant", GROQ)
+    assert picked == "llama-3.1-8b-instant"
+
+
+def test_downgrades_a_heavy_pick_to_the_cheapest_healthy_candidate(telemetry):
+    picked = model_router.choose_model("groq", "evaluate_interview_answer",
+                                       "llama-3.3-70b-versatile", GROQ)
+    assert picked == "llama-3.1-8b-instant"
+
+
+def test_unknown_selection_and_untiered_tasks_are_left_alone(telemetry):
+    assert model_router.choose_model("groq", "evaluate_interview_answer",
+                                     "some-new-model", GROQ) == "some-new-model"
+    assert model_router.choose_model("groq", "get_career_advice",
+                                     "llama-3.3-70b-versatile", GROQ) == "llama-3.3-70b-versatile"
+
+
+def test_slow_candidates_are_skipped(telemetry):
+    _observe(telemetry, "llama-3.1-8b-instant", 30.0)
+    picked = model_router.choose_model("groq", "find_pyq_resources",
+                                       "llama-3.3-70b-versatile", GROQ)
+    assert picked == "gemma2-9b-it"
+
+
+def test_cache_hits_do_not_count_as_latency_samples(telemetry):
+    _observe(telemetry, "llama-3.1-8b-instant", 30.0)
+    _observe(telemetry, "llama-3.1-8b-instant", 0.0, n=50, cached=True)
+    health = model_router.model_health("llama-3.1-8b-instant")
+    assert health["count"] == model_router.MIN_SAMPLES
+    assert health["p95"] == 30.0
+    assert telemetry.counter_total("llm_calls_total", cached=True) == 50
+
+
+def test_cohere_fast_tier_is_cheapest_first():
+    order = model_router.MODEL_COST_ORDER["cohere"]
+    fast = model_router.MODEL_TIERS["cohere"]["fast"]
+    assert fast == sorted(fast, key=order.index)
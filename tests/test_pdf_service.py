@@ -0,0 +1,57 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import pdf_service
+from pdf_service import PDFQueueFull, PDFRenderService
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("reportlab")
+
+import pyq_pdf  # noqa: E402
+import pyq_store  # noqa: E402
+
+
+def _jobs():
+    name = pyq_store.list_exams()[0]
+    return pyq_pdf.curated_jobs(name, pyq_store.get_exam(name))
+
+
+def _settled(service):
+    # A future's done-callbacks (which free the slot) run just after result() wakes
+    deadline = time.monotonic() + 5
+    while service.stats()["pending"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return service.stats()
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_pool_and_inline_render_the_same_document(workers):
+    service = PDFRenderService(max_workers=workers)
+    try:
+        service.warm()
+        data = service.submit(_jobs(), "PYQ", "footer").result(timeout=120)
+    finally:
+        service.shutdown()
+    doc = fitz.open("pdf", data)
+    assert doc.page_count == fitz.open("pdf", pyq_pdf.render_document(_jobs(), "PYQ", "f")).page_count
+    assert "footer" in doc[0].get_text()
+    stats = _settled(service)
+    assert stats["rendered"] == 1 and stats["pending"] == 0
+
+
+def test_full_queue_rejects_instead_of_waiting_forever(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(pdf_service, "pyq_pdf", SimpleNamespace(
+        render_document=lambda jobs, title, footer: release.wait(5) and b"%PDF"))
+    service = PDFRenderService(max_workers=0, max_pending=1)
+    first = service.submit([], "t", "f")
+    with pytest.raises(PDFQueueFull):
+        service.submit([], "t", "f", wait=0.05)
+    release.set()
+    assert first.result(timeout=5) == b"%PDF"
+    service.submit([], "t", "f", wait=5).result(timeout=5)
+    assert _settled(service) == {"workers": 0, "pending": 0, "max_pending": 1,
+                               "rendered": 2, "rejected": 1}
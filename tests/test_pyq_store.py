@@ -0,0 +1,68 @@
+import pytest
+
+import pyq_store
+
+EXAM = {
+    "tagline": "Test pack",
+    "accent": "#123456",
+    "sections": [
+        {"title": "Aptitude", "icon": "A", "questions": [
+            {"q": "What is the probability of heads?", "answer": "1/2",
+             "explanation": "A fair coin", "difficulty": "easy"},
+            {"q": "Train speed problem", "answer": "60", "explanation": "distance over time"},
+        ]},
+        {"title": "Coding", "icon": "C", "questions": [
+            {"q": "Reverse a linked list", "answer": "O(n)", "topic": "Lists",
+             "explanation": "Iterate with three pointers"},
+        ]},
+    ],
+}
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(pyq_store, "STORE_DIR", str(tmp_path))
+    monkeypatch.setattr(pyq_store, "_index", None)
+    monkeypatch.setattr(pyq_store, "_exams", type(pyq_store._exams)())
+    monkeypatch.setattr(pyq_store, "_hashes", {})
+    monkeypatch.setattr(pyq_store, "_fts", None)
+    pyq_store.write_exam("Mock Exam", EXAM, root=str(tmp_path))
+    return tmp_path
+
+
+def test_round_trip_keeps_the_pdf_shape(store):
+    assert pyq_store.list_exams() == ["Mock Exam"]
+    assert [s["count"] for s in pyq_store.exam_info("Mock Exam")["sections"]] == [2, 1]
+    exam = pyq_store.get_exam("Mock Exam")
+    assert exam["tagline"] == "Test pack"
+    assert [s["title"] for s in exam["sections"]] == ["Aptitude", "Coding"]
+    assert exam["sections"][1]["questions"][0]["q"] == "Reverse a linked list"
+    assert pyq_store.get_exam("Unknown") is None
+
+
+def test_iter_questions_filters(store):
+    assert [q["q"] for q in pyq_store.iter_questions(difficulty="EASY")] == [
+        "What is the probability of heads?"]
+    assert [q["q"] for q in pyq_store.iter_questions(topic="lists")] == [
+        "Reverse a linked list"]
+    assert len(list(pyq_store.iter_questions(section="aptitude"))) == 2
+
+
+def test_search_matches_prefixes_and_ignores_operators(store):
+    hits = pyq_store.search("revers pointer")
+    assert [h["q"] for h in hits] == ["Reverse a linked list"]
+    assert pyq_store.search('" OR *') == []
+
+
+def test_content_hash_changes_with_the_data_file(store):
+    before = pyq_store.content_hash("Mock Exam")
+    with open(store / "mock-exam.jsonl", "a", encoding="utf-8") as fh:
+        fh.write('{"section": "Coding", "q": "FizzBuzz", "answer": "-"}\n')
+    assert pyq_store.content_hash("Mock Exam") != before
+    pyq_store.reindex(root=str(store))
+    assert [s["count"] for s in pyq_store.exam_info("Mock Exam")["sections"]] == [2, 2]
+
+
+def test_bundled_bank_loads():
+    for name in pyq_store.list_exams():
+        assert pyq_store.get_exam(name)["sections"]
@@ -0,0 +1,70 @@
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+import resume_segmenter as rs  # noqa: E402
+
+
+def _pdf(pages):
+    doc = fitz.open()
+    for lines in pages:
+        page = doc.new_page()
+        y = 60
+        for text, size in lines:
+            page.insert_text((50, y), text, fontsize=size)
+            y += size + 8
+        page.insert_text((280, 820), str(doc.page_count), fontsize=9)
+    return fitz.open("pdf", doc.tobytes())
+
+
+def test_sections_contact_stripping_and_page_numbers():
+    doc = _pdf([
+        [("Jane Doe", 18), ("jane@example.com | +91 98765 43210 | Data Analyst", 10),
+         ("EXPERIENCE", 13), ("• Built dashboards in SQL and Tableau", 10),
+         ("Skills", 13), ("Python, SQL, Excel", 10)],
+        [("Education", 13), ("B.Tech Computer Science, 2022", 10)],
+    ])
+    seg = rs.segment_document(doc, max_pages=5, max_chars=5000)
+    sections = seg["sections"]
+    assert list(sections) == ["profile", "experience", "skills", "education"]
+    assert sections["experience"] == ["- Built dashboards in SQL and Tableau"]
+    assert "jane@example.com" not in " ".join(sections["profile"])
+    assert "Data Analyst" in " ".join(sections["profile"])
+    assert seg["pages_read"] == 2 and not seg["truncated"]
+
+    prompt = rs.to_prompt(seg)
+    assert "[EXPERIENCE]\n- Built dashboards" in prompt
+    assert not any(line.strip() in ("1", "2") for line in prompt.splitlines())
+
+
+def test_page_limit_and_prompt_cut():
+    doc = _pdf([[("Skills", 13), (f"Skill line {i} " + "x" * 40, 10)] for i in range(4)])
+    seg = rs.segment_document(doc, max_pages=2, max_chars=5000)
+    assert seg["pages_read"] == 2 and seg["truncated"]
+    prompt = rs.to_prompt(seg, max_chars=60)
+    assert len(prompt) <= 60
+    assert not prompt.endswith("]")
+
+
+def test_repeated_job_titles_are_kept_with_their_own_dates():
+    doc = _pdf([[("Jane Doe", 18), ("Experience", 13),
+                 ("Software Engineer", 10), ("Acme Corp, 2019 - 2021", 10),
+                 ("• Built the billing service", 10),
+                 ("Software Engineer", 10), ("Initech, 2021 - 2023", 10),
+                 ("• Led the search rewrite", 10)]])
+    seg = rs.segment_document(doc, max_pages=5, max_chars=5000)
+    assert seg["sections"]["experience"] == [
+        "Software Engineer", "Acme Corp, 2019 - 2021", "- Built the billing service",
+        "Software Engineer", "Initech, 2021 - 2023", "- Led the search rewrite"]
+
+
+def test_contact_block_reprinted_on_a_later_page_is_dropped():
+    doc = fitz.open()
+    for body in ("Skills\nPython, SQL", "Projects\nChurn model"):
+        page = doc.new_page()
+        page.insert_text((50, 80), "Jane Doe\njane@example.com\nPune, India", fontsize=10)
+        page.insert_text((50, 200), body, fontsize=10)
+    seg = rs.segment_document(fitz.open("pdf", doc.tobytes()), max_pages=5, max_chars=5000)
+    text = rs.to_prompt(seg)
+    assert text.count("Jane Doe") == 1 and text.count("Pune") == 1
+    assert "Churn model" in text
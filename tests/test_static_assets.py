@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+import static_assets
+
+ANIMATION = {"v": "5.7.4", "layers": [{"ty": 4}]}
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    bundled, cache = tmp_path / "bundled", tmp_path / "cache"
+    bundled.mkdir()
+    cache.mkdir()
+    monkeypatch.setattr(static_assets, "LOTTIE_DIR", str(bundled))
+    monkeypatch.setattr(static_assets, "LOTTIE_CACHE_DIR", str(cache))
+    monkeypatch.setattr(static_assets, "_lottie", {})
+    return bundled, cache
+
+
+def test_lottie_prefers_the_cache_over_the_bundled_copy(dirs):
+    bundled, cache = dirs
+    (bundled / "anim.json").write_text(json.dumps(ANIMATION))
+    assert static_assets.lottie("anim") == ANIMATION
+    assert static_assets.lottie_stats()["anim"] == {"source": "bundled", "age_s": None}
+
+    fresher = dict(ANIMATION, v="5.9.0")
+    (cache / "fresh.json").write_text(json.dumps(fresher))
+    (bundled / "fresh.json").write_text(json.dumps(ANIMATION))
+    assert static_assets.lottie("fresh") == fresher
+    assert static_assets.lottie_stats()["fresh"]["source"] == "cache"
+
+
+def test_lottie_without_any_copy_returns_none(dirs):
+    bundled, _ = dirs
+    (bundled / "broken.json").write_text("{not json")
+    assert static_assets.lottie("broken") is None
+    assert static_assets.lottie("missing") is None
+    assert static_assets.lottie_stats()["missing"]["source"] == "none"
+
+
+def test_vendor_writes_fetched_animations_into_the_bundle(dirs, monkeypatch):
+    bundled, _ = dirs
+    monkeypatch.setattr(static_assets, "LOTTIE_URLS", {"good": "u1", "bad": "u2"})
+    monkeypatch.setattr(static_assets, "_fetch", lambda url: ANIMATION if url == "u1" else None)
+    assert static_assets.vendor_lottie() == {"good": True, "bad": False}
+    assert json.loads((bundled / "good.json").read_text()) == ANIMATION
+    assert not (bundled / "bad.json").exists()
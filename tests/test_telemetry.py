@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+import telemetry
+from telemetry import Telemetry, current_method, instrumented
+
+
+@pytest.fixture
+def fresh(monkeypatch):
+    registry = Telemetry()
+    monkeypatch.setattr(telemetry, "TELEMETRY", registry)
+    return registry
+
+
+def test_instrumented_tags_calls_and_records_outcomes(fresh):
+    seen = []
+
+    @instrumented
+    def analyse(ok):
+        seen.append(current_method.get())
+        return "result" if ok else "⚠️ nothing"
+
+    analyse(True)
+    analyse(False)
+    assert seen == ["analyse", "analyse"]
+    assert len(fresh.samples("method_seconds", method="analyse", outcome="ok")) == 1
+    assert len(fresh.samples("method_seconds", method="analyse", outcome="empty")) == 1
+
+
+def test_instrumented_streams_record_time_to_first_chunk(fresh):
+    @instrumented
+    def chat():
+        yield "a"
+        yield "b"
+
+    assert "".join(chat()) == "ab"
+    assert len(fresh.samples("method_ttft_seconds", method="chat")) == 1
+    assert len(fresh.samples("method_seconds", method="chat", outcome="ok")) == 1
+
+
+def test_errors_are_counted_and_exported():
+    registry = Telemetry()
+    registry.record_llm_call(provider="groq", model="m", wall=0.3, prompt_chars=400)
+    registry.record_llm_call(provider="groq", model="m", wall=1.2, error="RateLimit")
+    assert registry.counter_total("llm_calls_total", outcome="error") == 1
+    assert registry.counter_total("llm_errors_total", error="RateLimit") == 1
+
+    prom = registry.to_prometheus()
+    assert "# TYPE jobless_llm_call_seconds histogram" in prom
+    assert 'jobless_llm_call_seconds_count{method="unknown",model="m",provider="groq"} 2' in prom
+    assert 'le="+Inf"' in prom
+    rows = [json.loads(line) for line in registry.to_jsonl().splitlines()]
+    assert {row["metric"] for row in rows} >= {"llm_call_seconds", "llm_calls_total"}
+
+
+def test_llm_calls_are_appended_to_the_log(tmp_path):
+    path = tmp_path / "calls.jsonl"
+    Telemetry(log_path=str(path)).record_llm_call(provider="gemini", model="m", wall=0.5,
+                                                  cached=True)
+    event = json.loads(path.read_text())
+    assert event["provider"] == "gemini" and event["cached"] is True